@@ -31,6 +31,12 @@ from typing import cast
 from deepdiff import DeepDiff
 from web3 import Web3
 
+from operate.bridge.history import (
+    HISTORY_INDEX_FILE,
+    get_bridge_history_index,
+    history_entry,
+    is_terminal,
+)
 from operate.bridge.providers.mayan_provider import MayanProvider
 from operate.bridge.providers.native_bridge_provider import (
     NativeBridgeProvider,
@@ -45,15 +51,21 @@ from operate.bridge.providers.provider import (
 from operate.bridge.providers.relay_provider import RelayProvider
 from operate.constants import ZERO_ADDRESS
 from operate.exceptions import InsufficientFundsException
+from operate.ledger import gas_pricing_snapshot
 from operate.operate_types import Chain, ChainAmounts
 from operate.resource import LocalResource
+from operate.utils.event_bus import BRIDGE_STATUS_EVENT, event_bus
 from operate.utils.gnosis import get_assets_balances
+from operate.utils.metrics import timed_job
 from operate.wallet.master import MasterWalletManager
 
 DEFAULT_BUNDLE_VALIDITY_PERIOD = 3 * 60
 EXECUTED_BUNDLES_PATH = "executed"
 BRIDGE_REQUEST_BUNDLE_PREFIX = "rb-"
 
+DEFAULT_HISTORY_PAGE_SIZE = 20
+MAX_HISTORY_PAGE_SIZE = 100
+
 RELAY_PROVIDER_ID = "relay-provider"
 MAYAN_PROVIDER_ID = "mayan-provider"
 
@@ -199,6 +211,7 @@ class BridgeManager:
         self.data: BridgeManagerData = cast(
             BridgeManagerData, BridgeManagerData.load(path)
         )
+        self.history = get_bridge_history_index(self.path / HISTORY_INDEX_FILE)
         self._native_bridge_providers = {
             provider_id: NativeBridgeProvider(
                 config["bridge_contract_adaptor_class"](
@@ -377,6 +390,7 @@ class BridgeManager:
                     f"Invalid input: 'from' address {from_address} does not match Master EOA nor Master Safe on chain {Chain(from_chain).name}."
                 )
 
+    @timed_job("bridge_refill_requirements")
     def bridge_refill_requirements(
         self, requests_params: t.List[t.Dict], force_update: bool = False
     ) -> t.Dict:
@@ -423,6 +437,7 @@ class BridgeManager:
         )
         return status_json
 
+    @timed_job("bridge_execute")
     def execute_bundle(self, bundle_id: str) -> t.Dict:
         """Execute the bundle"""
 
@@ -476,13 +491,24 @@ class BridgeManager:
             pass
         else:
             bundle_path = self.path / EXECUTED_BUNDLES_PATH / f"{bundle_id}.json"
-            if bundle_path.exists():
+            try:
                 bundle = cast(
                     ProviderRequestBundle, ProviderRequestBundle.load(bundle_path)
                 )
                 bundle.path = bundle_path  # TODO backport to resource.py ?
-            else:
-                raise FileNotFoundError(f"Bundle with ID {bundle_id} does not exist.")
+            except FileNotFoundError as e:
+                # The file may be removed by a compaction at any point, but
+                # only once the bundle is in the history index.
+                entry = self.history.get(bundle_id)
+                if entry is None:
+                    raise FileNotFoundError(
+                        f"Bundle with ID {bundle_id} does not exist."
+                    ) from e
+                # Compacted bundles are terminal: their status no longer changes.
+                return {
+                    "id": entry["id"],
+                    "bridge_request_status": entry["bridge_request_status"],
+                }
 
         initial_status = [request.status for request in bundle.provider_requests]
 
@@ -496,20 +522,32 @@ class BridgeManager:
         if initial_status != updated_status and bundle.path is not None:
             bundle.store()
 
-        return {
+        status_json = {
             "id": bundle.id,
             "bridge_request_status": provider_request_status,
         }
+        event_bus.publish(
+            BRIDGE_STATUS_EVENT, status_json, key=(BRIDGE_STATUS_EVENT, bundle.id)
+        )
+        return status_json
 
     def bridge_total_requirements(self, bundle: ProviderRequestBundle) -> ChainAmounts:
-        """Sum bridge requirements."""
+        """Sum bridge requirements.
+
+        All requests in the bundle share a single gas pricing fetch per chain.
+        """
         requirements = []
-        for provider_request in bundle.provider_requests:
-            if provider_request.status == ProviderRequestStatus.QUOTE_FAILED:
-                continue
-            provider = self._providers[provider_request.provider_id]
-            requirements.append(provider.requirements(provider_request))
+        with gas_pricing_snapshot() as snapshot:
+            for provider_request in bundle.provider_requests:
+                if provider_request.status == ProviderRequestStatus.QUOTE_FAILED:
+                    continue
+                provider = self._providers[provider_request.provider_id]
+                requirements.append(provider.requirements(provider_request))
 
+        self.logger.info(
+            f"[BRIDGE MANAGER] Gas pricing RPC calls for bundle {bundle.id}: "
+            f"{snapshot.fetches} fetched, {snapshot.reuses} reused."
+        )
         return ChainAmounts.add(*requirements)
 
     def quote_bundle(self, bundle: ProviderRequestBundle) -> None:
@@ -560,6 +598,107 @@ class BridgeManager:
         ):
             bundle.timestamp = int(time.time())
 
+    def _load_executed_bundles(self) -> t.List[ProviderRequestBundle]:
+        """Load the executed bundles that have not been compacted yet."""
+        bundles = []
+        for bundle_path in sorted((self.path / EXECUTED_BUNDLES_PATH).glob("*.json")):
+            try:
+                bundle = cast(
+                    ProviderRequestBundle, ProviderRequestBundle.load(bundle_path)
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.warning(
+                    f"[BRIDGE MANAGER] Skipping unreadable bundle {bundle_path}: {e}"
+                )
+                continue
+            bundle.path = bundle_path
+            bundles.append(bundle)
+        return bundles
+
+    def compact_history(self) -> int:
+        """Fold terminal executed bundles into the history index.
+
+        The per-bundle files of folded bundles are removed. Bundles that are
+        still in progress are left untouched. Returns the number of bundles
+        folded.
+        """
+        entries = []
+        folded_paths = []
+        for bundle in self._load_executed_bundles():
+            if self.history.get(bundle.id) is None:
+                if not is_terminal(bundle.provider_requests):
+                    continue
+                bridge_request_status = [
+                    self._providers[request.provider_id].status_json(request)
+                    for request in bundle.provider_requests
+                ]
+                entries.append(history_entry(bundle, bridge_request_status))
+            folded_paths.append(t.cast(Path, bundle.path))
+
+        # Append before removing, so that a crash in between can only leave
+        # a duplicate file behind (which is removed on the next compaction).
+        self.history.append(entries)
+        for bundle_path in folded_paths:
+            bundle_path.unlink(missing_ok=True)
+
+        if folded_paths:
+            self.logger.info(
+                f"[BRIDGE MANAGER] Compacted {len(folded_paths)} executed bundles into the history index."
+            )
+        return len(folded_paths)
+
+    def get_history(
+        self,
+        offset: int = 0,
+        limit: int = DEFAULT_HISTORY_PAGE_SIZE,
+        status: t.Optional[str] = None,
+        chain: t.Optional[str] = None,
+    ) -> t.Dict:
+        """Get a page of executed bundles, most recent first."""
+        if offset < 0 or not 0 < limit <= MAX_HISTORY_PAGE_SIZE:
+            raise ValueError(
+                f"Invalid pagination: offset must be >= 0 and limit in [1, {MAX_HISTORY_PAGE_SIZE}]."
+            )
+
+        entries = self.history.entries()
+        entries.extend(
+            self.history.pending_entries(
+                sorted((self.path / EXECUTED_BUNDLES_PATH).glob("*.json")),
+                self._summarize_executed_bundle,
+            )
+        )
+
+        if status is not None:
+            entries = [entry for entry in entries if entry["status"] == status]
+        if chain is not None:
+            entries = [entry for entry in entries if chain in entry["chains"]]
+        entries.sort(key=lambda entry: entry["timestamp"], reverse=True)
+
+        return {
+            "total": len(entries),
+            "offset": offset,
+            "limit": limit,
+            "items": [
+                {k: v for k, v in entry.items() if k != "bridge_request_status"}
+                for entry in entries[offset : offset + limit]
+            ],
+        }
+
+    def _summarize_executed_bundle(self, bundle_path: Path) -> t.Optional[t.Dict]:
+        """History summary of an executed bundle file, if readable."""
+        try:
+            bundle = cast(
+                ProviderRequestBundle, ProviderRequestBundle.load(bundle_path)
+            )
+        except FileNotFoundError:
+            return None  # compacted meanwhile
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                f"[BRIDGE MANAGER] Skipping unreadable bundle {bundle_path}: {e}"
+            )
+            return None
+        return history_entry(bundle)
+
     def last_executed_bundle_id(self) -> t.Optional[str]:
         """Get the last executed bundle id."""
         return self.data.last_executed_bundle_id
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Append-only history index of executed bridge bundles.
+
+Terminal bundles are folded into a JSONL file (one summary per line) so that
+they can be listed and filtered without loading one JSON file per bundle.
+The index is only ever appended to, so readers parse it incrementally from
+the last offset they have seen.
+"""
+
+import json
+import logging
+import os
+import threading
+import typing as t
+from pathlib import Path
+
+from operate.bridge.providers.provider import ProviderRequest, ProviderRequestStatus
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from operate.bridge.bridge_manager import (  # pylint: disable=cyclic-import
+        ProviderRequestBundle,
+    )
+
+logger = logging.getLogger(__name__)
+
+HISTORY_INDEX_FILE = "history.jsonl"
+
+TERMINAL_STATUSES = (
+    ProviderRequestStatus.EXECUTION_DONE,
+    ProviderRequestStatus.EXECUTION_FAILED,
+)
+
+
+def bundle_status(provider_requests: t.List[ProviderRequest]) -> str:
+    """Aggregate the status of the requests of an executed bundle."""
+    statuses = {request.status for request in provider_requests}
+    if ProviderRequestStatus.EXECUTION_FAILED in statuses:
+        return ProviderRequestStatus.EXECUTION_FAILED.value
+    if statuses and statuses <= {ProviderRequestStatus.EXECUTION_DONE}:
+        return ProviderRequestStatus.EXECUTION_DONE.value
+    return ProviderRequestStatus.EXECUTION_PENDING.value
+
+
+def is_terminal(provider_requests: t.List[ProviderRequest]) -> bool:
+    """Whether all requests of a bundle reached a final status."""
+    return all(request.status in TERMINAL_STATUSES for request in provider_requests)
+
+
+def history_entry(
+    bundle: "ProviderRequestBundle",
+    bridge_request_status: t.Optional[t.List[t.Dict]] = None,
+) -> t.Dict:
+    """Build the history summary of an executed bundle."""
+    requests = []
+    for request in bundle.provider_requests:
+        execution_data = request.execution_data
+        requests.append(
+            {
+                "id": request.id,
+                "provider_id": request.provider_id,
+                "from_chain": request.params["from"]["chain"],
+                "from_token": request.params["from"]["token"],
+                "to_chain": request.params["to"]["chain"],
+                "to_token": request.params["to"]["token"],
+                "to_amount": str(request.params["to"]["amount"]),
+                "status": request.status.value,
+                "elapsed_time": execution_data.elapsed_time if execution_data else None,
+                "from_tx_hash": execution_data.from_tx_hash if execution_data else None,
+                "to_tx_hash": execution_data.to_tx_hash if execution_data else None,
+            }
+        )
+
+    elapsed_times = [r["elapsed_time"] for r in requests if r["elapsed_time"]]
+    execution_timestamps = [
+        request.execution_data.timestamp
+        for request in bundle.provider_requests
+        if request.execution_data
+    ]
+    entry: t.Dict[str, t.Any] = {
+        "id": bundle.id,
+        "timestamp": min(execution_timestamps, default=bundle.timestamp),
+        "status": bundle_status(bundle.provider_requests),
+        "elapsed_time": max(elapsed_times) if elapsed_times else None,
+        "chains": sorted(
+            {r["from_chain"] for r in requests} | {r["to_chain"] for r in requests}
+        ),
+        "requests": requests,
+    }
+    if bridge_request_status is not None:
+        entry["bridge_request_status"] = bridge_request_status
+    return entry
+
+
+class BridgeHistoryIndex:
+    """JSONL index of executed bridge bundles."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the index."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: t.Dict[str, t.Dict] = {}
+        self._offset = 0
+        # summaries of bundles not indexed yet, by path, with the file version
+        self._pending: t.Dict[Path, t.Tuple[t.Tuple[int, int, int], t.Dict]] = {}
+
+    def _refresh(self) -> None:
+        """Parse the lines appended since the last read (caller holds the lock)."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._offset:
+            # The file was replaced; start over.
+            self._entries = {}
+            self._offset = 0
+        if size == self._offset:
+            return
+
+        with self.path.open("rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # Ignore a trailing partial line; it is picked up on the next read.
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                self._entries.setdefault(entry["id"], entry)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed bridge history line: {e}")
+        self._offset += end
+
+    def append(self, entries: t.List[t.Dict]) -> None:
+        """Append entries to the index (entries already present are skipped)."""
+        with self._lock:
+            self._refresh()
+            new_entries = [e for e in entries if e["id"] not in self._entries]
+            if not new_entries:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                for entry in new_entries:
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._refresh()
+
+    def get(self, bundle_id: str) -> t.Optional[t.Dict]:
+        """Get the entry of a bundle, if indexed."""
+        with self._lock:
+            self._refresh()
+            return self._entries.get(bundle_id)
+
+    def entries(self) -> t.List[t.Dict]:
+        """All indexed entries, in insertion order."""
+        with self._lock:
+            self._refresh()
+            return list(self._entries.values())
+
+    def pending_entries(
+        self,
+        bundle_paths: t.Iterable[Path],
+        summarize: t.Callable[[Path], t.Optional[t.Dict]],
+    ) -> t.List[t.Dict]:
+        """Summaries of the executed bundles at `bundle_paths` not indexed yet.
+
+        Bundle files are named after their bundle id. A summary made by
+        `summarize` is kept until its file changes, so that only new and
+        updated bundles are read.
+        """
+        with self._lock:
+            self._refresh()
+            pending = {}
+            for bundle_path in bundle_paths:
+                if bundle_path.stem in self._entries:
+                    continue
+                try:
+                    stat = bundle_path.stat()
+                except FileNotFoundError:
+                    continue  # compacted meanwhile
+                version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                cached = self._pending.get(bundle_path)
+                if cached is not None and cached[0] == version:
+                    pending[bundle_path] = cached
+                    continue
+                entry = summarize(bundle_path)
+                if entry is not None:
+                    pending[bundle_path] = (version, entry)
+            self._pending = pending
+            return [entry for _, entry in pending.values()]
+
+
+BRIDGE_HISTORY_INDEXES: t.Dict[Path, BridgeHistoryIndex] = {}
+_BRIDGE_HISTORY_INDEXES_LOCK = threading.Lock()
+
+
+def get_bridge_history_index(path: Path) -> BridgeHistoryIndex:
+    """Get the shared history index stored at `path`."""
+    with _BRIDGE_HISTORY_INDEXES_LOCK:
+        if path not in BRIDGE_HISTORY_INDEXES:
+            BRIDGE_HISTORY_INDEXES[path] = BridgeHistoryIndex(path)
+        return BRIDGE_HISTORY_INDEXES[path]
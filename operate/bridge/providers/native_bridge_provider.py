@@ -57,6 +57,7 @@ from operate.ledger import (
     update_tx_with_gas_estimate,
     update_tx_with_gas_pricing,
 )
+from operate.ledger.block_index import BlockTimestampIndex, get_block_timestamp_index
 from operate.ledger.profiles import ERC20_TOKENS, EXPLORER_URL
 from operate.operate_types import Chain
 from operate.wallet.master import MasterWalletManager
@@ -626,7 +627,9 @@ class NativeBridgeProvider(Provider):
             # Find the event on the 'to' chain
             to_ledger_api = self._to_ledger_api(provider_request)
             to_w3 = to_ledger_api.api
-            starting_block = self._find_block_before_timestamp(to_w3, bridge_tx_ts)
+            starting_block = self._find_block_before_timestamp(
+                to_w3, bridge_tx_ts, chain=Chain(provider_request.params["to"]["chain"])
+            )
             starting_block_ts = to_w3.eth.get_block(starting_block).timestamp
             latest_block = to_w3.eth.block_number
 
@@ -672,20 +675,16 @@ class NativeBridgeProvider(Provider):
             return
 
     @staticmethod
-    def _find_block_before_timestamp(w3: Web3, timestamp: int) -> int:
+    def _find_block_before_timestamp(
+        w3: Web3, timestamp: int, chain: t.Optional[Chain] = None
+    ) -> int:
         """Returns the largest block number of the block before `timestamp`."""
-        latest = w3.eth.block_number
-        low, high = 0, latest
-        best = 0
-        while low <= high:
-            mid = (low + high) // 2
-            block = w3.eth.get_block(mid)
-            if block["timestamp"] < timestamp:
-                best = mid
-                low = mid + 1
-            else:
-                high = mid - 1
-        return best
+        index = (
+            get_block_timestamp_index(chain)
+            if chain is not None
+            else BlockTimestampIndex(chain_id=0)
+        )
+        return index.find_block_before_timestamp(w3, timestamp)
 
     def _get_explorer_link(self, provider_request: ProviderRequest) -> t.Optional[str]:
         """Get the explorer link for a transaction."""
@@ -42,6 +42,7 @@ from operate.constants import (
 )
 from operate.exceptions import InsufficientFundsException
 from operate.ledger import (
+    gas_pricing_snapshot,
     get_default_ledger_api,
     update_tx_with_gas_pricing,
 )
@@ -250,10 +251,20 @@ class Provider(ABC):
         """Get the sorted list of transactions to execute the quote."""
         raise NotImplementedError()
 
-    def requirements(  # pylint: disable=too-many-locals
+    def requirements(self, provider_request: ProviderRequest) -> ChainAmounts:
+        """Gets the requirements to execute the quote, with updated gas estimation.
+
+        Gas pricing is fetched once per chain and shared by all the transactions
+        of the request (and of the enclosing bundle, if the caller opened a
+        gas pricing snapshot).
+        """
+        with gas_pricing_snapshot():
+            return self._requirements(provider_request)
+
+    def _requirements(  # pylint: disable=too-many-locals
         self, provider_request: ProviderRequest
     ) -> ChainAmounts:
-        """Gets the requirements to execute the quote, with updated gas estimation."""
+        """Compute the requirements to execute the quote."""
         self.logger.info(f"[PROVIDER] Requirements for request {provider_request.id}.")
 
         self._validate(provider_request)
@@ -319,13 +330,16 @@ class Provider(ABC):
             total_gas_fees += gas_fees
             total_native += tx_value + gas_fees
 
-            self.logger.debug(
-                f"[PROVIDER] Transaction {gas_key}={tx.get(gas_key, 0)} maxPriorityFeePerGas={tx.get('maxPriorityFeePerGas', -1)} gas={tx['gas']} {gas_fees=} {tx_value=}"
-            )
-            self.logger.debug(f"[PROVIDER] {from_ledger_api.api.eth.gas_price=}")
-            self.logger.debug(
-                f"[PROVIDER] {from_ledger_api.api.eth.get_block('latest').baseFeePerGas=}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # Diagnostic reads below are extra RPC calls; only pay for them
+                # when debug logging is actually enabled.
+                self.logger.debug(
+                    f"[PROVIDER] Transaction {gas_key}={tx.get(gas_key, 0)} maxPriorityFeePerGas={tx.get('maxPriorityFeePerGas', -1)} gas={tx['gas']} {gas_fees=} {tx_value=}"
+                )
+                self.logger.debug(f"[PROVIDER] {from_ledger_api.api.eth.gas_price=}")
+                self.logger.debug(
+                    f"[PROVIDER] {from_ledger_api.api.eth.get_block('latest').baseFeePerGas=}"
+                )
 
             # TODO Move the requirements logic to be implemented by each provider.
             #
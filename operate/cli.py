@@ -22,6 +22,7 @@
 import asyncio
 import atexit
 import enum
+import json
 import multiprocessing
 import os
 import shutil
@@ -30,7 +31,6 @@ import sys
 import traceback
 import typing as t
 import uuid
-from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from http import HTTPStatus
 from pathlib import Path
@@ -43,9 +43,9 @@ from aea.helpers.logging import setup_logger
 from clea import group, params, run
 from fastapi import APIRouter, FastAPI
 from fastapi import Path as FastApiPath
-from fastapi import Query, Request
+from fastapi import Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.routing import APIRoute
 from pydantic import ValidationError
 from uvicorn.config import Config
@@ -53,11 +53,17 @@ from uvicorn.server import Server
 
 from operate import __version__, services
 from operate.account.user import UserAccount
-from operate.bridge.bridge_manager import BridgeManager
+from operate.bridge.bridge_manager import BridgeManager, DEFAULT_HISTORY_PAGE_SIZE
 from operate.constants import (
+    AGENT_ASSETS_DIR,
     AGENT_RUNNER_PREFIX,
+    BLOCK_INDEX_DIR,
+    CONFIG_JSON,
     DEPLOYMENT_DIR,
+    DEPLOYMENT_JSON,
+    HEALTHCHECK_JSON,
     KEYS_DIR,
+    LOG_SCAN_CHECKPOINTS_JSON,
     MIN_PASSWORD_LENGTH,
     MSG_INVALID_MNEMONIC,
     MSG_INVALID_PASSWORD,
@@ -78,6 +84,8 @@ from operate.constants import (
     ZERO_ADDRESS,
 )
 from operate.keys import KeysManager
+from operate.ledger.block_index import set_block_index_dir, store_block_indexes
+from operate.ledger.log_scanner import set_log_scan_checkpoints_path
 from operate.ledger.profiles import (
     DEFAULT_EOA_TOPUPS,
     DEFAULT_NEW_SAFE_FUNDS,
@@ -90,6 +98,7 @@ from operate.operate_types import (
     DeploymentStatus,
     FundRecoveryExecuteRequest,
     FundRecoveryScanRequest,
+    FundRecoveryScanResponse,
     LedgerType,
     PearlStore,
     Version,
@@ -102,13 +111,24 @@ from operate.quickstart.reset_staking import reset_staking
 from operate.quickstart.run_service import run_service
 from operate.quickstart.stop_service import stop_service
 from operate.quickstart.terminate_on_chain_service import terminate_service
+from operate.services.agent_assets import AgentAssetStore
+from operate.services.deploy_timings import deploy_timings
 from operate.services.deployment_runner import stop_deployment_manager
-from operate.services.fund_recovery_manager import FundRecoveryManager
+from operate.services.fund_recovery_manager import (
+    FUND_RECOVERY_SCAN_TIMEOUT,
+    FundRecoveryManager,
+)
 from operate.services.funding_manager import FundingInProgressError, FundingManager
 from operate.services.health_checker import HealthChecker
 from operate.settings import Settings
 from operate.utils import subtract_dicts
+from operate.utils.download import download_tracker
+from operate.utils.etag import etag_matches, make_etag
+from operate.utils.event_bus import EventFilter, Subscription, event_bus
 from operate.utils.gnosis import Transfer, get_assets_balances
+from operate.utils.metrics import EXECUTOR_QUEUE_DEPTH, MetricsMiddleware, registry
+from operate.utils.profiling import LoopLagMonitor, collapsed_stacks, sample_stacks
+from operate.utils.request_executor import RequestExecutor
 from operate.utils.single_instance import AppSingleInstance, ParentWatchdog
 from operate.validators import (
     SAFE_ID_PATTERN,
@@ -125,6 +145,13 @@ autonomy.chain.tx.ERRORS_TO_RETRY |= {"replacement transaction underpriced"}
 
 
 DEFAULT_MAX_RETRIES = 3
+EVENTS_HEARTBEAT_INTERVAL = 15.0
+BRIDGE_HISTORY_COMPACTION_INTERVAL = 600.0  # seconds
+PROFILE_DEFAULT_SECONDS = 10.0
+PROFILE_MAX_SECONDS = 60.0
+# Blocking writes sending transactions from the master wallet run one at a
+# time, so that they do not race on its nonces
+MASTER_WALLET_RESOURCE = "master_wallet"
 USER_NOT_LOGGED_IN_ERROR = JSONResponse(
     content={"error": "User not logged in."}, status_code=HTTPStatus.UNAUTHORIZED
 )
@@ -220,6 +247,8 @@ class OperateApp:  # pylint: disable=too-many-instance-attributes
         self._keys = self._path / KEYS_DIR
         self.setup()
         self._backup_operate_if_new_version()
+        set_block_index_dir(self._path / BLOCK_INDEX_DIR)
+        set_log_scan_checkpoints_path(self._path / LOG_SCAN_CHECKPOINTS_JSON)
 
         self._password: t.Optional[str] = os.environ.get("OPERATE_USER_PASSWORD")
         self._keys_manager: KeysManager = KeysManager(
@@ -502,12 +531,18 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         )
     )
 
+    # Both debugging aids are off unless enabled: the loop monitor when given
+    # a lag threshold in seconds, the profiler endpoint when PROFILER_ON=1.
+    LOOP_LAG_THRESHOLD = float(os.environ.get("LOOP_LAG_THRESHOLD", "0"))
+    PROFILER_ON = os.environ.get("PROFILER_ON", "0") == "1"
+
     if HEALTH_CHECKER_OFF:
         logger.warning("Healthchecker is off!!!")
     operate = OperateApp(home=home)
 
     funding_job: t.Optional[asyncio.Task] = None
     maintenance_task: t.Optional[asyncio.Task] = None
+    bridge_history_task: t.Optional[asyncio.Task] = None
     health_checker = HealthChecker(
         operate.service_manager(), number_of_fails=number_of_fails, logger=logger
     )
@@ -516,16 +551,46 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     (operate._path / "operate.kill").write_text(  # pylint: disable=protected-access
         shutdown_endpoint
     )
-    thread_pool_executor = ThreadPoolExecutor(max_workers=12)
+    request_executor = RequestExecutor()
+    EXECUTOR_QUEUE_DEPTH.set_function(request_executor.queue_depths)
+    loop_monitor = (
+        LoopLagMonitor(threshold=LOOP_LAG_THRESHOLD, logger=logger)
+        if LOOP_LAG_THRESHOLD > 0
+        else None
+    )
 
-    async def run_in_executor(fn: t.Callable, *args: t.Any) -> t.Any:
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(thread_pool_executor, fn, *args)
-        res = await future
-        exception = future.exception()
-        if exception is not None:  # pragma: no cover
-            raise exception  # pragma: no cover
-        return res
+    async def run_in_executor(
+        fn: t.Callable,
+        *args: t.Any,
+        pool: str = RequestExecutor.WRITE,
+        resource: t.Optional[t.Hashable] = None,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """Run blocking work off the event loop, one at a time per `resource`."""
+        return await request_executor.run(pool, fn, *args, resource=resource, **kwargs)
+
+    def service_resource(service_config_id: str) -> t.Hashable:
+        """Resource of the writes to the files and safe of a service."""
+        return ("service", service_config_id)
+
+    async def run_read(request: Request, pool: str, fn: t.Callable) -> t.Any:
+        """Run a read off the event loop, once for identical concurrent requests."""
+        key = (request.method, request.url.path, request.url.query)
+        return await request_executor.coalesce(key, pool, fn)
+
+    async def conditional_read(
+        request: Request, version: t.List[str], fn: t.Callable
+    ) -> Response:
+        """Serve a disk read, or 304 if the client has the current version.
+
+        ``version`` must be taken before the read, so that a change racing
+        the read yields a stale tag and the next poll fetches again.
+        """
+        etag = make_etag(request.url.path, *version)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        content = await run_read(request, RequestExecutor.DISK, fn)
+        return JSONResponse(content=content, headers={"ETag": etag})
 
     def schedule_healthcheck_job(
         service_config_id: str,
@@ -570,6 +635,24 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         maintenance_task = asyncio.get_running_loop().create_task(
             run_in_executor(operate.service_manager().service_maintenance)
         )
+        nonlocal bridge_history_task
+        if bridge_history_task is None or bridge_history_task.done():
+            bridge_history_task = asyncio.get_running_loop().create_task(
+                bridge_history_job()
+            )
+
+    async def bridge_history_job() -> None:
+        """Periodically fold the bridge bundles that finished into the history index."""
+        while True:
+            await run_in_executor(compact_bridge_history)
+            await asyncio.sleep(BRIDGE_HISTORY_COMPACTION_INTERVAL)
+
+    def compact_bridge_history() -> None:
+        """Fold terminal executed bridge bundles into the history index."""
+        try:
+            operate.bridge_manager.compact_history()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Bridge history compaction failed.")
 
     def recover_stale_deployment_statuses() -> None:
         """Heal services left mid-transition by a crash before pausing them."""
@@ -654,15 +737,30 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
 
         watchdog = ParentWatchdog(on_parent_exit=stop_app)
         watchdog.start()
+        if loop_monitor is not None:
+            loop_monitor.start()
 
         yield  # --- app is running ---
 
+        if loop_monitor is not None:
+            with suppress(Exception):
+                await loop_monitor.stop()
+
         with suppress(Exception):
             cancel_funding_job()
 
+        if bridge_history_task is not None:
+            bridge_history_task.cancel()
+
         with suppress(Exception):
             await watchdog.stop()
 
+        with suppress(Exception):
+            await health_checker.close()
+
+        with suppress(Exception):
+            store_block_indexes()
+
     app = FastAPI(lifespan=lifespan)
 
     # Sub-router carrying every endpoint that reads a ``service_config_id``
@@ -689,6 +787,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             )
         return response
 
+    # Outermost, so that it also times the middlewares above.
+    app.add_middleware(MetricsMiddleware)
+
     @app.get(f"/{shutdown_endpoint}")
     async def _kill_server(request: Request) -> JSONResponse:
         """Kill backend server from inside."""
@@ -710,11 +811,153 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         """Get API info."""
         return JSONResponse(content=operate.json)
 
+    @app.get("/api/metrics")
+    async def _get_metrics(request: Request) -> Response:
+        """Get the metrics in the Prometheus text format."""
+        return Response(
+            content=registry.render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    @app.get("/api/downloads")
+    async def _get_downloads(request: Request) -> JSONResponse:
+        """Get the progress of running and recent agent asset downloads."""
+        return JSONResponse(content=download_tracker.json)
+
+    if PROFILER_ON:
+        profile_lock = asyncio.Lock()
+
+        @app.post("/api/debug/profile")
+        async def _profile(request: Request) -> Response:
+            """Sample the stacks of all threads, in the collapsed stack format."""
+            data = await request.json()
+            if operate.password is None:
+                return USER_NOT_LOGGED_IN_ERROR
+            if operate.password != data.get("password"):
+                return JSONResponse(
+                    content={"error": MSG_INVALID_PASSWORD},
+                    status_code=HTTPStatus.UNAUTHORIZED,
+                )
+            try:
+                seconds = float(
+                    request.query_params.get("seconds", PROFILE_DEFAULT_SECONDS)
+                )
+            except ValueError:
+                seconds = -1
+            if not 0 < seconds <= PROFILE_MAX_SECONDS:
+                return JSONResponse(
+                    content={
+                        "error": f"'seconds' must be a number in (0, {PROFILE_MAX_SECONDS}]."
+                    },
+                    status_code=HTTPStatus.BAD_REQUEST,
+                )
+            if profile_lock.locked():
+                return JSONResponse(
+                    content={"error": "A profile is already running."},
+                    status_code=HTTPStatus.CONFLICT,
+                )
+            async with profile_lock:
+                # on its own thread, so that it samples a blocked loop too
+                counts = await asyncio.get_running_loop().run_in_executor(
+                    None, sample_stacks, seconds
+                )
+            return Response(content=collapsed_stacks(counts), media_type="text/plain")
+
     @app.get("/api/settings")
     async def _get_settings(request: Request) -> JSONResponse:
         """Get settings."""
         return JSONResponse(content=operate.settings.json)
 
+    def subscribe_events(
+        query_params: t.Mapping[str, str], headers: t.Mapping[str, str]
+    ) -> Subscription:
+        """Subscribe to the event bus with the filter and cursor of a client.
+
+        The cursor is the ``Last-Event-ID`` header sent by reconnecting
+        ``EventSource`` clients, or the ``last_event_id`` query parameter.
+        Raises ValueError for a malformed cursor.
+        """
+        types = query_params.get("types")
+        last_event_id = headers.get("last-event-id") or query_params.get(
+            "last_event_id"
+        )
+        return event_bus.subscribe(
+            event_filter=EventFilter(
+                types=frozenset(types.split(",")) if types else None,
+                service_config_id=query_params.get("service_config_id"),
+            ),
+            last_event_id=int(last_event_id) if last_event_id else None,
+        )
+
+    @app.get("/api/events")
+    async def _get_events(request: Request) -> Response:
+        """Stream service, deployment, funding and bridge events (SSE).
+
+        Optional filters: ``types`` (comma-separated event types) and
+        ``service_config_id``. A client that falls too far behind is
+        disconnected and resumes from its ``Last-Event-ID``.
+        """
+        try:
+            subscription = subscribe_events(request.query_params, request.headers)
+        except ValueError:
+            return JSONResponse(
+                content={"error": "Invalid last event id."},
+                status_code=HTTPStatus.BAD_REQUEST,
+            )
+
+        async def _stream() -> t.AsyncIterator[str]:
+            try:
+                while True:
+                    try:
+                        event = await asyncio.wait_for(
+                            subscription.get(), timeout=EVENTS_HEARTBEAT_INTERVAL
+                        )
+                    except asyncio.TimeoutError:
+                        yield ": ping\n\n"
+                        continue
+                    if event is None:
+                        return
+                    yield event.sse
+            finally:
+                subscription.close()
+
+        return StreamingResponse(
+            _stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.websocket("/api/events/ws")
+    async def _events_ws(websocket: WebSocket) -> None:
+        """Event stream of ``/api/events`` over a WebSocket, one JSON message per event."""
+        try:
+            subscription = subscribe_events(websocket.query_params, websocket.headers)
+        except ValueError:
+            await websocket.close(code=1008, reason="Invalid last event id.")
+            return
+        await websocket.accept()
+
+        async def _watch_disconnect() -> None:
+            # clients only listen; any disconnect ends the subscription
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+            subscription.close()
+
+        watcher = asyncio.ensure_future(_watch_disconnect())
+        try:
+            while True:
+                event = await subscription.get()
+                if event is None:
+                    break
+                await websocket.send_json(event.json)
+            if not watcher.done():
+                await websocket.close()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            watcher.cancel()
+            subscription.close()
+
     # --- Pearl Store API ---
     # Backed by .operate/pearl_store.json so it migrates with the .operate folder.
     _pearl_store = PearlStore(
@@ -725,7 +968,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @app.get("/api/store")
     async def _get_store(request: Request) -> JSONResponse:
         """Get the full pearl store."""
-        data = await run_in_executor(PearlStore.read, _pearl_store.path)
+        data = await run_read(
+            request, RequestExecutor.DISK, lambda: PearlStore.read(_pearl_store.path)
+        )
         return JSONResponse(content={"data": data}, status_code=HTTPStatus.OK)
 
     @app.post("/api/store")
@@ -875,9 +1120,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @app.get("/api/wallet")
     async def _get_wallets(request: Request) -> t.List[t.Dict]:
         """Get wallets."""
-        wallets = []
-        for wallet in operate.wallet_manager:
-            wallets.append(wallet.json)
+        wallets = await run_read(
+            request,
+            RequestExecutor.DISK,
+            lambda: [wallet.json for wallet in operate.wallet_manager],
+        )
         return JSONResponse(content=wallets)
 
     @app.post("/api/wallet")
@@ -899,7 +1146,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                     "mnemonic": None,
                 }
             )
-        wallet, mnemonic = manager.create(ledger_type=ledger_type)
+        wallet, mnemonic = await run_in_executor(
+            manager.create, ledger_type=ledger_type, resource=MASTER_WALLET_RESOURCE
+        )
         return JSONResponse(content={"wallet": wallet.json, "mnemonic": mnemonic})
 
     @app.post("/api/wallet/private_key")
@@ -961,20 +1210,27 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @app.get("/api/wallet/extended")
     async def _get_wallet_safe(request: Request) -> t.List[t.Dict]:
         """Get wallets."""
-        wallets = []
-        for wallet in operate.wallet_manager:
-            wallets.append(wallet.extended_json)
+        wallets = await run_read(
+            request,
+            RequestExecutor.RPC,
+            lambda: [wallet.extended_json for wallet in operate.wallet_manager],
+        )
         return JSONResponse(content=wallets)
 
     @app.get("/api/wallet/safe")
     async def _get_safes(request: Request) -> t.List[t.Dict]:
         """Create wallet safe"""
-        all_safes = []
-        for wallet in operate.wallet_manager:
-            safes = []
-            if wallet.safes is not None:
-                safes = list(wallet.safes.values())
-            all_safes.append({wallet.ledger_type: safes})
+
+        def _read() -> t.List[t.Dict]:
+            all_safes = []
+            for wallet in operate.wallet_manager:
+                safes = []
+                if wallet.safes is not None:
+                    safes = list(wallet.safes.values())
+                all_safes.append({wallet.ledger_type: safes})
+            return all_safes
+
+        all_safes = await run_read(request, RequestExecutor.DISK, _read)
         return JSONResponse(content=all_safes)
 
     @app.get("/api/wallet/safe/{chain}")
@@ -1047,9 +1303,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                 backup_owner = ledger_api.api.to_checksum_address(backup_owner)
 
             try:
-                create_tx = wallet.create_safe(
+                create_tx = await run_in_executor(
+                    wallet.create_safe,
                     chain=chain,
                     backup_owner=backup_owner,
+                    resource=MASTER_WALLET_RESOURCE,
                 )
                 # After creation the safe should be in wallet.safes
                 wallet = manager.load(ledger_type=ledger_type)  # reload
@@ -1082,22 +1340,30 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             asset_addresses = {ZERO_ADDRESS} | {
                 token[chain] for token in ERC20_TOKENS.values() if chain in token
             }
-            master_eoa_balances = get_assets_balances(
-                ledger_api=ledger_api,
-                addresses={wallet.address},
-                asset_addresses=asset_addresses,
-                raise_on_invalid_address=False,
+            master_eoa_balances = (
+                await run_in_executor(
+                    get_assets_balances,
+                    ledger_api=ledger_api,
+                    addresses={wallet.address},
+                    asset_addresses=asset_addresses,
+                    raise_on_invalid_address=False,
+                    pool=RequestExecutor.RPC,
+                )
             )[wallet.address]
             initial_funds = subtract_dicts(
                 master_eoa_balances, DEFAULT_EOA_TOPUPS[chain]
             )
         else:
             initial_funds = data.get("initial_funds", DEFAULT_NEW_SAFE_FUNDS[chain])
-            safe_balances = get_assets_balances(
-                ledger_api=ledger_api,
-                addresses={safe_address},
-                asset_addresses=set(initial_funds.keys()) | {ZERO_ADDRESS},
-                raise_on_invalid_address=False,
+            safe_balances = (
+                await run_in_executor(
+                    get_assets_balances,
+                    ledger_api=ledger_api,
+                    addresses={safe_address},
+                    asset_addresses=set(initial_funds.keys()) | {ZERO_ADDRESS},
+                    raise_on_invalid_address=False,
+                    pool=RequestExecutor.RPC,
+                )
             )[safe_address]
             initial_funds = subtract_dicts(initial_funds, safe_balances)
 
@@ -1113,12 +1379,14 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                 logger.info(
                     f"_create_safe Transfer to={safe_address} {amount=} {chain} {asset=}"
                 )
-                tx_hash = wallet.transfer(
+                tx_hash = await run_in_executor(
+                    wallet.transfer,
                     to=safe_address,
                     amount=int(amount),
                     chain=chain,
                     asset=asset,
                     from_safe=False,
+                    resource=MASTER_WALLET_RESOURCE,
                 )
                 transfer_txs[asset] = tx_hash
             except Exception as e:  # pylint: disable=broad-except
@@ -1238,9 +1506,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             all_succeeded = True
             for chain in list(wallet.safes):
                 try:
-                    wallet.update_backup_owner(
+                    await run_in_executor(
+                        wallet.update_backup_owner,
                         chain=chain,
                         backup_owner=backup_owner,
+                        resource=MASTER_WALLET_RESOURCE,
                     )
                     results.append(
                         {
@@ -1261,7 +1531,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
 
             # Persist the canonical backup owner after all transactions complete.
             wallet.canonical_backup_owner = backup_owner
-            wallet.store()
+            await run_in_executor(wallet.store, resource=MASTER_WALLET_RESOURCE)
 
             return JSONResponse(
                 content={
@@ -1287,9 +1557,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         if backup_owner:
             backup_owner = ledger_api.api.to_checksum_address(backup_owner)
 
-        backup_owner_updated = wallet.update_backup_owner(
+        backup_owner_updated = await run_in_executor(
+            wallet.update_backup_owner,
             chain=chain,
             backup_owner=backup_owner,
+            resource=MASTER_WALLET_RESOURCE,
         )
         message = (
             "Backup owner updated successfully"
@@ -1330,7 +1602,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                 status_code=HTTPStatus.BAD_REQUEST,
             )
 
-        result = wallet.sync_backup_owner()
+        result = await run_in_executor(
+            wallet.sync_backup_owner, resource=MASTER_WALLET_RESOURCE
+        )
         return JSONResponse(content=result)
 
     @app.get("/api/wallet/safe/backup_owner/status")
@@ -1352,7 +1626,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             )
 
         wallet = manager.load(ledger_type=LedgerType.ETHEREUM)
-        result = wallet.backup_owner_status()
+        result = await run_read(
+            request, RequestExecutor.RPC, wallet.backup_owner_status
+        )
         return JSONResponse(content=result)
 
     @app.post("/api/wallet/withdraw")
@@ -1388,9 +1664,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                 if not transfers:
                     continue
 
-                txs = wallet.transfer_batch_from_safe_then_eoa(
+                txs = await run_in_executor(
+                    wallet.transfer_batch_from_safe_then_eoa,
                     chain=chain,
                     transfers=transfers,
+                    resource=MASTER_WALLET_RESOURCE,
                 )
                 # Backward compatibility: each asset reports the
                 # transaction list of the (shared) batched withdrawal.
@@ -1426,65 +1704,151 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         )
 
     @app.get("/api/v2/services")
-    async def _get_services(request: Request) -> JSONResponse:
+    async def _get_services(request: Request) -> Response:
         """Get all services."""
-        return JSONResponse(content=operate.service_manager().json)
+        service_manager = operate.service_manager()
+        return await conditional_read(
+            request,
+            service_manager.content_version(files=(CONFIG_JSON,)),
+            lambda: service_manager.json,
+        )
 
     @app.get("/api/v2/services/validate")
     async def _validate_services(request: Request) -> JSONResponse:
         """Validate all services."""
-        service_manager = operate.service_manager()
-        service_ids = service_manager.get_all_service_ids()
-        _services = [
-            service.service_config_id
-            for service in service_manager.get_all_services()[0]
-        ]
+
+        def _read() -> t.Dict[str, bool]:
+            service_manager = operate.service_manager()
+            service_ids = service_manager.get_all_service_ids()
+            _services = [
+                service.service_config_id
+                for service in service_manager.get_all_services()[0]
+            ]
+            return {service_id: service_id in _services for service_id in service_ids}
 
         return JSONResponse(
-            content={service_id: service_id in _services for service_id in service_ids}
+            content=await run_read(request, RequestExecutor.DISK, _read)
         )
 
     @app.get("/api/v2/services/deployment")
-    async def _get_services_deployment(request: Request) -> JSONResponse:
+    async def _get_services_deployment(request: Request) -> Response:
         """Get a service deployment."""
-        service_manager = operate.service_manager()
-        output = {}
-        for service in service_manager.get_all_services()[0]:
-            deployment_json = service.deployment.json
-            deployment_json["healthcheck"] = service.get_latest_healthcheck()
-            output[service.service_config_id] = deployment_json
 
-        return JSONResponse(content=output)
+        def _read() -> t.Dict[str, t.Dict]:
+            service_manager = operate.service_manager()
+            output = {}
+            for service in service_manager.get_all_services()[0]:
+                deployment_json = service.deployment.json
+                deployment_json["healthcheck"] = health_checker.get_latest_healthcheck(
+                    service
+                )
+                output[service.service_config_id] = deployment_json
+            return output
+
+        return await conditional_read(
+            request,
+            operate.service_manager().content_version(
+                files=(DEPLOYMENT_JSON, HEALTHCHECK_JSON)
+            ),
+            _read,
+        )
+
+    @app.get("/api/v2/services/healthcheck/schedule")
+    async def _get_services_healthcheck_schedule(request: Request) -> JSONResponse:
+        """Get the health probe schedule of all services."""
+        return JSONResponse(content=health_checker.scheduler.json)
 
     @service_router.get("/api/v2/service/{service_config_id}")
     async def _get_service(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
-    ) -> JSONResponse:
+        request: Request,
+    ) -> Response:
         """Get a service."""
         if not operate.service_manager().exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
-        return JSONResponse(
-            content=(
-                operate.service_manager()
-                .load(
-                    service_config_id=service_config_id,
-                )
-                .json
-            )
+        service_manager = operate.service_manager()
+        return await conditional_read(
+            request,
+            service_manager.content_version(
+                files=(CONFIG_JSON,), service_config_id=service_config_id
+            ),
+            lambda: service_manager.load(
+                service_config_id=service_config_id,
+            ).json,
         )
 
     @service_router.get("/api/v2/service/{service_config_id}/deployment")
     async def _get_service_deployment(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
-    ) -> JSONResponse:
+        request: Request,
+    ) -> Response:
         """Get a service deployment."""
         if not operate.service_manager().exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
 
-        service = operate.service_manager().load(service_config_id=service_config_id)
-        deployment_json = service.deployment.json
-        deployment_json["healthcheck"] = service.get_latest_healthcheck()
-        return JSONResponse(content=deployment_json)
+        def _read() -> t.Dict:
+            service = operate.service_manager().load(
+                service_config_id=service_config_id
+            )
+            deployment_json = service.deployment.json
+            deployment_json["healthcheck"] = health_checker.get_latest_healthcheck(
+                service
+            )
+            return deployment_json
+
+        return await conditional_read(
+            request,
+            operate.service_manager().content_version(
+                files=(DEPLOYMENT_JSON, HEALTHCHECK_JSON),
+                service_config_id=service_config_id,
+            ),
+            _read,
+        )
+
+    @service_router.get("/api/v2/service/{service_config_id}/deployment/timings")
+    async def _get_service_deployment_timings(
+        service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+    ) -> JSONResponse:
+        """Get the phase timings of the recent deploys of a service."""
+        if not operate.service_manager().exists(service_config_id=service_config_id):
+            return service_not_found_error(service_config_id=service_config_id)
+
+        return JSONResponse(content=deploy_timings.json(service_config_id))
+
+    @service_router.get("/api/v2/service/{service_config_id}/healthcheck/latency")
+    async def _get_service_healthcheck_latency(
+        service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+    ) -> JSONResponse:
+        """Get the latency histogram of the service health probes."""
+        if not operate.service_manager().exists(service_config_id=service_config_id):
+            return service_not_found_error(service_config_id=service_config_id)
+
+        return JSONResponse(content=health_checker.latency_stats(service_config_id))
+
+    @service_router.get("/api/v2/service/{service_config_id}/healthcheck/history")
+    async def _get_service_healthcheck_history(
+        service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+        limit: t.Optional[int] = Query(None, ge=0),  # noqa: B008
+    ) -> JSONResponse:
+        """Get the recent health probes of a service with summary stats."""
+        if not operate.service_manager().exists(service_config_id=service_config_id):
+            return service_not_found_error(service_config_id=service_config_id)
+
+        return JSONResponse(
+            content=health_checker.history(service_config_id).json(limit=limit)
+        )
+
+    @service_router.get("/api/v2/service/{service_config_id}/healthcheck/restarts")
+    async def _get_service_healthcheck_restarts(
+        service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+    ) -> JSONResponse:
+        """Get the health checker restart stats of a service."""
+        if not operate.service_manager().exists(service_config_id=service_config_id):
+            return service_not_found_error(service_config_id=service_config_id)
+
+        return JSONResponse(
+            content=health_checker.restarts.stats(service_config_id).json
+        )
 
     @service_router.get("/api/v2/service/{service_config_id}/achievements")
     async def _get_service_achievements(
@@ -1550,28 +1914,38 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @service_router.get("/api/v2/service/{service_config_id}/agent_performance")
     async def _get_agent_performance(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+        request: Request,
     ) -> JSONResponse:
         """Get the service refill requirements."""
         if not operate.service_manager().exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
 
         return JSONResponse(
-            content=operate.service_manager()
-            .load(service_config_id=service_config_id)
-            .get_agent_performance()
+            content=await run_read(
+                request,
+                RequestExecutor.DISK,
+                lambda: operate.service_manager()
+                .load(service_config_id=service_config_id)
+                .get_agent_performance(),
+            )
         )
 
     @service_router.get("/api/v2/service/{service_config_id}/funding_requirements")
     async def _get_funding_requirements(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+        request: Request,
     ) -> JSONResponse:
         """Get the service refill requirements."""
         if not operate.service_manager().exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
 
         return JSONResponse(
-            content=operate.service_manager().funding_requirements(
-                service_config_id=service_config_id
+            content=await run_read(
+                request,
+                RequestExecutor.RPC,
+                lambda: operate.service_manager().funding_requirements(
+                    service_config_id=service_config_id
+                ),
             )
         )
 
@@ -1579,14 +1953,19 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @service_router.get("/api/v2/service/{service_config_id}/refill_requirements")
     async def _get_refill_requirements(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+        request: Request,
     ) -> JSONResponse:
         """Get the service refill requirements."""
         if not operate.service_manager().exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
 
         return JSONResponse(
-            content=operate.service_manager().refill_requirements(
-                service_config_id=service_config_id
+            content=await run_read(
+                request,
+                RequestExecutor.RPC,
+                lambda: operate.service_manager().refill_requirements(
+                    service_config_id=service_config_id
+                ),
             )
         )
 
@@ -1597,7 +1976,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             return USER_NOT_LOGGED_IN_ERROR
         template = await request.json()
         manager = operate.service_manager()
-        output = manager.create(service_template=template)
+        output = await run_in_executor(manager.create, service_template=template)
 
         return JSONResponse(content=output.json)
 
@@ -1610,7 +1989,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         if operate.password is None:
             return USER_NOT_LOGGED_IN_ERROR
 
-        pause_all_services()
+        await run_in_executor(pause_all_services)
         manager = operate.service_manager()
 
         if not manager.exists(service_config_id=service_config_id):
@@ -1683,15 +2062,74 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             f"_update_service {partial_update=} {allow_different_service_public_id=}"
         )
 
-        output = manager.update(
+        output = await run_in_executor(
+            manager.update,
             service_config_id=service_config_id,
             service_template=template,
             allow_different_service_public_id=allow_different_service_public_id,
             partial_update=partial_update,
+            resource=service_resource(service_config_id),
         )
 
         return JSONResponse(content=output.json)
 
+    @service_router.put("/api/v2/service/{service_config_id}/deployment")
+    @service_router.patch("/api/v2/service/{service_config_id}/deployment")
+    async def _update_service_deployment(
+        service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+        request: Request,
+    ) -> JSONResponse:
+        """Update a service, swapping its running deployment for an updated one."""
+        if operate.password is None:
+            return USER_NOT_LOGGED_IN_ERROR
+
+        manager = operate.service_manager()
+
+        if not manager.exists(service_config_id=service_config_id):
+            return service_not_found_error(service_config_id=service_config_id)
+
+        template = await request.json()
+        allow_different_service_public_id = template.get(
+            "allow_different_service_public_id", False
+        )
+        partial_update = request.method != "PUT"
+
+        logger.info(
+            f"_update_service_deployment {partial_update=} {allow_different_service_public_id=}"
+        )
+
+        # the agent is restarted in the swap; probes would count it as unhealthy
+        health_checker.stop_for_service(service_config_id=service_config_id)
+        try:
+            output = await run_in_executor(
+                manager.update_service_locally,
+                service_config_id=service_config_id,
+                service_template=template,
+                allow_different_service_public_id=allow_different_service_public_id,
+                partial_update=partial_update,
+                resource=service_resource(service_config_id),
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Deployment update failed: {e}\n{traceback.format_exc()}")
+            return JSONResponse(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                content={
+                    "error": "Failed to update the service deployment. Please check the logs."
+                },
+            )
+        finally:
+            # after a rollback the previous deployment runs again
+            try:
+                service = manager.load(service_config_id=service_config_id)
+                if service.deployment.status == DeploymentStatus.DEPLOYED:
+                    schedule_healthcheck_job(service_config_id=service_config_id)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(
+                    f"Could not resume the health checks of {service_config_id}: {e}"
+                )
+
+        return JSONResponse(content=output.json)
+
     @service_router.post("/api/v2/service/{service_config_id}/deployment/stop")
     async def _stop_service_locally(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
@@ -1737,7 +2175,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                 status_code=HTTPStatus.BAD_REQUEST,
             )
 
-        try:
+        def _fn() -> None:
             pause_all_services()
             service = service_manager.load(service_config_id=service_config_id)
 
@@ -1780,6 +2218,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                     from_safe=False,
                     rpc=chain_config.ledger_config.rpc,
                 )
+
+        try:
+            await run_in_executor(_fn)
         except InsufficientFundsException as e:
             logger.error(
                 f"Withdrawal failed. Insufficient funds: {e}\n{traceback.format_exc()}"
@@ -1815,7 +2256,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         if not service_manager.exists(service_config_id=service_config_id):
             return service_not_found_error(service_config_id=service_config_id)
 
-        try:
+        def _fn() -> None:
             pause_all_services()
             service = service_manager.load(service_config_id=service_config_id)
             for chain in service.chain_configs:
@@ -1831,6 +2272,8 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                     withdrawal_address=master_safe,
                 )
 
+        try:
+            await run_in_executor(_fn)
         except InsufficientFundsException as e:
             logger.error(
                 f"Failed to terminate service and withdraw funds. Insufficient funds: {e}\n{traceback.format_exc()}"
@@ -1863,6 +2306,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @service_router.get("/api/v2/service/{service_config_id}/safe_withdrawable_balance")
     async def _safe_withdrawable_balance(
         service_config_id: Annotated[str, FastApiPath(pattern=SAFE_ID_PATTERN)],
+        request: Request,
     ) -> JSONResponse:
         """Return per-chain, per-token withdrawable balances for the Agent Safe."""
 
@@ -1890,7 +2334,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                     )
                 return balances
 
-            result = await run_in_executor(_get_balances)
+            result = await run_read(request, RequestExecutor.RPC, _get_balances)
         except Exception as e:  # pylint: disable=broad-except
             logger.error(
                 f"Failed to get withdrawable balance: {e}\n{traceback.format_exc()}"
@@ -1958,7 +2402,8 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                         operate.funding_manager.partial_withdraw_service_safe(
                             service=_svc, amounts=_amounts, chain=_chain
                         )
-                    )
+                    ),
+                    resource=service_resource(service_config_id),
                 )
                 succeeded_chains.append(chain_str)
 
@@ -2022,7 +2467,8 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
 
         try:
             data = await request.json()
-            service_manager.fund_service(
+            await run_in_executor(
+                service_manager.fund_service,
                 service_config_id=service_config_id,
                 amounts=ChainAmounts(
                     {
@@ -2035,6 +2481,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                         for chain_str, addresses in data.items()
                     }
                 ),
+                resource=MASTER_WALLET_RESOURCE,
             )
         except ValueError as e:
             logger.error(
@@ -2086,9 +2533,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
 
         try:
             data = await request.json()
-            output = operate.bridge_manager.bridge_refill_requirements(
+            output = await run_in_executor(
+                operate.bridge_manager.bridge_refill_requirements,
                 requests_params=data["bridge_requests"],
                 force_update=data.get("force_update", False),
+                pool=RequestExecutor.RPC,
             )
 
             return JSONResponse(
@@ -2120,7 +2569,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
 
         try:
             data = await request.json()
-            output = operate.bridge_manager.execute_bundle(bundle_id=data["id"])
+            output = await run_in_executor(
+                operate.bridge_manager.execute_bundle,
+                bundle_id=data["id"],
+                resource=MASTER_WALLET_RESOURCE,
+            )
 
             return JSONResponse(
                 content=output,
@@ -2158,6 +2611,42 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         content = {"id": operate.bridge_manager.last_executed_bundle_id()}
         return JSONResponse(content=content, status_code=HTTPStatus.OK)
 
+    @app.get("/api/bridge/history")
+    async def _bridge_history(request: Request) -> JSONResponse:
+        """Get the paginated history of executed bridge bundles."""
+        try:
+            output = await run_read(
+                request,
+                RequestExecutor.DISK,
+                lambda: operate.bridge_manager.get_history(
+                    offset=int(request.query_params.get("offset", 0)),
+                    limit=int(
+                        request.query_params.get("limit", DEFAULT_HISTORY_PAGE_SIZE)
+                    ),
+                    status=request.query_params.get("status"),
+                    chain=request.query_params.get("chain"),
+                ),
+            )
+
+            return JSONResponse(
+                content=output,
+                status_code=HTTPStatus.OK,
+            )
+        except ValueError as e:
+            logger.error(f"Bridge history error: {e}")
+            return JSONResponse(
+                content={"error": "Invalid pagination parameters."},
+                status_code=HTTPStatus.BAD_REQUEST,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Bridge history error: {e}\n{traceback.format_exc()}")
+            return JSONResponse(
+                content={
+                    "error": "Failed to get bridge history. Please check the logs."
+                },
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+
     @app.get("/api/bridge/status/{id}")
     async def _bridge_status(request: Request) -> JSONResponse:
         """Get bridge transaction status."""
@@ -2165,7 +2654,13 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         quote_bundle_id = request.path_params["id"]
 
         try:
-            output = operate.bridge_manager.get_status_json(bundle_id=quote_bundle_id)
+            output = await run_read(
+                request,
+                RequestExecutor.RPC,
+                lambda: operate.bridge_manager.get_status_json(
+                    bundle_id=quote_bundle_id
+                ),
+            )
 
             return JSONResponse(
                 content=output,
@@ -2207,8 +2702,10 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             )
 
         try:
-            output = operate.wallet_recovery_manager.prepare_recovery(
-                new_password=new_password
+            output = await run_in_executor(
+                operate.wallet_recovery_manager.prepare_recovery,
+                new_password=new_password,
+                resource=MASTER_WALLET_RESOURCE,
             )
             return JSONResponse(
                 content=output,
@@ -2232,7 +2729,11 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         """Get recovery funding requirements."""
 
         try:
-            output = operate.wallet_recovery_manager.recovery_requirements()
+            output = await run_read(
+                request,
+                RequestExecutor.RPC,
+                operate.wallet_recovery_manager.recovery_requirements,
+            )
             return JSONResponse(
                 content=output,
                 status_code=HTTPStatus.OK,
@@ -2253,7 +2754,9 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         """Get recovery status."""
 
         try:
-            output = operate.wallet_recovery_manager.status()
+            output = await run_read(
+                request, RequestExecutor.RPC, operate.wallet_recovery_manager.status
+            )
             return JSONResponse(
                 content=output,
                 status_code=HTTPStatus.OK,
@@ -2285,8 +2788,10 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
         raise_if_inconsistent_owners = data.get("require_consistent_owners", True)
 
         try:
-            operate.wallet_recovery_manager.complete_recovery(
+            await run_in_executor(
+                operate.wallet_recovery_manager.complete_recovery,
                 raise_if_inconsistent_owners=raise_if_inconsistent_owners,
+                resource=MASTER_WALLET_RESOURCE,
             )
             return JSONResponse(
                 content=operate.wallet_manager.json,
@@ -2317,16 +2822,10 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     # Fund recovery endpoints (unauthenticated — user has no Pearl account)
     # ---------------------------------------------------------------------------
 
-    @app.post("/api/fund_recovery/scan")
-    async def _fund_recovery_scan(request: Request) -> JSONResponse:
-        """Scan for on-chain funds recoverable from a BIP-39 mnemonic.
-
-        This endpoint is intentionally unauthenticated: the user has lost their
-        .operate folder and has no Pearl account on this device.
-
-        Security: the mnemonic is NEVER logged, persisted, or transmitted beyond
-        the lifetime of this request.
-        """
+    async def _parse_fund_recovery_scan_request(
+        request: Request,
+    ) -> t.Union[str, JSONResponse]:
+        """Return the normalized mnemonic of a scan request, or an error response."""
         try:
             data = await request.json()
             req = FundRecoveryScanRequest(**data)
@@ -2352,10 +2851,27 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
                 content={"error": "Invalid mnemonic"},
                 status_code=HTTPStatus.BAD_REQUEST,
             )
+        return mnemonic
+
+    @app.post("/api/fund_recovery/scan")
+    async def _fund_recovery_scan(request: Request) -> JSONResponse:
+        """Scan for on-chain funds recoverable from a BIP-39 mnemonic.
+
+        This endpoint is intentionally unauthenticated: the user has lost their
+        .operate folder and has no Pearl account on this device.
+
+        Security: the mnemonic is NEVER logged, persisted, or transmitted beyond
+        the lifetime of this request.
+        """
+        mnemonic = await _parse_fund_recovery_scan_request(request)
+        if isinstance(mnemonic, JSONResponse):
+            return mnemonic
 
         try:
             manager = FundRecoveryManager()
-            result = await run_in_executor(manager.scan, mnemonic)
+            result = await run_in_executor(
+                manager.scan, mnemonic, pool=RequestExecutor.RPC
+            )
             return JSONResponse(content=result.model_dump(), status_code=HTTPStatus.OK)
         except Exception as e:  # pylint: disable=broad-except
             # Log only the exception message — never the traceback, which may
@@ -2371,6 +2887,49 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             mnemonic = ""
             del mnemonic
 
+    @app.post("/api/fund_recovery/scan/stream")
+    async def _fund_recovery_scan_stream(request: Request) -> Response:
+        """Stream the fund recovery scan as newline-delimited JSON.
+
+        Emits one ``{"event": "chain", ...}`` line per chain as soon as it
+        completes (with ``"error": "timeout"`` for chains that did not finish
+        in time), then a final ``{"event": "summary", ...}`` line with the same
+        body as ``/api/fund_recovery/scan``.  A failure mid-scan is reported as
+        an ``{"event": "error"}`` line.
+
+        Security: as for ``/api/fund_recovery/scan``, the mnemonic is never
+        logged or persisted and is dropped once the stream ends.
+        """
+        mnemonic = await _parse_fund_recovery_scan_request(request)
+        if isinstance(mnemonic, JSONResponse):
+            return mnemonic
+
+        def _events(mnemonic: str) -> t.Iterator[str]:
+            events = FundRecoveryManager().scan_stream(
+                mnemonic, timeout=FUND_RECOVERY_SCAN_TIMEOUT
+            )
+            mnemonic = ""
+            try:
+                for event in events:
+                    kind = (
+                        "summary"
+                        if isinstance(event, FundRecoveryScanResponse)
+                        else "chain"
+                    )
+                    yield json.dumps({"event": kind, **event.model_dump()}) + "\n"
+            except Exception as e:  # pylint: disable=broad-except
+                # Never log the traceback (see _fund_recovery_scan).
+                logger.error(f"fund_recovery_scan_stream error: {e}")
+                yield json.dumps(
+                    {
+                        "event": "error",
+                        "error": "Fund recovery scan failed. Please check the logs.",
+                    }
+                ) + "\n"
+
+        # The generator is iterated in a worker thread by StreamingResponse.
+        return StreamingResponse(_events(mnemonic), media_type="application/x-ndjson")
+
     @app.post("/api/fund_recovery/execute")
     async def _fund_recovery_execute(request: Request) -> JSONResponse:
         """Execute the full fund recovery sequence from a BIP-39 mnemonic.
@@ -2637,6 +3196,13 @@ def qs_reset_password(
     reset_password(operate=operate)
 
 
+@_operate.command(name="gc")
+def _gc() -> None:
+    """Remove the downloaded agent assets no service uses any more."""
+    removed = AgentAssetStore(OPERATE_HOME.resolve() / AGENT_ASSETS_DIR).gc()
+    logger.info(f"Removed {len(removed)} unused agent asset(s).")
+
+
 @_operate.command(name="analyse-logs")
 def qs_analyse_logs(  # pylint: disable=too-many-arguments
     config: Annotated[str, params.String(help="Quickstart config file path")],
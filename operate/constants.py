@@ -30,6 +30,9 @@ KEYS_DIR = "keys"
 WALLETS_DIR = "wallets"
 WALLET_RECOVERY_DIR = "wallet_recovery"
 DEPLOYMENT_DIR = "deployment"
+DEPLOYMENT_STAGING_DIR = "deployment.staging"
+DEPLOYMENT_PREVIOUS_DIR = "deployment.previous"
+SERVICE_BACKUP_DIR = ".update_backup"
 DEPLOYMENT_JSON = "deployment.json"
 CONFIG_JSON = "config.json"
 USER_JSON = "user.json"
@@ -39,6 +42,10 @@ PEARL_STORE_JSON = "pearl_store.json"
 VERSION_FILE = "operate.version"
 SETTINGS_JSON = "settings.json"
 FUNDING_REQUIREMENTS_JSON = "funding_requirements.json"
+BLOCK_INDEX_DIR = "block_index"
+AGENT_ASSETS_DIR = "agent_assets"
+VENV_TEMPLATES_DIR = "venv_templates"
+LOG_SCAN_CHECKPOINTS_JSON = "log_scan_checkpoints.json"
 DEFAULT_TOPUP_THRESHOLD = 0.5
 
 MASTER_EOA_PLACEHOLDER = "master_eoa"
@@ -20,15 +20,21 @@
 """Ledger helpers."""
 
 import os
+import time
 import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
+from dataclasses import dataclass, field
 from math import ceil
+from urllib.parse import urlparse
 
 from aea.crypto.base import LedgerApi
 from aea.crypto.registries import make_ledger_api
 from aea_ledger_ethereum import DEFAULT_GAS_PRICE_STRATEGIES, EIP1559, GWEI, to_wei
 
 from operate.operate_types import Chain
+from operate.utils.metrics import RPC_REQUESTS, RPC_REQUEST_DURATION
 
 CHAINS = [
     Chain.ARBITRUM_ONE,
@@ -112,6 +118,32 @@ def get_currency_smallest_unit(chain: Chain) -> str:
 DEFAULT_LEDGER_APIS: t.Dict[Chain, LedgerApi] = {}
 
 
+def instrument_rpc_provider(provider: t.Any, chain: Chain, rpc: str) -> None:
+    """Count and time the JSON-RPC requests sent through a web3 provider.
+
+    The endpoint is labelled by host only, as RPC URLs may embed API keys.
+    Must be called before the first request, as web3 caches the request
+    function of the provider.
+    """
+    make_request = provider.make_request
+    endpoint = urlparse(rpc).hostname or "unknown"
+
+    def _make_request(method: str, params: t.Any) -> t.Any:
+        start = time.perf_counter()
+        outcome = "exception"
+        try:
+            response = make_request(method, params)
+            outcome = "error" if "error" in response else "ok"
+            return response
+        finally:
+            RPC_REQUEST_DURATION.observe(
+                time.perf_counter() - start, chain.value, endpoint, method
+            )
+            RPC_REQUESTS.inc(chain.value, endpoint, method, outcome)
+
+    provider.make_request = _make_request
+
+
 def make_chain_ledger_api(
     chain: Chain,
     rpc: t.Optional[str] = None,
@@ -131,13 +163,15 @@ def make_chain_ledger_api(
             6000, GWEI
         )
 
+    rpc = rpc or get_default_rpc(chain=chain)
     ledger_api = make_ledger_api(
         chain.ledger_type.name.lower(),
-        address=rpc or get_default_rpc(chain=chain),
+        address=rpc,
         chain_id=chain.id,
         gas_price_strategies=gas_price_strategies,
         poa_chain=chain in (Chain.OPTIMISM, Chain.POLYGON),
     )
+    instrument_rpc_provider(ledger_api.api.provider, chain=chain, rpc=rpc)
 
     return ledger_api
 
@@ -176,6 +210,54 @@ def is_gas_spike_error(err: str) -> bool:
     )
 
 
+@dataclass
+class GasPricingSnapshot:
+    """Gas pricing fetched once per chain and shared within a scope."""
+
+    pricing: t.Dict[t.Any, t.Dict] = field(default_factory=dict)
+    fetches: int = 0
+    reuses: int = 0
+
+    def get(self, ledger_api: LedgerApi) -> t.Optional[t.Dict]:
+        """Get the gas pricing for the ledger's chain, fetching it at most once."""
+        key = getattr(ledger_api, "_chain_id", None) or id(ledger_api)
+        if key in self.pricing:
+            self.reuses += 1
+            return dict(self.pricing[key])
+
+        self.fetches += 1
+        gas_pricing = ledger_api.try_get_gas_pricing()
+        if gas_pricing is not None:
+            self.pricing[key] = dict(gas_pricing)
+        return gas_pricing
+
+
+_GAS_PRICING_SNAPSHOT: ContextVar[t.Optional[GasPricingSnapshot]] = ContextVar(
+    "gas_pricing_snapshot", default=None
+)
+
+
+@contextmanager
+def gas_pricing_snapshot() -> t.Generator[GasPricingSnapshot, None, None]:
+    """Share a single gas pricing fetch per chain across the enclosed block.
+
+    Only use it around read-only computations (e.g. requirements); transactions
+    that are actually sent must be priced outside of a snapshot. Nested scopes
+    reuse the outermost snapshot.
+    """
+    snapshot = _GAS_PRICING_SNAPSHOT.get()
+    if snapshot is not None:
+        yield snapshot
+        return
+
+    snapshot = GasPricingSnapshot()
+    token = _GAS_PRICING_SNAPSHOT.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _GAS_PRICING_SNAPSHOT.reset(token)
+
+
 # TODO backport to open aea/autonomy
 # TODO This gas pricing management should be done at a lower level in the library
 def update_tx_with_gas_pricing(tx: t.Dict, ledger_api: LedgerApi) -> None:
@@ -184,7 +266,11 @@ def update_tx_with_gas_pricing(tx: t.Dict, ledger_api: LedgerApi) -> None:
     tx.pop("gasPrice", None)
     tx.pop("maxPriorityFeePerGas", None)
 
-    gas_pricing = ledger_api.try_get_gas_pricing()
+    snapshot = _GAS_PRICING_SNAPSHOT.get()
+    if snapshot is not None:
+        gas_pricing = snapshot.get(ledger_api)
+    else:
+        gas_pricing = ledger_api.try_get_gas_pricing()
     if gas_pricing is None:
         raise RuntimeError("Unable to retrieve gas pricing.")
 
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Discovery of the block range in which an address was active.
+
+For contracts (e.g. Safes) the range goes from the deployment block to the
+block of the last ``nonce()`` increment; for EOAs, from the first to the last
+outgoing transaction. Each boundary is located with a k-ary search that probes
+several historical blocks concurrently, so a search over ``N`` blocks takes
+``log_k(N)`` round trips instead of ``log_2(N)``.
+
+Historical state queries need an archive node. If ``<CHAIN>_ARCHIVE_RPC`` is
+set (e.g. ``GNOSIS_ARCHIVE_RPC``) it is used for the probes; otherwise the
+default RPC is used. Probes that keep failing raise
+:class:`ActivityDiscoveryError` instead of being mistaken for "not deployed".
+"""
+
+import os
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from eth_typing import ChecksumAddress, HexStr
+from web3 import Web3
+
+from operate.operate_types import Chain
+
+#: Number of sub-intervals per search round (``SEARCH_ARITY - 1`` probes).
+SEARCH_ARITY = 8
+
+#: Attempts per probe before the search is aborted.
+PROBE_ATTEMPTS = 3
+
+#: Delay between probe attempts (seconds).
+PROBE_RETRY_DELAY = 0.5
+
+#: Selector of the Safe ``nonce()`` function.
+NONCE_SELECTOR = HexStr("0xaffed0e0")
+
+T = t.TypeVar("T")
+
+
+class ActivityDiscoveryError(RuntimeError):
+    """Raised when the RPC cannot answer the historical queries."""
+
+
+@dataclass(frozen=True)
+class AddressActivity:
+    """Block range in which an address was active."""
+
+    is_contract: bool
+    first_block: int
+    last_block: int
+    nonce: int
+    head_block: int
+
+
+def get_archive_rpc(chain: Chain) -> t.Optional[str]:
+    """Get the archive RPC configured for `chain`, if any."""
+    return os.environ.get(f"{chain.name}_ARCHIVE_RPC") or None
+
+
+def get_archive_w3(chain: Chain, w3: Web3) -> Web3:
+    """Get a Web3 instance backed by the archive RPC, or `w3` if none is set."""
+    rpc = get_archive_rpc(chain)
+    if rpc is None:
+        return w3
+    return Web3(Web3.HTTPProvider(rpc))
+
+
+def _probe(fn: t.Callable[[int], T], block: int) -> T:
+    """Evaluate `fn(block)`, retrying transient failures."""
+    for attempt in range(PROBE_ATTEMPTS):
+        try:
+            return fn(block)
+        except Exception as e:  # pylint: disable=broad-except
+            if attempt == PROBE_ATTEMPTS - 1:
+                raise ActivityDiscoveryError(
+                    f"Historical query at block {block} failed: {e}"
+                ) from e
+            time.sleep(PROBE_RETRY_DELAY)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def kary_search(
+    fn: t.Callable[[int], bool],
+    low: int,
+    high: int,
+    arity: int = SEARCH_ARITY,
+    executor: t.Optional[ThreadPoolExecutor] = None,
+) -> int:
+    """Return the smallest block in ``[low, high]`` for which `fn` holds.
+
+    `fn` must be monotonic (false, ..., false, true, ..., true) and is assumed
+    to hold at `high`. Each round probes up to ``arity - 1`` blocks concurrently.
+    """
+    own_executor = executor is None
+    pool = executor or ThreadPoolExecutor(max_workers=arity - 1)
+    try:
+        while low < high:
+            span = high - low
+            points = sorted({low + span * i // arity for i in range(1, arity)})
+            results = list(pool.map(lambda block: _probe(fn, block), points))
+            next_low, next_high = low, high
+            for block, result in zip(points, results):
+                if result:
+                    next_high = block
+                    break
+                next_low = block + 1
+            low, high = next_low, next_high
+        return low
+    finally:
+        if own_executor:
+            pool.shutdown(wait=False)
+
+
+class AddressActivityDiscovery:
+    """Finds (and caches) the active block range of addresses."""
+
+    def __init__(self, arity: int = SEARCH_ARITY) -> None:
+        """Initialize the discovery component."""
+        self.arity = arity
+        self._cache: t.Dict[t.Tuple[int, ChecksumAddress], AddressActivity] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _has_code(w3: Web3, address: ChecksumAddress, block: int) -> bool:
+        """Whether `address` has contract code at `block`."""
+        return len(w3.eth.get_code(address, block_identifier=block)) > 0
+
+    @staticmethod
+    def _nonce(
+        w3: Web3, address: ChecksumAddress, is_contract: bool, block: int
+    ) -> int:
+        """Safe nonce (contracts) or transaction count (EOAs) at `block`."""
+        if is_contract:
+            res = w3.eth.call(
+                {"to": address, "data": NONCE_SELECTOR}, block_identifier=block
+            )
+            return int.from_bytes(res, "big") if res else 0
+        return int(w3.eth.get_transaction_count(address, block_identifier=block))
+
+    def discover(
+        self,
+        w3: Web3,
+        address: str,
+        chain: t.Optional[Chain] = None,
+        head_block: t.Optional[int] = None,
+    ) -> t.Optional[AddressActivity]:
+        """Return the active range of `address`, or None if it never was active.
+
+        Results are cached per (chain, address); later calls only search the
+        blocks added since the cached head.
+        """
+        archive_w3 = get_archive_w3(chain, w3) if chain is not None else w3
+        if head_block is None or archive_w3 is not w3:
+            # The archive node may lag behind the default RPC.
+            archive_head = int(archive_w3.eth.block_number)
+            head_block = min(head_block or archive_head, archive_head)
+        w3, head = archive_w3, head_block
+        checksum_address = Web3.to_checksum_address(address)
+        key = (chain.id if chain is not None else 0, checksum_address)
+
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached.head_block >= head:
+            return cached
+
+        with ThreadPoolExecutor(max_workers=self.arity - 1) as pool:
+            activity = self._discover(w3, checksum_address, head, cached, pool)
+
+        if activity is not None and chain is not None:
+            with self._lock:
+                self._cache[key] = activity
+        return activity
+
+    def _discover(
+        self,
+        w3: Web3,
+        address: ChecksumAddress,
+        head: int,
+        cached: t.Optional[AddressActivity],
+        pool: ThreadPoolExecutor,
+    ) -> t.Optional[AddressActivity]:
+        """Search implementation for `discover`."""
+        if cached is not None:
+            is_contract = cached.is_contract
+            first_block = cached.first_block
+            search_from = cached.last_block
+        else:
+            is_contract = _probe(lambda b: self._has_code(w3, address, b), head)
+            first_block = 0
+            search_from = 0
+
+        nonce = _probe(lambda b: self._nonce(w3, address, is_contract, b), head)
+
+        if cached is None:
+            if is_contract:
+                first_block = kary_search(
+                    lambda b: self._has_code(w3, address, b),
+                    0,
+                    head,
+                    self.arity,
+                    pool,
+                )
+            elif nonce == 0:
+                return None
+            else:
+                first_block = kary_search(
+                    lambda b: self._nonce(w3, address, False, b) > 0,
+                    0,
+                    head,
+                    self.arity,
+                    pool,
+                )
+            search_from = first_block
+
+        if cached is not None and nonce == cached.nonce:
+            last_block = cached.last_block
+        elif nonce == 0:
+            last_block = first_block
+        else:
+            last_block = kary_search(
+                lambda b: self._nonce(w3, address, is_contract, b) >= nonce,
+                search_from,
+                head,
+                self.arity,
+                pool,
+            )
+
+        return AddressActivity(
+            is_contract=is_contract,
+            first_block=first_block,
+            last_block=last_block,
+            nonce=nonce,
+            head_block=head,
+        )
+
+
+#: Shared discovery instance (results cached for the lifetime of the process).
+ADDRESS_ACTIVITY_DISCOVERY = AddressActivityDiscovery()
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Per-chain block timestamp index.
+
+Keeps a sparse, sorted table of ``(block, timestamp)`` samples per chain so
+that timestamp-to-block lookups can interpolate between known points instead
+of bisecting the full chain height with one RPC per probe. Every block fetched
+during a lookup is recorded, so repeated lookups in the same region are
+resolved almost entirely from the table. Tables are written to disk at most
+once per ``STORE_INTERVAL``, and on shutdown.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from web3 import Web3
+
+from operate.operate_types import Chain
+from operate.utils import safe_file_operation
+
+logger = logging.getLogger(__name__)
+
+#: Approximate average block time (seconds) used to seed the first probe.
+AVERAGE_BLOCK_TIMES: t.Dict[Chain, float] = {
+    Chain.ARBITRUM_ONE: 0.25,
+    Chain.BASE: 2.0,
+    Chain.CELO: 1.0,
+    Chain.ETHEREUM: 12.0,
+    Chain.GNOSIS: 5.0,
+    Chain.MODE: 2.0,
+    Chain.OPTIMISM: 2.0,
+    Chain.POLYGON: 2.0,
+}
+
+#: Maximum number of samples kept per chain before the table is thinned.
+MAX_SAMPLES = 4096
+
+#: Number of consecutive interpolation probes allowed to shrink the search
+#: interval by less than half before falling back to a bisection step.
+MAX_SLOW_STEPS = 2
+
+#: Minimum number of seconds between two writes of a table to disk; every
+#: lookup records the chain head, so writing on each one would rewrite the
+#: file on every call.
+STORE_INTERVAL = 60.0
+
+
+class BlockTimestampIndex:  # pylint: disable=too-many-instance-attributes
+    """Sparse (block, timestamp) sample table for a single chain."""
+
+    def __init__(
+        self,
+        chain_id: int,
+        path: t.Optional[Path] = None,
+        average_block_time: t.Optional[float] = None,
+    ) -> None:
+        """Initialize the index."""
+        self.chain_id = chain_id
+        self.path = path
+        self.average_block_time = average_block_time
+        self._lock = threading.Lock()
+        self._blocks: t.List[int] = []
+        self._timestamps: t.Dict[int, int] = {}
+        self._dirty = False
+        self._stored_at: t.Optional[float] = None
+        self.rpc_calls = 0
+        if path is not None and path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        """Number of samples in the index."""
+        return len(self._blocks)
+
+    def _load(self) -> None:
+        """Load samples from disk, ignoring unreadable files."""
+        try:
+            data = json.loads(t.cast(Path, self.path).read_text(encoding="utf-8"))
+            for block, timestamp in data.get("samples", []):
+                self._insert(int(block), int(timestamp))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable block index {self.path}: {e}")
+            self._blocks = []
+            self._timestamps = {}
+        self._dirty = False
+
+    def store(self, force: bool = False) -> None:
+        """Persist samples to disk (no-op if nothing changed or no path set).
+
+        Unless `force` is set, nothing is written within ``STORE_INTERVAL``
+        seconds of the previous write; the changes are kept for the next one.
+        """
+        if self.path is None:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            if (
+                not force
+                and self._stored_at is not None
+                and time.monotonic() - self._stored_at < STORE_INTERVAL
+            ):
+                return
+            samples = [[block, self._timestamps[block]] for block in self._blocks]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.parent / f".{self.path.name}.tmp"
+            tmp_path.write_text(
+                json.dumps({"chain_id": self.chain_id, "samples": samples}),
+                encoding="utf-8",
+            )
+            safe_file_operation(os.replace, tmp_path, self.path)
+            self._dirty = False
+            self._stored_at = time.monotonic()
+
+    def _insert(self, block: int, timestamp: int) -> None:
+        """Insert a sample (caller must hold the lock or own the instance)."""
+        if block in self._timestamps:
+            return
+        bisect.insort(self._blocks, block)
+        self._timestamps[block] = timestamp
+        self._dirty = True
+        if len(self._blocks) > MAX_SAMPLES:
+            # Keep the endpoints and every other sample in between.
+            kept = self._blocks[:1] + self._blocks[1:-1:2] + self._blocks[-1:]
+            self._timestamps = {b: self._timestamps[b] for b in kept}
+            self._blocks = kept
+
+    def record(self, block: int, timestamp: int) -> None:
+        """Record a known (block, timestamp) pair."""
+        with self._lock:
+            self._insert(block, timestamp)
+
+    def get_timestamp(self, w3: Web3, block: int) -> int:
+        """Return the timestamp of `block`, fetching it only if unknown."""
+        with self._lock:
+            timestamp = self._timestamps.get(block)
+        if timestamp is not None:
+            return timestamp
+
+        self.rpc_calls += 1
+        timestamp = int(w3.eth.get_block(block)["timestamp"])
+        self.record(block, timestamp)
+        return timestamp
+
+    def _bracket(self, timestamp: int, latest: int) -> t.Tuple[int, int]:
+        """Return the tightest known samples `lo < hi` around `timestamp`.
+
+        The latest block must already be indexed with a timestamp not below
+        `timestamp`, so the scan always stops at or before it.
+        """
+        with self._lock:
+            lo, hi = 0, latest
+            for block in self._blocks:
+                if self._timestamps[block] < timestamp:
+                    lo = block
+                else:
+                    hi = block
+                    break
+        return lo, hi
+
+    def find_block_before_timestamp(self, w3: Web3, timestamp: int) -> int:
+        """Return the largest block whose timestamp is strictly below `timestamp`.
+
+        Returns ``0`` if no such block exists.
+        """
+        try:
+            return self._find_block_before_timestamp(w3, timestamp)
+        finally:
+            self.store()
+
+    def _find_block_before_timestamp(self, w3: Web3, timestamp: int) -> int:
+        """Search implementation for `find_block_before_timestamp`."""
+        latest = int(w3.eth.block_number)
+        self.rpc_calls += 1
+        latest_ts = self.get_timestamp(w3, latest)
+        if latest_ts < timestamp:
+            return latest
+
+        lo, hi = self._bracket(timestamp, latest)
+        lo_ts = self.get_timestamp(w3, lo)
+        if lo_ts >= timestamp:
+            return 0
+        hi_ts = self.get_timestamp(w3, hi)
+
+        # Seed the first probe from the average block time, counting back
+        # from the upper bound; later probes interpolate between samples.
+        guess: t.Optional[int] = None
+        if self.average_block_time:
+            guess = hi - int((hi_ts - timestamp) / self.average_block_time) - 1
+
+        slow_steps = 0
+        while hi - lo > 1:
+            span = hi - lo
+            if guess is None:
+                if slow_steps >= MAX_SLOW_STEPS:
+                    guess = (lo + hi) // 2
+                    slow_steps = 0
+                else:
+                    guess = lo + int((timestamp - lo_ts) * span / (hi_ts - lo_ts))
+            mid = min(max(guess, lo + 1), hi - 1)
+            guess = None
+
+            mid_ts = self.get_timestamp(w3, mid)
+            if mid_ts < timestamp:
+                lo, lo_ts = mid, mid_ts
+            else:
+                hi, hi_ts = mid, mid_ts
+
+            slow_steps = slow_steps + 1 if (hi - lo) * 2 > span else 0
+
+        return lo
+
+
+BLOCK_TIMESTAMP_INDEXES: t.Dict[int, BlockTimestampIndex] = {}
+_BLOCK_TIMESTAMP_INDEXES_LOCK = threading.Lock()
+_block_index_dir: t.Optional[Path] = None
+
+
+def set_block_index_dir(path: t.Optional[Path]) -> None:
+    """Set the directory where shared block indexes are persisted."""
+    global _block_index_dir  # pylint: disable=global-statement
+    store_block_indexes()
+    with _BLOCK_TIMESTAMP_INDEXES_LOCK:
+        _block_index_dir = path
+        BLOCK_TIMESTAMP_INDEXES.clear()
+
+
+def store_block_indexes() -> None:
+    """Write the pending samples of all shared block indexes to disk."""
+    with _BLOCK_TIMESTAMP_INDEXES_LOCK:
+        indexes = list(BLOCK_TIMESTAMP_INDEXES.values())
+    for index in indexes:
+        try:
+            index.store(force=True)
+        except OSError as e:
+            logger.warning(f"Failed to store block index {index.path}: {e}")
+
+
+def get_block_timestamp_index(chain: Chain) -> BlockTimestampIndex:
+    """Get the shared block timestamp index for `chain`."""
+    with _BLOCK_TIMESTAMP_INDEXES_LOCK:
+        if chain.id not in BLOCK_TIMESTAMP_INDEXES:
+            BLOCK_TIMESTAMP_INDEXES[chain.id] = BlockTimestampIndex(
+                chain_id=chain.id,
+                path=(
+                    _block_index_dir / f"{chain.value}.json"
+                    if _block_index_dir is not None
+                    else None
+                ),
+                average_block_time=AVERAGE_BLOCK_TIMES.get(chain),
+            )
+        return BLOCK_TIMESTAMP_INDEXES[chain.id]
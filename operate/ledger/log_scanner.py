@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Concurrent event-log scanner with adaptive chunk sizes and checkpoints.
+
+A block range is split into windows that are fetched by a bounded worker
+pool. The window size is adapted per RPC endpoint with an AIMD policy
+(additive increase on success, halving on failure), and failed windows are
+split and retried. Results can be checkpointed per (chain, address, topics)
+so that later scans of the same range only fetch the new blocks.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from web3 import Web3
+
+from operate.utils import safe_file_operation
+
+logger = logging.getLogger(__name__)
+
+#: Window size bounds (blocks) and AIMD additive step.
+MIN_CHUNK_SIZE = 1
+MAX_CHUNK_SIZE = 100_000
+CHUNK_SIZE_STEP = 10_000
+
+#: Concurrent ``eth_getLogs`` requests per scan.
+DEFAULT_MAX_WORKERS = 4
+
+Topics = t.List[t.Optional[str]]
+Window = t.Tuple[int, int]
+
+
+class ChunkSizer:
+    """AIMD window size for one RPC endpoint."""
+
+    def __init__(self, size: int = MAX_CHUNK_SIZE) -> None:
+        """Initialize the sizer."""
+        self._size = size
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Current window size."""
+        return self._size
+
+    def success(self) -> None:
+        """Grow the window additively."""
+        with self._lock:
+            self._size = min(MAX_CHUNK_SIZE, self._size + CHUNK_SIZE_STEP)
+
+    def failure(self) -> None:
+        """Shrink the window multiplicatively."""
+        with self._lock:
+            self._size = max(MIN_CHUNK_SIZE, self._size // 2)
+
+
+CHUNK_SIZERS: t.Dict[t.Any, ChunkSizer] = {}
+_CHUNK_SIZERS_LOCK = threading.Lock()
+
+
+def get_chunk_sizer(w3: Web3) -> ChunkSizer:
+    """Get the shared chunk sizer for the endpoint behind `w3`."""
+    key = getattr(w3.provider, "endpoint_uri", None) or id(w3)
+    with _CHUNK_SIZERS_LOCK:
+        if key not in CHUNK_SIZERS:
+            CHUNK_SIZERS[key] = ChunkSizer()
+        return CHUNK_SIZERS[key]
+
+
+class LogScanCheckpoints:
+    """Persisted scan results, keyed by (chain, address, topics)."""
+
+    def __init__(self, path: t.Optional[Path] = None) -> None:
+        """Initialize the store."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: t.Dict[str, t.Dict] = {}
+        if path is not None and path.exists():
+            try:
+                self._data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable log scan checkpoints {path}: {e}")
+
+    @staticmethod
+    def key(chain_id: int, address: str, topics: Topics) -> str:
+        """Checkpoint key for a scan."""
+        digest = hashlib.sha256(json.dumps(topics).encode()).hexdigest()[:16]
+        return f"{chain_id}:{address.lower()}:{digest}"
+
+    def get(self, key: str) -> t.Optional[t.Dict]:
+        """Get a checkpoint."""
+        with self._lock:
+            return self._data.get(key)
+
+    def put(self, key: str, checkpoint: t.Dict) -> None:
+        """Store a checkpoint."""
+        with self._lock:
+            self._data[key] = checkpoint
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.parent / f".{self.path.name}.tmp"
+            tmp_path.write_text(json.dumps(self._data), encoding="utf-8")
+            safe_file_operation(os.replace, tmp_path, self.path)
+
+
+LOG_SCAN_CHECKPOINTS = LogScanCheckpoints()
+
+
+def set_log_scan_checkpoints_path(path: t.Optional[Path]) -> None:
+    """Set the file where log scan checkpoints are persisted."""
+    global LOG_SCAN_CHECKPOINTS  # pylint: disable=global-statement
+    LOG_SCAN_CHECKPOINTS = LogScanCheckpoints(path)
+
+
+class LogScanner:
+    """Fetches logs over a block range with a bounded worker pool."""
+
+    def __init__(
+        self,
+        w3: Web3,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sizer: t.Optional[ChunkSizer] = None,
+    ) -> None:
+        """Initialize the scanner."""
+        self.w3 = w3
+        self.max_workers = max_workers
+        self.sizer = sizer or get_chunk_sizer(w3)
+
+    def _get_logs(self, address: str, topics: Topics, window: Window) -> t.List:
+        return self.w3.eth.get_logs(
+            {
+                "address": Web3.to_checksum_address(address),
+                "topics": topics,  # type: ignore[typeddict-item]
+                "fromBlock": window[0],
+                "toBlock": window[1],
+            }
+        )
+
+    def fetch(  # pylint: disable=too-many-locals
+        self,
+        address: str,
+        topics: Topics,
+        from_block: int,
+        to_block: int,
+    ) -> t.Tuple[t.List, int]:
+        """Fetch the logs in ``[from_block, to_block]``.
+
+        Returns the logs and the last block up to which the range was scanned
+        without gaps (windows that fail at the minimum size are skipped).
+        """
+        logs: t.List = []
+        failed: t.List[Window] = []
+        retry: t.Deque[Window] = deque()
+        cursor = from_block
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            in_flight: t.Dict[Future, Window] = {}
+            while cursor <= to_block or retry or in_flight:
+                while len(in_flight) < self.max_workers and (
+                    retry or cursor <= to_block
+                ):
+                    if retry:
+                        window = retry.popleft()
+                    else:
+                        window = (
+                            cursor,
+                            min(cursor + self.sizer.size - 1, to_block),
+                        )
+                        cursor = window[1] + 1
+                    future = pool.submit(self._get_logs, address, topics, window)
+                    in_flight[future] = window
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = in_flight.pop(future)
+                    try:
+                        logs.extend(future.result())
+                        self.sizer.success()
+                    except Exception as e:  # pylint: disable=broad-except
+                        self.sizer.failure()
+                        start, end = window
+                        if start == end:
+                            logger.warning(
+                                f"Log chunk [{start},{end}] failed at minimum size: {e}"
+                            )
+                            failed.append(window)
+                            continue
+                        mid = (start + end) // 2
+                        retry.extendleft([(mid + 1, end), (start, mid)])
+
+        scanned_through = min(failed)[0] - 1 if failed else to_block
+        return logs, scanned_through
+
+    def scan(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        address: str,
+        topics: Topics,
+        from_block: int,
+        to_block: int,
+        extract: t.Callable[[t.Any], t.Any],
+        chain_id: t.Optional[int] = None,
+    ) -> t.Set:
+        """Return the values extracted from the logs in ``[from_block, to_block]``.
+
+        With a `chain_id`, results are checkpointed and a later scan of the same
+        (chain, address, topics) only fetches blocks after the checkpoint.
+        """
+        key = (
+            LogScanCheckpoints.key(chain_id, address, topics)
+            if chain_id is not None
+            else None
+        )
+        checkpoint = LOG_SCAN_CHECKPOINTS.get(key) if key is not None else None
+        if checkpoint is not None and (
+            checkpoint["from_block"] <= from_block <= checkpoint["to_block"] + 1
+        ):
+            base_block = checkpoint["from_block"]
+            entries: t.List[t.List] = list(checkpoint["entries"])
+            start = checkpoint["to_block"] + 1
+        else:
+            base_block, entries, start = from_block, [], from_block
+
+        if start <= to_block:
+            logs, scanned_through = self.fetch(address, topics, start, to_block)
+            for log in logs:
+                value = extract(log)
+                if value is not None:
+                    entries.append([int(log.get("blockNumber", start)), value])
+            if key is not None and scanned_through >= start:
+                LOG_SCAN_CHECKPOINTS.put(
+                    key,
+                    {
+                        "from_block": base_block,
+                        "to_block": scanned_through,
+                        "entries": [e for e in entries if e[0] <= scanned_through],
+                    },
+                )
+
+        return {value for block, value in entries if from_block <= block <= to_block}
@@ -653,6 +653,25 @@ class FundRecoveryScanResponse(BaseModel):
     balances: ChainAmounts
     services: t.List[RecoveredServiceInfo]
     gas_warning: t.Dict[str, GasWarningEntry]
+    # chain id -> why the chain was not fully scanned
+    errors: t.Dict[str, str] = {}
+
+    @field_serializer("balances")
+    def serialize_balances(self, balances: ChainAmounts) -> dict:
+        """Serialize balances using ChainAmounts.json property."""
+        return balances.json
+
+
+class FundRecoveryChainScanResult(BaseModel):
+    """Scan result for a single chain, streamed by POST /api/fund_recovery/scan/stream."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    chain_id: str
+    balances: ChainAmounts
+    services: t.List[RecoveredServiceInfo]
+    gas_warning: GasWarningEntry
+    error: t.Optional[str] = None
 
     @field_serializer("balances")
     def serialize_balances(self, balances: ChainAmounts) -> dict:
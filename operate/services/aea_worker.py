@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Long-lived worker process running aea CLI commands."""
+
+import logging
+import multiprocessing
+import os
+import traceback
+import typing as t
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+# Exit code reported when the worker died or timed out without one
+WORKER_LOST_EXIT_CODE = -1
+
+
+def _serve_aea_commands(conn: Connection) -> None:  # pragma: no cover
+    """Worker main: run the aea commands received on `conn`, one at a time.
+
+    Each request is ``(cwd, args)`` and is answered with an exit code; ``None``
+    stops the worker.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from aea.cli.core import cli as call_aea
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        cwd, args = request
+        try:
+            os.chdir(cwd)
+            call_aea(  # pylint: disable=unexpected-keyword-arg, no-value-for-parameter
+                args, standalone_mode=False
+            )
+            exitcode = 0
+        except SystemExit as e:
+            exitcode = e.code if isinstance(e.code, int) else 1
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+            exitcode = 1
+        conn.send(exitcode)
+    conn.close()
+    # os._exit(0) is needed in case of run on linux with fork subprocess method
+    # it looks like aea+pyinstaller+multiprocess exit hooks issue on process stops
+    os._exit(0)  # pylint: disable=protected-access
+
+
+class AeaCommandWorker:
+    """Runs aea CLI commands in a child process that outlives each command.
+
+    The child imports the aea CLI once and then serves commands sequentially
+    over a pipe, so a deployment pays interpreter start-up and imports once
+    instead of once per command. Commands still run out of the daemon
+    process; a worker that dies or times out is killed and replaced by a
+    fresh one on the next command.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        """Initialize the worker; the process is started on first use."""
+        self.logger = logger
+        self._process: t.Optional[multiprocessing.Process] = None
+        self._conn: t.Optional[Connection] = None
+
+    def _ensure_started(self) -> Connection:
+        if self._process is not None and self._process.is_alive():
+            return t.cast(Connection, self._conn)
+        if self._process is not None:
+            self.logger.warning(
+                f"aea worker exited with code {self._process.exitcode}, starting a new one"
+            )
+            self._discard()
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_serve_aea_commands, args=(child_conn,), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+        return parent_conn
+
+    def run(
+        self, cwd: t.Union[str, Path], args: t.Sequence[str], timeout: float
+    ) -> int:
+        """Run an aea command and return its exit code."""
+        conn = self._ensure_started()
+        try:
+            conn.send((str(cwd), list(args)))
+            if conn.poll(timeout):
+                return conn.recv()
+            self.logger.error(f"aea command timed out after {timeout}s")
+        except (EOFError, OSError):
+            self.logger.error("aea worker died while running a command")
+        self._discard()
+        return WORKER_LOST_EXIT_CODE
+
+    def _discard(self) -> None:
+        """Kill the worker, if any."""
+        if self._conn is not None:
+            self._conn.close()
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.kill()
+            self._process.join()
+        self._process, self._conn = None, None
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the worker, killing it if it does not exit in time."""
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            try:
+                t.cast(Connection, self._conn).send(None)
+            except OSError:
+                pass
+            self._process.join(timeout)
+        self._discard()
@@ -19,25 +19,36 @@
 # -------------------------------------------------------------
 """Source code to download agent assets from GitHub releases."""
 
-import hashlib
 import json
 import os
 import platform
+import re
 import shutil
 import stat
 import sys
 import sysconfig
+import time
+import uuid
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from aea.configurations.data_types import PublicId
 from aea.helpers.logging import setup_logger
 
-from operate.constants import AGENT_RUNNER_PREFIX, CONFIG_JSON, DEFAULT_TIMEOUT
+from operate.constants import (
+    AGENT_ASSETS_DIR,
+    AGENT_RUNNER_PREFIX,
+    CONFIG_JSON,
+    DEFAULT_TIMEOUT,
+    SERVICES_DIR,
+)
+from operate.services.deploy_timings import deploy_timings
+from operate.utils.download import RangeDownloader, file_sha256
+
+SHA256_SIDECAR_SUFFIX = ".sha256.json"
 
 
 @dataclass
@@ -70,11 +81,133 @@ class AgentRelease:
         return file_url, file_hash
 
 
+class AgentAssetStore:
+    """Content-addressed store of agent release assets shared by all services.
+
+    Each asset is kept once, named after its sha256, and service directories
+    get hard links to it (or a copy where the file system cannot link). An
+    asset whose only link is the one in the store is not used by any service
+    and is removed by `gc`.
+    """
+
+    HASH_REGEX = re.compile(r"sha256:([0-9a-f]{64})")
+    TMP_DIR = "tmp"
+    # Seconds after which an untouched download in `TMP_DIR` is abandoned;
+    # younger ones may still be in progress, or resumed later.
+    TMP_MAX_AGE = 7 * 24 * 3600.0
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store; nothing is created until an asset is added."""
+        self.path = path
+
+    @classmethod
+    def is_valid_hash(cls, file_hash: str) -> bool:
+        """Whether `file_hash` can address an asset in the store."""
+        return cls.HASH_REGEX.fullmatch(file_hash) is not None
+
+    def asset_path(self, file_hash: str) -> Path:
+        """Path of the asset with the given hash."""
+        match = self.HASH_REGEX.fullmatch(file_hash)
+        if match is None:
+            raise ValueError(f"Not a sha256 hash: {file_hash}")
+        return self.path / match.group(1)
+
+    def has(self, file_hash: str) -> bool:
+        """Whether the asset with the given hash is in the store."""
+        return self.asset_path(file_hash).is_file()
+
+    def is_linked(self, file_hash: str, target_path: Path) -> bool:
+        """Whether `target_path` is a link to the asset with the given hash."""
+        try:
+            return os.path.samefile(self.asset_path(file_hash), target_path)
+        except OSError:
+            return False
+
+    def discard(self, file_hash: str) -> None:
+        """Remove the asset with the given hash from the store, if there."""
+        self.asset_path(file_hash).unlink(missing_ok=True)
+
+    def tmp_dir(self) -> Path:
+        """Directory for downloads, on the same file system as the store."""
+        tmp_dir = self.path / self.TMP_DIR
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return tmp_dir
+
+    def add(self, file_path: Path, file_hash: str, target_path: Path) -> None:
+        """Move a verified file into the store and link it at `target_path`."""
+        # link first, so that the asset is never in the store unreferenced
+        self._link(file_path, target_path)
+        os.replace(file_path, self.asset_path(file_hash))
+
+    def adopt(self, file_path: Path, file_hash: str) -> None:
+        """Share a verified file downloaded before the store existed.
+
+        The file is replaced by a link to the stored asset, or becomes the
+        stored asset if there is none yet.
+        """
+        if self.has(file_hash):
+            self.link(file_hash, file_path)
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(file_path, self.asset_path(file_hash))
+        except OSError:
+            pass  # not linkable; the service keeps its own copy
+
+    def link(self, file_hash: str, target_path: Path) -> None:
+        """Link the asset with the given hash at `target_path`."""
+        self._link(self.asset_path(file_hash), target_path)
+
+    @staticmethod
+    def _link(source: Path, target_path: Path) -> None:
+        tmp_path = target_path.with_name(f".{target_path.name}.{uuid.uuid4().hex}")
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, target_path)
+
+    def gc(self) -> List[Path]:
+        """Remove the assets no service links to, and abandoned downloads.
+
+        Returns the paths of the removed assets.
+        """
+        removed: List[Path] = []
+        if not self.path.is_dir():
+            return removed
+        for path in self.path.iterdir():
+            if not self.is_valid_hash(f"sha256:{path.name}"):
+                continue
+            if path.stat().st_nlink <= 1:
+                path.unlink()
+                removed.append(path)
+
+        tmp_dir = self.path / self.TMP_DIR
+        if tmp_dir.is_dir():
+            cutoff = time.time() - self.TMP_MAX_AGE
+            for path in tmp_dir.iterdir():
+                try:
+                    if path.stat().st_mtime >= cutoff:
+                        continue
+                    if path.is_dir():
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        path.unlink()
+                except FileNotFoundError:
+                    pass  # finished or removed meanwhile
+        return removed
+
+
 class AgentAssetManager:
     """Agent Asset Manager."""
 
     logger = setup_logger(name="operate.agent_asset_manager")
     _runner_environment_logged = False
+    # Seconds after which a file is hashed again even though its sidecar
+    # still matches; 0 trusts the sidecar until the file changes.
+    DEEP_VERIFY_INTERVAL = float(
+        os.environ.get("AGENT_ASSET_DEEP_VERIFY_INTERVAL", "0")
+    )
 
     @staticmethod
     def get_python_environment_architecture() -> str:
@@ -140,18 +273,21 @@ class AgentAssetManager:
         return (public_id.author, public_id.name)
 
     @classmethod
-    def download_file(cls, url: str, save_path: Path) -> None:
-        """Download file of agent runner."""
-        try:
-            # Send a GET request to the URL
-            response = requests.get(url, stream=True, timeout=DEFAULT_TIMEOUT)
-            response.raise_for_status()  # Raise an error for bad status codes (4xx or 5xx)
-
-            # Open the file in binary write mode and save the content
-            with open(save_path, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+    def download_file(
+        cls, url: str, save_path: Path, expected_hash: Optional[str] = None
+    ) -> None:
+        """Download file of agent runner.
 
+        The download is split in parallel range requests and resumes from
+        where an interrupted download of `save_path` stopped.
+        """
+        try:
+            RangeDownloader(
+                url=url,
+                path=save_path,
+                timeout=DEFAULT_TIMEOUT,
+                expected_hash=expected_hash,
+            ).run()
             cls.logger.info(f"File downloaded and saved to {save_path}")
         except requests.exceptions.RequestException as e:
             cls.logger.error(f"Error downloading file: {e}")
@@ -176,59 +312,142 @@ class AgentAssetManager:
     @staticmethod
     def get_local_file_sha256(path: Path) -> str:
         """Get local file sha256."""
-        sha256_hash = hashlib.sha256()
-        with open(path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return "sha256:" + sha256_hash.hexdigest()
+        return file_sha256(path)
+
+    @staticmethod
+    def _sha256_sidecar_path(path: Path) -> Path:
+        return path.with_name(f".{path.name}{SHA256_SIDECAR_SUFFIX}")
+
+    @staticmethod
+    def _file_identity(path: Path) -> Dict[str, Any]:
+        file_stat = path.stat()
+        return {
+            "path": str(path.resolve()),
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+            "inode": file_stat.st_ino,
+        }
 
     @classmethod
-    def update_agent_release_asset(
+    def get_verified_file_sha256(cls, path: Path) -> str:
+        """Get local file sha256, hashing it only if it changed since last verified.
+
+        The hash is kept in a sidecar file along with the path, size,
+        modification time and inode of the file it was computed from.
+        """
+        identity = cls._file_identity(path)
+        try:
+            record = json.loads(cls._sha256_sidecar_path(path).read_text())
+            fresh = (
+                not cls.DEEP_VERIFY_INTERVAL
+                or time.time() - record["verified_at"] < cls.DEEP_VERIFY_INTERVAL
+            )
+            if record["identity"] == identity and fresh:
+                return record["sha256"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        file_hash = cls.get_local_file_sha256(path)
+        cls.record_verified_file_sha256(path, file_hash)
+        return file_hash
+
+    @classmethod
+    def record_verified_file_sha256(cls, path: Path, file_hash: str) -> None:
+        """Store the verified sha256 of a file in its sidecar; best effort."""
+        sidecar = cls._sha256_sidecar_path(path)
+        tmp_path = sidecar.with_name(f"{sidecar.name}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps(
+                    {
+                        "identity": cls._file_identity(path),
+                        "sha256": file_hash,
+                        "verified_at": time.time(),
+                    }
+                )
+            )
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            cls.logger.warning(f"Could not record the hash of {path}: {e}")
+
+    @staticmethod
+    def get_asset_store(service_dir: Path) -> Optional[AgentAssetStore]:
+        """Get the asset store shared by the services next to `service_dir`."""
+        if service_dir.parent.name != SERVICES_DIR:
+            return None
+        return AgentAssetStore(service_dir.parent.parent / AGENT_ASSETS_DIR)
+
+    @classmethod
+    def update_agent_release_asset(  # pylint: disable=too-many-arguments
         cls,
         target_path: Path,
         agent_release_asset_name: str,
         target_filename: str,
         agent_release: AgentRelease,
+        store: Optional[AgentAssetStore] = None,
     ) -> None:
-        """Download agent release asset (e.g., agent_runner or agent.zip)."""
+        """Download agent release asset (e.g., agent_runner or agent.zip).
+
+        With a `store`, the asset is linked from it when present there, and
+        added to it once downloaded.
+        """
         download_url, remote_file_hash = agent_release.get_url_and_hash(
             agent_release_asset_name
         )
+        if store is not None and not store.is_valid_hash(remote_file_hash):
+            store = None
 
         if target_path.exists():
+            linked = store is not None and store.is_linked(
+                remote_file_hash, target_path
+            )
             # check sha
-            current_file_hash = cls.get_local_file_sha256(target_path)
+            with deploy_timings.phase("verify"):
+                current_file_hash = cls.get_verified_file_sha256(target_path)
             if remote_file_hash == current_file_hash:
                 cls.logger.info(
                     "local and remote files hashes are match, nothing to download"
                 )
+                if store is not None and not linked:
+                    store.adopt(target_path, remote_file_hash)
                 return
             cls.logger.info(
                 "local and remote files hashes does not match, go to download"
             )
+            if store is not None and linked:
+                # the shared asset itself was modified; never link it again
+                store.discard(remote_file_hash)
         else:
             cls.logger.info("local file not found, go to download")
 
+        if store is not None and store.has(remote_file_hash):
+            cls.logger.info("asset found in the shared store, nothing to download")
+            store.link(remote_file_hash, target_path)
+            cls.record_verified_file_sha256(target_path, remote_file_hash)
+            return
+
+        is_runner = "agent_runner" in target_filename
+        # a stable download path lets an interrupted download resume
+        if store is not None:
+            download_path = store.tmp_dir() / store.asset_path(remote_file_hash).name
+        else:
+            download_path = target_path.with_name(f".{target_filename}.download")
         try:
-            with TemporaryDirectory() as tmp_dir:
-                tmp_file = Path(tmp_dir) / target_filename
-                cls.download_file(download_url, tmp_file)
-                # Verify hash of downloaded file
-                downloaded_hash = cls.get_local_file_sha256(tmp_file)
-                if downloaded_hash != remote_file_hash:
-                    raise ValueError(
-                        f"Hash verification failed for {target_filename}!\n"
-                        f"Expected: {remote_file_hash}\n"
-                        f"Got:      {downloaded_hash}\n"
-                        f"Downloaded file may be corrupted or tampered."
-                    )
-                cls.logger.info(f"Hash verification passed: {downloaded_hash}")
-                shutil.copy2(tmp_file, target_path)
+            with deploy_timings.phase("download"):
+                cls.download_file(
+                    download_url, download_path, expected_hash=remote_file_hash
+                )
+            cls.logger.info(f"Hash verification passed: {remote_file_hash}")
+            if store is not None:
+                if os.name == "posix" and is_runner:  # pragma: no cover
+                    download_path.chmod(download_path.stat().st_mode | stat.S_IEXEC)
+                store.add(download_path, remote_file_hash, target_path)
+            else:
+                shutil.copy2(download_path, target_path)
+                download_path.unlink(missing_ok=True)
                 # Make executable only for agent runner (detect by filename pattern)
-                if (
-                    os.name == "posix" and "agent_runner" in target_filename
-                ):  # pragma: no cover
+                if os.name == "posix" and is_runner:  # pragma: no cover
                     target_path.chmod(target_path.stat().st_mode | stat.S_IEXEC)
+            cls.record_verified_file_sha256(target_path, remote_file_hash)
         except Exception:
             # remove in case of errors
             if target_path.exists():
@@ -248,6 +467,7 @@ class AgentAssetManager:
             agent_release_asset_name=agent_runner_name,
             target_filename=agent_runner_name,
             agent_release=agent_release,
+            store=cls.get_asset_store(service_dir),
         )
         return str(agent_runner_path)
 
@@ -264,6 +484,7 @@ class AgentAssetManager:
             agent_release_asset_name="agent.zip",
             target_filename="agent.zip",
             agent_release=agent_release,
+            store=cls.get_asset_store(service_dir),
         )
         return str(agent_zip_path)
 
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Phase timings of service deployments."""
+
+import contextvars
+import platform
+import sys
+import threading
+import time
+import typing as t
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from operate import __version__
+from operate.utils.metrics import DEPLOY_PHASE_DURATION
+
+
+@dataclass
+class PhaseTiming:
+    """Timing of a deploy phase."""
+
+    name: str
+    offset: float  # seconds since the deploy started
+    duration: t.Optional[float] = None
+    failed: bool = False
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """To dictionary object."""
+        return {
+            "name": self.name,
+            "offset": self.offset,
+            "duration": self.duration,
+            "failed": self.failed,
+        }
+
+
+@dataclass
+class DeployTiming:
+    """Timings of a single deploy of a service."""
+
+    service_config_id: str
+    started_at: float = field(default_factory=time.time)
+    status: str = "running"
+    duration: t.Optional[float] = None
+    first_healthy_after: t.Optional[float] = None
+    phases: t.List[PhaseTiming] = field(default_factory=list)
+    _start: float = field(default_factory=time.monotonic, repr=False)
+
+    def elapsed(self) -> float:
+        """Seconds since the deploy started."""
+        return time.monotonic() - self._start
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """To dictionary object."""
+        return {
+            "started_at": self.started_at,
+            "status": self.status,
+            "duration": self.duration,
+            "first_healthy_after": self.first_healthy_after,
+            "phases": [phase.json for phase in self.phases],
+        }
+
+
+class DeployTimings:
+    """Phase timings of the most recent deploys of each service.
+
+    Phases are recorded into the deploy tracked by the calling thread, so
+    code running as part of a deploy does not need to know about it.
+    Phases may nest; their offsets tell how they overlap.
+    """
+
+    HISTORY_SIZE = 10
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        """Initialize the timings."""
+        self.size = size
+        self._lock = threading.Lock()
+        self._deploys: t.Dict[str, t.Deque[DeployTiming]] = {}
+        self._current: contextvars.ContextVar[t.Optional[DeployTiming]] = (
+            contextvars.ContextVar("deploy_timing", default=None)
+        )
+
+    @contextmanager
+    def track(self, service_config_id: str) -> t.Iterator[DeployTiming]:
+        """Track the timings of a deploy of a service."""
+        deploy = DeployTiming(service_config_id=service_config_id)
+        with self._lock:
+            self._deploys.setdefault(service_config_id, deque(maxlen=self.size)).append(
+                deploy
+            )
+        token = self._current.set(deploy)
+        try:
+            yield deploy
+            deploy.status = "completed"
+        except BaseException:
+            deploy.status = "failed"
+            raise
+        finally:
+            deploy.duration = deploy.elapsed()
+            self._current.reset(token)
+
+    @contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        """Time a phase of the deploy tracked by the caller, if any."""
+        deploy = self._current.get()
+        if deploy is None:
+            yield
+            return
+        timing = PhaseTiming(name=name, offset=deploy.elapsed())
+        with self._lock:
+            deploy.phases.append(timing)
+        try:
+            yield
+        except BaseException:
+            timing.failed = True
+            raise
+        finally:
+            timing.duration = deploy.elapsed() - timing.offset
+            DEPLOY_PHASE_DURATION.observe(timing.duration, name)
+
+    def healthy(self, service_config_id: str) -> None:
+        """Record a healthy probe of a service, the first one after its last deploy."""
+        with self._lock:
+            deploys = self._deploys.get(service_config_id)
+            if not deploys:
+                return
+            deploy = deploys[-1]
+            if deploy.status != "completed" or deploy.first_healthy_after is not None:
+                return
+            deploy.first_healthy_after = deploy.elapsed()
+        DEPLOY_PHASE_DURATION.observe(deploy.first_healthy_after, "first_healthy")
+
+    def json(self, service_config_id: str) -> t.Dict[str, t.Any]:
+        """The deploys of a service, oldest first, with the environment they ran in."""
+        with self._lock:
+            deploys = [
+                deploy.json for deploy in self._deploys.get(service_config_id, ())
+            ]
+        return {
+            "operate_version": __version__,
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "executable": sys.executable,
+            "deploys": deploys,
+        }
+
+
+deploy_timings = DeployTimings()
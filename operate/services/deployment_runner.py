@@ -26,8 +26,10 @@ import multiprocessing
 import os
 import platform
 import shutil  # nosec
+import socket
 import subprocess  # nosec
 import sys  # nosec
+import threading
 import time
 import typing as t
 from abc import ABC, ABCMeta, abstractmethod
@@ -36,7 +38,6 @@ from enum import Enum
 from io import TextIOWrapper
 from pathlib import Path
 from typing import Any, Dict, List, Type
-from venv import main as venv_cli
 
 import psutil
 import requests
@@ -45,7 +46,7 @@ from aea.helpers.logging import setup_logger
 from autonomy.__version__ import __version__ as autonomy_version
 
 from operate import _is_usable_ca_bundle_path, constants, get_runtime_ca_bundle_env
-from operate.utils import secure_copy_private_key
+from operate.utils import secure_copy_private_key, wait_for
 from operate.utils.pid_file import (
     PIDFileError,
     StalePIDFile,
@@ -55,7 +56,10 @@ from operate.utils.pid_file import (
     write_pid_file,
 )
 
+from .aea_worker import AeaCommandWorker
 from .agent_assets import AgentAssetManager, get_agent_code_path, get_agent_runner_path
+from .deploy_timings import deploy_timings
+from .venv_templates import VenvTemplateCache
 
 
 class AbstractDeploymentRunner(ABC):
@@ -74,78 +78,186 @@ class AbstractDeploymentRunner(ABC):
         """Stop the deployment."""
 
 
-def _kill_process(pid: int) -> None:
-    """Kill process."""
-    while True:
-        if not psutil.pid_exists(pid=pid):
-            return
-        process = psutil.Process(pid=pid)
-        if process.status() in (
-            psutil.STATUS_DEAD,
-            psutil.STATUS_ZOMBIE,
-        ):
-            return
-        try:
-            process.kill()
-        except OSError:
-            return
-        except psutil.AccessDenied:
-            return
-        time.sleep(1)
+PROCESS_EXIT_TIMEOUT = 10.0  # seconds
+PORT_RELEASE_TIMEOUT = 10.0  # seconds
+PORT_PROBE_TIMEOUT = 0.5  # seconds
+TENDERMINT_INITIAL_VALIDATOR_STATE = {"height": "0", "round": 0, "step": 0}
+
+# Installed in the venv of host python deployments
+VENV_REQUIREMENTS = [
+    f"open-autonomy[all]=={autonomy_version}",
+    f"open-aea-ledger-ethereum=={aea_version}",
+    f"open-aea-ledger-cosmos=={aea_version}",
+    # Install tendermint dependencies
+    "flask",
+    "requests",
+    "multiaddr==0.0.9",  # TODO: remove when pinned on open-aea
+]
+
+
+def _kill_process(pid: int, timeout: float = PROCESS_EXIT_TIMEOUT) -> None:
+    """Kill process and wait for it to exit."""
+    if not psutil.pid_exists(pid=pid):
+        return
+    process = psutil.Process(pid=pid)
+    if process.status() in (
+        psutil.STATUS_DEAD,
+        psutil.STATUS_ZOMBIE,
+    ):
+        return
+    try:
+        process.kill()
+    except OSError:
+        return
+    except psutil.AccessDenied:
+        return
+    psutil.wait_procs([process], timeout=timeout)
 
 
-def kill_process(pid: int) -> None:
+def kill_process(pid: int, timeout: float = PROCESS_EXIT_TIMEOUT) -> None:
     """Kill the process and all children first."""
     if not psutil.pid_exists(pid=pid):
         return
     current_process = psutil.Process(pid=pid)
     children = list(reversed(current_process.children(recursive=True)))
     for child in children:
-        _kill_process(child.pid)
-        _kill_process(child.pid)
-    _kill_process(pid)
-    _kill_process(pid)
+        _kill_process(child.pid, timeout=timeout)
+    _kill_process(pid, timeout=timeout)
+
 
+class PortOwners:
+    """Processes started by the deployment runners, by the local port they serve.
 
-def kill_processes_on_port(port: int, logger: logging.Logger) -> None:
+    Freeing a port then only needs the connections of the few processes
+    started for it, rather than those of every process on the host. The
+    index lives in memory: ports held by processes of an earlier middleware
+    run are found by scanning the connections of the host.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._lock = threading.Lock()
+        self._owners: Dict[int, t.Tuple[int, float]] = {}
+
+    def track(self, port: int, pid: int) -> None:
+        """Record that the process `pid` was started to serve `port`."""
+        try:
+            create_time = psutil.Process(pid).create_time()
+        except psutil.Error:
+            return
+        with self._lock:
+            self._owners[port] = (pid, create_time)
+
+    def untrack(self, port: int) -> None:
+        """Forget the process serving `port`."""
+        with self._lock:
+            self._owners.pop(port, None)
+
+    def listening_pid(self, port: int) -> t.Optional[int]:
+        """Get the tracked process of `port` if it, or a child of it, listens on it."""
+        with self._lock:
+            owner = self._owners.get(port)
+        if owner is None:
+            return None
+        pid, create_time = owner
+        try:
+            process = psutil.Process(pid)
+            # a different creation time means the PID was reused
+            if process.create_time() != create_time:
+                raise psutil.NoSuchProcess(pid)
+            processes = [process, *process.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            self.untrack(port)
+            return None
+        for proc in processes:
+            with suppress(psutil.Error):
+                if any(
+                    conn.status == psutil.CONN_LISTEN
+                    and conn.laddr
+                    and conn.laddr.port == port
+                    for conn in proc.connections(kind="inet")
+                ):
+                    return pid
+        return None
+
+
+port_owners = PortOwners()
+
+
+def _port_in_use(port: int) -> bool:
+    """Whether a local process accepts connections on the given TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(PORT_PROBE_TIMEOUT)
+        try:
+            return s.connect_ex(("127.0.0.1", port)) == 0
+        except OSError:
+            return False
+
+
+def _listening_pids(port: int) -> t.Set[int]:
+    """Get the PIDs of other local processes listening on the given TCP port."""
+    own_pid = os.getpid()
+    return {
+        conn.pid
+        for conn in psutil.net_connections(kind="inet")
+        if conn.pid not in (None, own_pid)
+        and conn.status == psutil.CONN_LISTEN
+        and conn.laddr
+        and conn.laddr.port == port
+    }
+
+
+def kill_processes_on_port(
+    port: int, logger: logging.Logger, timeout: float = PORT_RELEASE_TIMEOUT
+) -> None:
     """Kill any local process listening on the given TCP port.
 
     Backstop for PID-file tracking misses (PID reuse, unexpected process name,
     orphaned child): only one agent owns the fixed ports at a time, so whatever
     listens on one is the blocker preventing the next agent from binding.
+    Returns once the port is released, or after `timeout` seconds.
 
-    ``net_connections`` needs root on macOS and raises ``AccessDenied`` for an
-    unprivileged process, so the reap is silently skipped there.
+    The process started for the port is looked up in `port_owners`; the
+    connections of the whole host are only scanned when the port is held by
+    another process. ``net_connections`` needs root on macOS and raises
+    ``AccessDenied`` for an unprivileged process, so that scan is silently
+    skipped there.
     """
-    own_pid = os.getpid()
+    pid = port_owners.listening_pid(port)
+    if pid is not None:
+        logger.warning(
+            f"Port {port} is held by leftover process PID {pid}; "
+            f"killing it to free the port for the deployment"
+        )
+        kill_process(pid)
+        port_owners.untrack(port)
+        wait_for(lambda: not _port_in_use(port), timeout=timeout)
+    if not _port_in_use(port):
+        return
+
     try:
-        connections = psutil.net_connections(kind="inet")
+        pids = _listening_pids(port)
     except (psutil.AccessDenied, OSError) as e:
         logger.warning(f"Could not enumerate connections to free port {port}: {e}")
         return
 
-    pids = {
-        conn.pid
-        for conn in connections
-        if conn.pid not in (None, own_pid)
-        and conn.status == psutil.CONN_LISTEN
-        and conn.laddr
-        and conn.laddr.port == port
-    }
     for pid in pids:
         logger.warning(
             f"Port {port} is held by leftover process PID {pid}; "
             f"killing it to free the port for the deployment"
         )
         kill_process(pid)
+    if pids and not wait_for(lambda: not _listening_pids(port), timeout=timeout):
+        logger.warning(f"Port {port} is still in use after {timeout}s")
 
 
 class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
     """Base deployment with aea support."""
 
     TM_CONTROL_URL = constants.TM_CONTROL_URL
-    SLEEP_BEFORE_TM_KILL = 2  # seconds
+    TM_EXIT_TIMEOUT = 2  # seconds
     START_TRIES = constants.DEPLOYMENT_START_TRIES_NUM
+    AEA_COMMAND_TIMEOUT = 600  # seconds
     logger = setup_logger(name="operate.base_deployment_runner")
 
     @staticmethod
@@ -175,6 +287,7 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
         self._is_aea = is_aea
         self._agent_log_file: t.Optional[TextIOWrapper] = None
         self._tm_log_file: t.Optional[TextIOWrapper] = None
+        self._aea_worker = AeaCommandWorker(logger=self.logger)
 
     def _open_agent_runner_log_file(self) -> TextIOWrapper:
         """Open agent_runner.log file."""
@@ -216,40 +329,27 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
         self.logger.info(
             f"Running aea command: {' '.join(no_password_args)} at {str(cwd)}"
         )
-        p = multiprocessing.Process(
-            target=self.__class__._call_aea_command,  # pylint: disable=protected-access
-            args=(cwd, args),
+        exitcode = self._aea_worker.run(
+            cwd=cwd, args=args, timeout=self.AEA_COMMAND_TIMEOUT
         )
-        p.start()
-        p.join()
-        if p.exitcode != 0:
+        if exitcode != 0:
             raise RuntimeError(
-                f"aea command `{' '.join(no_password_args)}` execution failed with exit code: {p.exitcode}"
+                f"aea command `{' '.join(no_password_args)}` execution failed with exit code: {exitcode}"
             )
 
-    @staticmethod
-    def _call_aea_command(cwd: str | Path, args: List[str]) -> None:  # pragma: no cover
-        import os  # pylint: disable=redefined-outer-name,reimported,import-outside-toplevel
-
-        os.chdir(cwd)
-        # pylint: disable-next=import-outside-toplevel
-        from aea.cli.core import cli as call_aea
-
-        call_aea(  # pylint: disable=unexpected-keyword-arg, no-value-for-parameter
-            args, standalone_mode=False
-        )
-        # os._exit(0) is needed in case of run on linux with fork subprocess method
-        # otherwise it performs all actions successfully but returns code 1 to the caller
-        # it looks like aea+pyinstaller+multiprocess exit hooks issue on process stops
-        os._exit(0)  # pylint: disable=protected-access
-
-    def _run_cmd(self, args: t.List[str], cwd: t.Optional[Path] = None) -> None:
+    def _run_cmd(
+        self,
+        args: t.List[str],
+        cwd: t.Optional[Path] = None,
+        env: t.Optional[t.Dict[str, str]] = None,
+    ) -> None:
         """Run command in a subprocess."""
         self.logger.info(f"Running: {' '.join(args)}")
         self.logger.info(f"Working dir: {os.getcwd()}")
         result = subprocess.run(  # pylint: disable=subprocess-run-check # nosec
             args=args,
             cwd=cwd,
+            env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         )
@@ -313,17 +413,18 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
                     # return cause dont need to perform all other actions in setup with aea commands
                     return
 
-                self._run_aea_command(
-                    "init",
-                    "--reset",
-                    "--author",
-                    "valory",
-                    "--remote",
-                    "--ipfs",
-                    "--ipfs-node",
-                    "/dns/registry.autonolas.tech/tcp/443/https",
-                    cwd=working_dir,
-                )
+                with deploy_timings.phase("aea_init"):
+                    self._run_aea_command(
+                        "init",
+                        "--reset",
+                        "--author",
+                        "valory",
+                        "--remote",
+                        "--ipfs",
+                        "--ipfs-node",
+                        "/dns/registry.autonolas.tech/tcp/443/https",
+                        cwd=working_dir,
+                    )
 
                 # download an unpack agent sources
                 self.prepare_agent_sources(
@@ -332,37 +433,38 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
                     private_key_in_agent=private_key_in_agent,
                 )
 
-                # Add keys securely
-                secure_copy_private_key(
-                    src=working_dir / "ethereum_private_key.txt",
-                    dst=private_key_in_agent,
-                )
+                with deploy_timings.phase("keys"):
+                    # Add keys securely
+                    secure_copy_private_key(
+                        src=working_dir / "ethereum_private_key.txt",
+                        dst=private_key_in_agent,
+                    )
 
-                self._run_aea_command(
-                    "-s",
-                    "add-key",
-                    "--password",
-                    password,
-                    "ethereum",
-                    cwd=working_dir / "agent",
-                )
-                self._run_aea_command(
-                    "-s",
-                    "add-key",
-                    "--password",
-                    password,
-                    "ethereum",
-                    "--connection",
-                    cwd=working_dir / "agent",
-                )
+                    self._run_aea_command(
+                        "-s",
+                        "add-key",
+                        "--password",
+                        password,
+                        "ethereum",
+                        cwd=working_dir / "agent",
+                    )
+                    self._run_aea_command(
+                        "-s",
+                        "add-key",
+                        "--password",
+                        password,
+                        "ethereum",
+                        "--connection",
+                        cwd=working_dir / "agent",
+                    )
 
-                self._run_aea_command(
-                    "-s",
-                    "issue-certificates",
-                    "--password",
-                    password,
-                    cwd=working_dir / "agent",
-                )
+                    self._run_aea_command(
+                        "-s",
+                        "issue-certificates",
+                        "--password",
+                        password,
+                        cwd=working_dir / "agent",
+                    )
 
                 # Success - break out of retry loop
                 self.logger.info(
@@ -400,7 +502,8 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
         self.logger.info("Checking and downloading agent zip!")
         agent_zip_path = Path(get_agent_code_path(service_dir))
         self.logger.info(f"Agentsource zip file is {agent_zip_path}")
-        AgentAssetManager.extract_agent_zip(agent_zip_path, agent_dir_full_path)
+        with deploy_timings.phase("extract"):
+            AgentAssetManager.extract_agent_zip(agent_zip_path, agent_dir_full_path)
 
         # Ensure parent directory exists before trying to delete file
         if private_key_in_agent.parent.exists():
@@ -445,20 +548,67 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
         # Reap leftovers first (prior run, or a failed earlier _start attempt):
         # a process still holding a fixed port would make binding fail with
         # OSError 10048. Done before setup so nothing survives into the bind.
-        self._free_deployment_ports()
-        self._setup_agent(password=password)
+        with deploy_timings.phase("free_ports"):
+            self._free_deployment_ports()
+        with deploy_timings.phase("setup_agent"):
+            self.prepare(password=password)
         if self._is_aea:
-            self._start_tendermint()
+            with deploy_timings.phase("tendermint_start"):
+                self._start_tendermint()
 
-        self._start_agent(password=password)
+        with deploy_timings.phase("agent_start"):
+            self._start_agent(password=password)
         self.logger.info("Deployment: Agent process started!")
 
+    def prepare(self, password: str) -> None:
+        """Set up the deployment without starting its processes."""
+        try:
+            self._setup_agent(password=password)
+        finally:
+            self._aea_worker.close()
+
+    def relocate(self, previous_dir: Path) -> None:
+        """Point the configuration of a deployment moved from `previous_dir` to its location."""
+        for name in ("agent.json", "tendermint.json"):
+            path = self._work_directory / name
+            if not path.exists():
+                continue
+            config = json.loads(path.read_text(encoding="utf-8"))
+            for key, value in config.items():
+                if isinstance(value, str):
+                    config[key] = value.replace(
+                        str(previous_dir), str(self._work_directory)
+                    )
+            path.write_text(json.dumps(config, indent=4), encoding="utf-8")
+
     def stop(self) -> None:
         """Stop the deployment."""
         self._stop_agent()
         if self._is_aea:
             self._stop_tendermint()
 
+    def restart(self, password: str) -> None:
+        """Restart the agent and tendermint processes, reusing the existing setup.
+
+        Tendermint starts over from an empty chain, as in a new build.
+        """
+        working_dir = self._work_directory
+        if (
+            not (working_dir / "agent").is_dir()
+            or not (working_dir / "agent.json").exists()
+        ):
+            raise RuntimeError(f"Deployment at {working_dir} is not set up")
+
+        self.logger.info("Restarting the deployment processes")
+        self.stop()
+        self._free_deployment_ports()
+        if self._is_aea:
+            reset_tendermint_state(working_dir)
+            self._start_tendermint()
+
+        self._start_agent(password=password)
+        self.logger.info("Deployment: Agent process restarted!")
+
     def _terminate_recorded_process(
         self,
         pid_file: Path,
@@ -518,9 +668,16 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
 
     def _stop_tendermint(self) -> None:
         """Stop tendermint process using safe PID file operations."""
+        pid_file = self._work_directory / "tendermint.pid"
         try:
             requests.get(self._get_tm_exit_url(), timeout=(1, 10))
-            time.sleep(self.SLEEP_BEFORE_TM_KILL)
+            # give tendermint the chance to exit on its own before it is killed
+            pid = read_raw_pid(pid_file)
+            if pid is not None:
+                with suppress(psutil.NoSuchProcess):
+                    psutil.wait_procs(
+                        [psutil.Process(pid)], timeout=self.TM_EXIT_TIMEOUT
+                    )
         except requests.ConnectionError:
             self.logger.debug(
                 f"No Tendermint process listening on {self._get_tm_exit_url()} (already stopped)."
@@ -529,7 +686,7 @@ class BaseDeploymentRunner(AbstractDeploymentRunner, metaclass=ABCMeta):
             self.logger.exception("Exception on tendermint stop!")
 
         self._terminate_recorded_process(
-            self._work_directory / "tendermint.pid",
+            pid_file,
             expected_process_names=["tendermint", "flask", "python"],
             label="tendermint",
         )
@@ -619,6 +776,7 @@ class PyInstallerHostDeploymentRunner(BaseDeploymentRunner):
             except Exception:  # nosec # pylint: disable=broad-except
                 pass  # Best-effort cleanup; don't mask original error
             raise
+        port_owners.track(constants.AGENT_HTTP_PORT, process.pid)
 
     def _start_agent_process(  # pragma: no cover
         self, env: Dict, working_dir: Path, password: str
@@ -658,6 +816,7 @@ class PyInstallerHostDeploymentRunner(BaseDeploymentRunner):
             except Exception:  # nosec # pylint: disable=broad-except
                 pass  # Best-effort cleanup; don't mask original error
             raise
+        port_owners.track(constants.TENDERMINT_COM_PORT, process.pid)
 
     def _start_tendermint_process(
         self, env: Dict, working_dir: Path
@@ -898,6 +1057,7 @@ class HostPythonHostDeploymentRunner(BaseDeploymentRunner):
             except Exception:  # nosec # pylint: disable=broad-except
                 pass  # Best-effort cleanup; don't mask original error
             raise
+        port_owners.track(constants.AGENT_HTTP_PORT, process.pid)
 
     def _start_tendermint(self) -> None:
         """Start tendermint process."""
@@ -942,36 +1102,43 @@ class HostPythonHostDeploymentRunner(BaseDeploymentRunner):
             except Exception:  # nosec # pylint: disable=broad-except
                 pass  # Best-effort cleanup; don't mask original error
             raise
+        port_owners.track(constants.TENDERMINT_COM_PORT, process.pid)
 
     @property
     def _venv_dir(self) -> Path:
         """Get venv dir for aea."""
         return self._work_directory / "venv"
 
+    @property
+    def _wheelhouse(self) -> t.Optional[Path]:
+        """Get the local wheelhouse to install from, if configured."""
+        wheelhouse = os.environ.get("OPERATE_WHEELHOUSE")
+        return Path(wheelhouse) if wheelhouse else None
+
     def _setup_venv(self) -> None:
-        """Perform venv setup, install deps."""
+        """Perform venv setup, cloning the template with the deps installed."""
         if not self._is_aea:
             return
 
-        self._venv_dir.mkdir(exist_ok=True)
-        venv_cli(args=[str(self._venv_dir)])
-        pbin = str(self._venv_dir / "bin" / "python")
-        # Install agent dependencies
-        self._run_cmd(
-            args=[
-                pbin,
-                "-m",
-                "pip",
-                "install",
-                f"open-autonomy[all]=={autonomy_version}",
-                f"open-aea-ledger-ethereum=={aea_version}",
-                f"open-aea-ledger-cosmos=={aea_version}",
-                # Install tendermint dependencies
-                "flask",
-                "requests",
-                "multiaddr==0.0.9",  # TODO: remove when pinned on open-aea
-            ],
+        cache = VenvTemplateCache(
+            path=self._get_operate_dir() / constants.VENV_TEMPLATES_DIR,
+            logger=self.logger,
+            run_cmd=lambda args: self._run_cmd(args=args),
         )
+        template = cache.get_or_create(
+            requirements=VENV_REQUIREMENTS, wheelhouse=self._wheelhouse
+        )
+        cache.clone(template=template, target=self._venv_dir)
+
+    def relocate(self, previous_dir: Path) -> None:
+        """Point the configuration and venv of a moved deployment to its location."""
+        super().relocate(previous_dir)
+        if self._venv_dir.exists():
+            VenvTemplateCache.relocate(
+                venv=self._venv_dir,
+                old_prefix=previous_dir,
+                new_prefix=self._work_directory,
+            )
 
     def _setup_agent(self, password: str) -> None:
         """Prepare agent."""
@@ -981,23 +1148,34 @@ class HostPythonHostDeploymentRunner(BaseDeploymentRunner):
         except RuntimeError as e:
             # If start method is already set (e.g., in test environment), log and continue
             self.logger.warning(f"Could not set multiprocessing start method: {e}")
-        self._setup_venv()
+        with deploy_timings.phase("venv"):
+            self._setup_venv()
         super()._setup_agent(password=password)
         if not self._is_aea:
             return
 
         # Install agent dependencies
-        self._run_cmd(
-            args=[
-                self._agent_runner_bin,
-                "-v",
-                "debug",
-                "install",
-                "--timeout",
-                "600",
-            ],
-            cwd=self._work_directory / "agent",
-        )
+        with deploy_timings.phase("agent_deps"):
+            self._run_cmd(
+                args=[
+                    self._agent_runner_bin,
+                    "-v",
+                    "debug",
+                    "install",
+                    "--timeout",
+                    "600",
+                ],
+                cwd=self._work_directory / "agent",
+                env=(
+                    None
+                    if self._wheelhouse is None
+                    else {
+                        **os.environ,
+                        "PIP_NO_INDEX": "1",
+                        "PIP_FIND_LINKS": str(self._wheelhouse),
+                    }
+                ),
+            )
 
 
 class States(Enum):
@@ -1086,7 +1264,8 @@ class DeploymentManager:
             raise ValueError("Service already in transition")
 
         # doing pre check for ipfs works fine, also network connection is ok.
-        self.check_ipfs_connection_works()
+        with deploy_timings.phase("ipfs_check"):
+            self.check_ipfs_connection_works()
 
         self.logger.info(f"Starting deployment {build_dir}...")
         self._states[build_dir] = States.STARTING
@@ -1110,6 +1289,56 @@ class DeploymentManager:
             )
             self.stop_deployment(build_dir=build_dir, force=True)
 
+    def prepare_deployment(
+        self, build_dir: Path, password: str, is_aea: bool = True
+    ) -> None:
+        """Set up a deployment without starting it."""
+        if self._is_stopping:
+            raise RuntimeError("deployment manager stopped")
+
+        with deploy_timings.phase("ipfs_check"):
+            self.check_ipfs_connection_works()
+
+        self.logger.info(f"Preparing deployment {build_dir}...")
+        deployment_runner = self._get_deployment_runner(
+            build_dir=build_dir, is_aea=is_aea
+        )
+        deployment_runner.prepare(password=password)
+        self.logger.info(f"Prepared deployment {build_dir}")
+
+    def relocate_deployment(
+        self, build_dir: Path, previous_dir: Path, is_aea: bool = True
+    ) -> None:
+        """Point a deployment moved from `previous_dir` to `build_dir`."""
+        self.logger.info(f"Relocating deployment {previous_dir} to {build_dir}")
+        deployment_runner = self._get_deployment_runner(
+            build_dir=build_dir, is_aea=is_aea
+        )
+        deployment_runner.relocate(previous_dir=previous_dir)
+
+    def restart_deployment(
+        self, build_dir: Path, password: str, is_aea: bool = True
+    ) -> None:
+        """Restart the processes of a deployment without setting it up again."""
+        if self._is_stopping:
+            raise RuntimeError("deployment manager stopped")
+        if self.get_state(build_dir=build_dir) in [States.STARTING, States.STOPPING]:
+            raise ValueError("Service already in transition")
+
+        self.logger.info(f"Restarting deployment {build_dir}...")
+        self._states[build_dir] = States.STARTING
+        deployment_runner = self._get_deployment_runner(
+            build_dir=build_dir, is_aea=is_aea
+        )
+        try:
+            deployment_runner.restart(password=password)
+        except Exception:
+            self.logger.exception(f"Restarting deployment failed {build_dir}")
+            self._states[build_dir] = States.ERROR
+            raise
+        self.logger.info(f"Restarted deployment {build_dir}")
+        self._states[build_dir] = States.STARTED
+
     def stop_deployment(
         self, build_dir: Path, force: bool = False, is_aea: bool = True
     ) -> None:
@@ -1144,6 +1373,54 @@ def run_host_deployment(build_dir: Path, password: str, is_aea: bool = True) ->
     )
 
 
+def prepare_host_deployment(
+    build_dir: Path, password: str, is_aea: bool = True
+) -> None:
+    """Set up a host deployment without starting it."""
+    deployment_manager.prepare_deployment(
+        build_dir=build_dir, password=password, is_aea=is_aea
+    )
+
+
+def relocate_host_deployment(
+    build_dir: Path, previous_dir: Path, is_aea: bool = True
+) -> None:
+    """Point a host deployment moved from `previous_dir` to `build_dir`."""
+    deployment_manager.relocate_deployment(
+        build_dir=build_dir, previous_dir=previous_dir, is_aea=is_aea
+    )
+
+
+def restart_host_deployment(
+    build_dir: Path, password: str, is_aea: bool = True
+) -> None:
+    """Restart the processes of a host deployment."""
+    deployment_manager.restart_deployment(
+        build_dir=build_dir, password=password, is_aea=is_aea
+    )
+
+
+def reset_tendermint_state(build_dir: Path) -> None:
+    """Reset the chain data of the tendermint nodes of a build, keeping their keys.
+
+    As `tendermint unsafe-reset-all` does, the blocks, the address book and
+    the validator signing state are dropped, so that the nodes start over as
+    in a newly generated build.
+    """
+    homes = [build_dir / "node", *sorted((build_dir / "nodes").glob("*"))]
+    for home in homes:
+        data = home / "data"
+        if not data.is_dir():
+            continue
+        shutil.rmtree(data)
+        data.mkdir()
+        (data / "priv_validator_state.json").write_text(
+            json.dumps(TENDERMINT_INITIAL_VALIDATOR_STATE, indent=2),
+            encoding="utf-8",
+        )
+        (home / "config" / "addrbook.json").unlink(missing_ok=True)
+
+
 def stop_host_deployment(build_dir: Path, is_aea: bool = True) -> None:
     """Stop host deployment."""
     deployment_manager.stop_deployment(build_dir=build_dir, is_aea=is_aea)
@@ -49,6 +49,11 @@ from operate.constants import (
 )
 from operate.keys import KeysManager
 from operate.ledger import get_default_ledger_api, get_default_rpc
+from operate.ledger.address_activity import (
+    ADDRESS_ACTIVITY_DISCOVERY,
+    ActivityDiscoveryError,
+)
+from operate.ledger.log_scanner import LogScanner
 from operate.ledger.profiles import (
     CONTRACTS,
     DEFAULT_EOA_THRESHOLD,
@@ -60,6 +65,7 @@ from operate.ledger.profiles import (
 from operate.operate_types import (
     Chain,
     ChainAmounts,
+    FundRecoveryChainScanResult,
     FundRecoveryExecuteResponse,
     FundRecoveryScanResponse,
     GasWarningEntry,
@@ -77,6 +83,7 @@ from operate.utils.gnosis import (
     get_asset_balance,
     get_owners,
 )
+from operate.utils.multicall import try_aggregate
 from operate.wallet.master import EthereumMasterWallet, MasterWalletManager
 
 logger = setup_logger(name="operate.fund_recovery_manager")
@@ -119,6 +126,12 @@ SUBGRAPH_URLS: t.Dict[Chain, str] = {
 #: from the resulting Service object are used.
 _RECOVERY_SERVICE_HASH = "bafybeifhxeoar5hdwilmnzhy6jf664zqp5lgrzi6lpbkc4qmoqrr24ow4q"
 
+#: Seconds the streaming scan waits for all chains before reporting timeouts.
+FUND_RECOVERY_SCAN_TIMEOUT = 120.0
+
+#: Selector of the ERC-721 ``ownerOf(uint256)`` function.
+OWNER_OF_SELECTOR = "0x6352211e"
+
 
 # ---------------------------------------------------------------------------
 # Helper utilities
@@ -144,129 +157,98 @@ def _get_service_registry_contract(
     )
 
 
-def _get_safe_deploy_and_last_tx_block(
-    w3: "Web3", safe: str, current_block: int
-) -> t.Tuple[int, int]:
-    """Find the block when the Safe was deployed and the block of its last transaction."""
-    safe_checksum = w3.to_checksum_address(safe)
-
-    # 1. Binary search for deployment block
-    low = 0
-    high = current_block
-    deploy_block = current_block
-
-    while low <= high:
-        mid = (low + high) // 2
-        try:
-            code = w3.eth.get_code(safe_checksum, block_identifier=mid)
-            if len(code) > 2:
-                deploy_block = mid
-                high = mid - 1
-            else:
-                low = mid + 1
-        except Exception:  # pylint: disable=broad-except
-            low = mid + 1
-
-    # 2. Binary search for last transaction block
-    try:
-        # Keccak of "nonce()"
-        nonce_data = Web3.keccak(text="nonce()")[:4].hex()
-        res = w3.eth.call(
-            {"to": safe_checksum, "data": nonce_data}, block_identifier=current_block
-        )
-        current_nonce = int.from_bytes(res, "big") if res else 0
-    except Exception:  # pylint: disable=broad-except
-        current_nonce = 0
-
-    last_tx_block = current_block
-    if current_nonce > 0:
-        low = deploy_block
-        high = current_block
-        last_tx_block = current_block
-
-        while low <= high:
-            mid = (low + high) // 2
-            try:
-                res = w3.eth.call(
-                    {"to": safe_checksum, "data": nonce_data}, block_identifier=mid
-                )
-                mid_nonce = int.from_bytes(res, "big") if res else 0
-
-                if mid_nonce == current_nonce:
-                    last_tx_block = mid
-                    high = mid - 1
-                else:
-                    low = mid + 1
-            except Exception:  # pylint: disable=broad-except
-                low = mid + 1
-
-    return deploy_block, last_tx_block
-
-
 def _fetch_logs_in_chunks(
     w3: "Web3",
     registry: str,
     start_block: int,
     end_block: int,
     topics: t.List[t.Optional[str]],
+    chain: t.Optional[Chain] = None,
 ) -> t.Set[int]:
-    """Fetch logs dynamically adjusting chunk sizes on failure."""
-    token_ids: t.Set[int] = set()
-    current_start = start_block
-    chunk_size = 100_000
-    registry_checksum = w3.to_checksum_address(registry)
-
-    while current_start <= end_block:
-        chunk_end = min(current_start + chunk_size - 1, end_block)
-        try:
-            logs = w3.eth.get_logs(
-                {
-                    "address": registry_checksum,
-                    "topics": topics,
-                    "fromBlock": hex(current_start),
-                    "toBlock": hex(chunk_end),
-                }
-            )
-            for log in logs:
-                if len(log["topics"]) >= 4:
-                    token_ids.add(int(log["topics"][3].hex(), 16))
+    """Fetch the token ids of Transfer logs, scanning block windows concurrently."""
+
+    def _token_id(log: t.Any) -> t.Optional[int]:
+        if len(log["topics"]) >= 4:
+            return int(log["topics"][3].hex(), 16)
+        return None
+
+    return LogScanner(w3).scan(
+        address=registry,
+        topics=topics,
+        from_block=start_block,
+        to_block=end_block,
+        extract=_token_id,
+        chain_id=chain.id if chain is not None else None,
+    )
 
-            current_start = chunk_end + 1
-            # Grow chunk size on success up to max
-            chunk_size = min(100_000, chunk_size * 2)
 
-        except Exception as e:  # pylint: disable=broad-except
-            if chunk_size <= 1:
-                logger.warning(
-                    f"Log chunk [{current_start},{chunk_end}] failed at minimum size: {e}"
+def _get_owners_of(
+    ledger_api: t.Any,
+    contract: t.Any,
+    service_registry_address: str,
+    token_ids: t.List[int],
+) -> t.List[t.Optional[str]]:
+    """Return ``ownerOf`` for each token (None if the call failed).
+
+    Calls are batched through Multicall3; if that is not available, they are
+    made one by one.
+    """
+    try:
+        results = try_aggregate(
+            ledger_api.api,
+            [
+                (
+                    service_registry_address,
+                    bytes.fromhex(OWNER_OF_SELECTOR[2:]) + token_id.to_bytes(32, "big"),
                 )
-                current_start = chunk_end + 1
-            else:
-                chunk_size = max(1, chunk_size // 2)
+                for token_id in token_ids
+            ],
+        )
+        return [
+            Web3.to_checksum_address(result[12:32]) if result else None
+            for result in results
+        ]
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning(f"Multicall ownerOf failed, falling back to single calls: {exc}")
 
-    return token_ids
+    owners: t.List[t.Optional[str]] = []
+    for token_id in token_ids:
+        try:
+            owners.append(contract.functions.ownerOf(token_id).call())
+        except Exception:  # pylint: disable=broad-except
+            owners.append(None)  # token may not exist or call failed
+    return owners
 
 
 def _enumerate_owned_services(  # pylint: disable=too-many-locals
     ledger_api: t.Any,
     service_registry_address: str,
     owner_address: str,
+    chain: t.Optional[Chain] = None,
 ) -> t.List[int]:
     """
     Enumerate service IDs owned by *owner_address* by scanning Transfer events.
 
     ServiceRegistryL2 does NOT expose ``getServicesOfOwner``.  Instead we scan
     Transfer events where ``to == owner_address`` in bounded chunks, then filter
-    via ``ownerOf(tokenId)`` to skip transferred-away NFTs.
+    via ``ownerOf(tokenId)`` to skip transferred-away NFTs. The scanned range is
+    the owner's active block range (Safe deployment / first transaction up to
+    its last transaction), cached per (chain, owner). Raises
+    ``ActivityDiscoveryError`` if that range cannot be discovered, rather
+    than reporting no services.
     """
     contract = _get_service_registry_contract(ledger_api, service_registry_address)
     try:
         latest_block = ledger_api.api.eth.block_number
         owner_checksum: str = str(Web3.to_checksum_address(owner_address))
 
-        deploy_block, last_tx_block = _get_safe_deploy_and_last_tx_block(
-            ledger_api.api, owner_checksum, latest_block
+        activity = ADDRESS_ACTIVITY_DISCOVERY.discover(
+            ledger_api.api, owner_checksum, chain=chain, head_block=latest_block
         )
+        if activity is None:
+            # The owner never sent a transaction, so it cannot have created
+            # (or operated) any service.
+            return []
 
         topics: t.List[t.Optional[str]] = [
             Web3.keccak(text="Transfer(address,address,uint256)").to_0x_hex(),
@@ -277,21 +259,24 @@ def _enumerate_owned_services(  # pylint: disable=too-many-locals
         token_ids = _fetch_logs_in_chunks(
             ledger_api.api,
             service_registry_address,
-            deploy_block,
-            last_tx_block,
+            activity.first_block,
+            activity.last_block,
             topics,
+            chain=chain,
         )
 
-        owned = []
-        for token_id in token_ids:
-            try:
-                current_owner = contract.functions.ownerOf(token_id).call()
-                if current_owner.lower() == owner_address.lower():
-                    owned.append(token_id)
-            except Exception:  # pylint: disable=broad-except  # nosec B110
-                pass  # token may not exist or call failed
-
-        return owned
+        sorted_ids = sorted(token_ids)
+        owners = _get_owners_of(
+            ledger_api, contract, service_registry_address, sorted_ids
+        )
+        return [
+            token_id
+            for token_id, current_owner in zip(sorted_ids, owners)
+            if current_owner is not None
+            and current_owner.lower() == owner_address.lower()
+        ]
+    except ActivityDiscoveryError:
+        raise
     except Exception as exc:  # pylint: disable=broad-except
         logger.warning(f"Service enumeration failed: {exc}")
         return []
@@ -380,6 +365,7 @@ def _get_master_safes_from_contracts(  # pylint: disable=too-many-locals
             ledger_api=ledger_api,
             service_registry_address=service_registry_address,
             owner_address=eoa_address,
+            chain=chain,
         )
 
     # ── 2. MasterSafe resolution per service ID ─────────────────────────────
@@ -510,7 +496,7 @@ class FundRecoveryManager:  # pylint: disable=too-few-public-methods
     # Public API
     # ------------------------------------------------------------------
 
-    def scan(  # pylint: disable=too-many-locals,too-many-nested-blocks,too-many-statements
+    def scan(
         self,
         mnemonic: str,
     ) -> FundRecoveryScanResponse:
@@ -527,22 +513,57 @@ class FundRecoveryManager:  # pylint: disable=too-few-public-methods
         -------
         FundRecoveryScanResponse
         """
+        *_, summary = self.scan_stream(mnemonic)
+        return t.cast(FundRecoveryScanResponse, summary)
+
+    def scan_stream(  # pylint: disable=too-many-locals,too-many-nested-blocks,too-many-statements
+        self,
+        mnemonic: str,
+        timeout: t.Optional[float] = None,
+    ) -> t.Iterator[t.Union[FundRecoveryChainScanResult, FundRecoveryScanResponse]]:
+        """
+        Discover on-chain funds, yielding each chain's result as soon as it completes.
+
+        Parameters
+        ----------
+        mnemonic:
+            BIP-39 seed phrase (12, 15, 18, 21, or 24 words).  Never logged or
+            stored.
+        timeout:
+            Seconds to wait for all chains.  Chains still running afterwards
+            are reported with ``error="timeout"`` and left out of the summary.
+            Chains whose services could not be discovered are reported with
+            the failure as ``error``; the summary lists the errors per chain.
+
+        Yields
+        ------
+        FundRecoveryChainScanResult
+            One per chain in ``RECOVERY_CHAINS``, in completion order.
+        FundRecoveryScanResponse
+            The summary of the completed chains, always last.
+        """
         eoa_address = _mnemonic_to_address(mnemonic)
 
         balances: ChainAmounts = ChainAmounts()
         services: t.List[RecoveredServiceInfo] = []
         gas_warning: t.Dict[str, GasWarningEntry] = {}
+        errors: t.Dict[str, str] = {}
 
-        def _scan_chain(
+        def _scan_chain(  # pylint: disable=too-many-branches
             chain: t.Any,
         ) -> t.Tuple[
-            str, t.Dict[str, t.Any], t.List[RecoveredServiceInfo], GasWarningEntry
+            str,
+            t.Dict[str, t.Any],
+            t.List[RecoveredServiceInfo],
+            GasWarningEntry,
+            t.Optional[str],
         ]:
             chain_id = chain.id
             chain_id_str = str(chain_id)
             chain_balances: t.Dict[str, t.Any] = {}
             chain_services: t.List[RecoveredServiceInfo] = []
             chain_gas_warning: GasWarningEntry = GasWarningEntry(insufficient=True)
+            chain_error: t.Optional[str] = None
 
             try:
                 ledger_api = get_default_ledger_api(chain)
@@ -644,6 +665,7 @@ class FundRecoveryManager:  # pylint: disable=too-few-public-methods
                                         ledger_api=ledger_api,
                                         service_registry_address=service_registry_addr,
                                         owner_address=safe_addr,
+                                        chain=chain,
                                     )
                                     all_service_ids.extend(safe_owned_ids)
 
@@ -808,6 +830,12 @@ class FundRecoveryManager:  # pylint: disable=too-few-public-methods
                             "No contract addresses configured for chain %s; skipping service enumeration.",
                             chain.value,
                         )
+                except ActivityDiscoveryError as exc:
+                    # the services of the chain are unknown, not absent
+                    self._logger.warning(
+                        f"Service enumeration failed for chain {chain_id}: {exc}"
+                    )
+                    chain_error = str(exc)
                 except Exception as exc:  # pylint: disable=broad-except
                     self._logger.warning(
                         f"Service enumeration failed for chain {chain_id}: {exc}"
@@ -820,28 +848,79 @@ class FundRecoveryManager:  # pylint: disable=too-few-public-methods
                     ledger_api=ledger_api,
                 )
 
+            except ActivityDiscoveryError as exc:
+                logger.warning(f"Scan failed for chain {chain_id}: {exc}")
+                chain_error = str(exc)
             except Exception as exc:  # pylint: disable=broad-except
                 logger.warning(f"Scan failed for chain {chain_id}: {exc}")
 
-            return chain_id_str, chain_balances, chain_services, chain_gas_warning
+            return (
+                chain_id_str,
+                chain_balances,
+                chain_services,
+                chain_gas_warning,
+                chain_error,
+            )
+
+        def _chain_result(
+            future: concurrent.futures.Future,
+        ) -> FundRecoveryChainScanResult:
+            (
+                chain_id_str,
+                chain_balances,
+                chain_services,
+                chain_gas_warning,
+                chain_error,
+            ) = future.result()
+            balances[chain_id_str] = chain_balances
+            services.extend(chain_services)
+            gas_warning[chain_id_str] = chain_gas_warning
+            if chain_error is not None:
+                errors[chain_id_str] = chain_error
+            return FundRecoveryChainScanResult(
+                chain_id=chain_id_str,
+                balances=ChainAmounts({chain_id_str: chain_balances}),
+                services=chain_services,
+                gas_warning=chain_gas_warning,
+                error=chain_error,
+            )
 
-        with concurrent.futures.ThreadPoolExecutor(
+        executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=len(RECOVERY_CHAINS)
-        ) as executor:
-            futures = [executor.submit(_scan_chain, chain) for chain in RECOVERY_CHAINS]
-            for future in concurrent.futures.as_completed(futures):
-                chain_id_str, chain_balances, chain_services, chain_gas_warning = (
-                    future.result()
+        )
+        futures = {
+            executor.submit(_scan_chain, chain): chain for chain in RECOVERY_CHAINS
+        }
+        pending = set(futures)
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=timeout):
+                pending.discard(future)
+                yield _chain_result(future)
+        except concurrent.futures.TimeoutError:
+            for future in pending:
+                if future.done():
+                    yield _chain_result(future)
+                    continue
+                chain_id = futures[future].id
+                logger.warning(f"Scan timed out for chain {chain_id}")
+                errors[str(chain_id)] = "timeout"
+                yield FundRecoveryChainScanResult(
+                    chain_id=str(chain_id),
+                    balances=ChainAmounts(),
+                    services=[],
+                    gas_warning=GasWarningEntry(insufficient=True),
+                    error="timeout",
                 )
-                balances[chain_id_str] = chain_balances
-                services.extend(chain_services)
-                gas_warning[chain_id_str] = chain_gas_warning
+        finally:
+            # Do not wait for timed-out chains (or for a closed stream).
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        return FundRecoveryScanResponse(
+        yield FundRecoveryScanResponse(
             master_eoa_address=eoa_address,
             balances=balances,
             services=services,
             gas_warning=gas_warning,
+            errors=errors,
         )
 
     def execute(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements,too-many-nested-blocks
@@ -978,6 +1057,7 @@ class FundRecoveryManager:  # pylint: disable=too-few-public-methods
                                                 ledger_api=ledger_api,
                                                 service_registry_address=service_registry_addr,
                                                 owner_address=safe_addr,
+                                                chain=chain,
                                             )
                                         )
 
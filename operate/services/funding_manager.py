@@ -65,6 +65,7 @@ from operate.serialization import BigInt
 from operate.services.protocol import EthSafeTxBuilder, StakingManager, StakingState
 from operate.services.service import NON_EXISTENT_TOKEN, Service
 from operate.utils import concurrent_execute
+from operate.utils.event_bus import FUNDING_STATUS_EVENT, event_bus
 from operate.utils.gnosis import (
     Transfer,
     drain_eoa,
@@ -74,6 +75,7 @@ from operate.utils.gnosis import (
     transfer_batch_from_safe,
     transfer_erc20_from_eoa,
 )
+from operate.utils.metrics import timed_job
 from operate.wallet.master import InsufficientFundsException, MasterWalletManager
 
 # An ERC20 `transfer` typically uses ~3x the gas of a native transfer.
@@ -1340,6 +1342,7 @@ class FundingManager:  # pylint: disable=too-many-instance-attributes
                     f"transfer(s), executed {len(result.sent)} on {chain.value}."
                 )
 
+    @timed_job("fund_service")
     def fund_service(self, service: Service, amounts: ChainAmounts) -> None:
         """Fund service-related wallets."""
         service_config_id = service.service_config_id
@@ -1354,6 +1357,10 @@ class FundingManager:  # pylint: disable=too-many-instance-attributes
                     f"Funding already in progress for service {service_config_id}."
                 )
             self._funding_in_progress[service_config_id] = True
+        event_bus.publish(
+            FUNDING_STATUS_EVENT,
+            {"service_config_id": service_config_id, "in_progress": True},
+        )
 
         try:
             for chain_str, addresses in amounts.items():
@@ -1379,6 +1386,10 @@ class FundingManager:  # pylint: disable=too-many-instance-attributes
                 self._funding_requests_cooldown_until[service_config_id] = (
                     time() + self.funding_requests_cooldown_seconds
                 )
+            event_bus.publish(
+                FUNDING_STATUS_EVENT,
+                {"service_config_id": service_config_id, "in_progress": False},
+            )
 
     async def funding_job(
         self,
@@ -1394,10 +1405,11 @@ class FundingManager:  # pylint: disable=too-many-instance-attributes
                 # try claiming rewards every hour
                 if last_claim + 3600 < time():
                     try:
-                        await loop.run_in_executor(
-                            executor,
-                            service_manager.claim_all_on_chain_from_safe,
-                        )
+                        with timed_job("claim_rewards"):
+                            await loop.run_in_executor(
+                                executor,
+                                service_manager.claim_all_on_chain_from_safe,
+                            )
                     except Exception:  # pylint: disable=broad-except
                         self.logger.exception("Error occurred while claiming rewards")
                     last_claim = time()
@@ -1405,10 +1417,11 @@ class FundingManager:  # pylint: disable=too-many-instance-attributes
                 # fund Master EOA every hour
                 if last_master_eoa_funding + 3600 < time():
                     try:
-                        await loop.run_in_executor(
-                            executor,
-                            self.fund_master_eoa,
-                        )
+                        with timed_job("fund_master_eoa"):
+                            await loop.run_in_executor(
+                                executor,
+                                self.fund_master_eoa,
+                            )
                     except Exception:  # pylint: disable=broad-except
                         self.logger.exception("Error occurred while funding Master EOA")
                     last_master_eoa_funding = time()
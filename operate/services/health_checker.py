@@ -20,21 +20,522 @@
 """Source code for checking aea is alive.."""
 
 import asyncio
+import bisect
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+import math
+import random
 import threading
 import time
 import typing as t
+from collections import deque
+from dataclasses import asdict, dataclass
 from http import HTTPStatus
 from pathlib import Path
 
 import aiohttp  # type: ignore
 
 from operate.constants import HEALTHCHECK_JSON, HEALTH_CHECK_URL
+from operate.services.deploy_timings import deploy_timings
 from operate.services.manage import ServiceManager  # type: ignore
+from operate.services.service import is_healthy
+from operate.utils.event_bus import SERVICE_HEALTH_EVENT, event_bus
+from operate.utils.metrics import HEALTH_PROBES
+
+
+class LatencyHistogram:
+    """Cumulative histogram of health probe latencies."""
+
+    # Upper bounds of the buckets, in milliseconds
+    BUCKETS_MS: t.Tuple[int, ...] = (
+        5,
+        10,
+        25,
+        50,
+        100,
+        250,
+        500,
+        1000,
+        2500,
+        5000,
+        10000,
+        30000,
+    )
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record a probe that got an HTTP response."""
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def error(self) -> None:
+        """Record a probe that got no HTTP response."""
+        self.errors += 1
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """JSON representation; bucket counts are cumulative."""
+        buckets: t.Dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip((*self.BUCKETS_MS, "inf"), self.counts):
+            cumulative += count
+            buckets[f"le_{bound}ms" if bound != "inf" else "le_inf"] = cumulative
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "max_ms": self.max_ms if self.count else None,
+            "buckets": buckets,
+        }
+
+
+@dataclass(frozen=True)
+class HealthRecord:
+    """Result of a single health probe."""
+
+    timestamp: float
+    healthy: bool
+    latency_ms: t.Optional[float] = None
+
+
+class HealthHistory:
+    """Bounded history of the health probes of a service.
+
+    The latest payload is kept in memory and written to ``healthcheck.json``
+    only when it changes (the health state is part of the payload).
+    """
+
+    SIZE = 720  # 1 hour of probes at the default sleep period
+
+    def __init__(self, size: int = SIZE) -> None:
+        """Initialize the history."""
+        self.records: t.Deque[HealthRecord] = deque(maxlen=size)
+        self.latest: t.Optional[t.Dict] = None
+        self._digest: t.Optional[str] = None
+        self._mtime_ns: t.Optional[int] = None
+
+    def record(self, healthy: bool, latency_ms: t.Optional[float] = None) -> None:
+        """Record a probe result."""
+        self.records.append(HealthRecord(time.time(), healthy, latency_ms))
+
+    def persist(self, path: Path, payload: t.Dict) -> bool:
+        """Write `payload` to `path` unless it is unchanged; return whether written."""
+        self.latest = payload
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        if digest == self._digest and self.persisted(path):
+            return False
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        self._digest = digest
+        self._mtime_ns = path.stat().st_mtime_ns
+        return True
+
+    def persisted(self, path: Path) -> bool:
+        """Whether `path` still holds the last payload written by this history."""
+        try:
+            return path.stat().st_mtime_ns == self._mtime_ns
+        except OSError:
+            return False
 
+    def summary(self) -> t.Dict[str, t.Any]:
+        """Uptime, failure streaks and p95 latency over the recorded probes."""
+        records = list(self.records)
+        healthy = sum(1 for r in records if r.healthy)
+        longest_streak = streak = 0
+        for r in records:
+            streak = 0 if r.healthy else streak + 1
+            longest_streak = max(longest_streak, streak)
+        latencies = sorted(r.latency_ms for r in records if r.latency_ms is not None)
+        p95 = latencies[math.ceil(0.95 * len(latencies)) - 1] if latencies else None
+        return {
+            "count": len(records),
+            "uptime_pct": 100 * healthy / len(records) if records else None,
+            "current_failure_streak": streak,
+            "longest_failure_streak": longest_streak,
+            "p95_latency_ms": p95,
+            "since": records[0].timestamp if records else None,
+            "last_check": records[-1].timestamp if records else None,
+        }
+
+    def json(self, limit: t.Optional[int] = None) -> t.Dict[str, t.Any]:
+        """JSON representation with the summary and the newest `limit` records."""
+        records = list(self.records)
+        if limit is not None:
+            records = records[-limit:] if limit > 0 else []
+        return {
+            "summary": self.summary(),
+            "records": [asdict(r) for r in records],
+        }
+
+
+@dataclass
+class ProbeSchedule:
+    """Probe timing state of a service."""
+
+    interval: float
+    next_due: float = 0.0
+    healthy_streak: int = 0
+    last_result: t.Optional[bool] = None
+    last_probe: t.Optional[float] = None
+    seq: int = -1
+    pending: t.Optional[
+        t.Tuple["asyncio.Future[bool]", t.Optional[Path], t.Optional[float]]
+    ] = None
+
+
+class HealthCheckScheduler:  # pylint: disable=too-many-instance-attributes
+    """Single timer for the health probes of all services.
+
+    Service jobs await :meth:`probe`; one scheduler task keeps a heap of due
+    probes and runs them, at most ``max_concurrent`` at a time. The interval of
+    a service grows while it stays healthy and goes back to the base interval
+    after a failure or a restart. Due times are spread with a small jitter.
+    """
+
+    MAX_CONCURRENT_PROBES = 4
+    STABLE_PROBES = 3  # healthy probes in a row before the interval grows
+    BACKOFF_FACTOR = 2
+    MAX_INTERVAL_FACTOR = 6  # max interval = base interval * factor
+    JITTER = 0.1  # fraction of the interval
 
-class HealthChecker:
+    def __init__(
+        self,
+        probe_fn: t.Callable[[str, t.Optional[Path]], t.Awaitable[bool]],
+        base_interval: float,
+        max_interval: t.Optional[float] = None,
+        max_concurrent: int = MAX_CONCURRENT_PROBES,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._probe_fn = probe_fn
+        self.base_interval = base_interval
+        self.max_interval = max_interval or base_interval * self.MAX_INTERVAL_FACTOR
+        self.max_concurrent = max_concurrent
+        self._schedules: t.Dict[str, ProbeSchedule] = {}
+        self._heap: t.List[t.Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._in_flight: t.Set[asyncio.Task] = set()
+        self._semaphore: t.Optional[asyncio.Semaphore] = None
+        self._wakeup: t.Optional[asyncio.Event] = None
+        self._task: t.Optional[asyncio.Task] = None
+
+    def _ensure_running(self) -> asyncio.Event:
+        """Start the scheduler task if needed and return its wakeup event."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return t.cast(asyncio.Event, self._wakeup)
+
+    def _push(self, service_config_id: str, schedule: ProbeSchedule) -> None:
+        """Queue the pending probe of a service at its due time."""
+        schedule.seq = next(self._counter)
+        due = max(schedule.next_due, asyncio.get_running_loop().time())
+        heapq.heappush(self._heap, (due, schedule.seq, service_config_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def probe(
+        self,
+        service_config_id: str,
+        service_path: t.Optional[Path] = None,
+        interval: t.Optional[float] = None,
+    ) -> bool:
+        """Wait for the next due probe of a service and return its result.
+
+        With a fixed `interval`, a failed probe is retried after it, a
+        successful one makes the next probe due right away, and the adaptive
+        interval is left untouched.
+        """
+        self._ensure_running()
+        schedule = self._schedules.setdefault(
+            service_config_id, ProbeSchedule(interval=self.base_interval)
+        )
+        future: "asyncio.Future[bool]" = asyncio.get_running_loop().create_future()
+        schedule.pending = (future, service_path, interval)
+        self._push(service_config_id, schedule)
+        return await future
+
+    def reset(self, service_config_id: str) -> None:
+        """Probe a service again right away, at the base interval."""
+        schedule = self._schedules.get(service_config_id)
+        if schedule is None:
+            return
+        schedule.interval = self.base_interval
+        schedule.healthy_streak = 0
+        schedule.next_due = 0.0
+        if schedule.pending is not None:
+            self._push(service_config_id, schedule)
+
+    def remove(self, service_config_id: str) -> None:
+        """Stop scheduling probes for a service; a job waiting for one is cancelled."""
+        schedule = self._schedules.pop(service_config_id, None)
+        if schedule is not None and schedule.pending is not None:
+            schedule.pending[0].cancel()
+            schedule.pending = None
+
+    async def close(self) -> None:
+        """Stop the scheduler task and the probes in flight."""
+        tasks = [*self._in_flight, *([self._task] if self._task else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run the probes as they become due."""
+        loop = asyncio.get_running_loop()
+        wakeup = t.cast(asyncio.Event, self._wakeup)
+        while True:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, service_config_id = heapq.heappop(self._heap)
+                schedule = self._schedules.get(service_config_id)
+                if schedule is None or schedule.seq != seq or not schedule.pending:
+                    continue  # removed, rescheduled or already run
+                (future, service_path, interval), schedule.pending = (
+                    schedule.pending,
+                    None,
+                )
+                if future.done():
+                    continue  # the job stopped waiting
+                task = loop.create_task(
+                    self._execute(
+                        service_config_id, schedule, future, service_path, interval
+                    )
+                )
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+            wakeup.clear()
+            timer = loop.call_at(self._heap[0][0], wakeup.set) if self._heap else None
+            try:
+                await wakeup.wait()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+    async def _execute(  # pylint: disable=too-many-arguments
+        self,
+        service_config_id: str,
+        schedule: ProbeSchedule,
+        future: "asyncio.Future[bool]",
+        service_path: t.Optional[Path],
+        interval: t.Optional[float],
+    ) -> None:
+        """Run one probe and resolve the waiting job."""
+        loop = asyncio.get_running_loop()
+        async with t.cast(asyncio.Semaphore, self._semaphore):
+            schedule.last_probe = time.time()
+            error: t.Optional[BaseException] = None
+            try:
+                healthy = bool(await self._probe_fn(service_config_id, service_path))
+            except Exception as e:  # pylint: disable=broad-except
+                healthy, error = False, e
+
+        schedule.last_result = healthy
+        if interval is None:
+            if healthy:
+                schedule.healthy_streak += 1
+                if schedule.healthy_streak >= self.STABLE_PROBES:
+                    schedule.interval = min(
+                        schedule.interval * self.BACKOFF_FACTOR, self.max_interval
+                    )
+            else:
+                schedule.healthy_streak = 0
+                schedule.interval = self.base_interval
+        if interval is None:
+            wait = schedule.interval
+        else:
+            # fixed-interval polls (port readiness) only wait to retry a failure
+            wait = interval if error is not None else 0.0
+        jitter = random.uniform(-self.JITTER, self.JITTER)  # nosec B311
+        schedule.next_due = loop.time() + wait * (1 + jitter)
+
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(healthy)
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """JSON representation of the schedule."""
+        # due times are on the clock of the loop running the scheduler
+        now = self._task.get_loop().time() if self._task is not None else None
+        return {
+            "base_interval": self.base_interval,
+            "max_interval": self.max_interval,
+            "max_concurrent": self.max_concurrent,
+            "in_flight": len(self._in_flight),
+            "services": {
+                service_config_id: {
+                    "interval": schedule.interval,
+                    "due_in": (
+                        max(0.0, schedule.next_due - now)
+                        if now is not None and schedule.pending
+                        else None
+                    ),
+                    "waiting": schedule.pending is not None,
+                    "healthy_streak": schedule.healthy_streak,
+                    "last_result": schedule.last_result,
+                    "last_probe": schedule.last_probe,
+                }
+                for service_config_id, schedule in self._schedules.items()
+            },
+        }
+
+
+class TimeToHealthyHistogram(LatencyHistogram):
+    """Cumulative histogram of the time from a restart to a healthy probe."""
+
+    BUCKETS_MS = (10000, 30000, 60000, 120000, 300000, 600000, 1800000)
+
+
+@dataclass
+class RestartStats:
+    """Restart counters of a service."""
+
+    process_restarts: int = 0
+    rebuilds: int = 0
+    failures: int = 0
+    last_restart: t.Optional[float] = None
+    last_time_to_healthy: t.Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Initialize the time-to-healthy histogram."""
+        self.time_to_healthy = TimeToHealthyHistogram()
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """JSON representation of the stats."""
+        return {**asdict(self), "time_to_healthy": self.time_to_healthy.json}
+
+
+class RestartPipeline:
+    """Escalating restarts of unhealthy services.
+
+    A restart first restarts the agent and tendermint processes of the
+    existing build, with the tendermint chain data reset. It escalates to a full stop, rebuild and deploy when that
+    fails, or when the previous restart did not bring the service back to
+    healthy. Restarts of a service run one at a time, in request order, and
+    consecutive ones are spaced with an exponential backoff.
+    """
+
+    PROCESS = "process"
+    REBUILD = "rebuild"
+    BACKOFF_BASE = 15  # seconds before the second consecutive restart
+    BACKOFF_MAX = 300  # seconds
+
+    def __init__(self, service_manager: ServiceManager, logger: logging.Logger) -> None:
+        """Initialize the pipeline."""
+        self._service_manager = service_manager
+        self.logger = logger
+        self._locks: t.Dict[str, asyncio.Lock] = {}
+        # restarts since the service was last healthy
+        self._attempts: t.Dict[str, int] = {}
+        # start time and kind of the restart awaiting a healthy probe
+        self._pending: t.Dict[str, t.Tuple[float, str]] = {}
+        self._stats: t.Dict[str, RestartStats] = {}
+
+    def backoff(self, service_config_id: str) -> float:
+        """Seconds to wait before the next restart of a service."""
+        attempts = self._attempts.get(service_config_id, 0)
+        if attempts == 0:
+            return 0.0
+        return float(min(self.BACKOFF_BASE * 2 ** (attempts - 1), self.BACKOFF_MAX))
+
+    def stats(self, service_config_id: str) -> RestartStats:
+        """Get the restart stats of a service."""
+        return self._stats.setdefault(service_config_id, RestartStats())
+
+    def reset(self, service_config_id: str) -> None:
+        """Forget the pending restarts of a service (e.g. on a manual start)."""
+        self._attempts.pop(service_config_id, None)
+        self._pending.pop(service_config_id, None)
+
+    async def restart(self, service_config_id: str) -> str:
+        """Restart a service and return the kind of restart performed."""
+        lock = self._locks.setdefault(service_config_id, asyncio.Lock())
+        async with lock:
+            delay = self.backoff(service_config_id)
+            if delay:
+                self.logger.info(
+                    f"[HEALTH_CHECKER] {service_config_id} restart backoff {delay}s"
+                )
+                await asyncio.sleep(delay)
+
+            escalate = service_config_id in self._attempts
+            self._attempts[service_config_id] = (
+                self._attempts.get(service_config_id, 0) + 1
+            )
+            stats = self.stats(service_config_id)
+            stats.last_restart = started = time.time()
+            kind = self.REBUILD if escalate else self.PROCESS
+            try:
+                if kind == self.PROCESS:
+                    try:
+                        await asyncio.to_thread(
+                            self._service_manager.restart_service_locally,
+                            service_config_id=service_config_id,
+                        )
+                    except Exception as e:  # pylint: disable=broad-except
+                        self.logger.warning(
+                            f"[HEALTH_CHECKER] {service_config_id} process restart failed, rebuilding: {e}"
+                        )
+                        kind = self.REBUILD
+                if kind == self.REBUILD:
+                    await asyncio.to_thread(self._rebuild, service_config_id)
+            except Exception:
+                stats.failures += 1
+                raise
+
+            if kind == self.PROCESS:
+                stats.process_restarts += 1
+            else:
+                stats.rebuilds += 1
+            self._pending[service_config_id] = (started, kind)
+            return kind
+
+    def _rebuild(self, service_config_id: str) -> None:
+        """Stop, rebuild and deploy a service."""
+        self._service_manager.stop_service_locally(service_config_id=service_config_id)
+        self._service_manager.deploy_service_locally(
+            service_config_id=service_config_id, force_rebuild=True
+        )
+
+    def healthy(self, service_config_id: str) -> t.Optional[float]:
+        """Mark a service healthy; return the time since its restart, if any."""
+        self._attempts.pop(service_config_id, None)
+        pending = self._pending.pop(service_config_id, None)
+        if pending is None:
+            return None
+        started, kind = pending
+        elapsed = max(0.0, time.time() - started)
+        stats = self.stats(service_config_id)
+        stats.last_time_to_healthy = elapsed
+        stats.time_to_healthy.observe(elapsed)
+        self.logger.info(
+            f"[HEALTH_CHECKER] {service_config_id} healthy {elapsed:.1f}s after a {kind} restart"
+        )
+        return elapsed
+
+
+class HealthChecker:  # pylint: disable=too-many-instance-attributes
     """Health checker manager."""
 
     SLEEP_PERIOD_DEFAULT = 5  # seconds
@@ -43,6 +544,8 @@ class HealthChecker:
     NUMBER_OF_FAILS_DEFAULT = 60
     FAILFAST_NUM = 15
     FAILFAST_TIMEOUT = 15 * 60  # 15 minutes
+    CONNECTION_LIMIT_PER_HOST = 4
+    KEEPALIVE_TIMEOUT = 60  # seconds
 
     def __init__(
         self,
@@ -60,6 +563,60 @@ class HealthChecker:
         self.port_up_timeout = port_up_timeout or self.PORT_UP_TIMEOUT_DEFAULT
         self.sleep_period = sleep_period or self.SLEEP_PERIOD_DEFAULT
         self.number_of_fails = number_of_fails or self.NUMBER_OF_FAILS_DEFAULT
+        self._session: t.Optional[aiohttp.ClientSession] = None
+        self._latencies: t.Dict[str, LatencyHistogram] = {}
+        self._histories: t.Dict[str, HealthHistory] = {}
+        # resolve check_service_health on each call, it may be replaced
+        self.scheduler = HealthCheckScheduler(
+            lambda service_config_id, service_path: self.check_service_health(  # pylint: disable=unnecessary-lambda
+                service_config_id, service_path
+            ),
+            base_interval=self.sleep_period,
+        )
+        self.restarts = RestartPipeline(service_manager, logger)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared keep-alive session used for all probes."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_DEFAULT),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Stop the probe scheduler and close the shared session."""
+        await self.scheduler.close()
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def latency_stats(self, service_config_id: str) -> t.Dict[str, t.Any]:
+        """Get the probe latency histogram of a service."""
+        return self._latencies.get(service_config_id, LatencyHistogram()).json
+
+    def history(self, service_config_id: str) -> HealthHistory:
+        """Get the probe history of a service."""
+        return self._histories.setdefault(service_config_id, HealthHistory())
+
+    def get_latest_healthcheck(self, service: t.Any) -> t.Dict:
+        """Get the latest healthcheck payload of a service.
+
+        Served from memory while ``healthcheck.json`` still holds the payload
+        written by this checker; otherwise the file is read.
+        """
+        history = self._histories.get(service.service_config_id)
+        healthcheck_json_path = service.path / HEALTHCHECK_JSON
+        if (
+            history is not None
+            and history.latest is not None
+            and history.persisted(healthcheck_json_path)
+        ):
+            return history.latest
+        return service.get_latest_healthcheck()
 
     def start_for_service(self, service_config_id: str) -> None:
         """Start for a specific service."""
@@ -80,6 +637,8 @@ class HealthChecker:
                 )
 
             # Create new job
+            self.scheduler.reset(service_config_id)
+            self.restarts.reset(service_config_id)
             loop = asyncio.get_running_loop()
             self._jobs[service_config_id] = loop.create_task(
                 self.healthcheck_job(
@@ -105,44 +664,50 @@ class HealthChecker:
                 )
             # Remove from dict - task will handle cancellation
             del self._jobs[service_config_id]
+            self.scheduler.remove(service_config_id)
+            self.restarts.reset(service_config_id)
 
     async def check_service_health(  # pylint: disable=too-many-return-statements
         self, service_config_id: str, service_path: t.Optional[Path] = None
     ) -> bool:
         """Check the service health"""
-        del service_config_id
-        timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT_DEFAULT)
+        latencies = self._latencies.setdefault(service_config_id, LatencyHistogram())
+        history = self.history(service_config_id)
+        healthy: t.Any = False
+        latency: t.Optional[float] = None
+        started = time.monotonic()
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(HEALTH_CHECK_URL) as resp:
-                    status = resp.status
-
-                    if status != HTTPStatus.OK:
-                        # not HTTP OK -> not healthy for sure
-                        content = await resp.text()
-                        self.logger.warning(
-                            f"[HEALTH_CHECKER] Bad http status code : {status} content: {content}. not healthy!"
-                        )
-                        return False
+            async with self._get_session().get(HEALTH_CHECK_URL) as resp:
+                latency = time.monotonic() - started
+                latencies.observe(latency)
+                status = resp.status
+
+                if status != HTTPStatus.OK:
+                    # not HTTP OK -> not healthy for sure
+                    content = await resp.text()
+                    self.logger.warning(
+                        f"[HEALTH_CHECKER] Bad http status code : {status} content: {content}. not healthy!"
+                    )
+                    return False
 
-                    response_json = await resp.json()
+                response_json = await resp.json()
 
-                    if service_path:
-                        healthcheck_json_path = service_path / HEALTHCHECK_JSON
-                        healthcheck_json_path.write_text(
-                            json.dumps(response_json, indent=2), encoding="utf-8"
-                        )
+                if service_path:
+                    history.persist(service_path / HEALTHCHECK_JSON, response_json)
 
-                    return response_json.get(
-                        "is_healthy", response_json.get("is_transitioning_fast", False)
-                    )  # TODO: remove is_transitioning_fast after all the services start reporting is_healthy
+                healthy = is_healthy(response_json)
+                if healthy:
+                    deploy_timings.healthy(service_config_id)
+                return healthy
         except asyncio.TimeoutError as e:
+            latencies.error()
             # NOTE: Must come before OSError since TimeoutError is a subclass of OSError in Python 3.10+
             self.logger.error(
                 f"[HEALTH_CHECKER] Request timeout during health check: {e}. set not healthy!"
             )
             return False
         except aiohttp.ClientError as e:
+            latencies.error()
             self.logger.error(
                 f"[HEALTH_CHECKER] HTTP client error during health check: {e}. set not healthy!"
             )
@@ -166,6 +731,11 @@ class HealthChecker:
                 exc_info=True,
             )
             return False
+        finally:
+            history.record(
+                bool(healthy), latency * 1000 if latency is not None else None
+            )
+            HEALTH_PROBES.inc("healthy" if healthy else "unhealthy")
 
     async def healthcheck_job(  # pylint: disable=too-many-statements
         self,
@@ -183,14 +753,15 @@ class HealthChecker:
                 self.logger.info("[HEALTH_CHECKER]: wait port is up")
                 while True:
                     try:
-                        await self.check_service_health(service_config_id, service_path)
+                        await self.scheduler.probe(
+                            service_config_id, service_path, interval=sleep_period
+                        )
                         self.logger.info("[HEALTH_CHECKER]: port is UP")
                         return
                     except aiohttp.ClientConnectionError:
                         self.logger.error(
                             "[HEALTH_CHECKER]: error connecting http port"
                         )
-                    await asyncio.sleep(sleep_period)
 
             async def _check_port_ready(
                 timeout: int = self.port_up_timeout, sleep_period: int = 15
@@ -203,14 +774,12 @@ class HealthChecker:
                 except asyncio.TimeoutError:
                     return False
 
-            async def _check_health(
-                number_of_fails: int = 5, sleep_period: int = self.sleep_period
-            ) -> None:
+            async def _check_health(number_of_fails: int = 5) -> None:
                 fails = 0
                 while True:
                     try:
-                        # Check the service health
-                        healthy = await self.check_service_health(
+                        # Check the service health when the scheduler says it is due
+                        healthy = await self.scheduler.probe(
                             service_config_id, service_path
                         )
                     except aiohttp.ClientConnectionError as e:
@@ -225,6 +794,14 @@ class HealthChecker:
                         )
                         healthy = False
 
+                    event_bus.publish(
+                        SERVICE_HEALTH_EVENT,
+                        {
+                            "service_config_id": service_config_id,
+                            "healthy": bool(healthy),
+                        },
+                        key=(SERVICE_HEALTH_EVENT, service_config_id),
+                    )
                     if not healthy:
                         fails += 1
                         if fails == 1 or fails % 10 == 0 or fails >= number_of_fails:
@@ -237,6 +814,7 @@ class HealthChecker:
                         )
                         # reset fails if comes healty
                         fails = 0
+                        self.restarts.healthy(service_config_id)
 
                     if fails >= number_of_fails:
                         # too much fails, exit
@@ -245,21 +823,6 @@ class HealthChecker:
                         )
                         return
 
-                    await asyncio.sleep(sleep_period)
-
-            async def _restart(
-                service_manager: ServiceManager, service_config_id: str
-            ) -> None:
-                def _do_restart() -> None:
-                    service_manager.stop_service_locally(
-                        service_config_id=service_config_id
-                    )
-                    service_manager.deploy_service_locally(
-                        service_config_id=service_config_id
-                    )
-
-                await asyncio.to_thread(_do_restart)
-
             async def _stop(
                 service_manager: ServiceManager, service_config_id: str
             ) -> None:
@@ -282,23 +845,21 @@ class HealthChecker:
                         f"[HEALTH_CHECKER]  {service_config_id} port is ready, checking health every {self.sleep_period}"
                     )
                     failfast_records = []
-                    await _check_health(
-                        number_of_fails=self.number_of_fails,
-                        sleep_period=self.sleep_period,
-                    )
+                    await _check_health(number_of_fails=self.number_of_fails)
 
                 else:
                     self.logger.info(
                         "[HEALTH_CHECKER] port not ready within timeout. restart deployment"
                     )
 
-                # perform restart
-                # TODO: blocking!!!!!!!
+                # perform restart, the pipeline backs off between attempts
                 while True:
                     # we count every restart till success (port is up and healtcheck started)
                     failfast_records.append(time.time())
                     try:
-                        await _restart(self._service_manager, service_config_id)
+                        await self.restarts.restart(service_config_id)
+                        # probe the restarted service closely again
+                        self.scheduler.reset(service_config_id)
                         break
                     except Exception:  # pylint: disable=broad-except
                         if (len(failfast_records) >= self.FAILFAST_NUM) or (
@@ -308,7 +869,6 @@ class HealthChecker:
                             raise
 
                         self.logger.exception(f"Restart problem: {service_config_id}")
-                        await asyncio.sleep(30)
 
         except Exception:
             self.logger.exception(
@@ -22,6 +22,7 @@
 import json
 import logging
 import os
+import shutil
 import threading
 import traceback
 import typing as t
@@ -42,6 +43,7 @@ from operate.constants import (
     AGENT_LOG_ENV_VAR,
     AGENT_PERSISTENT_STORAGE_DIR,
     AGENT_PERSISTENT_STORAGE_ENV_VAR,
+    CONFIG_JSON,
     IPFS_ADDRESS,
     MIN_AGENT_BOND,
     POLY_SAFE_SERVICE_NAMES,
@@ -71,6 +73,7 @@ from operate.operate_types import (
     ServiceEnvProvisionType,
     ServiceTemplate,
 )
+from operate.services.deploy_timings import deploy_timings
 from operate.services.funding_manager import FundingManager
 from operate.services.protocol import (
     EthSafeTxBuilder,
@@ -86,6 +89,7 @@ from operate.services.service import (
     SERVICE_CONFIG_VERSION,
     Service,
 )
+from operate.utils.etag import file_version
 from operate.utils.gnosis import (
     get_asset_balance,
     simulate_safe_sub_tx,
@@ -207,6 +211,28 @@ class ServiceManager:
         services, _ = self.get_all_services()
         return [service.json for service in services]
 
+    def content_version(
+        self,
+        files: t.Sequence[str] = (CONFIG_JSON,),
+        service_config_id: t.Optional[str] = None,
+    ) -> t.List[str]:
+        """
+        Get the content version of services without loading them.
+
+        :param files: Files of each service the content is derived from.
+        :param service_config_id: Only this service; all services if None.
+        :return: One version entry per service and file.
+        """
+        if service_config_id is None:
+            service_ids = sorted(self.get_all_service_ids())
+        else:
+            service_ids = [service_config_id]
+        return [
+            f"{service_id}/{file}:{file_version(self.path / service_id / file)}"
+            for service_id in service_ids
+            for file in files
+        ]
+
     def exists(self, service_config_id: str) -> bool:
         """Check if service exists."""
         return (self.path / service_config_id).exists()
@@ -2230,6 +2256,7 @@ class ServiceManager:
         use_docker: bool = False,
         use_kubernetes: bool = False,
         build_only: bool = False,
+        force_rebuild: bool = False,
     ) -> Deployment:
         """
         Deploy service locally
@@ -2239,23 +2266,43 @@ class ServiceManager:
         :param use_docker: Use a Docker Compose deployment (True) or Host deployment (False).
         :param use_kubernetes: Use Kubernetes for deployment
         :param build_only: Only build the deployment without starting it
+        :param force_rebuild: Rebuild the deployment even if its build is up to date
         :return: Deployment instance
         """
-        service = self.load(service_config_id=service_config_id)
+        with deploy_timings.track(service_config_id):
+            service = self.load(service_config_id=service_config_id)
+
+            deployment = service.deployment
+            with deploy_timings.phase("build"):
+                deployment.build(
+                    use_docker=use_docker,
+                    use_kubernetes=use_kubernetes,
+                    force=force_rebuild,
+                    chain=chain or service.home_chain,
+                    keys_manager=self.keys_manager,
+                )
+            if build_only:
+                return deployment
+            with deploy_timings.phase("start"):
+                deployment.start(
+                    password=self.wallet_manager.password,
+                    use_docker=use_docker,
+                    is_aea=service.agent_release["is_aea"],
+                )
+            return deployment
+
+    def restart_service_locally(self, service_config_id: str) -> Deployment:
+        """
+        Restart the processes of a locally deployed service, reusing its build.
 
+        :param service_config_id: Service config id
+        :return: Deployment instance
+        """
+        service = self.load(service_config_id=service_config_id)
+        service.remove_latest_healthcheck()
         deployment = service.deployment
-        deployment.build(
-            use_docker=use_docker,
-            use_kubernetes=use_kubernetes,
-            force=True,
-            chain=chain or service.home_chain,
-            keys_manager=self.keys_manager,
-        )
-        if build_only:
-            return deployment
-        deployment.start(
+        deployment.restart(
             password=self.wallet_manager.password,
-            use_docker=use_docker,
             is_aea=service.agent_release["is_aea"],
         )
         return deployment
@@ -2304,6 +2351,69 @@ class ServiceManager:
         )
         return service
 
+    def update_service_locally(
+        self,
+        service_config_id: str,
+        service_template: ServiceTemplate,
+        allow_different_service_public_id: bool = False,
+        partial_update: bool = True,
+    ) -> Service:
+        """
+        Update a service, swapping its running host deployment for an updated one.
+
+        The updated deployment is built and set up while the running one keeps
+        running, which is then only stopped to restart the agent from the
+        updated build. If anything fails, the service is restored and the
+        previous deployment keeps running.
+
+        :param service_config_id: Service config id
+        :param service_template: Service template to update the service with
+        :param allow_different_service_public_id: Allow changing the service public id
+        :param partial_update: Update the given attributes only
+        :return: Service instance
+        """
+        service = self.load(service_config_id=service_config_id)
+        if service.deployment.status != DeploymentStatus.DEPLOYED:
+            return self.update(
+                service_config_id=service_config_id,
+                service_template=service_template,
+                allow_different_service_public_id=allow_different_service_public_id,
+                partial_update=partial_update,
+            )
+
+        self.logger.info(f"Updating deployed {service_config_id=}")
+        previous_is_aea = service.agent_release["is_aea"]
+        backup = service.backup()
+        try:
+            with deploy_timings.track(service_config_id):
+                with deploy_timings.phase("update"):
+                    service.update(
+                        service_template=service_template,
+                        allow_different_service_public_id=allow_different_service_public_id,
+                        partial_update=partial_update,
+                    )
+                with deploy_timings.phase("stage"):
+                    build_fingerprint = service.deployment.stage(
+                        keys_manager=self.keys_manager,
+                        password=self.wallet_manager.password,
+                    )
+                service.remove_latest_healthcheck()
+                with deploy_timings.phase("swap"):
+                    service.deployment.swap(
+                        password=self.wallet_manager.password,
+                        is_aea=service.agent_release["is_aea"],
+                        previous_is_aea=previous_is_aea,
+                        build_fingerprint=build_fingerprint,
+                    )
+        except Exception:
+            self.logger.exception(f"Updating deployed {service_config_id=} failed")
+            service.restore(backup=backup)
+            raise
+        finally:
+            shutil.rmtree(backup, ignore_errors=True)
+
+        return self.load(service_config_id=service_config_id)
+
     def funding_requirements(  # pylint: disable=too-many-locals,too-many-statements,too-many-nested-blocks
         self, service_config_id: str
     ) -> t.Dict:
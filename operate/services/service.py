@@ -19,6 +19,7 @@
 
 """Service as HTTP resource."""
 
+import hashlib
 import json
 import os
 import platform
@@ -64,13 +65,18 @@ from autonomy.deploy.generators.docker_compose.base import DockerComposeGenerato
 from autonomy.deploy.generators.kubernetes.base import KubernetesGenerator
 from docker import from_env
 
+from operate import __version__
 from operate.constants import (
     AGENT_FUNDS_STATUS_URL,
     AGENT_PERSISTENT_STORAGE_ENV_VAR,
     CONFIG_JSON,
     DEPLOYMENT_DIR,
     DEPLOYMENT_JSON,
+    DEPLOYMENT_PREVIOUS_DIR,
+    DEPLOYMENT_STAGING_DIR,
     HEALTHCHECK_JSON,
+    HEALTH_CHECK_URL,
+    SERVICE_BACKUP_DIR,
     SERVICE_SAFE_PLACEHOLDER,
     ZERO_ADDRESS,
 )
@@ -102,10 +108,23 @@ from operate.operate_types import (
     ServiceTemplate,
 )
 from operate.resource import LocalResource
-from operate.serialization import BigInt
-from operate.services.deployment_runner import run_host_deployment, stop_host_deployment
+from operate.serialization import BigInt, serialize
+from operate.services.deploy_timings import deploy_timings
+from operate.services.deployment_runner import (
+    prepare_host_deployment,
+    relocate_host_deployment,
+    reset_tendermint_state,
+    restart_host_deployment,
+    run_host_deployment,
+    stop_host_deployment,
+)
 from operate.services.utils import tendermint
-from operate.utils import secure_copy_private_key, unrecoverable_delete
+from operate.utils import secure_copy_private_key, unrecoverable_delete, wait_for
+from operate.utils.event_bus import (
+    ACHIEVEMENT_EVENT,
+    DEPLOYMENT_STATUS_EVENT,
+    event_bus,
+)
 from operate.utils.gnosis import get_asset_balance
 from operate.utils.ssl import create_ssl_certificate
 
@@ -121,6 +140,8 @@ NON_EXISTENT_MULTISIG = None
 NON_EXISTENT_TOKEN = -1
 
 AGENT_TYPE_IDS = {"mech": 37, "optimus": 40, "modius": 40, "trader": 25, "pett_ai": 80}
+BUILD_DIR_REMOVAL_TIMEOUT = 6.0  # seconds
+FIRST_HEALTHCHECK_TIMEOUT = 300.0  # seconds
 
 logger = setup_logger("operate.services.service")
 
@@ -144,6 +165,53 @@ def mkdirs(build_dir: Path) -> None:
             continue
 
 
+def _try_rmtree(path: Path) -> bool:
+    """Remove a directory tree; return whether it succeeded."""
+    try:
+        shutil.rmtree(path)
+    except OSError:
+        logger.debug(f"Failed to remove {path}, retrying...", exc_info=True)
+        return False
+    return True
+
+
+def _try_replace(source: Path, target: Path) -> bool:
+    """Move a directory tree; return whether it succeeded."""
+    try:
+        os.replace(source, target)
+    except OSError:
+        logger.debug(f"Failed to move {source} to {target}, retrying...", exc_info=True)
+        return False
+    return True
+
+
+def _move_build(source: Path, target: Path) -> None:
+    """Move a deployment build, waiting for windows to release its file handles."""
+    if not wait_for(
+        lambda: _try_replace(source, target),
+        timeout=BUILD_DIR_REMOVAL_TIMEOUT,
+        interval=0.5,
+    ):
+        os.replace(source, target)
+
+
+def is_healthy(healthcheck: t.Dict[str, t.Any]) -> bool:
+    """Whether the healthcheck response of an agent reports it healthy."""
+    # TODO: remove is_transitioning_fast after all the services start reporting is_healthy
+    return bool(
+        healthcheck.get("is_healthy", healthcheck.get("is_transitioning_fast", False))
+    )
+
+
+def _agent_is_healthy() -> bool:
+    """Whether the agent of a host deployment reports healthy on its healthcheck."""
+    try:
+        response = requests.get(HEALTH_CHECK_URL, timeout=5)
+        return response.status_code == requests.codes.ok and is_healthy(response.json())
+    except (requests.RequestException, ValueError):
+        return False
+
+
 def remove_service_network(service_name: str, force: bool = True) -> None:
     """Remove service network cache."""
     client = from_env()
@@ -375,6 +443,7 @@ class Deployment(LocalResource):
     status: DeploymentStatus
     nodes: DeployedNodes
     path: Path
+    build_fingerprint: t.Optional[str] = None
 
     _file = DEPLOYMENT_JSON
 
@@ -399,6 +468,16 @@ class Deployment(LocalResource):
         """Load a service"""
         return super().load(path)  # type: ignore
 
+    def store(self) -> None:
+        """Store the deployment and publish its status if it changed."""
+        super().store()
+        service_config_id = self.path.name
+        event_bus.publish(
+            DEPLOYMENT_STATUS_EVENT,
+            {"service_config_id": service_config_id, "status": self.status.value},
+            key=(DEPLOYMENT_STATUS_EVENT, service_config_id),
+        )
+
     def copy_previous_agent_run_logs(self) -> None:
         """Copy previous agent logs."""
         source_path = self.path / DEPLOYMENT_DIR / "agent" / "log.txt"
@@ -579,19 +658,17 @@ class Deployment(LocalResource):
             return
 
         if build.exists() and force:
-            stop_host_deployment(build_dir=build)
-            try:
-                # sleep needed to ensure all processes closed/killed otherwise it will block directory removal on windows
-                time.sleep(3)
+            with deploy_timings.phase("remove_previous_build"):
+                stop_host_deployment(build_dir=build)
                 self.copy_previous_agent_run_logs()
-                shutil.rmtree(build)
-            except Exception:  # pylint: disable=broad-except
-                logger.debug(
-                    "Failed to remove build dir on first attempt, retrying...",
-                    exc_info=True,
-                )
-                time.sleep(3)
-                shutil.rmtree(build)
+                # the processes have exited, but windows may release their file
+                # handles a little later, blocking the directory removal meanwhile
+                if not wait_for(
+                    lambda: _try_rmtree(build),
+                    timeout=BUILD_DIR_REMOVAL_TIMEOUT,
+                    interval=0.5,
+                ):
+                    shutil.rmtree(build)
 
         service = Service.load(path=self.path)
         if service.helper.config.number_of_agents > 1:
@@ -599,20 +676,39 @@ class Deployment(LocalResource):
                 "Host deployment currently only supports single agent deployments"
             )
 
-        if not chain:
-            chain = service.home_chain
+        self._generate_host_build(
+            service=service,
+            keys_manager=keys_manager,
+            build=build,
+            chain=chain or service.home_chain,
+            with_tm=with_tm,
+        )
 
-        chain_config = service.chain_configs[chain]
-        chain_data = chain_config.chain_data
+        self.status = DeploymentStatus.BUILT
+        self.store()
 
+    def _generate_host_build(  # pragma: no cover
+        self,
+        service: "Service",
+        keys_manager: KeysManager,
+        build: Path,
+        chain: str,
+        with_tm: bool,
+    ) -> None:
+        """Generate a host deployment build into `build`."""
+        chain_data = service.chain_configs[chain].chain_data
         keys_file = self.path / DEFAULT_KEYS_FILE
-        keys_file.write_text(
-            json.dumps(
-                [keys_manager.get(address).json for address in service.agent_addresses],
-                indent=4,
-            ),
-            encoding="utf-8",
-        )
+        with deploy_timings.phase("build_keys"):
+            keys_file.write_text(
+                json.dumps(
+                    [
+                        keys_manager.get(address).json
+                        for address in service.agent_addresses
+                    ],
+                    indent=4,
+                ),
+                encoding="utf-8",
+            )
         try:
             builder = ServiceBuilder.from_dir(
                 path=service.package_absolute_path,
@@ -633,11 +729,12 @@ class Deployment(LocalResource):
                 build_dir=build.resolve(),
                 use_tm_testnet_setup=True,
             )
-            if with_tm:
-                deployement_generator.generate_config_tendermint()
+            with deploy_timings.phase("build_generate"):
+                if with_tm:
+                    deployement_generator.generate_config_tendermint()
 
-            deployement_generator.generate()
-            deployement_generator.populate_private_keys()
+                deployement_generator.generate()
+                deployement_generator.populate_private_keys()
 
             # Add keys securely
             secure_copy_private_key(
@@ -650,9 +747,6 @@ class Deployment(LocalResource):
                 shutil.rmtree(build)
             raise e
 
-        self.status = DeploymentStatus.BUILT
-        self.store()
-
     def build(
         self,
         keys_manager: KeysManager,
@@ -666,13 +760,40 @@ class Deployment(LocalResource):
 
         :param use_docker: Use a Docker Compose deployment. If True, then no host deployment.
         :param use_kubernetes: Build Kubernetes deployment. If True, then no host deployment.
-        :param force: Remove existing deployment and build a new one
+        :param force: Remove existing deployment and build a new one, even if
+            the existing one was built from the same inputs
         :param chain: Chain to set runtime parameters on the deployment (home_chain if not provided).
         :return: Deployment object
         """
         # TODO: Maybe remove usage of chain and use home_chain always?
-        original_env = os.environ.copy()
         service = Service.load(path=self.path)
+        if (
+            not force
+            and not use_kubernetes
+            and self.build_fingerprint is not None
+            and self.build_fingerprint
+            == self._get_build_fingerprint(
+                service=service,
+                keys_manager=keys_manager,
+                use_docker=use_docker,
+                chain=chain,
+            )
+            and (self.path / DEPLOYMENT_DIR).exists()
+        ):
+            logger.info("Deployment build is up to date, reusing it")
+            # agent logs of the previous run are otherwise lost on the next start
+            self.copy_previous_agent_run_logs()
+            try:
+                # only the runtime state is refreshed, as a new build would be
+                reset_tendermint_state(build_dir=self.path / DEPLOYMENT_DIR)
+            except OSError as e:
+                logger.warning(f"Could not reset the deployment build, rebuilding: {e}")
+            else:
+                self.status = DeploymentStatus.BUILT
+                self.store()
+                return
+
+        original_env = os.environ.copy()
 
         if use_docker or use_kubernetes:
             ssl_key_path, ssl_cert_path = create_ssl_certificate(
@@ -691,7 +812,7 @@ class Deployment(LocalResource):
             )
             service.consume_env_variables()
             if use_docker:
-                self._build_docker(keys_manager=keys_manager, force=force, chain=chain)
+                self._build_docker(keys_manager=keys_manager, force=True, chain=chain)
             if use_kubernetes:
                 self._build_kubernetes(keys_manager=keys_manager, force=force)
         else:
@@ -708,7 +829,7 @@ class Deployment(LocalResource):
             is_aea = service.agent_release["is_aea"]
             self._build_host(
                 keys_manager=keys_manager,
-                force=force,
+                force=True,
                 chain=chain,
                 with_tm=is_aea,
             )
@@ -716,6 +837,42 @@ class Deployment(LocalResource):
         os.environ.clear()
         os.environ.update(original_env)
 
+        self.build_fingerprint = (
+            None
+            if use_kubernetes
+            else self._get_build_fingerprint(
+                service=service,
+                keys_manager=keys_manager,
+                use_docker=use_docker,
+                chain=chain,
+            )
+        )
+        self.store()
+
+    @staticmethod
+    def _get_build_fingerprint(
+        service: "Service",
+        keys_manager: KeysManager,
+        use_docker: bool,
+        chain: t.Optional[str],
+    ) -> str:
+        """Hash of everything a deployment build is generated from."""
+        build_inputs = {
+            "operate_version": __version__,
+            "service_hash": service.hash,
+            "env_variables": service.env_variables,
+            "agent_keys": [
+                keys_manager.get(address) for address in service.agent_addresses
+            ],
+            "chain": chain,
+            "chain_configs": service.chain_configs,
+            "agent_release": service.agent_release,
+            "use_docker": use_docker,
+        }
+        return hashlib.sha256(
+            json.dumps(serialize(build_inputs), sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     def start(
         self,
         password: str,
@@ -752,6 +909,164 @@ class Deployment(LocalResource):
         self.status = DeploymentStatus.DEPLOYED
         self.store()
 
+    def restart(self, password: str, is_aea: bool = True) -> None:
+        """Restart the processes of a host deployment, reusing its build."""
+        if self.status not in (DeploymentStatus.DEPLOYED, DeploymentStatus.BUILT):
+            raise NotAllowed(
+                f"The deployment is in {self.status}; It needs to be in {DeploymentStatus.DEPLOYED} status"
+            )
+
+        self.status = DeploymentStatus.DEPLOYING
+        self.store()
+
+        try:
+            restart_host_deployment(
+                build_dir=self.path / DEPLOYMENT_DIR,
+                password=password,
+                is_aea=is_aea,
+            )
+        except Exception:
+            self.status = DeploymentStatus.BUILT
+            self.store()
+            raise
+
+        self.status = DeploymentStatus.DEPLOYED
+        self.store()
+
+    def stage(self, keys_manager: KeysManager, password: str) -> str:
+        """Build and set up the next host deployment while the current one runs.
+
+        The staged deployment is generated in the staging directory as if it
+        was at the deployment directory, where `swap` moves it. Returns the
+        fingerprint of the staged build.
+        """
+        service = Service.load(path=self.path)
+        if service.helper.config.number_of_agents > 1:
+            raise RuntimeError(
+                "Host deployment currently only supports single agent deployments"
+            )
+
+        staging = self.path / DEPLOYMENT_STAGING_DIR
+        if staging.exists():
+            shutil.rmtree(staging)
+
+        is_aea = service.agent_release["is_aea"]
+        original_env = os.environ.copy()
+        try:
+            ssl_key_path, ssl_cert_path = create_ssl_certificate(
+                ssl_dir=staging / "ssl"
+            )
+            ssl_dir = self.path / DEPLOYMENT_DIR / "ssl"
+            service.update_env_variables_values(
+                {
+                    "SSL_KEY_PATH": str(ssl_dir / ssl_key_path.name),
+                    "SSL_CERT_PATH": str(ssl_dir / ssl_cert_path.name),
+                }
+            )
+            service.consume_env_variables()
+            self._generate_host_build(
+                service=service,
+                keys_manager=keys_manager,
+                build=staging,
+                chain=service.home_chain,
+                with_tm=is_aea,
+            )
+            prepare_host_deployment(build_dir=staging, password=password, is_aea=is_aea)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        finally:
+            os.environ.clear()
+            os.environ.update(original_env)
+
+        return self._get_build_fingerprint(
+            service=service,
+            keys_manager=keys_manager,
+            use_docker=False,
+            chain=service.home_chain,
+        )
+
+    def swap(
+        self,
+        password: str,
+        is_aea: bool = True,
+        previous_is_aea: bool = True,
+        build_fingerprint: t.Optional[str] = None,
+    ) -> None:
+        """Replace the running host deployment with the staged one.
+
+        The previous deployment is kept until the agent of the staged one
+        reports healthy on its healthcheck. Otherwise, the previous deployment
+        is moved back and restarted, and the error raised.
+        """
+        staging = self.path / DEPLOYMENT_STAGING_DIR
+        if not staging.exists():
+            raise NotAllowed(f"There is no staged deployment at {staging}")
+
+        build = self.path / DEPLOYMENT_DIR
+        previous = self.path / DEPLOYMENT_PREVIOUS_DIR
+        if previous.exists():
+            shutil.rmtree(previous)
+
+        self.status = DeploymentStatus.DEPLOYING
+        self.store()
+
+        try:
+            stop_host_deployment(build_dir=build, is_aea=previous_is_aea)
+            self.copy_previous_agent_run_logs()
+            _move_build(build, previous)
+        except Exception:
+            self.status = DeploymentStatus.BUILT
+            self.store()
+            raise
+
+        try:
+            _move_build(staging, build)
+            relocate_host_deployment(
+                build_dir=build, previous_dir=staging, is_aea=is_aea
+            )
+            restart_host_deployment(build_dir=build, password=password, is_aea=is_aea)
+            if not wait_for(
+                _agent_is_healthy,
+                timeout=FIRST_HEALTHCHECK_TIMEOUT,
+                interval=1.0,
+            ):
+                raise RuntimeError(
+                    f"The agent did not report healthy within {FIRST_HEALTHCHECK_TIMEOUT} seconds"
+                )
+        except Exception as e:
+            logger.error(f"Staged deployment failed, rolling back: {e}")
+            self._roll_back(
+                password=password, is_aea=is_aea, previous_is_aea=previous_is_aea
+            )
+            raise
+
+        shutil.rmtree(previous, ignore_errors=True)
+        self.build_fingerprint = build_fingerprint
+        self.status = DeploymentStatus.DEPLOYED
+        self.store()
+
+    def _roll_back(self, password: str, is_aea: bool, previous_is_aea: bool) -> None:
+        """Put the previous deployment back in place of a failed swap and restart it."""
+        build = self.path / DEPLOYMENT_DIR
+        # missing if the staged deployment could not be moved in place
+        if build.exists():
+            try:
+                stop_host_deployment(build_dir=build, is_aea=is_aea)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to stop the staged deployment")
+            if not wait_for(
+                lambda: _try_rmtree(build),
+                timeout=BUILD_DIR_REMOVAL_TIMEOUT,
+                interval=0.5,
+            ):
+                shutil.rmtree(build)
+        _move_build(self.path / DEPLOYMENT_PREVIOUS_DIR, build)
+
+        self.status = DeploymentStatus.BUILT
+        self.store()
+        self.restart(password=password, is_aea=previous_is_aea)
+
     def stop(
         self,
         use_docker: bool = False,
@@ -901,21 +1216,25 @@ class Service(LocalResource):
             not package_absolute_path.exists()
             or not (package_absolute_path / DEFAULT_SERVICE_CONFIG_FILE).exists()
         ):
-            with tempfile.TemporaryDirectory(dir=self.path) as temp_dir:
-                package_temp_path = Path(
-                    IPFSTool().download(
-                        hash_id=self.hash,
-                        target_dir=temp_dir,
-                    )
+            self._download_package()
+            self.store()
+
+    def _download_package(self) -> None:
+        """Download the package of the service hash, replacing the local one."""
+        with tempfile.TemporaryDirectory(dir=self.path) as temp_dir:
+            package_temp_path = Path(
+                IPFSTool().download(
+                    hash_id=self.hash,
+                    target_dir=temp_dir,
                 )
-                target_path = self.path / package_temp_path.name
+            )
+            target_path = self.path / package_temp_path.name
 
-                if target_path.exists():
-                    shutil.rmtree(target_path)
+            if target_path.exists():
+                shutil.rmtree(target_path)
 
-                shutil.move(package_temp_path, target_path)
-                self.package_path = Path(target_path.name)
-                self.store()
+            shutil.move(package_temp_path, target_path)
+            self.package_path = Path(target_path.name)
 
     @staticmethod
     def new(  # pylint: disable=too-many-locals
@@ -1124,7 +1443,7 @@ class Service(LocalResource):
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Cannot read file 'agent_performance.json': {e}")
 
-            save_changes = False
+            new_achievements = []
             for achievement_id in agent_achievements:
                 if achievement_id not in achievements_notifications.notifications:
                     achievements_notifications.notifications[achievement_id] = (
@@ -1134,10 +1453,18 @@ class Service(LocalResource):
                             acknowledgement_timestamp=0,
                         )
                     )
-                    save_changes = True
+                    new_achievements.append(achievement_id)
 
-            if save_changes:
+            if new_achievements:
                 achievements_notifications.store()
+                for achievement_id in new_achievements:
+                    event_bus.publish(
+                        ACHIEVEMENT_EVENT,
+                        {
+                            "service_config_id": self.service_config_id,
+                            "achievement_id": achievement_id,
+                        },
+                    )
 
         return achievements_notifications, agent_achievements
 
@@ -1223,17 +1550,15 @@ class Service(LocalResource):
         self.description = service_template.get("description", self.description)
         self.name = service_template.get("name", self.name)
 
-        package_absolute_path = self.path / self.package_path
-        if package_absolute_path.exists():
-            shutil.rmtree(package_absolute_path)
-
-        package_absolute_path = Path(
-            IPFSTool().download(
-                hash_id=self.hash,
-                target_dir=self.path,
-            )
-        )
-        self.package_path = Path(package_absolute_path.name)
+        # the previous package is kept until the new one is downloaded
+        previous_package_path = self.path / self.package_path
+        self._download_package()
+        if (
+            previous_package_path.parent == self.path
+            and previous_package_path.name != self.package_path.name
+            and previous_package_path.exists()
+        ):
+            shutil.rmtree(previous_package_path)
 
         self.agent_release = service_template.get("agent_release", self.agent_release)
 
@@ -1285,6 +1610,38 @@ class Service(LocalResource):
 
         self.store()
 
+    def backup(self) -> Path:
+        """Back up the configuration and package of the service."""
+        backup = self.path / SERVICE_BACKUP_DIR
+        if backup.exists():
+            shutil.rmtree(backup)
+        backup.mkdir()
+        shutil.copy2(self.path / CONFIG_JSON, backup / CONFIG_JSON)
+        package_absolute_path = self.path / self.package_path
+        if package_absolute_path.exists():
+            shutil.copytree(package_absolute_path, backup / package_absolute_path.name)
+        return backup
+
+    def restore(self, backup: Path) -> "Service":
+        """Restore the configuration and package of the service from a backup."""
+        restored = Service.load(path=backup)
+        restored.path = self.path
+        for package_absolute_path in (
+            self.path / self.package_path,
+            self.path / restored.package_path,
+        ):
+            if (
+                package_absolute_path.parent == self.path
+                and package_absolute_path.exists()
+            ):
+                shutil.rmtree(package_absolute_path)
+        if (backup / restored.package_path).exists():
+            shutil.copytree(
+                backup / restored.package_path, self.path / restored.package_path
+            )
+        restored.store()
+        return restored
+
     def update_user_params_from_template(
         self, service_template: ServiceTemplate
     ) -> None:
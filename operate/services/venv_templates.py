@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Template virtualenvs for host python deployments."""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import threading
+import typing as t
+import uuid
+from pathlib import Path
+from venv import main as venv_cli
+
+# Template creation is serialized, so that concurrent deployments needing
+# the same template install it once
+_CREATE_LOCK = threading.Lock()
+
+
+class VenvTemplateCache:
+    """Virtualenvs with a set of requirements installed, cloned per deployment.
+
+    A template is created once per python version and requirements set.
+    Deployments get a clone of it: files are hard linked, except for the
+    scripts and configuration referencing the venv location, which are
+    copied with the location rewritten.
+    """
+
+    MARKER = ".venv_template.json"
+    TMP_PREFIX = ".tmp-"
+    BIN_DIR = "bin"
+    PYVENV_CFG = "pyvenv.cfg"
+
+    def __init__(
+        self,
+        path: Path,
+        logger: logging.Logger,
+        run_cmd: t.Callable[[t.List[str]], None],
+    ) -> None:
+        """Initialize the cache.
+
+        `run_cmd` runs a command, raising on failure.
+        """
+        self.path = path
+        self.logger = logger
+        self.run_cmd = run_cmd
+
+    @staticmethod
+    def key(requirements: t.Sequence[str]) -> str:
+        """Key of the template for `requirements` on the running python."""
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "python": sys.version,
+                    "executable": sys.executable,
+                    "platform": platform.platform(),
+                    "requirements": sorted(requirements),
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+    def template_path(self, requirements: t.Sequence[str]) -> Path:
+        """Location of the template for `requirements`."""
+        return self.path / self.key(requirements)
+
+    def get_or_create(
+        self,
+        requirements: t.Sequence[str],
+        wheelhouse: t.Optional[Path] = None,
+    ) -> Path:
+        """Get the template for `requirements`, creating it if needed.
+
+        With a `wheelhouse`, requirements are installed from it only, so
+        that a template can be created offline.
+        """
+        template = self.template_path(requirements)
+        with _CREATE_LOCK:
+            if (template / self.MARKER).exists():
+                return template
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            for leftover in self.path.glob(f"{self.TMP_PREFIX}*"):
+                shutil.rmtree(leftover, ignore_errors=True)
+
+            self.logger.info(f"Creating venv template {template.name}")
+            build = self.path / f"{self.TMP_PREFIX}{uuid.uuid4().hex}"
+            try:
+                venv_cli(args=[str(build)])
+                args = [str(build / self.BIN_DIR / "python"), "-m", "pip", "install"]
+                if wheelhouse is not None:
+                    args += ["--no-index", "--find-links", str(wheelhouse)]
+                self.run_cmd([*args, *requirements])
+                (build / self.MARKER).write_text(
+                    json.dumps(
+                        {"path": str(build), "requirements": list(requirements)}
+                    ),
+                    encoding="utf-8",
+                )
+                if template.exists():
+                    shutil.rmtree(template)
+                os.replace(build, template)
+            finally:
+                shutil.rmtree(build, ignore_errors=True)
+        return template
+
+    def clone(self, template: Path, target: Path) -> None:
+        """Clone `template` into a working venv at `target`."""
+        marker = json.loads((template / self.MARKER).read_text(encoding="utf-8"))
+        old_prefix = marker["path"].encode()
+        new_prefix = str(target).encode()
+        if target.exists() or target.is_symlink():
+            shutil.rmtree(target)
+
+        for root, dirs, files in os.walk(template):
+            source_dir = Path(root)
+            relative = source_dir.relative_to(template)
+            target_dir = target / relative
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for name in list(dirs):
+                if (source_dir / name).is_symlink():
+                    # e.g. lib64 -> lib; not walked, recreated as is
+                    os.symlink(os.readlink(source_dir / name), target_dir / name)
+                    dirs.remove(name)
+            for name in files:
+                source, destination = source_dir / name, target_dir / name
+                if relative == Path() and name == self.MARKER:
+                    continue
+                if source.is_symlink():
+                    os.symlink(os.readlink(source), destination)
+                elif relative == Path(self.BIN_DIR) or (
+                    relative == Path() and name == self.PYVENV_CFG
+                ):
+                    self._copy_relocated(source, destination, old_prefix, new_prefix)
+                else:
+                    try:
+                        os.link(source, destination)
+                    except OSError:
+                        shutil.copy2(source, destination)
+
+    @classmethod
+    def relocate(cls, venv: Path, old_prefix: Path, new_prefix: Path) -> None:
+        """Point the scripts of a venv moved from under `old_prefix` to `new_prefix`."""
+        old, new = str(old_prefix).encode(), str(new_prefix).encode()
+        bin_dir = venv / cls.BIN_DIR
+        paths = [venv / cls.PYVENV_CFG]
+        if bin_dir.is_dir():
+            paths += [path for path in bin_dir.iterdir() if not path.is_symlink()]
+        for path in paths:
+            if not path.is_file():
+                continue
+            content = path.read_bytes()
+            if old in content and b"\0" not in content:
+                path.write_bytes(content.replace(old, new))
+
+    @staticmethod
+    def _copy_relocated(
+        source: Path, destination: Path, old_prefix: bytes, new_prefix: bytes
+    ) -> None:
+        """Copy a file, pointing references to the template to the clone."""
+        content = source.read_bytes()
+        if old_prefix not in content or b"\0" in content:
+            shutil.copy2(source, destination)
+            return
+        destination.write_bytes(content.replace(old_prefix, new_prefix))
+        shutil.copymode(source, destination)
@@ -35,6 +35,7 @@ from pathlib import Path
 
 from operate.constants import DEFAULT_TIMEOUT
 from operate.serialization import BigInt
+from operate.utils.metrics import TIMED_BLOCK_DURATION
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +126,22 @@ def safe_file_operation(operation: t.Callable, *args: t.Any, **kwargs: t.Any) ->
                 time.sleep(0.1)
 
 
+def wait_for(
+    condition: t.Callable[[], bool], timeout: float, interval: float = 0.1
+) -> bool:
+    """Wait until `condition` holds, polling every `interval` seconds.
+
+    Returns as soon as the condition holds, or False once `timeout` passed.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+    return True
+
+
 def secure_copy_private_key(src: Path, dst: Path) -> None:
     """
     Securely copy a private key file with strict permissions (0o600).
@@ -186,6 +203,7 @@ def timing_context(label: str = "Block") -> t.Generator[None, None, None]:
         yield
     finally:
         end = time.perf_counter()
+        TIMED_BLOCK_DURATION.observe(end - start, label)
         logger.debug(f"[{label}] Elapsed time: {end - start:.4f} seconds")
 
 
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Resumable downloads over parallel HTTP range requests."""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import requests
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_PARTS = 4
+MIN_PART_SIZE = 8 * 1024 * 1024
+JOURNAL_INTERVAL = 1.0  # seconds
+PART_SUFFIX = ".part"
+JOURNAL_SUFFIX = ".part.json"
+
+CONTENT_RANGE_REGEX = re.compile(r"bytes 0-0/(\d+)")
+
+
+def file_sha256(path: Path) -> str:
+    """Sha256 of a file, as ``sha256:<hex>``."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            sha256_hash = hashlib.file_digest(f, "sha256")
+        else:  # pragma: no cover
+            sha256_hash = hashlib.sha256()
+            for byte_block in iter(lambda: f.read(CHUNK_SIZE), b""):
+                sha256_hash.update(byte_block)
+    return "sha256:" + sha256_hash.hexdigest()
+
+
+@dataclass
+class DownloadProgress:
+    """Progress of a download."""
+
+    url: str
+    path: str
+    total_bytes: t.Optional[int] = None
+    downloaded_bytes: int = 0
+    status: str = "downloading"
+    error: t.Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the download is over."""
+        return self.status != "downloading"
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """To dictionary object."""
+        return {
+            "url": self.url,
+            "path": self.path,
+            "total_bytes": self.total_bytes,
+            "downloaded_bytes": self.downloaded_bytes,
+            "status": self.status,
+            "error": self.error,
+            "started_at": self.started_at,
+        }
+
+
+class DownloadTracker:
+    """Progress of the running and most recent downloads, by target path."""
+
+    HISTORY_SIZE = 20
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._lock = threading.Lock()
+        self._downloads: "OrderedDict[str, DownloadProgress]" = OrderedDict()
+
+    def start(self, url: str, path: Path) -> DownloadProgress:
+        """Track a new download."""
+        progress = DownloadProgress(url=url, path=str(path))
+        with self._lock:
+            self._downloads.pop(progress.path, None)
+            self._downloads[progress.path] = progress
+            finished = [k for k, v in self._downloads.items() if v.finished]
+            for key in finished[: max(0, len(self._downloads) - self.HISTORY_SIZE)]:
+                del self._downloads[key]
+        return progress
+
+    @property
+    def json(self) -> t.List[t.Dict[str, t.Any]]:
+        """To list of dictionary objects."""
+        with self._lock:
+            return [progress.json for progress in self._downloads.values()]
+
+
+download_tracker = DownloadTracker()
+
+
+class RangeDownloader:  # pylint: disable=too-many-instance-attributes
+    """Downloads a file in parallel parts, resuming after interruptions.
+
+    Data goes to ``<path>.part``, and ``<path>.part.json`` journals the
+    bytes done in each part. A later run with the same URL resumes from the
+    journal, as long as the size and validator (ETag or Last-Modified) of
+    the remote file are unchanged. Servers without range support get a
+    single, non-resumable request.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        url: str,
+        path: Path,
+        timeout: float,
+        expected_hash: t.Optional[str] = None,
+        parts: int = DEFAULT_PARTS,
+        tracker: DownloadTracker = download_tracker,
+    ) -> None:
+        """Initialize the downloader."""
+        self.url = url
+        self.path = path
+        self.timeout = timeout
+        self.expected_hash = expected_hash
+        self.parts = parts
+        self.tracker = tracker
+        self.part_path = path.with_name(path.name + PART_SUFFIX)
+        self.journal_path = path.with_name(path.name + JOURNAL_SUFFIX)
+        self.progress = DownloadProgress(url=url, path=str(path))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._journal_written = 0.0
+
+    def run(self) -> None:
+        """Download the file to `path`, verifying it against `expected_hash`."""
+        self.progress = self.tracker.start(self.url, self.path)
+        try:
+            self._download()
+            if self.expected_hash is not None:
+                downloaded_hash = file_sha256(self.part_path)
+                if downloaded_hash != self.expected_hash:
+                    self._discard()
+                    raise ValueError(
+                        f"Hash verification failed for {self.path.name}!\n"
+                        f"Expected: {self.expected_hash}\n"
+                        f"Got:      {downloaded_hash}\n"
+                        f"Downloaded file may be corrupted or tampered."
+                    )
+            os.replace(self.part_path, self.path)
+            self.journal_path.unlink(missing_ok=True)
+        except Exception as e:
+            self.progress.status = "failed"
+            self.progress.error = str(e)
+            raise
+        self.progress.status = "completed"
+
+    def _discard(self) -> None:
+        self.part_path.unlink(missing_ok=True)
+        self.journal_path.unlink(missing_ok=True)
+
+    def _download(self) -> None:
+        # a one byte range request tells whether ranges are supported, and
+        # doubles as the full download when they are not
+        response = requests.get(
+            self.url, headers={"Range": "bytes=0-0"}, stream=True, timeout=self.timeout
+        )
+        response.raise_for_status()
+        with response:
+            match = (
+                CONTENT_RANGE_REGEX.fullmatch(response.headers.get("Content-Range", ""))
+                if response.status_code == 206
+                else None
+            )
+            if match is None:
+                self._stream(response)
+                return
+            size = int(match.group(1))
+            validator = response.headers.get("ETag") or response.headers.get(
+                "Last-Modified", ""
+            )
+
+        journal = self._load_journal(size, validator)
+        if journal is None:
+            part_size = math.ceil(size / self._number_of_parts(size))
+            journal = {
+                "url": self.url,
+                "size": size,
+                "validator": validator,
+                "parts": [
+                    [start, min(start + part_size, size) - 1, 0]
+                    for start in range(0, size, part_size)
+                ],
+            }
+            with open(self.part_path, "wb") as f:
+                f.truncate(size)
+            self._write_journal(journal)
+
+        self.progress.total_bytes = size
+        self.progress.downloaded_bytes = sum(done for _, _, done in journal["parts"])
+        pending = [
+            i
+            for i, (start, end, done) in enumerate(journal["parts"])
+            if start + done <= end
+        ]
+        if not pending:
+            return
+        with ThreadPoolExecutor(
+            max_workers=len(pending), thread_name_prefix="operate-download"
+        ) as executor:
+            futures = [executor.submit(self._fetch_part, journal, i) for i in pending]
+            errors = []
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    # the other parts stop too; their progress is journaled
+                    self._stop.set()
+                    errors.append(error)
+        self._write_journal(journal)
+        if errors:
+            raise errors[0]
+
+    def _number_of_parts(self, size: int) -> int:
+        return max(1, min(self.parts, size // MIN_PART_SIZE))
+
+    def _stream(self, response: requests.Response) -> None:
+        """Download with a single request; the journal is not used."""
+        self.journal_path.unlink(missing_ok=True)
+        content_length = response.headers.get("Content-Length")
+        self.progress.total_bytes = int(content_length) if content_length else None
+        with open(self.part_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+                self.progress.downloaded_bytes += len(chunk)
+
+    def _fetch_part(self, journal: t.Dict[str, t.Any], index: int) -> None:
+        start, end, done = journal["parts"][index]
+        response = requests.get(
+            self.url,
+            headers={"Range": f"bytes={start + done}-{end}"},
+            stream=True,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        with response, open(self.part_path, "r+b") as f:
+            if response.status_code != 206:
+                raise ValueError(f"Range request ignored by the server for {self.url}")
+            f.seek(start + done)
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if self._stop.is_set():
+                    return
+                chunk = chunk[: end + 1 - (start + done)]
+                f.write(chunk)
+                # journal only what reached the file
+                f.flush()
+                done += len(chunk)
+                with self._lock:
+                    journal["parts"][index][2] = done
+                    self.progress.downloaded_bytes += len(chunk)
+                    if time.monotonic() - self._journal_written >= JOURNAL_INTERVAL:
+                        self._write_journal(journal)
+        if start + done <= end:
+            raise requests.exceptions.ChunkedEncodingError(
+                f"Connection closed with {end + 1 - start - done} bytes missing"
+            )
+
+    def _load_journal(self, size: int, validator: str) -> t.Optional[t.Dict]:
+        """The journal of an interrupted download of the same file, if any."""
+        try:
+            journal = json.loads(self.journal_path.read_text(encoding="utf-8"))
+            resumable = (
+                journal["url"] == self.url
+                and journal["size"] == size
+                and journal["validator"] == validator
+                and self.part_path.stat().st_size == size
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            resumable = False
+        if not resumable:
+            self._discard()
+            return None
+        return journal
+
+    def _write_journal(self, journal: t.Dict[str, t.Any]) -> None:
+        # the offsets are only journaled once the data they cover is on disk,
+        # so that after a crash the journal never points past it
+        with open(self.part_path, "r+b") as f:
+            os.fsync(f.fileno())
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(journal))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self._journal_written = time.monotonic()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Entity tags for conditional GET requests."""
+
+import hashlib
+import typing as t
+from pathlib import Path
+
+MISSING_VERSION = "-"
+
+
+def file_version(path: Path) -> str:
+    """Version of a file's content, from its metadata only.
+
+    Resources are stored by atomic replace, so every store changes the inode
+    as well as the modification time.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return MISSING_VERSION
+    return f"{stat.st_ino}.{stat.st_mtime_ns}.{stat.st_size}"
+
+
+def make_etag(*parts: str) -> str:
+    """Strong ETag over the given version parts."""
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: t.Optional[str], etag: str) -> bool:
+    """Whether an `If-None-Match` header value matches `etag`."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match uses the weak comparison
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""In-process bus of service, deployment and funding state events."""
+
+import asyncio
+import json
+import threading
+import time
+import typing as t
+from collections import deque
+from dataclasses import dataclass
+
+DEPLOYMENT_STATUS_EVENT = "deployment.status"
+SERVICE_HEALTH_EVENT = "service.health"
+FUNDING_STATUS_EVENT = "funding.status"
+BRIDGE_STATUS_EVENT = "bridge.status"
+ACHIEVEMENT_EVENT = "achievement"
+# Sent instead of a replay when the cursor is no longer covered by the replay
+# buffer; clients must refetch the full state.
+RESET_EVENT = "reset"
+
+
+@dataclass(frozen=True)
+class Event:
+    """A published event."""
+
+    id: int
+    type: str
+    data: t.Dict[str, t.Any]
+    timestamp: float
+
+    @property
+    def json(self) -> t.Dict[str, t.Any]:
+        """To dictionary object."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+    @property
+    def sse(self) -> str:
+        """Server-sent event encoding."""
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.json)}\n\n"
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Per-client event filter; empty fields match everything."""
+
+    types: t.Optional[t.FrozenSet[str]] = None
+    service_config_id: t.Optional[str] = None
+
+    def matches(self, event: Event) -> bool:
+        """Whether the event passes the filter."""
+        if self.types is not None and event.type not in self.types:
+            return False
+        return (
+            self.service_config_id is None
+            or event.data.get("service_config_id") == self.service_config_id
+        )
+
+
+class Subscription:
+    """Queue of the events of a subscriber, filled from any thread.
+
+    A subscriber that falls more than ``queue_size`` events behind is
+    closed; it can resume from its last event id.
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        loop: asyncio.AbstractEventLoop,
+        event_filter: EventFilter,
+        queue_size: int,
+    ) -> None:
+        """Initialize the subscription."""
+        self.filter = event_filter
+        self._bus = bus
+        self._loop = loop
+        self._queue_size = queue_size
+        self._queue: "asyncio.Queue[t.Optional[Event]]" = asyncio.Queue()
+        self._closed = False
+
+    def push(self, event: Event) -> None:
+        """Deliver an event; safe to call from any thread."""
+        if not self.filter.matches(event):
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:  # the subscriber's loop is closed
+            self.close()
+
+    def _put(self, event: Event) -> None:
+        if self._closed:
+            return
+        if self._queue.qsize() >= self._queue_size:
+            self.close()
+            return
+        self._queue.put_nowait(event)
+
+    async def get(self) -> t.Optional[Event]:
+        """Next event, or None once the subscription is closed."""
+        if self._closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        """Stop receiving events; pending ones are still returned by `get`."""
+        if self._closed:
+            return
+        self._closed = True
+        self._bus.unsubscribe(self)
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+        except RuntimeError:
+            pass
+
+
+class EventBus:
+    """Thread-safe publish/subscribe bus with a bounded replay buffer.
+
+    Events get increasing ids, which clients pass back as ``Last-Event-ID``
+    to resume after a reconnect. Ids count from `first_id`; cursors outside
+    the ids of this bus, e.g. from before a restart, get a reset. Publishers
+    may pass a ``key`` so that an event equal to the last one published under
+    that key is dropped, which turns repeated stores of the same state into a
+    single transition.
+    """
+
+    REPLAY_SIZE = 1000
+    QUEUE_SIZE = 256
+
+    def __init__(
+        self,
+        replay_size: int = REPLAY_SIZE,
+        queue_size: int = QUEUE_SIZE,
+        first_id: int = 0,
+    ) -> None:
+        """Initialize the bus."""
+        self._lock = threading.Lock()
+        self._buffer: t.Deque[Event] = deque(maxlen=replay_size)
+        self._subscribers: t.List[Subscription] = []
+        self._last: t.Dict[t.Hashable, t.Dict[str, t.Any]] = {}
+        self._last_id = first_id
+        self._queue_size = queue_size
+
+    @property
+    def last_id(self) -> int:
+        """Id of the last published event."""
+        return self._last_id
+
+    def publish(
+        self,
+        event_type: str,
+        data: t.Dict[str, t.Any],
+        key: t.Optional[t.Hashable] = None,
+    ) -> t.Optional[Event]:
+        """Publish an event; return it, or None if it repeats the last one for `key`."""
+        data = dict(data)
+        with self._lock:
+            if key is not None:
+                if self._last.get(key) == data:
+                    return None
+                self._last[key] = data
+            self._last_id += 1
+            event = Event(self._last_id, event_type, data, time.time())
+            self._buffer.append(event)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.push(event)
+        return event
+
+    def subscribe(
+        self,
+        event_filter: t.Optional[EventFilter] = None,
+        last_event_id: t.Optional[int] = None,
+    ) -> Subscription:
+        """Subscribe from the running loop, replaying events after `last_event_id`."""
+        subscription = Subscription(
+            bus=self,
+            loop=asyncio.get_running_loop(),
+            event_filter=event_filter or EventFilter(),
+            queue_size=self._queue_size,
+        )
+        with self._lock:
+            if last_event_id is not None and last_event_id > self._last_id:
+                # a cursor from another run of the daemon
+                subscription._put(  # pylint: disable=protected-access
+                    Event(self._last_id, RESET_EVENT, {}, time.time())
+                )
+            elif last_event_id is not None and last_event_id < self._last_id:
+                missed = [
+                    event
+                    for event in self._buffer
+                    if event.id > last_event_id and subscription.filter.matches(event)
+                ]
+                oldest = self._buffer[0].id if self._buffer else self._last_id + 1
+                if last_event_id < oldest - 1 or len(missed) > self._queue_size:
+                    missed = [Event(self._last_id, RESET_EVENT, {}, time.time())]
+                for event in missed:
+                    subscription._put(event)  # pylint: disable=protected-access
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+
+# Ids start from the boot time in microseconds, so that those of this run
+# are above the ids of any earlier run of the daemon
+event_bus = EventBus(first_id=time.time_ns() // 1000)
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""In-process metrics, exposed in the Prometheus text format.
+
+Recording a sample is a dictionary update under a lock; all formatting
+happens when the metrics are scraped, and gauges are computed only then.
+"""
+
+import bisect
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS: t.Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+JOB_BUCKETS: t.Tuple[float, ...] = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+LabelValues = t.Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    """Base class of the metric types."""
+
+    TYPE = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: t.Sequence[str] = ()
+    ) -> None:
+        """Initialize the metric."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: t.Sequence[str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}."
+            )
+        return tuple(str(label) for label in labels)
+
+    def _format_labels(
+        self, labels: LabelValues, extra: t.Sequence[t.Tuple[str, str]] = ()
+    ) -> str:
+        pairs = list(zip(self.labelnames, labels)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+    def samples(self) -> t.List[str]:
+        """Sample lines of the metric."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """The metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+            *self.samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    TYPE = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: t.Sequence[str] = ()
+    ) -> None:
+        """Initialize the counter."""
+        super().__init__(name, documentation, labelnames)
+        self._values: t.Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increment the counter of the given labels."""
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Current value of the counter of the given labels."""
+        return self._values.get(self._labels(labels), 0.0)
+
+    def samples(self) -> t.List[str]:
+        """Sample lines of the metric."""
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{self._format_labels(labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Metric):
+    """Value computed by a callback when the metrics are scraped."""
+
+    TYPE = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: t.Sequence[str] = ()
+    ) -> None:
+        """Initialize the gauge."""
+        super().__init__(name, documentation, labelnames)
+        self._function: t.Optional[t.Callable[[], t.Mapping[LabelValues, float]]] = None
+
+    def set_function(
+        self, function: t.Callable[[], t.Mapping[LabelValues, float]]
+    ) -> None:
+        """Set the callback returning the value of each label set."""
+        self._function = function
+
+    def samples(self) -> t.List[str]:
+        """Sample lines of the metric."""
+        if self._function is None:
+            return []
+        return [
+            f"{self.name}{self._format_labels(self._labels(labels))} {_format_value(value)}"
+            for labels, value in sorted(self._function().items())
+        ]
+
+
+class Histogram(Metric):
+    """Cumulative histogram of observed values."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram."""
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: bucket counts (last one is +Inf), sum
+        self._values: t.Dict[LabelValues, t.Tuple[t.List[int], t.List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record an observation for the given labels."""
+        key = self._labels(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations for the given labels."""
+        entry = self._values.get(self._labels(labels))
+        return sum(entry[0]) if entry else 0
+
+    @contextmanager
+    def time(self, *labels: str) -> t.Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def samples(self) -> t.List[str]:
+        """Sample lines of the metric."""
+        with self._lock:
+            values = sorted(
+                (labels, (list(counts), total[0]))
+                for labels, (counts, total) in self._values.items()
+            )
+        lines = []
+        for labels, (counts, total) in values:
+            cumulative = 0
+            bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(labels, [('le', bound)])} {cumulative}"
+                )
+            lines.append(
+                f"{self.name}_sum{self._format_labels(labels)} {_format_value(total)}"
+            )
+            lines.append(f"{self.name}_count{self._format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Set of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._metrics: t.Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Register a metric; names must be unique."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: t.Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        return t.cast(Counter, self.register(Counter(name, documentation, labelnames)))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: t.Sequence[str] = ()
+    ) -> Gauge:
+        """Create and register a gauge."""
+        return t.cast(Gauge, self.register(Gauge(name, documentation, labelnames)))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return t.cast(
+            Histogram,
+            self.register(Histogram(name, documentation, labelnames, buckets)),
+        )
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "operate_http_request_duration_seconds",
+    "Time from receiving an HTTP request to starting its response.",
+    ("method", "route", "status"),
+)
+RPC_REQUESTS = registry.counter(
+    "operate_rpc_requests_total",
+    "JSON-RPC requests sent to chain RPC endpoints.",
+    ("chain", "endpoint", "method", "outcome"),
+)
+RPC_REQUEST_DURATION = registry.histogram(
+    "operate_rpc_request_duration_seconds",
+    "Latency of JSON-RPC requests.",
+    ("chain", "endpoint", "method"),
+)
+EXECUTOR_QUEUE_DEPTH = registry.gauge(
+    "operate_executor_queue_depth",
+    "Blocking HTTP handler calls waiting for a worker thread.",
+    ("pool",),
+)
+HEALTH_PROBES = registry.counter(
+    "operate_health_probes_total",
+    "Agent health probes by result.",
+    ("result",),
+)
+JOB_DURATION = registry.histogram(
+    "operate_job_duration_seconds",
+    "Duration of funding and bridge jobs.",
+    ("job", "outcome"),
+    buckets=JOB_BUCKETS,
+)
+LOOP_LAG = registry.histogram(
+    "operate_event_loop_lag_seconds",
+    "Delay of the event loop heartbeat; only recorded when the monitor is on.",
+)
+DEPLOY_PHASE_DURATION = registry.histogram(
+    "operate_deploy_phase_duration_seconds",
+    "Duration of the phases of service deploys.",
+    ("phase",),
+    buckets=JOB_BUCKETS,
+)
+TIMED_BLOCK_DURATION = registry.histogram(
+    "operate_timed_block_duration_seconds",
+    "Duration of blocks timed with timing_context.",
+    ("label",),
+)
+
+
+@contextmanager
+def timed_job(job: str) -> t.Iterator[None]:
+    """Observe the duration of a job, labelled by whether it raised."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        JOB_DURATION.observe(time.perf_counter() - start, job, outcome)
+
+
+class MetricsMiddleware:
+    """ASGI middleware observing the latency of each HTTP request.
+
+    Requests are labelled by route template rather than path, so that ids
+    in paths do not create a label set per resource.
+    """
+
+    def __init__(self, app: t.Any) -> None:
+        """Initialize the middleware."""
+        self.app = app
+
+    async def __call__(
+        self, scope: t.Dict[str, t.Any], receive: t.Callable, send: t.Callable
+    ) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def _send(message: t.Dict[str, t.Any]) -> None:
+            if message["type"] == "http.response.start":
+                route = scope.get("route")
+                HTTP_REQUEST_DURATION.observe(
+                    time.perf_counter() - start,
+                    scope["method"],
+                    getattr(route, "path", "unmatched"),
+                    str(message["status"]),
+                )
+            await send(message)
+
+        await self.app(scope, receive, _send)
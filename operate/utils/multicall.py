@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Batched read-only calls through the Multicall3 contract."""
+
+import typing as t
+
+from web3 import Web3
+
+#: Multicall3 is deployed at the same address on all supported chains.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+#: Maximum number of calls per ``aggregate3`` request.
+MULTICALL_BATCH_SIZE = 200
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+def try_aggregate(
+    w3: Web3,
+    calls: t.Sequence[t.Tuple[str, bytes]],
+    batch_size: int = MULTICALL_BATCH_SIZE,
+) -> t.List[t.Optional[bytes]]:
+    """Execute `(target, calldata)` calls in batches.
+
+    Returns the return data of each call, or None for calls that reverted.
+    Raises if a batch as a whole fails (e.g. Multicall3 is not deployed).
+    """
+    contract = w3.eth.contract(
+        address=Web3.to_checksum_address(MULTICALL3_ADDRESS), abi=MULTICALL3_ABI
+    )
+    results: t.List[t.Optional[bytes]] = []
+    for i in range(0, len(calls), batch_size):
+        batch = calls[i : i + batch_size]
+        response = contract.functions.aggregate3(
+            [(Web3.to_checksum_address(target), True, data) for target, data in batch]
+        ).call()
+        if len(response) != len(batch):
+            raise ValueError(
+                f"Multicall returned {len(response)} results for {len(batch)} calls."
+            )
+        results.extend(
+            bytes(return_data) if success else None for success, return_data in response
+        )
+    return results
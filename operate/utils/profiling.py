@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Event loop stall detection and sampling profiler."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing as t
+from collections import Counter
+from types import FrameType
+
+from operate.utils.metrics import LOOP_LAG
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class LoopLagMonitor:
+    """Detects blocking calls on the event loop.
+
+    A heartbeat task on the loop records how late each of its wake-ups is.
+    A watchdog thread checks that the heartbeat keeps beating; when it has
+    been silent for longer than ``threshold`` it logs the stack of the loop
+    thread, which is the code blocking the loop at that moment.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        logger: logging.Logger,
+        interval: float = 0.1,
+    ) -> None:
+        """Initialize the monitor."""
+        self.threshold = threshold
+        self.interval = interval
+        self.logger = logger
+        self._beat = time.monotonic()
+        self._loop_thread_id: t.Optional[int] = None
+        self._task: t.Optional[asyncio.Task] = None
+        self._thread: t.Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring the running loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="operate-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self._beat = time.monotonic()
+            lag = max(0.0, self._beat - expected)
+            LOOP_LAG.observe(lag)
+            if lag > self.threshold:
+                self.logger.warning(f"Event loop was blocked for {lag:.3f}s.")
+
+    def _watch(self) -> None:
+        reported = None
+        while not self._stop.wait(self.interval):
+            beat = self._beat
+            stalled = time.monotonic() - beat
+            if stalled <= self.threshold or beat == reported:
+                continue
+            # report each stall once, with the stack seen when it crossed the threshold
+            reported = beat
+            frame = sys._current_frames().get(  # pylint: disable=protected-access
+                t.cast(int, self._loop_thread_id)
+            )
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            self.logger.warning(
+                f"Event loop blocked for more than {stalled:.3f}s, at:\n{stack}"
+            )
+
+
+def _frame_name(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def sample_stacks(
+    seconds: float, interval: float = DEFAULT_SAMPLE_INTERVAL
+) -> t.Dict[str, int]:
+    """Sample the stacks of all threads but the calling one for `seconds`.
+
+    Returns the number of samples of each stack, with frames from the
+    thread name down to the innermost call, separated by ``;``.
+    """
+    own = threading.get_ident()
+    counts: t.Counter[str] = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            stack = []
+            current: t.Optional[FrameType] = frame
+            while current is not None:
+                stack.append(_frame_name(current))
+                current = current.f_back
+            stack.append(names.get(ident, str(ident)))
+            counts[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return dict(counts)
+
+
+def collapsed_stacks(counts: t.Mapping[str, int]) -> str:
+    """Collapsed stack format, as read by flamegraph tools."""
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
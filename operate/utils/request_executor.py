@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Off-loop execution of blocking HTTP handler work."""
+
+import asyncio
+import functools
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+
+
+class RequestExecutor:
+    """Bounded thread pools per route class, with coalescing of identical reads.
+
+    Disk reads, RPC reads and writes run in separate pools so that slow RPC
+    calls cannot starve local reads. Concurrent reads with the same key share
+    one execution and its result, so callers must not mutate it. Writes to
+    the same resource, e.g. transactions from one wallet, run one at a time.
+    """
+
+    DISK = "disk"
+    RPC = "rpc"
+    WRITE = "write"
+
+    POOL_SIZES = {DISK: 4, RPC: 8, WRITE: 4}
+
+    def __init__(self, pool_sizes: t.Optional[t.Dict[str, int]] = None) -> None:
+        """Initialize the executor."""
+        self._pools = {
+            name: ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"operate-{name}"
+            )
+            for name, max_workers in {**self.POOL_SIZES, **(pool_sizes or {})}.items()
+        }
+        self._in_flight: t.Dict[t.Hashable, "asyncio.Future[t.Any]"] = {}
+        self._locks: t.Dict[t.Hashable, asyncio.Lock] = {}
+
+    async def run(
+        self,
+        pool: str,
+        fn: t.Callable,
+        *args: t.Any,
+        resource: t.Optional[t.Hashable] = None,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """Run `fn(*args, **kwargs)` in the given pool.
+
+        Calls for the same `resource` run one at a time, in arrival order.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        if resource is None:
+            return await loop.run_in_executor(self._pools[pool], call)
+
+        lock = self._locks.setdefault(resource, asyncio.Lock())
+        await lock.acquire()
+        try:
+            future = self._pools[pool].submit(call)
+        except BaseException:
+            lock.release()
+            raise
+
+        def _release(_: t.Any) -> None:
+            with suppress(RuntimeError):  # the loop is closed
+                loop.call_soon_threadsafe(lock.release)
+
+        # held until the work is done, even if the caller goes away
+        future.add_done_callback(_release)
+        return await asyncio.wrap_future(future)
+
+    def queue_depths(self) -> t.Dict[t.Tuple[str, ...], int]:
+        """Number of calls waiting for a worker thread, per pool."""
+        return {
+            (name,): executor._work_queue.qsize()  # pylint: disable=protected-access
+            for name, executor in self._pools.items()
+        }
+
+    async def coalesce(
+        self, key: t.Hashable, pool: str, fn: t.Callable, *args: t.Any
+    ) -> t.Any:
+        """Run `fn(*args)` once for all concurrent calls with the same key."""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.run(pool, fn, *args))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # a caller going away must not cancel the work the others wait for
+        return await asyncio.shield(future)
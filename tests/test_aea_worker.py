@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/services/aea_worker.py."""
+
+import logging
+import os
+import time
+from multiprocessing.connection import Connection
+from pathlib import Path
+from unittest.mock import patch
+
+from operate.services.aea_worker import AeaCommandWorker, WORKER_LOST_EXIT_CODE
+
+
+def _pid_server(conn: Connection) -> None:
+    """Answer each command with the worker pid; exit code 3 on `crash`."""
+    while True:
+        request = conn.recv()
+        if request is None:
+            return
+        _, args = request
+        if args == ["crash"]:
+            os._exit(3)  # pylint: disable=protected-access
+        if args == ["hang"]:
+            time.sleep(30)
+        conn.send(os.getpid())
+
+
+def _stubborn_server(conn: Connection) -> None:
+    """Ignore the stop request."""
+    conn.recv()
+    time.sleep(30)
+
+
+LOGGER = logging.getLogger("test_aea_worker")
+
+
+class TestAeaCommandWorker:
+    """Tests for AeaCommandWorker."""
+
+    def test_aea_commands_share_one_process(self, tmp_path: Path) -> None:
+        """The real worker runs several aea commands and reports failures."""
+        worker = AeaCommandWorker(logger=LOGGER)
+        try:
+            assert worker.run(tmp_path, ["--help"], timeout=120) == 0
+            pid = worker._process.pid  # type: ignore[union-attr]
+            assert worker.run(tmp_path, ["no-such-command"], timeout=60) != 0
+            assert worker.run(tmp_path, ["--help"], timeout=60) == 0
+            assert worker._process.pid == pid  # type: ignore[union-attr]
+        finally:
+            worker.close()
+        assert worker._process is None
+        worker.close()
+
+    def test_dead_worker_is_replaced(self, tmp_path: Path) -> None:
+        """A crash fails the current command only; the next one gets a new worker."""
+        with patch("operate.services.aea_worker._serve_aea_commands", _pid_server):
+            worker = AeaCommandWorker(logger=LOGGER)
+            try:
+                first = worker.run(tmp_path, ["ok"], timeout=10)
+                assert worker.run(tmp_path, ["ok"], timeout=10) == first
+                assert worker.run(tmp_path, ["crash"], timeout=10) == (
+                    WORKER_LOST_EXIT_CODE
+                )
+                assert worker.run(tmp_path, ["ok"], timeout=10) != first
+
+                # a worker that died between commands is replaced too
+                worker._process.kill()  # type: ignore[union-attr]
+                worker._process.join()  # type: ignore[union-attr]
+                assert worker.run(tmp_path, ["ok"], timeout=10) > 0
+            finally:
+                worker.close()
+
+    def test_timed_out_worker_is_killed(self, tmp_path: Path) -> None:
+        """A command running past its timeout kills the worker."""
+        with patch("operate.services.aea_worker._serve_aea_commands", _pid_server):
+            worker = AeaCommandWorker(logger=LOGGER)
+            assert worker.run(tmp_path, ["hang"], timeout=0.5) == (
+                WORKER_LOST_EXIT_CODE
+            )
+            assert worker._process is None
+            worker.close()
+
+    def test_close_kills_unresponsive_worker(self, tmp_path: Path) -> None:
+        """A worker not exiting on request is killed."""
+        with patch("operate.services.aea_worker._serve_aea_commands", _stubborn_server):
+            worker = AeaCommandWorker(logger=LOGGER)
+            worker._ensure_started()
+            process = worker._process
+            worker.close(timeout=0.5)
+        assert process is not None
+        assert not process.is_alive()
+
+    def test_close_with_broken_pipe(self, tmp_path: Path) -> None:
+        """A worker whose pipe is gone is still stopped."""
+        with patch("operate.services.aea_worker._serve_aea_commands", _pid_server):
+            worker = AeaCommandWorker(logger=LOGGER)
+            worker._ensure_started()
+            process = worker._process
+            worker._conn.close()  # type: ignore[union-attr]
+            worker.close(timeout=5)
+        assert process is not None
+        assert not process.is_alive()
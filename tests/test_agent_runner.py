@@ -22,6 +22,7 @@
 import hashlib
 import json
 import os
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -31,6 +32,7 @@ import requests
 
 from operate.services.agent_assets import (
     AgentAssetManager,
+    AgentAssetStore,
     AgentRelease,
     get_agent_runner_path,
 )
@@ -257,10 +259,10 @@ class TestAgentAssetManagerMethods:
     def test_download_file_writes_chunks(self, tmp_path: Path) -> None:
         """Test that download_file writes all chunks to disk."""
         save_path = tmp_path / "downloaded"
-        mock_response = MagicMock()
+        mock_response = MagicMock(status_code=200, headers={})
         mock_response.iter_content.return_value = [b"chunk1", b"chunk2"]
         with patch(
-            "operate.services.agent_assets.requests.get",
+            "operate.utils.download.requests.get",
             return_value=mock_response,
         ):
             AgentAssetManager.download_file("http://example.com/file", save_path)
@@ -270,7 +272,7 @@ class TestAgentAssetManagerMethods:
         """Test that download_file propagates request exceptions."""
         save_path = tmp_path / "downloaded"
         with patch(
-            "operate.services.agent_assets.requests.get",
+            "operate.utils.download.requests.get",
             side_effect=requests.exceptions.ConnectionError("failed"),
         ):
             with pytest.raises(requests.exceptions.ConnectionError):
@@ -402,25 +404,21 @@ class TestAgentAssetManagerMethods:
             )
         mock_dl.assert_called_once()
 
-    def test_update_agent_release_asset_downloaded_hash_mismatch_raises(
+    def test_update_agent_release_asset_downloads_resumably(
         self, tmp_path: Path
     ) -> None:
-        """Test that a hash mismatch after download raises ValueError."""
+        """The download goes to a stable path and is verified against the remote hash."""
         target = tmp_path / "runner"
         mock_release = MagicMock()
         mock_release.get_url_and_hash.return_value = (
             "http://example.com/runner",
             "sha256:EXPECTED",
         )
-        # Downloaded file hash doesn't match the remote hash
-        with (
-            patch.object(
-                AgentAssetManager,
-                "get_local_file_sha256",
-                return_value="sha256:CORRUPT",
-            ),
-            patch.object(AgentAssetManager, "download_file"),
-        ):
+        with patch.object(
+            AgentAssetManager,
+            "download_file",
+            side_effect=ValueError("Hash verification failed"),
+        ) as mock_dl:
             with pytest.raises(ValueError, match="Hash verification failed"):
                 AgentAssetManager.update_agent_release_asset(
                     target_path=target,
@@ -428,6 +426,11 @@ class TestAgentAssetManagerMethods:
                     target_filename="runner",
                     agent_release=mock_release,
                 )
+        mock_dl.assert_called_once_with(
+            "http://example.com/runner",
+            tmp_path / ".runner.download",
+            expected_hash="sha256:EXPECTED",
+        )
 
     @pytest.mark.skipif(os.name != "posix", reason="posix-only chmod test")
     def test_update_agent_release_asset_sets_executable_on_posix(
@@ -741,3 +744,317 @@ class TestAgentAssetManagerMethods:
             get_agent_code_path(tmp_path)
 
         mock_method.assert_called_once_with(service_dir=tmp_path)
+
+
+def _sha256(content: bytes) -> str:
+    """Hash in the format of GitHub release asset digests."""
+    return "sha256:" + hashlib.sha256(content).hexdigest()
+
+
+class TestAgentAssetStore:
+    """Tests for AgentAssetStore and its use by update_agent_release_asset."""
+
+    CONTENT = b"agent release asset"
+
+    @classmethod
+    def _update(
+        cls, store: AgentAssetStore, target: Path, content: bytes = CONTENT
+    ) -> MagicMock:
+        """Update `target` from a release serving `content`; return the download mock."""
+        mock_release = MagicMock()
+        mock_release.get_url_and_hash.return_value = (
+            "http://example.com/agent.zip",
+            _sha256(content),
+        )
+
+        def _download(url: str, save_path: Path, expected_hash: str) -> None:
+            save_path.write_bytes(content)
+
+        with patch.object(
+            AgentAssetManager, "download_file", side_effect=_download
+        ) as mock_dl:
+            AgentAssetManager.update_agent_release_asset(
+                target_path=target,
+                agent_release_asset_name="agent.zip",
+                target_filename="agent.zip",
+                agent_release=mock_release,
+                store=store,
+            )
+        return mock_dl
+
+    def test_services_share_one_download(self, tmp_path: Path) -> None:
+        """The second service links the stored asset instead of downloading."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        first, second = tmp_path / "svc1.zip", tmp_path / "svc2.zip"
+
+        self._update(store, first).assert_called_once()
+        self._update(store, second).assert_not_called()
+
+        asset = store.asset_path(_sha256(self.CONTENT))
+        assert second.read_bytes() == self.CONTENT
+        assert os.path.samefile(first, asset)
+        assert os.path.samefile(second, asset)
+        assert not list((store.path / store.TMP_DIR).iterdir())
+
+        # an up to date link is recognised without hashing the file
+        with patch.object(AgentAssetManager, "get_local_file_sha256") as mock_hash:
+            self._update(store, first).assert_not_called()
+        mock_hash.assert_not_called()
+
+    def test_modified_link_is_downloaded_again(self, tmp_path: Path) -> None:
+        """A linked asset changed in place is verified and not trusted."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        first, second = tmp_path / "svc1.zip", tmp_path / "svc2.zip"
+        self._update(store, first)
+        self._update(store, second)
+        # all links share the file, so this corrupts every service's copy
+        with open(first, "ab") as f:
+            f.write(b" corrupted")
+
+        self._update(store, first).assert_called_once()
+        assert first.read_bytes() == self.CONTENT
+        assert os.path.samefile(first, store.asset_path(_sha256(self.CONTENT)))
+
+        # the other service gets the fresh asset without downloading it
+        self._update(store, second).assert_not_called()
+        assert second.read_bytes() == self.CONTENT
+        assert os.path.samefile(first, second)
+
+    def test_new_release_replaces_the_link(self, tmp_path: Path) -> None:
+        """A new asset version is downloaded and the old one is left to gc."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        target = tmp_path / "svc1.zip"
+        self._update(store, target)
+        self._update(store, target, content=b"new release").assert_called_once()
+        assert target.read_bytes() == b"new release"
+
+        assert store.gc() == [store.asset_path(_sha256(self.CONTENT))]
+        assert store.has(_sha256(b"new release"))
+        # finished downloads leave nothing behind
+        assert not list((store.path / store.TMP_DIR).iterdir())
+
+    def test_existing_copy_is_adopted(self, tmp_path: Path) -> None:
+        """Assets downloaded before the store existed are shared, not downloaded again."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        first, second = tmp_path / "svc1.zip", tmp_path / "svc2.zip"
+        first.write_bytes(self.CONTENT)
+        second.write_bytes(self.CONTENT)
+
+        self._update(store, first).assert_not_called()
+        self._update(store, second).assert_not_called()
+        assert os.path.samefile(first, second)
+
+    def test_copies_when_links_are_not_supported(self, tmp_path: Path) -> None:
+        """Targets get a copy when the file system cannot hard link."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        first, second = tmp_path / "svc1.zip", tmp_path / "svc2.zip"
+        first.write_bytes(self.CONTENT)
+        with patch(
+            "operate.services.agent_assets.os.link", side_effect=OSError("no links")
+        ):
+            self._update(store, first).assert_not_called()
+            self._update(store, second).assert_called_once()
+        assert second.read_bytes() == self.CONTENT
+        assert not os.path.samefile(first, second)
+        # nothing links to the stored asset
+        assert len(store.gc()) == 1
+
+    def test_invalid_hash_bypasses_the_store(self, tmp_path: Path) -> None:
+        """Digests that are not sha256 cannot address the store."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        assert not store.is_valid_hash("sha256:../../etc")
+        with pytest.raises(ValueError, match="Not a sha256 hash"):
+            store.asset_path("md5:abc")
+
+        target = tmp_path / "runner"
+        mock_release = MagicMock()
+        mock_release.get_url_and_hash.return_value = ("http://x", "md5:abc")
+        with (
+            patch.object(
+                AgentAssetManager, "get_local_file_sha256", return_value="md5:abc"
+            ),
+            patch.object(AgentAssetManager, "download_file"),
+            patch("operate.services.agent_assets.shutil.copy2") as mock_copy,
+        ):
+            AgentAssetManager.update_agent_release_asset(
+                target_path=target,
+                agent_release_asset_name="runner",
+                target_filename="runner",
+                agent_release=mock_release,
+                store=store,
+            )
+        mock_copy.assert_called_once()
+        assert not store.path.exists()
+
+    def test_gc_keeps_linked_assets(self, tmp_path: Path) -> None:
+        """Only assets without links outside the store are removed."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        assert not store.gc()
+        self._update(store, tmp_path / "svc1.zip")
+        (store.path / "README").write_text("not an asset")
+        assert not store.gc()
+        assert (store.path / "README").exists()
+
+    def test_gc_keeps_recent_downloads(self, tmp_path: Path) -> None:
+        """Downloads in progress survive gc; abandoned ones are removed."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        tmp_dir = store.tmp_dir()
+        part = tmp_dir / ("a" * 64 + ".part")
+        part.write_bytes(b"partial")
+        journal = tmp_dir / ("a" * 64 + ".part.json")
+        journal.write_text("{}")
+        stale = tmp_dir / ("b" * 64 + ".part")
+        stale.write_bytes(b"abandoned")
+        old = time.time() - AgentAssetStore.TMP_MAX_AGE - 60
+        os.utime(stale, (old, old))
+
+        assert not store.gc()
+        assert part.exists()
+        assert journal.exists()
+        assert not stale.exists()
+
+    def test_gc_removes_stale_directories(self, tmp_path: Path) -> None:
+        """Abandoned directories in the tmp dir are removed with their content."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        stale = store.tmp_dir() / ("c" * 64 + ".part")
+        stale.mkdir()
+        (stale / "chunk").write_bytes(b"abandoned")
+        old = time.time() - AgentAssetStore.TMP_MAX_AGE - 60
+        os.utime(stale, (old, old))
+
+        assert not store.gc()
+        assert not stale.exists()
+
+    def test_gc_ignores_downloads_finishing_meanwhile(self, tmp_path: Path) -> None:
+        """A download moved out of the tmp dir during gc is not an error."""
+        store = AgentAssetStore(tmp_path / "agent_assets")
+        part = store.tmp_dir() / ("d" * 64 + ".part")
+        part.write_bytes(b"done")
+        stat = Path.stat
+
+        def _stat(path: Path, **kwargs: Any) -> os.stat_result:
+            if path == part:
+                path.unlink()
+            return stat(path, **kwargs)
+
+        with patch.object(Path, "stat", _stat):
+            assert not store.gc()
+        assert not part.exists()
+
+    def test_get_asset_store(self, tmp_path: Path) -> None:
+        """Only services in an operate services directory share a store."""
+        service_dir = tmp_path / "services" / "sc-1"
+        store = AgentAssetManager.get_asset_store(service_dir)
+        assert store is not None
+        assert store.path == tmp_path / "agent_assets"
+        assert AgentAssetManager.get_asset_store(tmp_path / "sc-1") is None
+
+
+class TestVerifiedFileSha256:
+    """Tests for the sha256 sidecar cache."""
+
+    def test_unchanged_file_is_not_hashed_again(self, tmp_path: Path) -> None:
+        """The sidecar answers until the file changes."""
+        path = tmp_path / "agent_runner"
+        path.write_bytes(b"binary")
+        with patch.object(
+            AgentAssetManager,
+            "get_local_file_sha256",
+            wraps=AgentAssetManager.get_local_file_sha256,
+        ) as mock_hash:
+            assert AgentAssetManager.get_verified_file_sha256(path) == _sha256(
+                b"binary"
+            )
+            assert AgentAssetManager.get_verified_file_sha256(path) == _sha256(
+                b"binary"
+            )
+            assert mock_hash.call_count == 1
+
+            path.write_bytes(b"patched binary")
+            assert AgentAssetManager.get_verified_file_sha256(path) == _sha256(
+                b"patched binary"
+            )
+            assert mock_hash.call_count == 2
+
+    def test_moved_file_is_hashed_again(self, tmp_path: Path) -> None:
+        """The sidecar is bound to the path of the file."""
+        path = tmp_path / "a" / "agent.zip"
+        path.parent.mkdir()
+        path.write_bytes(b"zip")
+        AgentAssetManager.get_verified_file_sha256(path)
+        moved = tmp_path / "b"
+        path.parent.rename(moved)
+        with patch.object(
+            AgentAssetManager, "get_local_file_sha256", return_value="sha256:X"
+        ) as mock_hash:
+            assert (
+                AgentAssetManager.get_verified_file_sha256(moved / "agent.zip")
+                == "sha256:X"
+            )
+        mock_hash.assert_called_once()
+
+    def test_deep_verify_rehashes_old_records(self, tmp_path: Path) -> None:
+        """With a deep verify interval, old records are not trusted."""
+        path = tmp_path / "agent.zip"
+        path.write_bytes(b"zip")
+        AgentAssetManager.get_verified_file_sha256(path)
+        with (
+            patch.object(AgentAssetManager, "DEEP_VERIFY_INTERVAL", 60.0),
+            patch.object(
+                AgentAssetManager,
+                "get_local_file_sha256",
+                wraps=AgentAssetManager.get_local_file_sha256,
+            ) as mock_hash,
+        ):
+            AgentAssetManager.get_verified_file_sha256(path)
+            mock_hash.assert_not_called()
+            with patch(
+                "operate.services.agent_assets.time.time",
+                return_value=time.time() + 120,
+            ):
+                AgentAssetManager.get_verified_file_sha256(path)
+            mock_hash.assert_called_once()
+
+    def test_unreadable_sidecar_is_ignored(self, tmp_path: Path) -> None:
+        """A corrupt sidecar triggers a rehash, and a failed write only warns."""
+        path = tmp_path / "agent.zip"
+        path.write_bytes(b"zip")
+        (tmp_path / ".agent.zip.sha256.json").write_text("{not json")
+        assert AgentAssetManager.get_verified_file_sha256(path) == _sha256(b"zip")
+
+        with (
+            patch(
+                "operate.services.agent_assets.os.replace",
+                side_effect=OSError("read-only"),
+            ),
+            patch.object(AgentAssetManager, "logger") as mock_logger,
+        ):
+            AgentAssetManager.record_verified_file_sha256(path, _sha256(b"zip"))
+        mock_logger.warning.assert_called_once()
+
+    def test_update_trusts_the_sidecar_of_a_downloaded_asset(
+        self, tmp_path: Path
+    ) -> None:
+        """A target written by an update is not hashed on the next start."""
+        target = tmp_path / "agent.zip"
+        mock_release = MagicMock()
+        mock_release.get_url_and_hash.return_value = ("http://x", _sha256(b"zip"))
+
+        def _download(url: str, save_path: Path, expected_hash: str) -> None:
+            save_path.write_bytes(b"zip")
+
+        kwargs: Any = {
+            "target_path": target,
+            "agent_release_asset_name": "agent.zip",
+            "target_filename": "agent.zip",
+            "agent_release": mock_release,
+        }
+        with patch.object(AgentAssetManager, "download_file", side_effect=_download):
+            AgentAssetManager.update_agent_release_asset(**kwargs)
+        with (
+            patch.object(AgentAssetManager, "download_file") as mock_dl,
+            patch.object(AgentAssetManager, "get_local_file_sha256") as mock_hash,
+        ):
+            AgentAssetManager.update_agent_release_asset(**kwargs)
+        mock_dl.assert_not_called()
+        mock_hash.assert_not_called()
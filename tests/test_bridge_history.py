@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the bridge history index."""
+
+import json
+import typing as t
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from operate.bridge.bridge_manager import (
+    BridgeManager,
+    EXECUTED_BUNDLES_PATH,
+    ProviderRequestBundle,
+)
+from operate.bridge.history import (
+    BridgeHistoryIndex,
+    HISTORY_INDEX_FILE,
+    bundle_status,
+    get_bridge_history_index,
+    history_entry,
+)
+from operate.bridge.providers.provider import (
+    ExecutionData,
+    ProviderRequest,
+    ProviderRequestStatus,
+)
+from operate.utils.event_bus import BRIDGE_STATUS_EVENT
+
+
+def _make_request(
+    status: ProviderRequestStatus,
+    to_chain: str = "base",
+    timestamp: int = 1_000,
+    elapsed_time: float = 30.0,
+) -> ProviderRequest:
+    """Create an executed ProviderRequest."""
+    return ProviderRequest(
+        id=f"r-{to_chain}-{timestamp}",
+        params={
+            "from": {"chain": "gnosis", "address": "0x" + "a" * 40, "token": "0x0"},
+            "to": {
+                "chain": to_chain,
+                "address": "0x" + "b" * 40,
+                "token": "0x0",
+                "amount": 10**18,
+            },
+        },
+        provider_id="relay-provider",
+        status=status,
+        quote_data=None,
+        execution_data=ExecutionData(
+            elapsed_time=elapsed_time,
+            message=None,
+            timestamp=timestamp,
+            from_tx_hash="0xfrom",
+            to_tx_hash="0xto",
+            provider_data=None,
+        ),
+    )
+
+
+def _store_bundle(
+    path: Path, bundle_id: str, requests: t.List[ProviderRequest]
+) -> ProviderRequestBundle:
+    """Store an executed bundle under `path`."""
+    bundle = ProviderRequestBundle(
+        id=bundle_id,
+        requests_params=[],
+        provider_requests=requests,
+        timestamp=900,
+    )
+    bundle.path = path / EXECUTED_BUNDLES_PATH / f"{bundle_id}.json"
+    bundle.path.parent.mkdir(parents=True, exist_ok=True)
+    bundle.store()
+    return bundle
+
+
+def _make_manager(tmp_path: Path) -> BridgeManager:
+    """Create a BridgeManager bypassing __init__."""
+    manager = object.__new__(BridgeManager)
+    manager.path = tmp_path
+    manager.logger = MagicMock()
+    manager.data = MagicMock(last_requested_bundle=None)
+    manager.history = BridgeHistoryIndex(tmp_path / HISTORY_INDEX_FILE)
+    provider = MagicMock()
+    provider.status_json.side_effect = lambda request: {"status": request.status.value}
+    manager._providers = {
+        "relay-provider": provider
+    }  # pylint: disable=protected-access
+    return manager
+
+
+class TestBridgeHistoryIndex:
+    """Tests for BridgeHistoryIndex."""
+
+    def test_append_and_reload(self, tmp_path: Path) -> None:
+        """Entries survive a new instance and duplicates are skipped."""
+        path = tmp_path / HISTORY_INDEX_FILE
+        index = BridgeHistoryIndex(path)
+        index.append([{"id": "rb-1"}, {"id": "rb-2"}])
+        index.append([{"id": "rb-1", "status": "other"}])
+        index.append([])
+
+        reloaded = BridgeHistoryIndex(path)
+        assert [e["id"] for e in reloaded.entries()] == ["rb-1", "rb-2"]
+        assert reloaded.get("rb-1") == {"id": "rb-1"}
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_reads_incrementally(self, tmp_path: Path) -> None:
+        """Lines appended by another writer are picked up; partial lines wait."""
+        path = tmp_path / HISTORY_INDEX_FILE
+        index = BridgeHistoryIndex(path)
+        assert index.entries() == []
+
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "rb-1"}) + "\n\nnot json\n")
+            f.write('{"id": "rb-')
+        assert [e["id"] for e in index.entries()] == ["rb-1"]
+
+        with path.open("a", encoding="utf-8") as f:
+            f.write('2"}\n')
+        assert index.get("rb-2") == {"id": "rb-2"}
+
+    def test_replaced_file_is_reparsed(self, tmp_path: Path) -> None:
+        """A file that shrank is parsed from scratch."""
+        path = tmp_path / HISTORY_INDEX_FILE
+        index = BridgeHistoryIndex(path)
+        index.append([{"id": "rb-long-identifier"}])
+        path.write_text(json.dumps({"id": "rb-1"}) + "\n")
+        assert [e["id"] for e in index.entries()] == ["rb-1"]
+
+    def test_shared_per_path(self, tmp_path: Path) -> None:
+        """The same instance is returned for the same path."""
+        path = tmp_path / HISTORY_INDEX_FILE
+        assert get_bridge_history_index(path) is get_bridge_history_index(path)
+
+
+class TestHistoryEntry:
+    """Tests for history_entry and bundle_status."""
+
+    @pytest.mark.parametrize(
+        ("statuses", "expected"),
+        [
+            ([ProviderRequestStatus.EXECUTION_DONE] * 2, "EXECUTION_DONE"),
+            (
+                [
+                    ProviderRequestStatus.EXECUTION_DONE,
+                    ProviderRequestStatus.EXECUTION_FAILED,
+                ],
+                "EXECUTION_FAILED",
+            ),
+            (
+                [
+                    ProviderRequestStatus.EXECUTION_DONE,
+                    ProviderRequestStatus.EXECUTION_PENDING,
+                ],
+                "EXECUTION_PENDING",
+            ),
+            ([], "EXECUTION_PENDING"),
+        ],
+    )
+    def test_bundle_status(
+        self, statuses: t.List[ProviderRequestStatus], expected: str
+    ) -> None:
+        """Bundle status aggregates the request statuses."""
+        requests = [_make_request(status) for status in statuses]
+        assert bundle_status(requests) == expected
+
+    def test_summary(self) -> None:
+        """The entry summarizes chains, amounts, timings and status."""
+        requests = [
+            _make_request(ProviderRequestStatus.EXECUTION_DONE, "base", 1_000, 20.0),
+            _make_request(ProviderRequestStatus.EXECUTION_DONE, "mode", 1_005, 45.0),
+        ]
+        requests[1].execution_data = None
+        bundle = ProviderRequestBundle(
+            id="rb-1", requests_params=[], provider_requests=requests, timestamp=900
+        )
+        entry = history_entry(bundle)
+        assert entry["timestamp"] == 1_000
+        assert entry["elapsed_time"] == 20.0
+        assert entry["chains"] == ["base", "gnosis", "mode"]
+        assert entry["requests"][0]["to_amount"] == str(10**18)
+        assert entry["requests"][1]["from_tx_hash"] is None
+        assert "bridge_request_status" not in entry
+
+
+class TestBridgeManagerHistory:
+    """Tests for BridgeManager history compaction and listing."""
+
+    def test_compact_folds_terminal_bundles_only(self, tmp_path: Path) -> None:
+        """Terminal bundles are indexed and their files removed."""
+        manager = _make_manager(tmp_path)
+        done = _store_bundle(
+            tmp_path, "rb-done", [_make_request(ProviderRequestStatus.EXECUTION_DONE)]
+        )
+        pending = _store_bundle(
+            tmp_path,
+            "rb-pending",
+            [_make_request(ProviderRequestStatus.EXECUTION_PENDING)],
+        )
+        (tmp_path / EXECUTED_BUNDLES_PATH / "rb-broken.json").write_text("{")
+
+        assert manager.compact_history() == 1
+        assert not t.cast(Path, done.path).exists()
+        assert t.cast(Path, pending.path).exists()
+        assert manager.compact_history() == 0
+
+        status = manager.get_status_json("rb-done")
+        assert status == {
+            "id": "rb-done",
+            "bridge_request_status": [{"status": "EXECUTION_DONE"}],
+        }
+
+    def test_status_of_bundle_compacted_while_read(self, tmp_path: Path) -> None:
+        """A bundle file removed by a concurrent compaction is read from the index."""
+        manager = _make_manager(tmp_path)
+        _store_bundle(
+            tmp_path, "rb-done", [_make_request(ProviderRequestStatus.EXECUTION_DONE)]
+        )
+        assert manager.compact_history() == 1
+        with patch.object(Path, "exists", return_value=True):
+            status = manager.get_status_json("rb-done")
+        assert status == {
+            "id": "rb-done",
+            "bridge_request_status": [{"status": "EXECUTION_DONE"}],
+        }
+
+    def test_status_is_published(self, tmp_path: Path) -> None:
+        """The status of a stored bundle is published, keyed by bundle."""
+        manager = _make_manager(tmp_path)
+        _store_bundle(
+            tmp_path,
+            "rb-pending",
+            [_make_request(ProviderRequestStatus.EXECUTION_PENDING)],
+        )
+        with patch("operate.bridge.bridge_manager.event_bus") as mock_bus:
+            status = manager.get_status_json("rb-pending")
+        mock_bus.publish.assert_called_once_with(
+            BRIDGE_STATUS_EVENT, status, key=(BRIDGE_STATUS_EVENT, "rb-pending")
+        )
+
+    def test_compact_removes_already_indexed_bundle(self, tmp_path: Path) -> None:
+        """A bundle file left behind after indexing is removed without re-indexing."""
+        manager = _make_manager(tmp_path)
+        bundle = _store_bundle(
+            tmp_path,
+            "rb-1",
+            [_make_request(ProviderRequestStatus.EXECUTION_PENDING)],
+        )
+        manager.history.append([{"id": "rb-1"}])
+        assert manager.compact_history() == 1
+        assert not t.cast(Path, bundle.path).exists()
+        assert manager.history.entries() == [{"id": "rb-1"}]
+
+    def test_unknown_bundle_status_raises(self, tmp_path: Path) -> None:
+        """An unknown bundle id still raises FileNotFoundError."""
+        manager = _make_manager(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            manager.get_status_json("rb-unknown")
+
+    def test_get_history_paginates_and_filters(self, tmp_path: Path) -> None:
+        """History merges indexed and pending bundles, newest first."""
+        manager = _make_manager(tmp_path)
+        for i in range(5):
+            _store_bundle(
+                tmp_path,
+                f"rb-{i}",
+                [
+                    _make_request(
+                        ProviderRequestStatus.EXECUTION_DONE,
+                        to_chain="base" if i % 2 else "mode",
+                        timestamp=1_000 + i,
+                    )
+                ],
+            )
+        manager.compact_history()
+        _store_bundle(
+            tmp_path,
+            "rb-5",
+            [_make_request(ProviderRequestStatus.EXECUTION_PENDING, timestamp=1_005)],
+        )
+
+        page = manager.get_history(offset=0, limit=2)
+        assert page["total"] == 6
+        assert [item["id"] for item in page["items"]] == ["rb-5", "rb-4"]
+        assert "bridge_request_status" not in page["items"][1]
+
+        page = manager.get_history(offset=4, limit=2)
+        assert [item["id"] for item in page["items"]] == ["rb-1", "rb-0"]
+
+        page = manager.get_history(status="EXECUTION_PENDING")
+        assert [item["id"] for item in page["items"]] == ["rb-5"]
+
+        page = manager.get_history(chain="mode")
+        assert [item["id"] for item in page["items"]] == ["rb-4", "rb-2", "rb-0"]
+
+    def test_get_history_reads_only_changed_bundles(self, tmp_path: Path) -> None:
+        """Pending bundles are read again only once their file changes."""
+        manager = _make_manager(tmp_path)
+        pending = [
+            _store_bundle(
+                tmp_path,
+                f"rb-{i}",
+                [_make_request(ProviderRequestStatus.EXECUTION_PENDING)],
+            )
+            for i in range(3)
+        ]
+        (tmp_path / EXECUTED_BUNDLES_PATH / "rb-broken.json").write_text("{")
+        assert manager.get_history()["total"] == 3
+        t.cast(MagicMock, manager.logger).warning.assert_called_once()
+
+        broken = tmp_path / EXECUTED_BUNDLES_PATH / "rb-broken.json"
+        load = ProviderRequestBundle.load
+        with patch.object(ProviderRequestBundle, "load", side_effect=load) as mock_load:
+            assert manager.get_history()["total"] == 3
+        assert mock_load.call_args_list == [((broken,),)]
+
+        pending[1].provider_requests[0].status = ProviderRequestStatus.EXECUTION_DONE
+        pending[1].store()
+        with patch.object(ProviderRequestBundle, "load", side_effect=load) as mock_load:
+            page = manager.get_history(status="EXECUTION_DONE")
+        assert [item["id"] for item in page["items"]] == ["rb-1"]
+        assert sorted(call.args[0] for call in mock_load.call_args_list) == [
+            pending[1].path,
+            broken,
+        ]
+
+    def test_get_history_skips_bundles_compacted_meanwhile(
+        self, tmp_path: Path
+    ) -> None:
+        """Bundle files removed or indexed while the history is listed are left out."""
+        manager = _make_manager(tmp_path)
+        _store_bundle(
+            tmp_path,
+            "rb-1",
+            [_make_request(ProviderRequestStatus.EXECUTION_PENDING)],
+        )
+        with patch.object(
+            ProviderRequestBundle, "load", side_effect=FileNotFoundError("gone")
+        ):
+            assert manager.get_history()["total"] == 0
+
+        # neither files gone nor files left behind by a compaction are read
+        summarize = MagicMock()
+        missing = tmp_path / EXECUTED_BUNDLES_PATH / "rb-2.json"
+        manager.history.append([{"id": "rb-1"}])
+        bundle_paths = [missing, tmp_path / EXECUTED_BUNDLES_PATH / "rb-1.json"]
+        assert manager.history.pending_entries(bundle_paths, summarize) == []
+        summarize.assert_not_called()
+
+    @pytest.mark.parametrize(("offset", "limit"), [(-1, 10), (0, 0), (0, 1_000)])
+    def test_get_history_invalid_pagination(
+        self, tmp_path: Path, offset: int, limit: int
+    ) -> None:
+        """Invalid pagination parameters raise ValueError."""
+        manager = _make_manager(tmp_path)
+        with pytest.raises(ValueError, match="Invalid pagination"):
+            manager.get_history(offset=offset, limit=limit)
@@ -34,6 +34,7 @@ from operate.bridge.bridge_manager import (
     EXECUTED_BUNDLES_PATH,
     ProviderRequestBundle,
 )
+from operate.bridge.history import BridgeHistoryIndex, HISTORY_INDEX_FILE
 from operate.bridge.providers.provider import (
     ProviderRequest,
     ProviderRequestStatus,
@@ -238,6 +239,7 @@ def _make_bridge_manager(tmp_path: Path) -> BridgeManager:
     manager.logger = MagicMock()
     manager.bundle_validity_period = DEFAULT_BUNDLE_VALIDITY_PERIOD
     manager.data = MagicMock()
+    manager.history = BridgeHistoryIndex(tmp_path / HISTORY_INDEX_FILE)
     manager._providers = {}  # pylint: disable=protected-access
     manager._native_bridge_providers = {}  # pylint: disable=protected-access
     return manager
@@ -23,7 +23,7 @@ import time
 import typing as t
 from pathlib import Path
 from platform import system
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from aea.helpers.logging import setup_logger
@@ -717,12 +717,23 @@ class TestNativeBridgeProvider(OnTestnet):
         assert not diff, "Wrong status."
         assert provider_request == expected_request, "Wrong request."
 
-    @pytest.mark.vcr
-    @pytest.mark.skipif(
-        RUNNING_IN_CI and system() != "Linux",
-        reason="Direct Web3.HTTPProvider calls bypass VCR cassette interception on macOS/Windows CI runners.",
-    )
-    @pytest.mark.parametrize("rpc", ["https://rpc-gate.autonolas.tech/base-rpc/"])
+
+class TestFindBlockBeforeTimestamp:
+    """Tests for NativeBridgeProvider._find_block_before_timestamp."""
+
+    # Base produces a block every 2 seconds from its genesis block
+    GENESIS_TIMESTAMP = 1686789347
+    LATEST_BLOCK = 42355151
+
+    def _base_w3(self) -> MagicMock:
+        """A Web3 instance answering like Base."""
+        w3 = MagicMock()
+        w3.eth.block_number = self.LATEST_BLOCK
+        w3.eth.get_block.side_effect = lambda block: {
+            "timestamp": self.GENESIS_TIMESTAMP + 2 * block
+        }
+        return w3
+
     @pytest.mark.parametrize(
         ("timestamp", "expected_block"),
         [
@@ -741,14 +752,15 @@ class TestNativeBridgeProvider(OnTestnet):
     )
     def test_find_block_before_timestamp(
         self,
-        rpc: str,
         timestamp: int,
         expected_block: int,
     ) -> None:
         """test_find_block_before_timestamp"""
-        w3 = Web3(Web3.HTTPProvider(rpc))
+        w3 = self._base_w3()
         block = NativeBridgeProvider._find_block_before_timestamp(w3, timestamp)
         assert block == expected_block, f"Expected block {expected_block}, got {block}."
+        # interpolation lands next to the target instead of bisecting the chain
+        assert w3.eth.get_block.call_count <= 4
 
 
 @pytest.mark.integration
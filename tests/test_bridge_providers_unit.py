@@ -327,6 +327,27 @@ class TestProviderBase:
         assert from_token in result[from_chain][from_addr]
         assert int(result[from_chain][from_addr][from_token]) == amount
 
+    def test_requirements_shares_gas_pricing_and_skips_debug_reads(self) -> None:
+        """requirements() fetches gas pricing once and skips debug-only RPC reads."""
+        txs = [
+            ("approve", {"to": ERC20_ADDR, "data": "0x", "gas": 50_000, "value": 0}),
+            ("bridge", {"to": ERC20_ADDR, "data": "0x", "gas": 90_000, "value": 0}),
+        ]
+        provider = _ConcreteProvider(txs_to_return=txs)
+        provider.logger.isEnabledFor.return_value = False  # type: ignore[attr-defined]
+        req = _make_request()
+
+        mock_ledger = MagicMock(_chain_id=8453)
+        mock_ledger.try_get_gas_pricing.return_value = {"gasPrice": 2}
+        with patch(
+            "operate.bridge.providers.provider.get_default_ledger_api",
+            return_value=mock_ledger,
+        ):
+            provider.requirements(req)
+
+        mock_ledger.try_get_gas_pricing.assert_called_once()
+        mock_ledger.api.eth.get_block.assert_not_called()
+
     def test_requirements_erc20_transfer_malformed_raises(self) -> None:
         """requirements() raises RuntimeError on malformed ERC20 transfer data (lines 315-316)."""
         from_token = ERC20_ADDR
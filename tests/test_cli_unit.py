@@ -26,13 +26,16 @@ import multiprocessing
 import os
 import signal as signal_module
 import threading
+import time
 from contextlib import ExitStack
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
 
 from operate import __version__
 from operate.cli import (
@@ -42,11 +45,23 @@ from operate.cli import (
     main,
     service_not_found_error,
 )
-from operate.constants import OPERATE, SERVICES_DIR, ZERO_ADDRESS
+from operate.constants import (
+    MSG_INVALID_PASSWORD,
+    OPERATE,
+    SERVICES_DIR,
+    ZERO_ADDRESS,
+)
 from operate.ledger.profiles import DEFAULT_EOA_TOPUPS
 from operate.migration import MigrationManager
 from operate.operate_types import Chain, DeploymentStatus
+from operate.services.deploy_timings import DeployTimings
 from operate.services.funding_manager import FundingInProgressError
+from operate.utils.download import DownloadTracker
+from operate.utils.event_bus import (
+    DEPLOYMENT_STATUS_EVENT,
+    EventBus,
+    FUNDING_STATUS_EVENT,
+)
 from operate.wallet.master import InsufficientFundsException
 from operate.wallet.wallet_recovery_manager import WalletRecoveryError
 
@@ -122,6 +137,9 @@ def _open_app(
     stack.enter_context(patch("operate.cli.OperateApp", return_value=mock_operate))
     mock_hc_cls = stack.enter_context(patch("operate.cli.HealthChecker"))
     mock_hc_cls.NUMBER_OF_FAILS_DEFAULT = 60
+    mock_hc_cls.return_value.get_latest_healthcheck.side_effect = (
+        lambda service: service.get_latest_healthcheck()
+    )
     stack.enter_context(patch("operate.cli.signal"))
     stack.enter_context(patch("operate.cli.atexit"))
     mock_wd = MagicMock()
@@ -375,6 +393,40 @@ class TestCreateAppInfra:
                 # The task runs in the app's event loop / executor; wait for it.
                 assert maintenance_called.wait(timeout=5)
 
+    def test_login_schedules_bridge_history_compaction(self) -> None:
+        """A login starts compacting the bridge history periodically; failures are logged."""
+        m = _make_mock_operate()
+        ua = MagicMock()
+        ua.is_valid.return_value = True
+        m.user_account = ua
+        compactions: List[float] = []
+        compacted_again = threading.Event()
+
+        def _compact() -> None:
+            compactions.append(time.monotonic())
+            if len(compactions) == 2:
+                compacted_again.set()
+            raise RuntimeError("fail")
+
+        m.bridge_manager.compact_history.side_effect = _compact
+
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            stack.enter_context(
+                patch("operate.cli.BRIDGE_HISTORY_COMPACTION_INTERVAL", 0.05)
+            )
+            with TestClient(app, raise_server_exceptions=False) as client:
+                m.password = None  # not logged in before login
+                for _ in range(2):
+                    resp = client.post(
+                        "/api/account/login",
+                        json={"password": _TEST_PW_TESTPASS123},
+                    )
+                    assert resp.status_code == HTTPStatus.OK
+                assert compacted_again.wait(timeout=5)
+            # the second login did not start another job compacting right away
+            assert compactions[1] - compactions[0] >= 0.04
+
     # ── cancel_funding_job ────────────────────────────────────────────────────
 
     def test_cancel_funding_job_none_returns_early(self) -> None:
@@ -614,6 +666,273 @@ class TestKillShutdownApiRoutes:
             assert resp.status_code == HTTPStatus.OK
 
 
+class TestMetricsRoute:
+    """Tests for /api/metrics."""
+
+    def test_metrics_include_route_latency(self) -> None:
+        """Served requests show up in the Prometheus exposition."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                assert c.get("/api").status_code == HTTPStatus.OK
+                resp = c.get("/api/metrics")
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'operate_http_request_duration_seconds_count{method="GET",route="/api",status="200"}'
+            in resp.text
+        )
+        assert 'operate_executor_queue_depth{pool="disk"} 0' in resp.text
+
+
+class TestDownloadsRoute:
+    """Tests for /api/downloads."""
+
+    def test_downloads_progress(self) -> None:
+        """Tracked downloads are listed with their progress."""
+        tracker = DownloadTracker()
+        progress = tracker.start("http://x/agent.zip", Path("/tmp/agent.zip"))
+        progress.total_bytes, progress.downloaded_bytes = 10, 4
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack, patch("operate.cli.download_tracker", tracker):
+            with TestClient(app) as c:
+                resp = c.get("/api/downloads")
+        assert resp.status_code == HTTPStatus.OK
+        [download] = resp.json()
+        assert download["url"] == "http://x/agent.zip"
+        assert download["total_bytes"] == 10
+        assert download["downloaded_bytes"] == 4
+        assert download["status"] == "downloading"
+
+
+class TestDebugRoutes:
+    """Tests for the loop lag monitor and the /api/debug/profile endpoint."""
+
+    def test_off_by_default(self) -> None:
+        """Without the env vars there is no monitor and no profiler route."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack, patch("operate.cli.LoopLagMonitor") as mock_monitor_cls:
+            with TestClient(app) as c:
+                resp = c.post("/api/debug/profile", json={})
+        assert resp.status_code == HTTPStatus.NOT_FOUND
+        mock_monitor_cls.assert_not_called()
+
+    def test_loop_monitor_runs_with_the_app(self) -> None:
+        """A lag threshold starts the monitor with the app and stops it after."""
+        m = _make_mock_operate()
+        with patch("operate.cli.LoopLagMonitor") as mock_monitor_cls:
+            mock_monitor_cls.return_value.stop = AsyncMock()
+            stack, app, _, _ = _open_app(m, env={"LOOP_LAG_THRESHOLD": "0.5"})
+            with stack:
+                with TestClient(app):
+                    mock_monitor_cls.return_value.start.assert_called_once()
+        assert mock_monitor_cls.call_args.kwargs["threshold"] == 0.5
+        mock_monitor_cls.return_value.stop.assert_awaited_once()
+
+    def test_profile_requires_the_password(self) -> None:
+        """The profiler is only available to the logged in user."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m, env={"PROFILER_ON": "1"})
+        with stack:
+            with TestClient(app) as c:
+                assert (
+                    c.post("/api/debug/profile", json={}).status_code
+                    == HTTPStatus.UNAUTHORIZED
+                )
+                m.password = "pass"  # nosec B105
+                resp = c.post("/api/debug/profile", json={"password": "wrong"})
+        assert resp.status_code == HTTPStatus.UNAUTHORIZED
+        assert resp.json()["error"] == MSG_INVALID_PASSWORD
+
+    @pytest.mark.parametrize("seconds", ["abc", "0", "61"])
+    def test_profile_rejects_bad_durations(self, seconds: str) -> None:
+        """Durations must be positive and bounded."""
+        m = _make_mock_operate()
+        m.password = "pass"  # nosec B105
+        stack, app, _, _ = _open_app(m, env={"PROFILER_ON": "1"})
+        with stack:
+            with TestClient(app) as c:
+                resp = c.post(
+                    f"/api/debug/profile?seconds={seconds}", json={"password": "pass"}
+                )
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_profile_returns_collapsed_stacks(self) -> None:
+        """Samples are returned in the collapsed format, one profile at a time."""
+        m = _make_mock_operate()
+        m.password = "pass"  # nosec B105
+        started, release = threading.Event(), threading.Event()
+
+        def _sample(seconds: float) -> dict:
+            started.set()
+            release.wait(5)
+            return {"MainThread;operate.cli:_handler": 3}
+
+        stack, app, _, _ = _open_app(m, env={"PROFILER_ON": "1"})
+        with stack, patch("operate.cli.sample_stacks", side_effect=_sample):
+            with TestClient(app) as c:
+                first = {}
+
+                def _first() -> None:
+                    first["resp"] = c.post(
+                        "/api/debug/profile?seconds=0.5", json={"password": "pass"}
+                    )
+
+                thread = threading.Thread(target=_first)
+                thread.start()
+                started.wait(5)
+                busy = c.post("/api/debug/profile", json={"password": "pass"})
+                release.set()
+                thread.join()
+        assert busy.status_code == HTTPStatus.CONFLICT
+        assert first["resp"].status_code == HTTPStatus.OK
+        assert first["resp"].text == "MainThread;operate.cli:_handler 3\n"
+
+
+class TestEventsRoutes:
+    """Tests for the /api/events SSE stream and its WebSocket variant."""
+
+    @staticmethod
+    def _close_when_subscribed(bus: EventBus, publish: bool = True) -> threading.Thread:
+        """Publish an event to the first subscriber, then end its stream."""
+
+        def _run() -> None:
+            while not bus._subscribers:  # pylint: disable=protected-access
+                time.sleep(0.01)
+            if publish:
+                bus.publish(FUNDING_STATUS_EVENT, {"service_config_id": "svc1"})
+            time.sleep(0.1)
+            bus._subscribers[0].close()  # pylint: disable=protected-access
+
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        return thread
+
+    def test_sse_resumes_and_streams_filtered_events(self) -> None:
+        """Missed events are replayed from Last-Event-ID, then live ones follow."""
+        bus = EventBus()
+        bus.publish(DEPLOYMENT_STATUS_EVENT, {"service_config_id": "svc1"})
+        bus.publish(DEPLOYMENT_STATUS_EVENT, {"service_config_id": "svc2"})
+        bus.publish(DEPLOYMENT_STATUS_EVENT, {"service_config_id": "svc1"})
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with (
+            stack,
+            patch("operate.cli.event_bus", bus),
+            patch("operate.cli.EVENTS_HEARTBEAT_INTERVAL", 0.01),
+        ):
+            thread = self._close_when_subscribed(bus)
+            with TestClient(app) as c:
+                resp = c.get(
+                    "/api/events?service_config_id=svc1",
+                    headers={"Last-Event-ID": "1"},
+                )
+            thread.join()
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        ids = [line for line in resp.text.splitlines() if line.startswith("id: ")]
+        assert ids == ["id: 3", "id: 4"]
+        assert f"event: {FUNDING_STATUS_EVENT}" in resp.text
+        assert ": ping" in resp.text
+        assert not bus._subscribers  # pylint: disable=protected-access
+
+    def test_sse_rejects_malformed_cursor(self) -> None:
+        """A non-numeric Last-Event-ID is a bad request."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.get("/api/events?last_event_id=abc")
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_websocket_streams_events(self) -> None:
+        """Events are sent as JSON messages; a disconnect unsubscribes."""
+        bus = EventBus()
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack, patch("operate.cli.event_bus", bus):
+            with TestClient(app) as c:
+                with c.websocket_connect(
+                    f"/api/events/ws?types={FUNDING_STATUS_EVENT}"
+                ) as ws:
+                    bus.publish(DEPLOYMENT_STATUS_EVENT, {"service_config_id": "a"})
+                    bus.publish(FUNDING_STATUS_EVENT, {"service_config_id": "a"})
+                    message = ws.receive_json()
+                for _ in range(100):
+                    if not bus._subscribers:  # pylint: disable=protected-access
+                        break
+                    time.sleep(0.01)
+        assert message["type"] == FUNDING_STATUS_EVENT
+        assert message["id"] == 2
+        assert not bus._subscribers  # pylint: disable=protected-access
+
+    def test_websocket_closes_when_subscription_ends(self) -> None:
+        """The server closes the socket when the subscription is closed."""
+        bus = EventBus()
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack, patch("operate.cli.event_bus", bus):
+            thread = self._close_when_subscribed(bus, publish=False)
+            with TestClient(app) as c:
+                with c.websocket_connect("/api/events/ws") as ws:
+                    with pytest.raises(WebSocketDisconnect):
+                        ws.receive_json()
+            thread.join()
+
+    def test_websocket_client_disconnect_unsubscribes(self) -> None:
+        """Messages from the client are ignored until it disconnects."""
+        bus = EventBus()
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack, patch("operate.cli.event_bus", bus):
+            with TestClient(app) as c:
+                with c.websocket_connect("/api/events/ws") as ws:
+                    ws.send_text("ping")
+                    bus.publish(FUNDING_STATUS_EVENT, {"service_config_id": "a"})
+                    message = ws.receive_json()
+                for _ in range(100):
+                    if not bus._subscribers:  # pylint: disable=protected-access
+                        break
+                    time.sleep(0.01)
+        assert message["type"] == FUNDING_STATUS_EVENT
+        assert not bus._subscribers  # pylint: disable=protected-access
+
+    def test_websocket_send_to_gone_client_unsubscribes(self) -> None:
+        """A send failing because the client has gone ends the subscription."""
+        bus = EventBus()
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with (
+            stack,
+            patch("operate.cli.event_bus", bus),
+            patch(
+                "fastapi.WebSocket.send_json", side_effect=WebSocketDisconnect(1001)
+            ) as send_json,
+        ):
+            with TestClient(app) as c:
+                with c.websocket_connect("/api/events/ws"):
+                    bus.publish(FUNDING_STATUS_EVENT, {"service_config_id": "a"})
+                    for _ in range(100):
+                        if not bus._subscribers:  # pylint: disable=protected-access
+                            break
+                        time.sleep(0.01)
+        send_json.assert_called_once()
+        assert not bus._subscribers  # pylint: disable=protected-access
+
+    def test_websocket_rejects_malformed_cursor(self) -> None:
+        """A non-numeric cursor closes the socket before accepting it."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                with pytest.raises(WebSocketDisconnect):
+                    with c.websocket_connect("/api/events/ws?last_event_id=abc"):
+                        pass  # pragma: no cover
+
+
 class TestAccountRoutes:
     """Cover account-related route handlers."""
 
@@ -1691,6 +2010,48 @@ class TestServiceRoutes:
                 resp = c.get("/api/v2/service/svc1")
             assert resp.status_code == HTTPStatus.OK
 
+    def test_service_reads_are_conditional(self) -> None:
+        """An unchanged content version is answered with 304, without a read."""
+        m = _make_mock_operate()
+        service_manager = m.service_manager.return_value
+        service_manager.exists.return_value = True
+        service_manager.content_version.return_value = ["svc1/config.json:1"]
+        svc = MagicMock()
+        svc.service_config_id = "svc1"
+        svc.json = {"service_config_id": "svc1"}
+        svc.deployment.json = {"status": "DEPLOYED"}
+        svc.get_latest_healthcheck.return_value = {}
+        service_manager.load.return_value = svc
+        service_manager.get_all_services.return_value = ([svc], True)
+        service_manager.json = [{"service_config_id": "svc1"}]
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                for path in (
+                    "/api/v2/services",
+                    "/api/v2/services/deployment",
+                    "/api/v2/service/svc1",
+                    "/api/v2/service/svc1/deployment",
+                ):
+                    resp = c.get(path)
+                    assert resp.status_code == HTTPStatus.OK
+                    etag = resp.headers["etag"]
+
+                    service_manager.load.reset_mock()
+                    service_manager.get_all_services.reset_mock()
+                    resp = c.get(path, headers={"If-None-Match": etag})
+                    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+                    assert resp.headers["etag"] == etag
+                    assert resp.content == b""
+                    service_manager.load.assert_not_called()
+                    service_manager.get_all_services.assert_not_called()
+
+                # a new content version invalidates the tag
+                service_manager.content_version.return_value = ["svc1/config.json:2"]
+                resp = c.get("/api/v2/service/svc1", headers={"If-None-Match": etag})
+                assert resp.status_code == HTTPStatus.OK
+                assert resp.headers["etag"] != etag
+
     def test_get_service_deployment_not_found(self) -> None:
         """Cover line 1133: service not found in deployment route."""
         m = _make_mock_operate()
@@ -1715,6 +2076,101 @@ class TestServiceRoutes:
                 resp = c.get("/api/v2/service/svc1/deployment")
             assert resp.status_code == HTTPStatus.OK
 
+    def test_get_service_healthcheck_latency_not_found(self) -> None:
+        """GET /api/v2/service/{id}/healthcheck/latency for an unknown service."""
+        m = _make_mock_operate()
+        m.service_manager.return_value.exists.return_value = False
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.get("/api/v2/service/svc1/healthcheck/latency")
+            assert resp.status_code == HTTPStatus.NOT_FOUND
+
+    def test_get_service_healthcheck_latency_and_session_close(self) -> None:
+        """Latency stats come from the health checker; its session closes on exit."""
+        import operate.cli as cli_module
+
+        m = _make_mock_operate()
+        m.service_manager.return_value.exists.return_value = True
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            health_checker.latency_stats.return_value = {"count": 3}
+            health_checker.close = AsyncMock()
+            with TestClient(app) as c:
+                resp = c.get("/api/v2/service/svc1/healthcheck/latency")
+                assert resp.json() == {"count": 3}
+            health_checker.latency_stats.assert_called_once_with("svc1")
+            health_checker.close.assert_awaited_once()
+
+    def test_get_service_healthcheck_history(self) -> None:
+        """GET /api/v2/service/{id}/healthcheck/history returns the probe history."""
+        import operate.cli as cli_module
+
+        m = _make_mock_operate()
+        m.service_manager.return_value.exists.side_effect = [False, True]
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            health_checker.history.return_value.json.return_value = {"records": []}
+            with TestClient(app) as c:
+                missing = c.get("/api/v2/service/svc1/healthcheck/history")
+                resp = c.get("/api/v2/service/svc1/healthcheck/history?limit=5")
+                invalid = c.get("/api/v2/service/svc1/healthcheck/history?limit=-1")
+            assert missing.status_code == HTTPStatus.NOT_FOUND
+            assert resp.json() == {"records": []}
+            health_checker.history.assert_called_once_with("svc1")
+            health_checker.history.return_value.json.assert_called_once_with(limit=5)
+            assert invalid.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    def test_get_service_healthcheck_restarts(self) -> None:
+        """GET /api/v2/service/{id}/healthcheck/restarts returns the restart stats."""
+        import operate.cli as cli_module
+
+        m = _make_mock_operate()
+        m.service_manager.return_value.exists.side_effect = [False, True]
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            health_checker.restarts.stats.return_value.json = {"rebuilds": 1}
+            with TestClient(app) as c:
+                missing = c.get("/api/v2/service/svc1/healthcheck/restarts")
+                resp = c.get("/api/v2/service/svc1/healthcheck/restarts")
+            assert missing.status_code == HTTPStatus.NOT_FOUND
+            assert resp.json() == {"rebuilds": 1}
+            health_checker.restarts.stats.assert_called_once_with("svc1")
+
+    def test_get_service_deployment_timings(self) -> None:
+        """GET /api/v2/service/{id}/deployment/timings returns the deploy timings."""
+        timings = DeployTimings()
+        with timings.track("svc1"), timings.phase("build"):
+            pass
+        m = _make_mock_operate()
+        m.service_manager.return_value.exists.side_effect = [False, True]
+        stack, app, _, _ = _open_app(m)
+        with stack, patch("operate.cli.deploy_timings", timings):
+            with TestClient(app) as c:
+                missing = c.get("/api/v2/service/svc1/deployment/timings")
+                resp = c.get("/api/v2/service/svc1/deployment/timings")
+        assert missing.status_code == HTTPStatus.NOT_FOUND
+        [deploy] = resp.json()["deploys"]
+        assert deploy["status"] == "completed"
+        assert [phase["name"] for phase in deploy["phases"]] == ["build"]
+
+    def test_get_services_healthcheck_schedule(self) -> None:
+        """GET /api/v2/services/healthcheck/schedule returns the probe schedule."""
+        import operate.cli as cli_module
+
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            health_checker.scheduler.json = {"in_flight": 0, "services": {}}
+            with TestClient(app) as c:
+                resp = c.get("/api/v2/services/healthcheck/schedule")
+            assert resp.status_code == HTTPStatus.OK
+            assert resp.json() == {"in_flight": 0, "services": {}}
+
     def test_get_service_achievements_not_found(self) -> None:
         """Cover line 1148: service not found in achievements route."""
         m = _make_mock_operate()
@@ -1988,6 +2444,95 @@ class TestServiceRoutes:
                 resp = c.patch("/api/v2/service/svc1", json={})
             assert resp.status_code == HTTPStatus.OK
 
+    def test_update_service_deployment_not_logged_in(self) -> None:
+        """PUT deployment requires a logged in user."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.put("/api/v2/service/svc1/deployment", json={})
+            assert resp.status_code == HTTPStatus.UNAUTHORIZED
+
+    def test_update_service_deployment_not_found(self) -> None:
+        """PUT deployment of a missing service."""
+        m = self._basic_with_password()
+        m.service_manager.return_value.exists.return_value = False
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.put("/api/v2/service/svc1/deployment", json={})
+            assert resp.status_code == HTTPStatus.NOT_FOUND
+
+    @pytest.mark.parametrize(
+        ("method", "partial_update"), [("put", False), ("patch", True)]
+    )
+    def test_update_service_deployment(self, method: str, partial_update: bool) -> None:
+        """The deployment is swapped with probes paused meanwhile."""
+        import operate.cli as cli_module
+
+        m = self._basic_with_password()
+        svc_mgr = m.service_manager.return_value
+        svc_mgr.exists.return_value = True
+        svc_mgr.update_service_locally.return_value.json = {"service_config_id": "svc1"}
+        svc_mgr.load.return_value.deployment.status = DeploymentStatus.DEPLOYED
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            with TestClient(app) as c:
+                resp = getattr(c, method)(
+                    "/api/v2/service/svc1/deployment", json={"hash": "new"}
+                )
+            assert resp.status_code == HTTPStatus.OK
+            assert resp.json() == {"service_config_id": "svc1"}
+            svc_mgr.update_service_locally.assert_called_once_with(
+                service_config_id="svc1",
+                service_template={"hash": "new"},
+                allow_different_service_public_id=False,
+                partial_update=partial_update,
+            )
+            health_checker.stop_for_service.assert_called_once_with(
+                service_config_id="svc1"
+            )
+            health_checker.start_for_service.assert_called_once_with("svc1")
+
+    def test_update_service_deployment_failure(self) -> None:
+        """A failed update reports an error; probes resume for the restored deployment."""
+        import operate.cli as cli_module
+
+        m = self._basic_with_password()
+        svc_mgr = m.service_manager.return_value
+        svc_mgr.exists.return_value = True
+        svc_mgr.update_service_locally.side_effect = RuntimeError("swap failed")
+        svc_mgr.load.return_value.deployment.status = DeploymentStatus.DEPLOYED
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            with TestClient(app) as c:
+                resp = c.patch("/api/v2/service/svc1/deployment", json={})
+            assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+            assert "Failed to update the service deployment" in resp.json()["error"]
+            health_checker.start_for_service.assert_called_once_with("svc1")
+
+    def test_update_service_deployment_failure_with_unloadable_service(
+        self,
+    ) -> None:
+        """A service that cannot be loaded afterwards does not mask the update error."""
+        import operate.cli as cli_module
+
+        m = self._basic_with_password()
+        svc_mgr = m.service_manager.return_value
+        svc_mgr.exists.return_value = True
+        svc_mgr.update_service_locally.side_effect = RuntimeError("swap failed")
+        svc_mgr.load.side_effect = ValueError("corrupt config")
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            health_checker = cli_module.HealthChecker.return_value  # type: ignore[attr-defined]
+            with TestClient(app) as c:
+                resp = c.patch("/api/v2/service/svc1/deployment", json={})
+            assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+            assert "Failed to update the service deployment" in resp.json()["error"]
+            health_checker.start_for_service.assert_not_called()
+
     def test_stop_service_not_found(self) -> None:
         """Cover line 1332."""
         m = _make_mock_operate()
@@ -2456,6 +3001,41 @@ class TestBridgeRoutes:
             assert resp.status_code == HTTPStatus.OK
             assert resp.json()["id"] == "bundle42"
 
+    def test_bridge_history_success(self) -> None:
+        """GET /api/bridge/history forwards pagination and filters."""
+        m = _make_mock_operate()
+        m.bridge_manager.get_history.return_value = {"total": 0, "items": []}
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.get(
+                    "/api/bridge/history",
+                    params={"offset": 20, "limit": 10, "chain": "base"},
+                )
+            assert resp.status_code == HTTPStatus.OK
+            m.bridge_manager.get_history.assert_called_once_with(
+                offset=20, limit=10, status=None, chain="base"
+            )
+
+    def test_bridge_history_invalid_pagination(self) -> None:
+        """GET /api/bridge/history rejects invalid pagination parameters."""
+        m = _make_mock_operate()
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.get("/api/bridge/history", params={"limit": "abc"})
+            assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_bridge_history_generic_exception(self) -> None:
+        """GET /api/bridge/history returns 500 on unexpected errors."""
+        m = _make_mock_operate()
+        m.bridge_manager.get_history.side_effect = RuntimeError("fail")
+        stack, app, _, _ = _open_app(m)
+        with stack:
+            with TestClient(app) as c:
+                resp = c.get("/api/bridge/history")
+            assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+
     def test_bridge_status_success(self) -> None:
         """Cover lines 1622-1627: GET /api/bridge/status/{id}."""
         m = _make_mock_operate()
@@ -2995,6 +3575,16 @@ class TestCliCommands:
 
         mock_analyse.assert_called_once()
 
+    def test_gc_command_body(self, tmp_path: Path) -> None:
+        """_gc removes the agent assets no service links to."""
+        fn = self._get_callback("_gc")
+        store = tmp_path / "agent_assets"
+        store.mkdir()
+        (store / ("a" * 64)).write_bytes(b"unused")
+        with patch("operate.cli.OPERATE_HOME", tmp_path):
+            fn()
+        assert not list(store.iterdir())
+
 
 class TestMain:
     """Cover main() behavior."""
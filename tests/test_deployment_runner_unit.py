@@ -33,6 +33,9 @@ from operate.services.deployment_runner import (
     PyInstallerHostDeploymentRunnerMac,
     PyInstallerHostDeploymentRunnerWindows,
     States,
+    prepare_host_deployment,
+    relocate_host_deployment,
+    restart_host_deployment,
     run_host_deployment,
     stop_deployment_manager,
     stop_host_deployment,
@@ -355,6 +358,101 @@ class TestDeploymentManagerRunDeployment:
         mock_stop.assert_called_with(build_dir=tmp_path, force=True)
 
 
+class TestDeploymentManagerRestartDeployment:
+    """Tests for DeploymentManager.restart_deployment."""
+
+    def test_raises_when_manager_is_stopping(self, tmp_path: Path) -> None:
+        """Test RuntimeError when the manager is already stopping."""
+        manager = _make_manager()
+        manager._is_stopping = True
+        with pytest.raises(RuntimeError, match="deployment manager stopped"):
+            manager.restart_deployment(
+                build_dir=tmp_path, password="pass"
+            )  # nosec B106
+
+    def test_raises_when_service_in_transition(self, tmp_path: Path) -> None:
+        """Test ValueError when the service is already in transition."""
+        manager = _make_manager()
+        manager._states[tmp_path] = States.STOPPING
+        with pytest.raises(ValueError, match="Service already in transition"):
+            manager.restart_deployment(
+                build_dir=tmp_path, password="pass"
+            )  # nosec B106
+
+    def test_successful_restart_sets_started_state(self, tmp_path: Path) -> None:
+        """Test that a successful restart sets state to STARTED without an ipfs check."""
+        manager = _make_manager()
+        mock_runner = MagicMock()
+        with (
+            patch.object(manager, "_get_deployment_runner", return_value=mock_runner),
+            patch.object(manager, "check_ipfs_connection_works") as mock_ipfs,
+        ):
+            manager.restart_deployment(
+                build_dir=tmp_path, password="pass"
+            )  # nosec B106
+
+        assert manager._states[tmp_path] == States.STARTED
+        mock_runner.restart.assert_called_once_with(password="pass")  # nosec B106
+        mock_ipfs.assert_not_called()
+
+    def test_exception_sets_error_state_and_reraises(self, tmp_path: Path) -> None:
+        """Test that a failed restart sets ERROR state and re-raises."""
+        manager = _make_manager()
+        mock_runner = MagicMock()
+        mock_runner.restart.side_effect = RuntimeError("restart failed")
+        with (
+            patch.object(manager, "_get_deployment_runner", return_value=mock_runner),
+            pytest.raises(RuntimeError, match="restart failed"),
+        ):
+            manager.restart_deployment(
+                build_dir=tmp_path, password="pass"
+            )  # nosec B106
+        assert manager._states[tmp_path] == States.ERROR
+
+
+class TestDeploymentManagerPrepareDeployment:
+    """Tests for DeploymentManager.prepare_deployment and relocate_deployment."""
+
+    def test_raises_when_manager_is_stopping(self, tmp_path: Path) -> None:
+        """Test RuntimeError when the manager is already stopping."""
+        manager = _make_manager()
+        manager._is_stopping = True
+        with pytest.raises(RuntimeError, match="deployment manager stopped"):
+            manager.prepare_deployment(
+                build_dir=tmp_path, password="pass"
+            )  # nosec B106
+
+    def test_prepare_does_not_start(self, tmp_path: Path) -> None:
+        """Test that a deployment is set up without changing its state."""
+        manager = _make_manager()
+        mock_runner = MagicMock()
+        with (
+            patch.object(manager, "_get_deployment_runner", return_value=mock_runner),
+            patch.object(manager, "check_ipfs_connection_works") as mock_ipfs,
+        ):
+            manager.prepare_deployment(
+                build_dir=tmp_path, password="pass"
+            )  # nosec B106
+
+        mock_ipfs.assert_called_once()
+        mock_runner.prepare.assert_called_once_with(password="pass")  # nosec B106
+        mock_runner.start.assert_not_called()
+        assert manager.get_state(build_dir=tmp_path) == States.NONE
+
+    def test_relocate(self, tmp_path: Path) -> None:
+        """Test that the runner of the moved deployment is relocated."""
+        manager = _make_manager()
+        mock_runner = MagicMock()
+        with patch.object(
+            manager, "_get_deployment_runner", return_value=mock_runner
+        ) as mock_get:
+            manager.relocate_deployment(
+                build_dir=tmp_path / "new", previous_dir=tmp_path / "old", is_aea=False
+            )
+        mock_get.assert_called_once_with(build_dir=tmp_path / "new", is_aea=False)
+        mock_runner.relocate.assert_called_once_with(previous_dir=tmp_path / "old")
+
+
 class TestDeploymentManagerStopDeployment:
     """Tests for DeploymentManager.stop_deployment (lines 943-964)."""
 
@@ -415,6 +513,40 @@ class TestModuleLevelFunctions:
             build_dir=tmp_path, password="pass", is_aea=True  # nosec B106
         )
 
+    def test_restart_host_deployment_delegates_to_manager(self, tmp_path: Path) -> None:
+        """Test restart_host_deployment calls deployment_manager.restart_deployment."""
+        import operate.services.deployment_runner as dr
+
+        with patch.object(dr.deployment_manager, "restart_deployment") as mock_restart:
+            restart_host_deployment(build_dir=tmp_path, password="pass")  # nosec B106
+        mock_restart.assert_called_once_with(
+            build_dir=tmp_path, password="pass", is_aea=True  # nosec B106
+        )
+
+    def test_prepare_host_deployment_delegates_to_manager(self, tmp_path: Path) -> None:
+        """Test prepare_host_deployment calls deployment_manager.prepare_deployment."""
+        import operate.services.deployment_runner as dr
+
+        with patch.object(dr.deployment_manager, "prepare_deployment") as mock_prepare:
+            prepare_host_deployment(build_dir=tmp_path, password="pass")  # nosec B106
+        mock_prepare.assert_called_once_with(
+            build_dir=tmp_path, password="pass", is_aea=True  # nosec B106
+        )
+
+    def test_relocate_host_deployment_delegates_to_manager(
+        self, tmp_path: Path
+    ) -> None:
+        """Test relocate_host_deployment calls deployment_manager.relocate_deployment."""
+        import operate.services.deployment_runner as dr
+
+        with patch.object(
+            dr.deployment_manager, "relocate_deployment"
+        ) as mock_relocate:
+            relocate_host_deployment(build_dir=tmp_path, previous_dir=tmp_path.parent)
+        mock_relocate.assert_called_once_with(
+            build_dir=tmp_path, previous_dir=tmp_path.parent, is_aea=True
+        )
+
     def test_stop_host_deployment_delegates_to_manager(self, tmp_path: Path) -> None:
         """Test stop_host_deployment calls deployment_manager.stop_deployment."""
         import operate.services.deployment_runner as dr
@@ -21,6 +21,7 @@
 
 import json
 import os
+import socket
 import subprocess  # nosec B404
 import sys
 from pathlib import Path
@@ -33,15 +34,20 @@ import pytest
 
 from operate import constants
 from operate.services.agent_assets import AgentAssetManager
+from operate.services.deploy_timings import DeployTimings
 from operate.services.deployment_runner import (
     BaseDeploymentRunner,
     DeploymentManager,
     HostPythonHostDeploymentRunner,
+    PortOwners,
     PyInstallerHostDeploymentRunnerLinux,
     PyInstallerHostDeploymentRunnerMac,
+    VENV_REQUIREMENTS,
     _kill_process,
+    _port_in_use,
     kill_process,
     kill_processes_on_port,
+    reset_tendermint_state,
 )
 from operate.utils.pid_file import PIDFileError, StalePIDFile
 
@@ -150,26 +156,39 @@ class TestKillProcessHelper:
             _kill_process(12345)  # Should not raise
         mock_proc.kill.assert_called_once()
 
-    def test_kill_succeeds_then_pid_disappears(self) -> None:
-        """When kill() succeeds, loop continues until pid no longer exists."""
+    def test_kill_succeeds_then_waits_for_exit(self) -> None:
+        """When kill() succeeds, the process exit is awaited."""
         mock_proc = MagicMock()
         mock_proc.status.return_value = psutil.STATUS_RUNNING
-        # First call: pid exists; second call: pid gone
-        pid_exists_side_effects = [True, False]
 
         with (
             patch(
                 "operate.services.deployment_runner.psutil.pid_exists",
-                side_effect=pid_exists_side_effects,
+                return_value=True,
             ),
             patch(
                 "operate.services.deployment_runner.psutil.Process",
                 return_value=mock_proc,
             ),
-            patch("operate.services.deployment_runner.time.sleep"),
+            patch(
+                "operate.services.deployment_runner.psutil.wait_procs",
+                return_value=([mock_proc], []),
+            ) as mock_wait,
         ):
-            _kill_process(12345)
+            _kill_process(12345, timeout=3)
         mock_proc.kill.assert_called_once()
+        mock_wait.assert_called_once_with([mock_proc], timeout=3)
+
+    def test_real_process_is_gone_on_return(self) -> None:
+        """A killed child process has exited by the time _kill_process returns."""
+        process = subprocess.Popen(  # nosec
+            [sys.executable, "-c", "import time; time.sleep(30)"]
+        )
+        _kill_process(process.pid)
+        assert not psutil.pid_exists(process.pid) or (
+            psutil.Process(process.pid).status() == psutil.STATUS_ZOMBIE
+        )
+        process.wait(timeout=5)
 
 
 # ---------------------------------------------------------------------------
@@ -210,10 +229,10 @@ class TestKillProcess:
         ):
             kill_process(99999)
 
-        # Children killed first (reversed), then parent – each killed twice
+        # Children killed first (reversed), then parent; each kill awaits the exit
         calls = [c.args[0] for c in mock_kill.call_args_list]
         # reversed([child1, child2]) → [child2, child1]
-        assert calls == [22222, 22222, 11111, 11111, 99999, 99999]
+        assert calls == [22222, 11111, 99999]
 
 
 # ---------------------------------------------------------------------------
@@ -281,40 +300,31 @@ class TestRunAeaCommand:
     """Tests for _run_aea_command (lines 144-167)."""
 
     def test_success_with_exitcode_zero(self, tmp_path: Path) -> None:
-        """When process exitcode is 0, no exception is raised."""
+        """When the command exits with 0, no exception is raised."""
         runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
-        mock_proc = MagicMock()
-        mock_proc.exitcode = 0
 
-        with patch(
-            "operate.services.deployment_runner.multiprocessing.Process",
-            return_value=mock_proc,
-        ):
+        with patch.object(runner._aea_worker, "run", return_value=0) as mock_run:
             runner._run_aea_command("init", "--reset", cwd=tmp_path)
 
-        mock_proc.start.assert_called_once()
-        mock_proc.join.assert_called_once()
+        mock_run.assert_called_once_with(
+            cwd=tmp_path,
+            args=("init", "--reset"),
+            timeout=runner.AEA_COMMAND_TIMEOUT,
+        )
 
     def test_raises_runtime_error_on_nonzero_exitcode(self, tmp_path: Path) -> None:
-        """When process exitcode is non-zero, RuntimeError is raised."""
+        """When the command exits with a non-zero code, RuntimeError is raised."""
         runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
-        mock_proc = MagicMock()
-        mock_proc.exitcode = 1
 
         with (
-            patch(
-                "operate.services.deployment_runner.multiprocessing.Process",
-                return_value=mock_proc,
-            ),
-            pytest.raises(RuntimeError, match="execution failed with exit code"),
+            patch.object(runner._aea_worker, "run", return_value=1),
+            pytest.raises(RuntimeError, match="execution failed with exit code: 1"),
         ):
             runner._run_aea_command("init", cwd=tmp_path)
 
     def test_password_arg_is_masked_in_log(self, tmp_path: Path) -> None:
         """Password value following --password is masked in log output."""
         runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
-        mock_proc = MagicMock()
-        mock_proc.exitcode = 0
         logged_messages: List[str] = []
 
         def capture_info(msg: str, *args: Any, **kwargs: Any) -> None:
@@ -323,10 +333,7 @@ class TestRunAeaCommand:
         runner.logger = MagicMock()
         runner.logger.info.side_effect = capture_info
 
-        with patch(
-            "operate.services.deployment_runner.multiprocessing.Process",
-            return_value=mock_proc,
-        ):
+        with patch.object(runner._aea_worker, "run", return_value=0):
             runner._run_aea_command(
                 "add-key", "--password", "super_secret", "ethereum", cwd=tmp_path
             )
@@ -338,8 +345,6 @@ class TestRunAeaCommand:
     def test_password_equals_arg_is_masked_in_log(self, tmp_path: Path) -> None:
         """Password in --password=<value> form is masked in log output."""
         runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
-        mock_proc = MagicMock()
-        mock_proc.exitcode = 0
         logged_messages: List[str] = []
 
         def capture_info(msg: str, *args: Any, **kwargs: Any) -> None:
@@ -348,15 +353,26 @@ class TestRunAeaCommand:
         runner.logger = MagicMock()
         runner.logger.info.side_effect = capture_info
 
-        with patch(
-            "operate.services.deployment_runner.multiprocessing.Process",
-            return_value=mock_proc,
-        ):
-            runner._run_aea_command("--password=super_secret", cwd=tmp_path)
+        with patch.object(runner._aea_worker, "run", return_value=1):
+            with pytest.raises(RuntimeError) as exc_info:
+                runner._run_aea_command("--password=super_secret", cwd=tmp_path)
 
         combined = " ".join(logged_messages)
         assert "super_secret" not in combined
         assert "--password=******" in combined
+        assert "super_secret" not in str(exc_info.value)
+
+    def test_start_stops_the_worker_after_setup(self, tmp_path: Path) -> None:
+        """The aea worker only lives for the setup, even when it fails."""
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
+        with (
+            patch.object(runner, "_free_deployment_ports"),
+            patch.object(runner, "_setup_agent", side_effect=RuntimeError("boom")),
+            patch.object(runner._aea_worker, "close") as mock_close,
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            runner._start(password="pass")  # nosec B106
+        mock_close.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -647,6 +663,26 @@ class TestStart:
             runner._start(password="testpass")  # nosec B106
         mock_free.assert_called_once()
 
+    def test_internal_start_phases_are_timed(self, tmp_path: Path) -> None:
+        """_start records its phases into the deploy being tracked."""
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
+        timings = DeployTimings()
+        with (
+            patch.object(runner, "_setup_agent"),
+            patch.object(runner, "_free_deployment_ports"),
+            patch.object(runner, "_start_tendermint"),
+            patch.object(runner, "_start_agent"),
+            patch("operate.services.deployment_runner.deploy_timings", timings),
+            timings.track("svc") as deploy,
+        ):
+            runner._start(password="testpass")  # nosec B106
+        assert [phase.name for phase in deploy.phases] == [
+            "free_ports",
+            "setup_agent",
+            "tendermint_start",
+            "agent_start",
+        ]
+
     def test_free_deployment_ports_reaps_both_ports_for_aea(
         self, tmp_path: Path
     ) -> None:
@@ -683,19 +719,43 @@ class TestKillProcessesOnPort:
             pid=pid,
         )
 
+    @pytest.fixture(autouse=True)
+    def _port_held(self) -> Any:
+        """Nothing tracked, and the port held until the scan found its owner."""
+        with (
+            patch("operate.services.deployment_runner.port_owners", PortOwners()),
+            patch("operate.services.deployment_runner._port_in_use", return_value=True),
+        ):
+            yield
+
     def test_kills_listener_on_matching_port(self) -> None:
         """A process listening on the target port is killed."""
         logger = MagicMock()
         with (
             patch(
                 "operate.services.deployment_runner.psutil.net_connections",
-                return_value=[self._conn(8716, 4321)],
+                side_effect=[[self._conn(8716, 4321)], []],
             ),
             patch("operate.services.deployment_runner.os.getpid", return_value=999),
             patch("operate.services.deployment_runner.kill_process") as mock_kill,
         ):
             kill_processes_on_port(8716, logger=logger)
         mock_kill.assert_called_once_with(4321)
+        logger.warning.assert_called_once()
+
+    def test_waits_for_port_release(self) -> None:
+        """The port is polled until released, up to the timeout."""
+        logger = MagicMock()
+        with (
+            patch(
+                "operate.services.deployment_runner.psutil.net_connections",
+                return_value=[self._conn(8716, 4321)],
+            ),
+            patch("operate.services.deployment_runner.os.getpid", return_value=999),
+            patch("operate.services.deployment_runner.kill_process"),
+        ):
+            kill_processes_on_port(8716, logger=logger, timeout=0.2)
+        assert "still in use" in logger.warning.call_args.args[0]
 
     def test_ignores_other_ports_and_non_listening(self) -> None:
         """Connections on other ports or not in LISTEN state are ignored."""
@@ -743,6 +803,125 @@ class TestKillProcessesOnPort:
         mock_kill.assert_not_called()
         logger.warning.assert_called()
 
+    def test_free_port_is_not_scanned(self) -> None:
+        """The connections of the host are not scanned for a free port."""
+        with (
+            patch(
+                "operate.services.deployment_runner._port_in_use", return_value=False
+            ),
+            patch(
+                "operate.services.deployment_runner.psutil.net_connections"
+            ) as mock_scan,
+            patch("operate.services.deployment_runner.kill_process") as mock_kill,
+        ):
+            kill_processes_on_port(8716, logger=MagicMock())
+        mock_scan.assert_not_called()
+        mock_kill.assert_not_called()
+
+    def test_kills_tracked_listener_without_scan(self) -> None:
+        """The tracked process holding the port is killed without a scan."""
+        owners = PortOwners()
+        logger = MagicMock()
+        with (
+            patch("operate.services.deployment_runner.port_owners", owners),
+            patch.object(owners, "listening_pid", return_value=4321),
+            patch(
+                "operate.services.deployment_runner._port_in_use",
+                side_effect=[True, False, False],
+            ),
+            patch(
+                "operate.services.deployment_runner.psutil.net_connections"
+            ) as mock_scan,
+            patch("operate.services.deployment_runner.kill_process") as mock_kill,
+        ):
+            kill_processes_on_port(8716, logger=logger)
+        mock_kill.assert_called_once_with(4321)
+        mock_scan.assert_not_called()
+        assert "4321" in logger.warning.call_args.args[0]
+
+
+class TestPortOwners:
+    """Tests for PortOwners."""
+
+    @pytest.fixture
+    def listener(self) -> Any:
+        """A child process listening on a local port."""
+        process = subprocess.Popen(  # nosec B603
+            [
+                sys.executable,
+                "-c",
+                "import socket, sys, time\n"
+                "s = socket.socket()\n"
+                "s.bind(('127.0.0.1', 0))\n"
+                "s.listen()\n"
+                "print(s.getsockname()[1], flush=True)\n"
+                "time.sleep(60)\n",
+            ],
+            stdout=subprocess.PIPE,
+        )
+        assert process.stdout is not None
+        port = int(process.stdout.readline())
+        yield process, port
+        process.kill()
+        process.wait()
+
+    def test_listening_pid(self, listener: Any) -> None:
+        """The tracked process is found while it listens on its port."""
+        process, port = listener
+        owners = PortOwners()
+        assert owners.listening_pid(port) is None
+
+        owners.track(port, process.pid)
+        assert owners.listening_pid(port) == process.pid
+        assert owners.listening_pid(port + 1) is None
+        # tracked, but listening on another port
+        owners.track(port + 1, process.pid)
+        assert owners.listening_pid(port + 1) is None
+        owners.untrack(port + 1)
+
+        process.kill()
+        process.wait()
+        assert owners.listening_pid(port) is None
+        assert not owners._owners  # pylint: disable=protected-access
+
+    def test_reused_pid_is_not_reported(self) -> None:
+        """A process reusing a tracked PID is not mistaken for its owner."""
+        owners = PortOwners()
+        owners._owners[8716] = (os.getpid(), 0.0)  # pylint: disable=protected-access
+        assert owners.listening_pid(8716) is None
+        assert not owners._owners  # pylint: disable=protected-access
+
+    def test_track_exited_process(self) -> None:
+        """A process that already exited is not tracked."""
+        owners = PortOwners()
+        with patch(
+            "operate.services.deployment_runner.psutil.Process",
+            side_effect=psutil.NoSuchProcess(42),
+        ):
+            owners.track(8716, 42)
+        assert owners.listening_pid(8716) is None
+
+
+class TestPortInUse:
+    """Tests for _port_in_use."""
+
+    def test_listening_port(self) -> None:
+        """A port is in use while a socket listens on it, and free after."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            port = server.getsockname()[1]
+            assert _port_in_use(port)
+        assert not _port_in_use(port)
+
+    def test_probe_error_is_not_in_use(self) -> None:
+        """A port that cannot be probed is reported free."""
+        with patch("operate.services.deployment_runner.socket.socket") as mock_socket:
+            probe = mock_socket.return_value.__enter__.return_value
+            probe.connect_ex.side_effect = OSError("network unreachable")
+            assert not _port_in_use(8716)
+        probe.settimeout.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # stop tests
@@ -773,6 +952,151 @@ class TestStop:
         mock_tm.assert_not_called()
 
 
+class TestRestart:
+    """Tests for the process-level restart."""
+
+    def test_restart_requires_existing_setup(self, tmp_path: Path) -> None:
+        """restart() refuses to run without an agent set up."""
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
+        with (
+            patch.object(runner, "stop") as mock_stop,
+            pytest.raises(RuntimeError, match="is not set up"),
+        ):
+            runner.restart(password="testpass")  # nosec B106
+        mock_stop.assert_not_called()
+
+    @pytest.mark.parametrize("is_aea", [True, False])
+    def test_restart_reuses_setup(self, tmp_path: Path, is_aea: bool) -> None:
+        """restart() stops and starts the processes without setting up again."""
+        (tmp_path / "agent").mkdir()
+        (tmp_path / "agent.json").write_text("{}", encoding="utf-8")
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=is_aea)
+        calls = MagicMock()
+        with (
+            patch.object(runner, "stop", calls.stop),
+            patch.object(runner, "_free_deployment_ports", calls.free),
+            patch.object(runner, "_setup_agent", calls.setup),
+            patch(
+                "operate.services.deployment_runner.reset_tendermint_state",
+                calls.reset,
+            ),
+            patch.object(runner, "_start_tendermint", calls.tendermint),
+            patch.object(runner, "_start_agent", calls.agent),
+        ):
+            runner.restart(password="testpass")  # nosec B106
+        expected = (
+            ["stop", "free"] + (["reset", "tendermint"] if is_aea else []) + ["agent"]
+        )
+        assert [c[0] for c in calls.mock_calls] == expected
+        if is_aea:
+            calls.reset.assert_called_once_with(tmp_path)
+
+    def test_restart_does_not_reuse_tendermint_state(self, tmp_path: Path) -> None:
+        """Tendermint is restarted without the blocks of the previous run."""
+        (tmp_path / "agent").mkdir()
+        (tmp_path / "agent.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "node" / "data" / "blockstore.db").mkdir(parents=True)
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
+        with (
+            patch.object(runner, "stop"),
+            patch.object(runner, "_free_deployment_ports"),
+            patch.object(runner, "_start_tendermint"),
+            patch.object(runner, "_start_agent"),
+        ):
+            runner.restart(password="testpass")  # nosec B106
+        assert not (tmp_path / "node" / "data" / "blockstore.db").exists()
+
+
+class TestResetTendermintState:
+    """Tests for reset_tendermint_state."""
+
+    @pytest.mark.parametrize("home", ["node", "nodes/node0"])
+    def test_chain_data_is_dropped_and_keys_kept(
+        self, tmp_path: Path, home: str
+    ) -> None:
+        """Host and docker node homes start over from height 0 with their keys."""
+        config, data = tmp_path / home / "config", tmp_path / home / "data"
+        config.mkdir(parents=True)
+        (data / "blockstore.db").mkdir(parents=True)
+        (data / "priv_validator_state.json").write_text(
+            json.dumps({"height": "42", "round": 0, "step": 3}), encoding="utf-8"
+        )
+        (config / "priv_validator_key.json").write_text("key", encoding="utf-8")
+        (config / "addrbook.json").write_text("{}", encoding="utf-8")
+
+        reset_tendermint_state(tmp_path)
+
+        assert [p.name for p in data.iterdir()] == ["priv_validator_state.json"]
+        assert json.loads((data / "priv_validator_state.json").read_text()) == {
+            "height": "0",
+            "round": 0,
+            "step": 0,
+        }
+        assert (config / "priv_validator_key.json").read_text() == "key"
+        assert not (config / "addrbook.json").exists()
+
+    def test_builds_without_tendermint_are_left_alone(self, tmp_path: Path) -> None:
+        """Nothing is created for builds that have no tendermint node."""
+        (tmp_path / "agent").mkdir()
+        reset_tendermint_state(tmp_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["agent"]
+
+
+class TestPrepareAndRelocate:
+    """Tests for setting up a deployment ahead of a swap."""
+
+    def test_prepare_sets_up_without_starting(self, tmp_path: Path) -> None:
+        """prepare() sets up the agent and releases the aea worker."""
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
+        with (
+            patch.object(runner, "_setup_agent") as mock_setup,
+            patch.object(runner, "_aea_worker") as mock_worker,
+            patch.object(runner, "_start_agent") as mock_start,
+        ):
+            runner.prepare(password="testpass")  # nosec B106
+        mock_setup.assert_called_once_with(password="testpass")  # nosec B106
+        mock_worker.close.assert_called_once()
+        mock_start.assert_not_called()
+
+    def test_relocate_rewrites_paths(self, tmp_path: Path) -> None:
+        """relocate() points the agent and tendermint configs to the new location."""
+        previous, work_dir = tmp_path / "staging", tmp_path / "deployment"
+        work_dir.mkdir()
+        (work_dir / "agent.json").write_text(
+            json.dumps({"STORE": str(previous / "store"), "PORT": 8716}),
+            encoding="utf-8",
+        )
+        (work_dir / "tendermint.json").write_text(
+            json.dumps({"TMHOME": str(previous / "node")}), encoding="utf-8"
+        )
+        ConcreteDeploymentRunner(work_dir, is_aea=False).relocate(previous)
+
+        assert json.loads((work_dir / "agent.json").read_text()) == {
+            "STORE": str(work_dir / "store"),
+            "PORT": 8716,
+        }
+        assert json.loads((work_dir / "tendermint.json").read_text()) == {
+            "TMHOME": str(work_dir / "node")
+        }
+
+    def test_host_python_relocates_venv(self, tmp_path: Path) -> None:
+        """The venv of a host python deployment is relocated too."""
+        runner = HostPythonHostDeploymentRunner(tmp_path, is_aea=True)
+        with patch(
+            "operate.services.deployment_runner.VenvTemplateCache"
+        ) as mock_cache:
+            runner.relocate(tmp_path.parent / "staging")
+            mock_cache.relocate.assert_not_called()
+
+            (tmp_path / "venv").mkdir()
+            runner.relocate(tmp_path.parent / "staging")
+        mock_cache.relocate.assert_called_once_with(
+            venv=tmp_path / "venv",
+            old_prefix=tmp_path.parent / "staging",
+            new_prefix=tmp_path,
+        )
+
+
 # ---------------------------------------------------------------------------
 # _close_agent_log_file / _close_tm_log_file tests
 # ---------------------------------------------------------------------------
@@ -1011,6 +1335,28 @@ class TestStopTendermint:
             runner._stop_tendermint()
         mock_get.assert_called_once()
 
+    def test_waits_for_tendermint_exit_before_killing(self, tmp_path: Path) -> None:
+        """After the exit request, the recorded process gets time to exit by itself."""
+        (tmp_path / "tendermint.pid").write_text("55555", encoding="utf-8")
+        runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
+        mock_proc = MagicMock()
+        with (
+            patch("operate.services.deployment_runner.requests.get"),
+            patch(
+                "operate.services.deployment_runner.psutil.Process",
+                return_value=mock_proc,
+            ) as mock_process_cls,
+            patch(
+                "operate.services.deployment_runner.psutil.wait_procs",
+                return_value=([mock_proc], []),
+            ) as mock_wait,
+            patch.object(runner, "_terminate_recorded_process") as mock_terminate,
+        ):
+            runner._stop_tendermint()
+        mock_process_cls.assert_called_once_with(55555)
+        mock_wait.assert_called_once_with([mock_proc], timeout=runner.TM_EXIT_TIMEOUT)
+        mock_terminate.assert_called_once()
+
     def test_connection_error_logged(self, tmp_path: Path) -> None:
         """_stop_tendermint logs debug when ConnectionError raised (already stopped)."""
         runner = ConcreteDeploymentRunner(tmp_path, is_aea=True)
@@ -1223,10 +1569,12 @@ class TestPyInstallerStartAgent:
         with (
             patch.object(runner, "_start_agent_process", return_value=mock_process),
             patch("operate.services.deployment_runner.write_pid_file") as mock_write,
+            patch("operate.services.deployment_runner.port_owners") as mock_owners,
         ):
             runner._start_agent(password="pw")  # nosec B106
 
         mock_write.assert_called_once()
+        mock_owners.track.assert_called_once_with(constants.AGENT_HTTP_PORT, 42)
 
     def test_start_agent_propagates_runtime_ca_bundle(self, tmp_path: Path) -> None:
         """_start_agent passes the resolved CA bundle to spawned agent processes."""
@@ -1393,10 +1741,12 @@ class TestPyInstallerStartTendermint:
                 runner, "_start_tendermint_process", return_value=mock_process
             ),
             patch("operate.services.deployment_runner.write_pid_file") as mock_write,
+            patch("operate.services.deployment_runner.port_owners") as mock_owners,
         ):
             runner._start_tendermint()
 
         mock_write.assert_called_once()
+        mock_owners.track.assert_called_once_with(constants.TENDERMINT_COM_PORT, 99)
 
     def test_start_tendermint_kills_process_on_pid_file_error(
         self, tmp_path: Path
@@ -1808,27 +2158,51 @@ class TestHostPythonSetupVenv:
     def test_setup_venv_returns_early_when_not_is_aea(self, tmp_path: Path) -> None:
         """_setup_venv returns early when is_aea=False."""
         runner = HostPythonHostDeploymentRunner(tmp_path, is_aea=False)
-        with (
-            patch("operate.services.deployment_runner.venv_cli") as mock_venv,
-            patch.object(runner, "_run_cmd") as mock_cmd,
-        ):
+        with patch(
+            "operate.services.deployment_runner.VenvTemplateCache"
+        ) as mock_cache:
             runner._setup_venv()
-        mock_venv.assert_not_called()
-        mock_cmd.assert_not_called()
+        mock_cache.assert_not_called()
 
-    def test_setup_venv_calls_venv_cli_and_run_cmd_when_is_aea(
-        self, tmp_path: Path
+    def test_setup_venv_clones_template_when_is_aea(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """_setup_venv calls venv_cli and _run_cmd when is_aea=True."""
+        """_setup_venv clones the template with the requirements into the venv dir."""
+        monkeypatch.delenv("OPERATE_WHEELHOUSE", raising=False)
+        work_dir = tmp_path / "services" / "sc-1" / "deployment"
+        runner = HostPythonHostDeploymentRunner(work_dir, is_aea=True)
+        with patch(
+            "operate.services.deployment_runner.VenvTemplateCache"
+        ) as mock_cache:
+            runner._setup_venv()
+
+        assert mock_cache.call_args.kwargs["path"] == tmp_path / "venv_templates"
+        cache = mock_cache.return_value
+        cache.get_or_create.assert_called_once_with(
+            requirements=VENV_REQUIREMENTS, wheelhouse=None
+        )
+        cache.clone.assert_called_once_with(
+            template=cache.get_or_create.return_value, target=work_dir / "venv"
+        )
+
+        with patch.object(runner, "_run_cmd") as mock_cmd:
+            mock_cache.call_args.kwargs["run_cmd"](["pip", "install"])
+        mock_cmd.assert_called_once_with(args=["pip", "install"])
+
+    def test_setup_venv_uses_wheelhouse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The template is installed from the configured wheelhouse."""
+        monkeypatch.setenv("OPERATE_WHEELHOUSE", str(tmp_path / "wheels"))
         runner = HostPythonHostDeploymentRunner(tmp_path, is_aea=True)
-        with (
-            patch("operate.services.deployment_runner.venv_cli") as mock_venv,
-            patch.object(runner, "_run_cmd") as mock_cmd,
-        ):
+        with patch(
+            "operate.services.deployment_runner.VenvTemplateCache"
+        ) as mock_cache:
             runner._setup_venv()
 
-        mock_venv.assert_called_once()
-        mock_cmd.assert_called_once()
+        mock_cache.return_value.get_or_create.assert_called_once_with(
+            requirements=VENV_REQUIREMENTS, wheelhouse=tmp_path / "wheels"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -1872,6 +2246,29 @@ class TestHostPythonSetupAgent:
             runner._setup_agent(password="pw")  # nosec B106
 
         mock_cmd.assert_called_once()
+        assert mock_cmd.call_args.kwargs["env"] is None
+
+    def test_setup_agent_installs_from_wheelhouse(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Agent dependencies are installed from the configured wheelhouse."""
+        monkeypatch.setenv("OPERATE_WHEELHOUSE", str(tmp_path / "wheels"))
+        runner = HostPythonHostDeploymentRunner(tmp_path, is_aea=True)
+        with (
+            patch(
+                "operate.services.deployment_runner.multiprocessing.set_start_method"
+            ),
+            patch.object(runner, "_setup_venv"),
+            patch(
+                "operate.services.deployment_runner.BaseDeploymentRunner._setup_agent"
+            ),
+            patch.object(runner, "_run_cmd") as mock_cmd,
+        ):
+            runner._setup_agent(password="pw")  # nosec B106
+
+        env = mock_cmd.call_args.kwargs["env"]
+        assert env["PIP_NO_INDEX"] == "1"
+        assert env["PIP_FIND_LINKS"] == str(tmp_path / "wheels")
 
 
 class TestSetupAgentRuntimeErrorHandling:
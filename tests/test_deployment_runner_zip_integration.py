@@ -75,6 +75,7 @@ def test_setup_agent_uses_zip(tmp_path: Path) -> None:
         patch.object(AgentAssetManager, "extract_agent_zip") as mock_extract,
         patch.object(runner, "_run_aea_command") as mock_aea_cmd,
         patch.object(runner, "_prepare_agent_env") as mock_prepare_env,
+        patch.object(runner, "_get_operate_dir", return_value=tmp_path),
     ):
 
         # Setup mocks
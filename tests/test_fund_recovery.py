@@ -19,16 +19,21 @@
 
 """Unit tests for /api/fund_recovery/scan and /api/fund_recovery/execute endpoints."""
 
+import json
+import typing as t
 from http import HTTPStatus
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
 from operate.constants import ZERO_ADDRESS
+from operate.ledger.address_activity import ActivityDiscoveryError
 from operate.operate_types import (
     ChainAmounts,
+    FundRecoveryChainScanResult,
     FundRecoveryExecuteResponse,
     FundRecoveryScanResponse,
+    GasWarningEntry,
 )
 
 # A syntactically valid BIP-39 test mnemonic (never commit a real mnemonic)
@@ -110,6 +115,37 @@ class TestFundRecoveryScanValidation:
         assert resp.status_code == HTTPStatus.BAD_REQUEST
         assert resp.json()["error"] == "Invalid request body."
 
+    def test_failed_activity_probe_is_reported(
+        self, client_no_account: TestClient
+    ) -> None:
+        """Chains whose owner activity could not be discovered are listed as errors."""
+        module = "operate.services.fund_recovery_manager"
+        with (
+            patch(f"{module}.get_default_ledger_api"),
+            patch(f"{module}.get_asset_balance", return_value=0),
+            patch(f"{module}._get_service_registry_contract"),
+            patch(
+                f"{module}._fetch_services_from_subgraph",
+                side_effect=RuntimeError("subgraph down"),
+            ),
+            patch(
+                f"{module}.ADDRESS_ACTIVITY_DISCOVERY.discover",
+                side_effect=ActivityDiscoveryError("Historical query failed"),
+            ),
+            patch(
+                f"{module}._check_gas_warning",
+                return_value=GasWarningEntry(insufficient=False),
+            ),
+        ):
+            resp = client_no_account.post(
+                "/api/fund_recovery/scan", json={"mnemonic": _VALID_MNEMONIC}
+            )
+        assert resp.status_code == HTTPStatus.OK
+        body = resp.json()
+        assert body["services"] == []
+        assert body["errors"]
+        assert set(body["errors"].values()) == {"Historical query failed"}
+
     def test_manager_exception_returns_500(self, client_no_account: TestClient) -> None:
         """When FundRecoveryManager.scan() raises, the endpoint returns 500."""
         with patch(
@@ -126,6 +162,86 @@ class TestFundRecoveryScanValidation:
         assert "error" in resp.json()
 
 
+class TestFundRecoveryScanStream:
+    """Tests for POST /api/fund_recovery/scan/stream."""
+
+    def test_invalid_mnemonic_returns_bad_request(
+        self, client_no_account: TestClient
+    ) -> None:
+        """Request validation is shared with the non-streaming endpoint."""
+        resp = client_no_account.post(
+            "/api/fund_recovery/scan/stream",
+            json={"mnemonic": "not a valid mnemonic phrase at all zzz"},
+        )
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.json()["error"] == "Invalid mnemonic"
+
+    def test_streams_chain_events_then_summary(
+        self, client_no_account: TestClient
+    ) -> None:
+        """Each chain result is a NDJSON line, followed by the summary."""
+        balances = {"100": {_VALID_DESTINATION: {ZERO_ADDRESS: 5}}}
+        events = [
+            FundRecoveryChainScanResult(
+                chain_id="100",
+                balances=ChainAmounts.from_json(balances),
+                services=[],
+                gas_warning=GasWarningEntry(insufficient=False),
+            ),
+            FundRecoveryChainScanResult(
+                chain_id="8453",
+                balances=ChainAmounts(),
+                services=[],
+                gas_warning=GasWarningEntry(insufficient=True),
+                error="timeout",
+            ),
+            FundRecoveryScanResponse(
+                master_eoa_address=_VALID_DESTINATION,
+                balances=ChainAmounts.from_json(balances),
+                services=[],
+                gas_warning={"100": GasWarningEntry(insufficient=False)},
+            ),
+        ]
+        with patch(
+            "operate.services.fund_recovery_manager.FundRecoveryManager.scan_stream",
+            return_value=iter(events),
+        ) as mock_stream:
+            resp = client_no_account.post(
+                "/api/fund_recovery/scan/stream",
+                json={"mnemonic": _VALID_MNEMONIC},
+            )
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        assert mock_stream.call_args.args == (_VALID_MNEMONIC,)
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["event"] for line in lines] == ["chain", "chain", "summary"]
+        assert lines[0]["balances"]["100"][_VALID_DESTINATION][ZERO_ADDRESS] == "5"
+        assert lines[1]["error"] == "timeout"
+        assert lines[2]["master_eoa_address"] == _VALID_DESTINATION
+
+    def test_failure_mid_stream_emits_error_event(
+        self, client_no_account: TestClient
+    ) -> None:
+        """An exception while scanning ends the stream with an error line."""
+
+        def _stream(*args: t.Any, **kwargs: t.Any) -> t.Iterator[t.Any]:
+            raise RuntimeError("scan boom")
+            yield  # pylint: disable=unreachable
+
+        with patch(
+            "operate.services.fund_recovery_manager.FundRecoveryManager.scan_stream",
+            side_effect=_stream,
+        ):
+            resp = client_no_account.post(
+                "/api/fund_recovery/scan/stream",
+                json={"mnemonic": _VALID_MNEMONIC},
+            )
+        assert resp.status_code == HTTPStatus.OK
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [line["event"] for line in lines] == ["error"]
+        assert "scan boom" not in resp.text
+
+
 # ---------------------------------------------------------------------------
 # /api/fund_recovery/execute
 # ---------------------------------------------------------------------------
@@ -19,14 +19,19 @@
 
 """Unit tests for operate/services/fund_recovery_manager.py – no blockchain required."""
 
+import concurrent.futures
+import threading
 import typing as t
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from operate.constants import ZERO_ADDRESS
+from operate.ledger.address_activity import ActivityDiscoveryError
 from operate.operate_types import (
+    FundRecoveryChainScanResult,
     FundRecoveryExecuteResponse,
     FundRecoveryScanResponse,
     GasWarningEntry,
@@ -222,7 +227,7 @@ class TestEnumerateOwnedServices:
         """Returns IDs where ownerOf matches the given owner."""
         mock_ledger = MagicMock()
         mock_ledger.api.eth.block_number = 100
-        mock_ledger.api.eth.get_transaction_count.return_value = 0
+        mock_ledger.api.eth.get_transaction_count.return_value = 1
         mock_ledger.api.eth.call.return_value = b""
         mock_ledger.api.eth.get_code.return_value = b""
         mock_ledger.api.eth.get_logs.return_value = [self._make_log(7)]
@@ -244,7 +249,7 @@ class TestEnumerateOwnedServices:
         """Skips IDs where ownerOf returns a different address."""
         mock_ledger = MagicMock()
         mock_ledger.api.eth.block_number = 100
-        mock_ledger.api.eth.get_transaction_count.return_value = 0
+        mock_ledger.api.eth.get_transaction_count.return_value = 1
         mock_ledger.api.eth.call.return_value = b""
         mock_ledger.api.eth.get_code.return_value = b""
         mock_ledger.api.eth.get_logs.return_value = [self._make_log(5)]
@@ -291,7 +296,7 @@ class TestEnumerateOwnedServices:
         """Silently skips a token when ownerOf raises."""
         mock_ledger = MagicMock()
         mock_ledger.api.eth.block_number = 100
-        mock_ledger.api.eth.get_transaction_count.return_value = 0
+        mock_ledger.api.eth.get_transaction_count.return_value = 1
         mock_ledger.api.eth.call.return_value = b""
         mock_ledger.api.eth.get_code.return_value = b""
         mock_ledger.api.eth.get_logs.return_value = [self._make_log(3)]
@@ -309,12 +314,79 @@ class TestEnumerateOwnedServices:
             )
         assert result == []
 
+    def test_owners_are_batched_through_multicall(self) -> None:
+        """The ownerOf calls go through Multicall3; reverted calls are skipped."""
+        mock_ledger = MagicMock()
+        mock_ledger.api.eth.block_number = 100
+        mock_ledger.api.eth.get_transaction_count.return_value = 1
+        mock_ledger.api.eth.call.return_value = b""
+        mock_ledger.api.eth.get_code.return_value = b""
+        mock_ledger.api.eth.get_logs.return_value = [
+            self._make_log(i) for i in (9, 4, 2)
+        ]
+        owner_word = bytes(12) + bytes.fromhex(_TEST_EOA_ADDRESS[2:])
+        other_word = bytes(12) + b"\x99" * 20
+        contract_mock = MagicMock()
+
+        with (
+            patch(
+                "operate.services.fund_recovery_manager._get_service_registry_contract",
+                return_value=contract_mock,
+            ),
+            patch(
+                "operate.services.fund_recovery_manager.try_aggregate",
+                return_value=[owner_word, None, other_word],
+            ) as mock_aggregate,
+        ):
+            result = _enumerate_owned_services(
+                mock_ledger, _SERVICE_REGISTRY, _TEST_EOA_ADDRESS
+            )
+        assert result == [2]
+        calls = mock_aggregate.call_args.args[1]
+        assert [int.from_bytes(data[4:], "big") for _, data in calls] == [2, 4, 9]
+        assert calls[0][1][:4] == bytes.fromhex("6352211e")
+        contract_mock.functions.ownerOf.assert_not_called()
+
+    def test_owner_without_activity_is_not_scanned(self) -> None:
+        """An owner that never sent a transaction owns no services; no logs are fetched."""
+        mock_ledger = MagicMock()
+        mock_ledger.api.eth.block_number = 100
+        mock_ledger.api.eth.get_transaction_count.return_value = 0
+        mock_ledger.api.eth.get_code.return_value = b""
+
+        with patch(
+            "operate.services.fund_recovery_manager._get_service_registry_contract",
+            return_value=MagicMock(),
+        ):
+            result = _enumerate_owned_services(
+                mock_ledger, _SERVICE_REGISTRY, _TEST_EOA_ADDRESS
+            )
+        assert result == []
+        mock_ledger.api.eth.get_logs.assert_not_called()
+
+    def test_discovery_rpc_failure_is_not_treated_as_empty_range(self) -> None:
+        """Historical query failures abort enumeration instead of skewing the range."""
+        mock_ledger = MagicMock()
+        mock_ledger.api.eth.block_number = 100
+        mock_ledger.api.eth.get_code.side_effect = Exception("missing trie node")
+
+        with (
+            patch(
+                "operate.services.fund_recovery_manager._get_service_registry_contract",
+                return_value=MagicMock(),
+            ),
+            patch("operate.ledger.address_activity.PROBE_RETRY_DELAY", 0),
+            pytest.raises(ActivityDiscoveryError, match="missing trie node"),
+        ):
+            _enumerate_owned_services(mock_ledger, _SERVICE_REGISTRY, _TEST_EOA_ADDRESS)
+        mock_ledger.api.eth.get_logs.assert_not_called()
+
     def test_log_chunk_failure_is_swallowed(self) -> None:
         """A failed log chunk is swallowed; remaining chunks still processed."""
         mock_ledger = MagicMock()
         # block_number > chunk to force multiple iterations
         mock_ledger.api.eth.block_number = 15_000
-        mock_ledger.api.eth.get_transaction_count.return_value = 0
+        mock_ledger.api.eth.get_transaction_count.return_value = 1
         mock_ledger.api.eth.call.return_value = b""
         mock_ledger.api.eth.get_code.return_value = b""
         call_count = 0
@@ -862,6 +934,42 @@ class TestFundRecoveryManagerScan:
         service_ids = [s.service_id for s in result.services]
         assert 42 in service_ids
 
+    def test_scan_reports_failed_service_discovery(self) -> None:
+        """Chains whose services could not be discovered are reported as errors."""
+        manager = _make_manager()
+
+        with (
+            patch(f"{_MODULE}.get_default_ledger_api"),
+            patch(f"{_MODULE}.get_asset_balance", return_value=0),
+            patch(
+                f"{_MODULE}._get_master_safes_from_contracts", return_value=[_SAFE_ADDR]
+            ),
+            patch(
+                f"{_MODULE}._fetch_services_from_subgraph",
+                side_effect=Exception("network"),
+            ),
+            patch(
+                f"{_MODULE}._enumerate_owned_services",
+                side_effect=ActivityDiscoveryError("Historical query failed"),
+            ),
+            patch(
+                f"{_MODULE}._check_gas_warning",
+                return_value=GasWarningEntry(insufficient=False),
+            ),
+        ):
+            *chain_results, result = manager.scan_stream(_TEST_MNEMONIC)
+
+        assert result.services == []
+        assert result.errors
+        assert set(result.errors.values()) == {"Historical query failed"}
+        assert {
+            c.chain_id: c.error  # type: ignore[union-attr]
+            for c in chain_results
+            if c.chain_id in result.errors  # type: ignore[union-attr]
+        } == result.errors
+        # the rest of the chain is still scanned
+        assert set(result.gas_warning) == {str(chain.id) for chain in RECOVERY_CHAINS}
+
     def test_scan_deduplicates_service_ids_across_safes(self) -> None:
         """Same service_id seen from two safes is only reported once."""
         manager = _make_manager()
@@ -1443,6 +1551,115 @@ class TestFundRecoveryManagerScan:
         assert 88 in service_ids
 
 
+class TestFundRecoveryManagerScanStream:
+    """Tests for FundRecoveryManager.scan_stream."""
+
+    @staticmethod
+    def _patches(
+        ledger_api: t.Callable[[t.Any], t.Any] = lambda chain: MagicMock(),
+    ) -> t.List[t.Any]:
+        """Patches for a scan without services."""
+        return [
+            patch(f"{_MODULE}.get_default_ledger_api", side_effect=ledger_api),
+            patch(
+                f"{_MODULE}.get_asset_balance",
+                side_effect=lambda *, asset_address, **kw: (
+                    7 if asset_address == ZERO_ADDRESS else 0
+                ),
+            ),
+            patch(f"{_MODULE}._get_master_safes_from_contracts", return_value=[]),
+            patch(
+                f"{_MODULE}._check_gas_warning",
+                return_value=GasWarningEntry(insufficient=False),
+            ),
+        ]
+
+    def test_yields_each_chain_then_summary(self) -> None:
+        """One event per chain is yielded before the summary."""
+        with ExitStack() as stack:
+            for p in self._patches():
+                stack.enter_context(p)
+            events = list(_make_manager().scan_stream(_TEST_MNEMONIC))
+
+        *chain_events, summary = events
+        assert isinstance(summary, FundRecoveryScanResponse)
+        assert all(isinstance(e, FundRecoveryChainScanResult) for e in chain_events)
+        chain_results = t.cast(t.List[FundRecoveryChainScanResult], chain_events)
+        assert sorted(e.chain_id for e in chain_results) == sorted(
+            str(chain.id) for chain in RECOVERY_CHAINS
+        )
+        for event in chain_results:
+            assert event.error is None
+            assert list(event.balances) == [event.chain_id]
+            assert summary.balances[event.chain_id] == event.balances[event.chain_id]
+            assert summary.gas_warning[event.chain_id] == event.gas_warning
+        dumped = chain_results[0].model_dump()
+        assert dumped["balances"][chain_results[0].chain_id][
+            summary.master_eoa_address
+        ] == {ZERO_ADDRESS: "7"}
+
+    def test_slow_chain_times_out(self) -> None:
+        """A chain that does not finish in time is reported and left out."""
+        release = threading.Event()
+        slow = RECOVERY_CHAINS[0]
+
+        def _ledger_api(chain: t.Any) -> MagicMock:
+            if chain == slow:
+                release.wait(10)
+            return MagicMock()
+
+        try:
+            with ExitStack() as stack:
+                for p in self._patches(_ledger_api):
+                    stack.enter_context(p)
+                *chain_events, summary = _make_manager().scan_stream(
+                    _TEST_MNEMONIC, timeout=0.5
+                )
+        finally:
+            release.set()
+
+        timed_out = [
+            e
+            for e in t.cast(t.List[FundRecoveryChainScanResult], chain_events)
+            if e.error == "timeout"
+        ]
+        assert [e.chain_id for e in timed_out] == [str(slow.id)]
+        assert len(chain_events) == len(RECOVERY_CHAINS)
+        summary = t.cast(FundRecoveryScanResponse, summary)
+        assert str(slow.id) not in summary.balances
+        assert len(summary.balances) == len(RECOVERY_CHAINS) - 1
+
+    def test_chains_done_at_timeout_are_reported(self) -> None:
+        """Chains that complete while the timeout fires are still yielded."""
+
+        def _as_completed(fs: t.Any, timeout: t.Optional[float] = None) -> t.Any:
+            concurrent.futures.wait(fs)
+            raise concurrent.futures.TimeoutError()
+            yield  # pylint: disable=unreachable
+
+        with ExitStack() as stack:
+            for p in self._patches():
+                stack.enter_context(p)
+            stack.enter_context(
+                patch(
+                    f"{_MODULE}.concurrent.futures.as_completed",
+                    side_effect=_as_completed,
+                )
+            )
+            *chain_events, summary = _make_manager().scan_stream(
+                _TEST_MNEMONIC, timeout=1
+            )
+
+        assert len(chain_events) == len(RECOVERY_CHAINS)
+        assert all(
+            e.error is None
+            for e in t.cast(t.List[FundRecoveryChainScanResult], chain_events)
+        )
+        assert len(t.cast(FundRecoveryScanResponse, summary).balances) == len(
+            RECOVERY_CHAINS
+        )
+
+
 # ---------------------------------------------------------------------------
 # FundRecoveryManager.execute
 # ---------------------------------------------------------------------------
@@ -1730,89 +1947,6 @@ class TestScanSafeErc20Balance:
         ), f"Safe ERC-20 balance not recorded; balances={result.balances}"
 
 
-class TestGetSafeDeployAndLastTxBlock:
-    """Test the _get_safe_deploy_and_last_tx_block function."""
-
-    def test_finds_deploy_block_and_last_tx_block(self) -> None:
-        """Test happy path finding deploy and last tx block."""
-        from unittest.mock import MagicMock
-
-        from operate.services.fund_recovery_manager import (
-            _get_safe_deploy_and_last_tx_block,
-        )
-
-        w3 = MagicMock()
-        w3.to_checksum_address.return_value = "0xSafe"
-
-        def mock_get_code(addr: str, block_identifier: int) -> bytes:
-            if block_identifier >= 5:
-                return b"123"
-            return b""
-
-        def mock_call(params: dict, block_identifier: int) -> bytes:
-            if block_identifier == 10:
-                return (42).to_bytes(32, "big")
-            if block_identifier >= 8:
-                return (42).to_bytes(32, "big")
-            return (40).to_bytes(32, "big")
-
-        w3.eth.get_code.side_effect = mock_get_code
-        w3.eth.call.side_effect = mock_call
-
-        deploy_block, last_tx = _get_safe_deploy_and_last_tx_block(w3, "0xSafe", 10)
-        assert deploy_block == 5
-        assert last_tx == 8
-
-    def test_handles_exceptions_gracefully(self) -> None:
-        """Test outer exceptions are handled gracefully."""
-        from unittest.mock import MagicMock
-
-        from operate.services.fund_recovery_manager import (
-            _get_safe_deploy_and_last_tx_block,
-        )
-
-        w3 = MagicMock()
-        w3.to_checksum_address.return_value = "0xSafe"
-        w3.eth.get_code.side_effect = Exception("get_code fail")
-        w3.eth.call.side_effect = Exception("call fail")
-
-        deploy_block, last_tx = _get_safe_deploy_and_last_tx_block(w3, "0xSafe", 10)
-        assert deploy_block == 10
-        assert last_tx == 10
-
-    def test_inner_search_exception(self) -> None:
-        """Test inner search loop exceptions are handled."""
-        from unittest.mock import MagicMock
-
-        from operate.services.fund_recovery_manager import (
-            _get_safe_deploy_and_last_tx_block,
-        )
-
-        w3 = MagicMock()
-        w3.to_checksum_address.return_value = "0xSafe"
-
-        def mock_get_code(addr: str, block_identifier: int) -> bytes:
-            if block_identifier >= 5:
-                return b"123"
-            return b""
-
-        def mock_call(params: dict, block_identifier: int) -> bytes:
-            if block_identifier == 10:
-                return (42).to_bytes(32, "big")
-            if block_identifier == 7:
-                raise ValueError("Inner search fail")
-            if block_identifier > 7:
-                return (42).to_bytes(32, "big")
-            return (40).to_bytes(32, "big")
-
-        w3.eth.get_code.side_effect = mock_get_code
-        w3.eth.call.side_effect = mock_call
-
-        deploy_block, last_tx = _get_safe_deploy_and_last_tx_block(w3, "0xSafe", 10)
-        assert deploy_block == 5
-        assert last_tx == 8
-
-
 class TestFetchLogsInChunks:
     """Test the _fetch_logs_in_chunks function."""
 
@@ -1835,6 +1969,21 @@ class TestFetchLogsInChunks:
         token_ids = _fetch_logs_in_chunks(w3, "0xRegistry", 0, 2, [None])
         assert token_ids == set()
 
+    def test_logs_without_token_id_are_ignored(self) -> None:
+        """Logs with fewer than four topics carry no token id."""
+        from operate.services.fund_recovery_manager import _fetch_logs_in_chunks
+
+        w3 = MagicMock()
+        w3.provider.endpoint_uri = None
+        w3.eth.get_logs.return_value = [
+            {"blockNumber": 1, "topics": [b"\x00" * 32] * 3},
+            {
+                "blockNumber": 2,
+                "topics": [b"\x00" * 32] * 3 + [(5).to_bytes(32, "big")],
+            },
+        ]
+        assert _fetch_logs_in_chunks(w3, _SERVICE_REGISTRY, 0, 2, [None]) == {5}
+
 
 class TestFetchServicesFromSubgraph:
     """Tests for _fetch_services_from_subgraph."""
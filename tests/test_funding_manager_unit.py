@@ -491,13 +491,21 @@ class TestFundService:
 
         amounts = ChainAmounts({"gnosis": {EOA_ADDR: {ZERO_ADDRESS: BigInt(100)}}})
 
-        with patch.object(
-            manager, "fund_chain_amounts", side_effect=RuntimeError("rpc down")
+        with (
+            patch.object(
+                manager, "fund_chain_amounts", side_effect=RuntimeError("rpc down")
+            ),
+            patch("operate.services.funding_manager.event_bus") as mock_bus,
         ):
             with pytest.raises(RuntimeError, match="rpc down"):
                 manager.fund_service(mock_service, amounts)
 
         assert manager._funding_in_progress.get(service_id) is False
+        # the in-progress flag is published on both edges
+        assert [c.args[1]["in_progress"] for c in mock_bus.publish.call_args_list] == [
+            True,
+            False,
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -13,6 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 import pytest
 
+from operate.services.deploy_timings import DeployTiming, DeployTimings
 from operate.services.health_checker import HealthChecker
 
 # aiohttp used via patch target "operate.services.health_checker.aiohttp.ClientSession"
@@ -52,11 +53,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             result = await health_checker.check_service_health(
                 service_config_id, tmp_path
@@ -94,11 +92,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             try:
                 result = await health_checker.check_service_health(
@@ -137,11 +132,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             with patch.object(health_checker.logger, "error") as mock_log:
                 await health_checker.check_service_health(service_config_id, tmp_path)
@@ -176,11 +168,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             result = await health_checker.check_service_health(
                 service_config_id, tmp_path
@@ -211,11 +200,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             result = await health_checker.check_service_health(
                 service_config_id, tmp_path
@@ -243,11 +229,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             result = await health_checker.check_service_health(
                 service_config_id, tmp_path
@@ -282,10 +265,7 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            mock_client_session.return_value = mock_session
 
             result = await health_checker.check_service_health(
                 service_config_id, tmp_path
@@ -313,11 +293,8 @@ class TestCheckServiceHealthErrorHandling:
         with patch(
             "operate.services.health_checker.aiohttp.ClientSession"
         ) as mock_client_session:
-            # Make ClientSession() context manager return our mock session
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_client_session.return_value = mock_ctx
+            # Make the shared ClientSession our mock session
+            mock_client_session.return_value = mock_session
 
             result = await health_checker.check_service_health(
                 service_config_id, tmp_path
@@ -330,3 +307,113 @@ class TestCheckServiceHealthErrorHandling:
         health_checker.logger.error.assert_called()  # type: ignore[attr-defined]
         call_str = str(health_checker.logger.error.call_args)  # type: ignore[attr-defined]
         assert "unexpected" in call_str.lower()
+
+
+class TestSharedSession:
+    """Test the shared session and probe latency histograms."""
+
+    @pytest.fixture
+    def health_checker(self) -> HealthChecker:
+        """Create a HealthChecker instance for testing."""
+        return HealthChecker(service_manager=MagicMock(), logger=MagicMock())
+
+    @staticmethod
+    def _session(healthy: bool = True) -> MagicMock:
+        """Create an open session mock answering every probe."""
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value={"is_healthy": healthy})
+        mock_get_ctx = MagicMock()
+        mock_get_ctx.__aenter__ = AsyncMock(return_value=mock_resp)
+        mock_get_ctx.__aexit__ = AsyncMock(return_value=None)
+        mock_session = MagicMock(closed=False)
+        mock_session.get = MagicMock(return_value=mock_get_ctx)
+        mock_session.close = AsyncMock()
+        return mock_session
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_and_closed(
+        self, health_checker: HealthChecker
+    ) -> None:
+        """All probes share one session, which is closed on shutdown."""
+        mock_session = self._session()
+        with (
+            patch(
+                "operate.services.health_checker.aiohttp.ClientSession",
+                return_value=mock_session,
+            ) as mock_client_session,
+            patch(
+                "operate.services.health_checker.aiohttp.TCPConnector"
+            ) as mock_connector,
+        ):
+            for _ in range(3):
+                assert await health_checker.check_service_health("svc") is True
+
+        mock_client_session.assert_called_once()
+        mock_connector.assert_called_once_with(
+            limit_per_host=HealthChecker.CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=HealthChecker.KEEPALIVE_TIMEOUT,
+        )
+        assert mock_session.get.call_count == 3
+
+        await health_checker.close()
+        mock_session.close.assert_awaited_once()
+        await health_checker.close()
+        mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_latency_histogram(self, health_checker: HealthChecker) -> None:
+        """Responses are bucketed per service; failed probes count as errors."""
+        mock_session = self._session()
+        with (
+            patch(
+                "operate.services.health_checker.aiohttp.ClientSession",
+                return_value=mock_session,
+            ),
+            patch("operate.services.health_checker.aiohttp.TCPConnector"),
+            patch(
+                "operate.services.health_checker.time.monotonic",
+                side_effect=[0.0, 0.02, 1.0, 1.3, 2.0],
+            ),
+        ):
+            await health_checker.check_service_health("svc")
+            await health_checker.check_service_health("svc")
+            mock_session.get.side_effect = aiohttp.ClientConnectionError("refused")
+            await health_checker.check_service_health("svc")
+
+        stats = health_checker.latency_stats("svc")
+        assert stats["count"] == 2
+        assert stats["errors"] == 1
+        assert stats["max_ms"] == pytest.approx(300)
+        assert stats["mean_ms"] == pytest.approx(160)
+        assert stats["buckets"]["le_10ms"] == 0
+        assert stats["buckets"]["le_25ms"] == 1
+        assert stats["buckets"]["le_250ms"] == 1
+        assert stats["buckets"]["le_500ms"] == 2
+        assert stats["buckets"]["le_inf"] == 2
+
+        empty = health_checker.latency_stats("other")
+        assert empty["count"] == 0
+        assert empty["mean_ms"] is None
+
+    @pytest.mark.asyncio
+    async def test_first_healthy_probe_is_timed(
+        self, health_checker: HealthChecker
+    ) -> None:
+        """Healthy probes mark the first healthy point of the last deploy."""
+        timings = DeployTimings()
+        with timings.track("svc"):
+            pass
+        for healthy, elapsed, first_healthy_after in (
+            (False, 1.0, None),
+            (True, 2.0, 2.0),
+            (True, 3.0, 2.0),
+        ):
+            health_checker._session = self._session(healthy=healthy)
+            with (
+                patch("operate.services.health_checker.deploy_timings", timings),
+                patch.object(DeployTiming, "elapsed", return_value=elapsed),
+            ):
+                await health_checker.check_service_health("svc")
+            [deploy] = timings.json("svc")["deploys"]
+            assert deploy["first_healthy_after"] == first_healthy_after
@@ -15,6 +15,7 @@ import aiohttp
 import pytest
 
 from operate.services.health_checker import HealthChecker
+from operate.utils.event_bus import SERVICE_HEALTH_EVENT
 
 # Save the REAL asyncio.sleep before any test patches it so nested-function
 # tests can still perform real timing waits inside a patch("asyncio.sleep") block.
@@ -301,7 +302,10 @@ class TestHealthCheckerJobManagement:
         async def always_healthy(*args: object, **kwargs: object) -> bool:
             return True
 
-        with patch.object(health_checker, "check_service_health", always_healthy):
+        with (
+            patch.object(health_checker, "check_service_health", always_healthy),
+            patch("operate.services.health_checker.event_bus") as mock_bus,
+        ):
             task = asyncio.create_task(
                 health_checker.healthcheck_job(service_config_id)
             )
@@ -314,6 +318,12 @@ class TestHealthCheckerJobManagement:
 
         # Job ran — at minimum the startup log should have been emitted
         health_checker.logger.info.assert_called()  # type: ignore[attr-defined]
+        # and the health state was published, keyed per service
+        mock_bus.publish.assert_called_with(
+            SERVICE_HEALTH_EVENT,
+            {"service_config_id": service_config_id, "healthy": True},
+            key=(SERVICE_HEALTH_EVENT, service_config_id),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -551,7 +561,7 @@ class TestHealthCheckerNestedAsyncFunctions:
             service_config_id="test-service"
         )
         health_checker._service_manager.deploy_service_locally.assert_called_with(
-            service_config_id="test-service"
+            service_config_id="test-service", force_rebuild=True
         )
 
     async def test_restart_failfast_calls_stop_and_reraises(
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the health checker probe history."""
+
+import json
+import typing as t
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from operate.constants import HEALTHCHECK_JSON
+from operate.services.health_checker import HealthChecker, HealthHistory
+
+
+def _make_session(payloads: t.List[t.Dict]) -> MagicMock:
+    """Create a session mock answering probes with successive payloads."""
+
+    def _get(url: str) -> MagicMock:
+        mock_resp = AsyncMock()
+        mock_resp.status = 200
+        mock_resp.json = AsyncMock(return_value=payloads.pop(0))
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=mock_resp)
+        ctx.__aexit__ = AsyncMock(return_value=None)
+        return ctx
+
+    session = MagicMock(closed=False)
+    session.get = MagicMock(side_effect=_get)
+    return session
+
+
+class TestHealthHistory:
+    """Tests for HealthHistory."""
+
+    def test_summary(self) -> None:
+        """Uptime, failure streaks and p95 latency are computed over the buffer."""
+        history = HealthHistory(size=25)
+        for healthy in [False] * 5 + [True] * 12 + [False] * 3:
+            history.record(healthy, 10.0)
+        for latency in range(1, 21):
+            history.record(True, float(latency))
+
+        summary = history.summary()
+        assert summary["count"] == 25
+        assert summary["uptime_pct"] == pytest.approx(100 * 22 / 25)
+        assert summary["current_failure_streak"] == 0
+        assert summary["longest_failure_streak"] == 3
+        assert summary["p95_latency_ms"] == 19.0
+        assert summary["since"] <= summary["last_check"]
+
+        history.record(False)
+        assert history.summary()["current_failure_streak"] == 1
+
+    def test_json_limit(self) -> None:
+        """The newest `limit` records are returned."""
+        history = HealthHistory()
+        assert history.json()["summary"]["uptime_pct"] is None
+        for healthy in (True, False, True):
+            history.record(healthy)
+        assert [r["healthy"] for r in history.json(limit=2)["records"]] == [
+            False,
+            True,
+        ]
+        assert history.json(limit=0)["records"] == []
+        assert len(history.json()["records"]) == 3
+
+    def test_persists_only_changes(self, tmp_path: Path) -> None:
+        """Unchanged payloads are not rewritten unless the file was removed."""
+        path = tmp_path / HEALTHCHECK_JSON
+        history = HealthHistory()
+        assert history.persist(path, {"is_healthy": True, "a": 1}) is True
+        assert history.persist(path, {"a": 1, "is_healthy": True}) is False
+        assert history.persist(path, {"is_healthy": False, "a": 1}) is True
+        assert json.loads(path.read_text()) == {"is_healthy": False, "a": 1}
+
+        path.unlink()
+        assert history.persisted(path) is False
+        assert history.persist(path, {"is_healthy": False, "a": 1}) is True
+
+
+class TestHealthCheckerHistory:
+    """Tests for the history kept by HealthChecker."""
+
+    @pytest.mark.asyncio
+    async def test_probes_are_recorded_and_served_from_memory(
+        self, tmp_path: Path
+    ) -> None:
+        """Every probe is recorded; the latest payload is served from memory."""
+        health_checker = HealthChecker(service_manager=MagicMock(), logger=MagicMock())
+        session = _make_session([{"is_healthy": True}] * 3 + [{"is_healthy": False}])
+        with (
+            patch(
+                "operate.services.health_checker.aiohttp.ClientSession",
+                return_value=session,
+            ),
+            patch("operate.services.health_checker.aiohttp.TCPConnector"),
+            patch.object(
+                Path, "write_text", autospec=True, side_effect=Path.write_text
+            ) as mock_write,
+        ):
+            for _ in range(4):
+                await health_checker.check_service_health("svc", tmp_path)
+            session.get.side_effect = RuntimeError("boom")
+            await health_checker.check_service_health("svc", tmp_path)
+
+        assert mock_write.call_count == 2
+        records = health_checker.history("svc").json()["records"]
+        assert [r["healthy"] for r in records] == [True, True, True, False, False]
+        assert records[0]["latency_ms"] is not None
+        assert records[-1]["latency_ms"] is None
+
+        service = MagicMock(service_config_id="svc", path=tmp_path)
+        assert health_checker.get_latest_healthcheck(service) == {"is_healthy": False}
+        service.get_latest_healthcheck.assert_not_called()
+
+        # Once the file is removed or replaced, it is the source of truth.
+        (tmp_path / HEALTHCHECK_JSON).unlink()
+        service.get_latest_healthcheck.return_value = {}
+        assert health_checker.get_latest_healthcheck(service) == {}
+
+        other = MagicMock(service_config_id="other", path=tmp_path)
+        other.get_latest_healthcheck.return_value = {"from": "file"}
+        assert health_checker.get_latest_healthcheck(other) == {"from": "file"}
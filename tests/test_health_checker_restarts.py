@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the health checker restart pipeline."""
+
+import asyncio
+import typing as t
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from operate.services.health_checker import HealthChecker, RestartPipeline
+
+
+def _make_pipeline() -> t.Tuple[RestartPipeline, MagicMock]:
+    """Create a pipeline over a mock service manager recording its calls."""
+    service_manager = MagicMock()
+    return RestartPipeline(service_manager, MagicMock()), service_manager
+
+
+def _called(service_manager: MagicMock) -> t.List[str]:
+    """Names of the service manager methods called, in order."""
+    return [c[0] for c in service_manager.mock_calls]
+
+
+@pytest.mark.asyncio
+class TestRestartPipeline:
+    """Tests for RestartPipeline."""
+
+    async def test_escalates_when_process_restart_does_not_recover(self) -> None:
+        """A process restart comes first; the next one without recovery rebuilds."""
+        pipeline, service_manager = _make_pipeline()
+        with patch(
+            "operate.services.health_checker.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            assert await pipeline.restart("svc") == RestartPipeline.PROCESS
+            assert _called(service_manager) == ["restart_service_locally"]
+
+            service_manager.reset_mock()
+            assert await pipeline.restart("svc") == RestartPipeline.REBUILD
+            assert _called(service_manager) == [
+                "stop_service_locally",
+                "deploy_service_locally",
+            ]
+            mock_sleep.assert_awaited_once_with(15.0)
+
+            # once healthy, the next restart is a cheap one again
+            pipeline.healthy("svc")
+            service_manager.reset_mock()
+            assert await pipeline.restart("svc") == RestartPipeline.PROCESS
+            assert mock_sleep.await_count == 1
+
+        stats = pipeline.stats("svc").json
+        assert stats["process_restarts"] == 2
+        assert stats["rebuilds"] == 1
+        assert stats["failures"] == 0
+
+    async def test_escalates_when_process_restart_fails(self) -> None:
+        """A failing process restart is followed by a rebuild right away."""
+        pipeline, service_manager = _make_pipeline()
+        service_manager.restart_service_locally.side_effect = RuntimeError("no setup")
+        assert await pipeline.restart("svc") == RestartPipeline.REBUILD
+        assert _called(service_manager) == [
+            "restart_service_locally",
+            "stop_service_locally",
+            "deploy_service_locally",
+        ]
+
+    async def test_failed_rebuild_is_counted_and_raised(self) -> None:
+        """A failed rebuild is counted and re-raised; the backoff keeps growing."""
+        pipeline, service_manager = _make_pipeline()
+        service_manager.deploy_service_locally.side_effect = RuntimeError("boom")
+        with patch(
+            "operate.services.health_checker.asyncio.sleep", new_callable=AsyncMock
+        ):
+            await pipeline.restart("svc")
+            for _ in range(2):
+                with pytest.raises(RuntimeError, match="boom"):
+                    await pipeline.restart("svc")
+        assert pipeline.stats("svc").failures == 2
+        assert pipeline.backoff("svc") == 60.0
+        assert pipeline.healthy("svc") is not None
+
+        pipeline._attempts["svc"] = 10  # pylint: disable=protected-access
+        assert pipeline.backoff("svc") == RestartPipeline.BACKOFF_MAX
+        pipeline.reset("svc")
+        assert pipeline.backoff("svc") == 0.0
+
+    async def test_restarts_of_a_service_are_serialised(self) -> None:
+        """Concurrent restart requests for a service run one after the other."""
+        pipeline, service_manager = _make_pipeline()
+        running = []
+        peak = 0
+
+        def _restart(service_config_id: str) -> None:
+            nonlocal peak
+            running.append(service_config_id)
+            peak = max(peak, running.count("svc"))
+            running.remove(service_config_id)
+
+        service_manager.restart_service_locally.side_effect = _restart
+        with patch(
+            "operate.services.health_checker.asyncio.sleep", new_callable=AsyncMock
+        ):
+            kinds = await asyncio.gather(
+                pipeline.restart("svc"), pipeline.restart("svc")
+            )
+        assert kinds == [RestartPipeline.PROCESS, RestartPipeline.REBUILD]
+        assert peak == 1
+
+    async def test_time_to_healthy_is_recorded(self) -> None:
+        """The time from a restart to the next healthy probe is a metric."""
+        pipeline, _ = _make_pipeline()
+        assert pipeline.healthy("svc") is None
+        with patch("operate.services.health_checker.time.time", return_value=100.0):
+            await pipeline.restart("svc")
+        with patch("operate.services.health_checker.time.time", return_value=142.0):
+            assert pipeline.healthy("svc") == 42.0
+        assert pipeline.healthy("svc") is None
+
+        stats = pipeline.stats("svc").json
+        assert stats["last_restart"] == 100.0
+        assert stats["last_time_to_healthy"] == 42.0
+        assert stats["time_to_healthy"]["count"] == 1
+        assert stats["time_to_healthy"]["buckets"]["le_60000ms"] == 1
+        assert stats["time_to_healthy"]["buckets"]["le_30000ms"] == 0
+
+    async def test_health_checker_uses_pipeline(self) -> None:
+        """The health checker forgets restart state on start and stop."""
+        health_checker = HealthChecker(service_manager=MagicMock(), logger=MagicMock())
+        restarts = health_checker.restarts
+        restarts._attempts["svc"] = 2  # pylint: disable=protected-access
+        health_checker._jobs["svc"] = MagicMock()  # pylint: disable=protected-access
+        health_checker.stop_for_service("svc")
+        assert restarts.backoff("svc") == 0.0
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the health check scheduler."""
+
+import asyncio
+import typing as t
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from operate.services.health_checker import HealthCheckScheduler, HealthChecker
+
+
+def _make_scheduler(
+    results: t.List[t.Any], base_interval: float = 0.01, **kwargs: t.Any
+) -> t.Tuple[HealthCheckScheduler, t.List[str]]:
+    """Create a scheduler whose probes return (or raise) successive results."""
+    calls: t.List[str] = []
+
+    async def _probe(service_config_id: str, service_path: t.Optional[Path]) -> bool:
+        calls.append(service_config_id)
+        result = results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    scheduler = HealthCheckScheduler(_probe, base_interval=base_interval, **kwargs)
+    scheduler.JITTER = 0.0
+    return scheduler, calls
+
+
+@pytest.mark.asyncio
+class TestHealthCheckScheduler:
+    """Tests for HealthCheckScheduler."""
+
+    async def test_interval_backs_off_while_healthy_and_resets_on_failure(
+        self,
+    ) -> None:
+        """Stable services are probed less often; a failure tightens the interval."""
+        scheduler, calls = _make_scheduler(
+            [True] * 5 + [False], base_interval=0.001, max_interval=0.004
+        )
+        intervals = []
+        for _ in range(5):
+            assert await scheduler.probe("svc") is True
+            intervals.append(scheduler.json["services"]["svc"]["interval"])
+        assert intervals == [0.001, 0.001, 0.002, 0.004, 0.004]
+
+        assert await scheduler.probe("svc") is False
+        service = scheduler.json["services"]["svc"]
+        assert service["interval"] == 0.001
+        assert service["healthy_streak"] == 0
+        assert service["last_result"] is False
+        assert service["last_probe"] is not None
+        assert calls == ["svc"] * 6
+        await scheduler.close()
+
+    async def test_reset_makes_probe_due_now(self) -> None:
+        """A reset (e.g. after a restart) runs the waiting probe right away."""
+        scheduler, _ = _make_scheduler([True] * 4, base_interval=0.01)
+        for _ in range(3):
+            await scheduler.probe("svc")
+        assert scheduler.json["services"]["svc"]["interval"] == 0.02
+        scheduler._schedules["svc"].next_due += 60  # pylint: disable=protected-access
+
+        waiter = asyncio.create_task(scheduler.probe("svc"))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        assert scheduler.json["services"]["svc"]["due_in"] > 50
+
+        scheduler.reset("svc")
+        scheduler.reset("unknown")
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+        assert scheduler.json["services"]["svc"]["interval"] == 0.01
+        await scheduler.close()
+
+    async def test_fixed_interval_only_delays_retries(self) -> None:
+        """Readiness polls retry after the fixed interval and hand over at once."""
+        error = aiohttp.ClientConnectionError("down")
+        scheduler, calls = _make_scheduler([error, True, True], base_interval=60)
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await scheduler.probe("svc", interval=0.01)
+        assert await scheduler.probe("svc", interval=0.01) is True
+        # the adaptive interval is untouched and the next probe is due now
+        assert scheduler.json["services"]["svc"]["healthy_streak"] == 0
+        assert await asyncio.wait_for(scheduler.probe("svc"), timeout=1) is True
+        assert calls == ["svc"] * 3
+        await scheduler.close()
+
+    async def test_concurrent_probes_are_capped(self) -> None:
+        """No more than max_concurrent probes run at the same time."""
+        running = 0
+        peak = 0
+
+        async def _probe(service_config_id: str, service_path: t.Any) -> bool:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        scheduler = HealthCheckScheduler(_probe, base_interval=1, max_concurrent=2)
+        results = await asyncio.gather(*(scheduler.probe(f"svc{i}") for i in range(6)))
+        assert results == [True] * 6
+        assert peak == 2
+        await scheduler.close()
+
+    async def test_cancelled_and_removed_probes_are_skipped(self) -> None:
+        """Probes nobody waits for anymore are not run; removal cancels the waiter."""
+        scheduler, calls = _make_scheduler([True, True], base_interval=60)
+        await scheduler.probe("svc")
+
+        waiter = asyncio.create_task(scheduler.probe("svc"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        scheduler.reset("svc")
+        await asyncio.sleep(0.01)
+
+        removed = asyncio.create_task(scheduler.probe("other"))
+        await asyncio.sleep(0)
+        scheduler.remove("other")
+        await asyncio.sleep(0.01)
+        assert calls == ["svc"]
+        assert removed.cancelled()
+        assert scheduler.json["services"] == {
+            "svc": {
+                "interval": 60,
+                "due_in": None,
+                "waiting": False,
+                "healthy_streak": 0,
+                "last_result": True,
+                "last_probe": scheduler.json["services"]["svc"]["last_probe"],
+            }
+        }
+        await scheduler.close()
+
+    async def test_json_is_readable_from_other_threads(self) -> None:
+        """Due times are reported against the clock of the scheduler's loop."""
+        scheduler, _ = _make_scheduler([True], base_interval=60)
+        await scheduler.probe("svc")
+        waiter = asyncio.create_task(scheduler.probe("svc"))
+        await asyncio.sleep(0)
+
+        schedule = await asyncio.to_thread(lambda: scheduler.json)
+        assert 0 < schedule["services"]["svc"]["due_in"] <= 60
+        waiter.cancel()
+        await scheduler.close()
+
+    async def test_probe_outlives_its_waiter(self) -> None:
+        """A probe whose job stopped waiting still updates the schedule."""
+        started = asyncio.Event()
+
+        async def _probe(service_config_id: str, service_path: t.Any) -> bool:
+            started.set()
+            await asyncio.sleep(0.01)
+            return False
+
+        scheduler = HealthCheckScheduler(_probe, base_interval=1)
+        waiter = asyncio.create_task(scheduler.probe("svc"))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        assert scheduler.json["services"]["svc"]["last_result"] is False
+        await scheduler.close()
+
+    async def test_close_cancels_probes_in_flight(self) -> None:
+        """Closing the scheduler stops its task and the running probes."""
+        started = asyncio.Event()
+
+        async def _probe(service_config_id: str, service_path: t.Any) -> bool:
+            started.set()
+            await asyncio.sleep(60)
+            return True  # pragma: no cover
+
+        scheduler = HealthCheckScheduler(_probe, base_interval=1)
+        waiter = asyncio.create_task(scheduler.probe("svc"))
+        await started.wait()
+        assert scheduler.json["in_flight"] == 1
+
+        await scheduler.close()
+        assert scheduler.json["in_flight"] == 0
+        waiter.cancel()
+        # the scheduler restarts on demand
+        scheduler._probe_fn = MagicMock(  # pylint: disable=protected-access
+            side_effect=lambda *_: asyncio.sleep(0, result=False)
+        )
+        assert await scheduler.probe("svc") is False
+        await scheduler.close()
+
+    async def test_health_checker_wires_scheduler(self) -> None:
+        """The health checker probes through its scheduler and forgets stopped services."""
+        health_checker = HealthChecker(
+            service_manager=MagicMock(), logger=MagicMock(), sleep_period=7
+        )
+        assert health_checker.scheduler.base_interval == 7
+        assert health_checker.scheduler.max_interval == 42
+
+        async def _check(service_config_id: str, service_path: t.Any) -> bool:
+            return service_path == Path("/svc")
+
+        health_checker.check_service_health = _check  # type: ignore[assignment]
+        assert await health_checker.scheduler.probe("svc", Path("/svc")) is True
+
+        health_checker._jobs["svc"] = MagicMock()  # pylint: disable=protected-access
+        health_checker.stop_for_service("svc")
+        assert health_checker.scheduler.json["services"] == {}
+        await health_checker.close()
@@ -30,12 +30,15 @@ from aea_ledger_ethereum import DEFAULT_GAS_PRICE_STRATEGIES, EIP1559, GWEI, to_
 from operate.ledger import (
     DEFAULT_GAS_ESTIMATE_MULTIPLIER,
     GAS_ESTIMATE_FALLBACK_ADDRESSES,
+    gas_pricing_snapshot,
     get_currency_smallest_unit,
+    instrument_rpc_provider,
     make_chain_ledger_api,
     update_tx_with_gas_estimate,
     update_tx_with_gas_pricing,
 )
 from operate.operate_types import Chain
+from operate.utils.metrics import RPC_REQUESTS, RPC_REQUEST_DURATION
 
 
 class TestGetCurrencySmallestUnit:
@@ -107,6 +110,51 @@ class TestMakeChainLedgerApi:
 
         assert captured["gas_price_strategies"] == default
 
+    def test_provider_is_instrumented_with_the_rpc_host(self) -> None:
+        """Requests are counted against the host of the RPC, not its full URL."""
+        ledger_api = MagicMock()
+        ledger_api.api.provider.make_request.return_value = {"result": "0x1"}
+        with patch("operate.ledger.make_ledger_api", return_value=ledger_api):
+            make_chain_ledger_api(Chain.GNOSIS, rpc="https://rpc.example.org/key")
+
+        before = RPC_REQUESTS.value("gnosis", "rpc.example.org", "eth_chainId", "ok")
+        ledger_api.api.provider.make_request("eth_chainId", [])
+        assert (
+            RPC_REQUESTS.value("gnosis", "rpc.example.org", "eth_chainId", "ok")
+            == before + 1
+        )
+
+
+class TestInstrumentRpcProvider:
+    """Tests for instrument_rpc_provider."""
+
+    @pytest.mark.parametrize(
+        ("side_effect", "outcome"),
+        [
+            ([{"result": "0x1"}], "ok"),
+            ([{"error": {"code": -32000}}], "error"),
+            (ConnectionError("down"), "exception"),
+        ],
+    )
+    def test_outcomes(self, side_effect: t.Any, outcome: str) -> None:
+        """Each request is timed and counted by outcome."""
+        provider = MagicMock()
+        provider.make_request.side_effect = side_effect
+        make_request = provider.make_request
+        instrument_rpc_provider(provider, Chain.BASE, "http://localhost:8545")
+
+        labels = ("base", "localhost", "eth_call")
+        count = RPC_REQUESTS.value(*labels, outcome)
+        observed = RPC_REQUEST_DURATION.count(*labels)
+        if outcome == "exception":
+            with pytest.raises(ConnectionError, match="down"):
+                provider.make_request("eth_call", [])
+        else:
+            assert provider.make_request("eth_call", []) == side_effect[0]
+        make_request.assert_called_once_with("eth_call", [])
+        assert RPC_REQUESTS.value(*labels, outcome) == count + 1
+        assert RPC_REQUEST_DURATION.count(*labels) == observed + 1
+
 
 class TestUpdateTxWithGasPricing:
     """Tests for update_tx_with_gas_pricing (lines 166-180)."""
@@ -163,6 +211,66 @@ class TestUpdateTxWithGasPricing:
             update_tx_with_gas_pricing({}, mock_api)
 
 
+class TestGasPricingSnapshot:
+    """Tests for gas_pricing_snapshot."""
+
+    def test_fetches_once_per_chain(self) -> None:
+        """Pricing is fetched once per chain and reused within the scope."""
+        gnosis_api = MagicMock(_chain_id=100)
+        gnosis_api.try_get_gas_pricing.return_value = {"gasPrice": 1}
+        base_api = MagicMock(_chain_id=8453)
+        base_api.try_get_gas_pricing.return_value = {
+            "maxFeePerGas": 5,
+            "maxPriorityFeePerGas": 2,
+        }
+
+        with gas_pricing_snapshot() as snapshot:
+            txs: t.List[dict] = [{} for _ in range(3)]
+            for tx in txs:
+                update_tx_with_gas_pricing(tx, gnosis_api)
+            base_tx: dict = {}
+            update_tx_with_gas_pricing(base_tx, base_api)
+            update_tx_with_gas_pricing({}, base_api)
+
+        assert gnosis_api.try_get_gas_pricing.call_count == 1
+        assert base_api.try_get_gas_pricing.call_count == 1
+        assert all(tx == {"gasPrice": 1} for tx in txs)
+        assert base_tx == {"maxFeePerGas": 5, "maxPriorityFeePerGas": 2}
+        assert (snapshot.fetches, snapshot.reuses) == (2, 3)
+
+    def test_nested_scopes_share_outer_snapshot(self) -> None:
+        """Inner scopes reuse the outermost snapshot."""
+        mock_api = MagicMock(_chain_id=100)
+        mock_api.try_get_gas_pricing.return_value = {"gasPrice": 1}
+        with gas_pricing_snapshot() as outer:
+            update_tx_with_gas_pricing({}, mock_api)
+            with gas_pricing_snapshot() as inner:
+                assert inner is outer
+                update_tx_with_gas_pricing({}, mock_api)
+        assert mock_api.try_get_gas_pricing.call_count == 1
+
+    def test_no_snapshot_fetches_every_time(self) -> None:
+        """Outside of a snapshot every call fetches fresh pricing."""
+        mock_api = MagicMock(_chain_id=100)
+        mock_api.try_get_gas_pricing.return_value = {"gasPrice": 1}
+        with gas_pricing_snapshot():
+            update_tx_with_gas_pricing({}, mock_api)
+        update_tx_with_gas_pricing({}, mock_api)
+        update_tx_with_gas_pricing({}, mock_api)
+        assert mock_api.try_get_gas_pricing.call_count == 3
+
+    def test_failed_fetch_is_not_cached(self) -> None:
+        """A missing pricing result still raises and is retried on the next call."""
+        mock_api = MagicMock(_chain_id=100)
+        mock_api.try_get_gas_pricing.side_effect = [None, {"gasPrice": 3}]
+        with gas_pricing_snapshot():
+            with pytest.raises(RuntimeError, match="Unable to retrieve gas pricing"):
+                update_tx_with_gas_pricing({}, mock_api)
+            tx: dict = {}
+            update_tx_with_gas_pricing(tx, mock_api)
+        assert tx == {"gasPrice": 3}
+
+
 class TestUpdateTxWithGasEstimate:
     """Tests for update_tx_with_gas_estimate (lines 191-205)."""
 
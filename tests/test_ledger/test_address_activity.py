@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate.ledger.address_activity module."""
+
+import bisect
+import typing as t
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from operate.ledger.address_activity import (
+    ActivityDiscoveryError,
+    AddressActivityDiscovery,
+    get_archive_rpc,
+    kary_search,
+)
+from operate.operate_types import Chain
+
+ADDRESS = "0x" + "a" * 40
+
+
+def _make_w3(
+    head: int,
+    deploy_block: t.Optional[int],
+    nonce_blocks: t.List[int],
+) -> MagicMock:
+    """Web3 mock for a contract deployed at `deploy_block` (None for an EOA).
+
+    `nonce_blocks` are the (sorted) blocks at which the nonce was incremented.
+    """
+    w3 = MagicMock()
+    w3.eth.block_number = head
+
+    def _get_code(address: str, block_identifier: int) -> bytes:
+        if deploy_block is not None and block_identifier >= deploy_block:
+            return b"\x60\x80"
+        return b""
+
+    def _nonce(block: int) -> int:
+        return bisect.bisect_right(nonce_blocks, block)
+
+    w3.eth.get_code.side_effect = _get_code
+    w3.eth.call.side_effect = lambda tx, block_identifier: _nonce(
+        block_identifier
+    ).to_bytes(32, "big")
+    w3.eth.get_transaction_count.side_effect = lambda address, block_identifier: _nonce(
+        block_identifier
+    )
+    return w3
+
+
+class TestKarySearch:
+    """Tests for kary_search."""
+
+    @pytest.mark.parametrize("target", [0, 1, 7, 500, 999_998, 1_000_000])
+    @pytest.mark.parametrize("arity", [2, 4, 8])
+    def test_finds_first_true(self, target: int, arity: int) -> None:
+        """The smallest block satisfying the predicate is returned."""
+        assert kary_search(lambda b: b >= target, 0, 1_000_000, arity) == target
+
+    def test_rounds(self) -> None:
+        """An 8-ary search over 1M blocks takes ~log8 rounds of 7 probes."""
+        probes: t.List[int] = []
+
+        def _fn(block: int) -> bool:
+            probes.append(block)
+            return block >= 654_321
+
+        kary_search(_fn, 0, 1_000_000, 8)
+        assert len(probes) <= 7 * 8
+
+
+class TestAddressActivityDiscovery:
+    """Tests for AddressActivityDiscovery."""
+
+    def test_contract(self) -> None:
+        """Deployment and last nonce increment are found for a contract."""
+        w3 = _make_w3(1_000_000, deploy_block=123_456, nonce_blocks=[200_000, 765_432])
+        activity = AddressActivityDiscovery().discover(w3, ADDRESS)
+        assert activity is not None
+        assert activity.is_contract
+        assert (activity.first_block, activity.last_block) == (123_456, 765_432)
+        assert activity.nonce == 2
+
+    def test_contract_without_transactions(self) -> None:
+        """A deployed contract with nonce 0 has a single-block range."""
+        w3 = _make_w3(1_000, deploy_block=10, nonce_blocks=[])
+        activity = AddressActivityDiscovery().discover(w3, ADDRESS)
+        assert activity is not None
+        assert (activity.first_block, activity.last_block) == (10, 10)
+
+    def test_eoa(self) -> None:
+        """First and last transactions are found for an EOA."""
+        w3 = _make_w3(1_000_000, deploy_block=None, nonce_blocks=[5_000, 6_000, 9_999])
+        activity = AddressActivityDiscovery().discover(w3, ADDRESS)
+        assert activity is not None
+        assert not activity.is_contract
+        assert (activity.first_block, activity.last_block) == (5_000, 9_999)
+
+    def test_inactive_eoa(self) -> None:
+        """An EOA that never sent a transaction has no activity."""
+        w3 = _make_w3(1_000, deploy_block=None, nonce_blocks=[])
+        assert AddressActivityDiscovery().discover(w3, ADDRESS) is None
+
+    def test_cached_per_chain_and_refreshed_incrementally(self) -> None:
+        """Results are cached per (chain, address) and only new blocks are searched."""
+        discovery = AddressActivityDiscovery()
+        nonce_blocks = [50_000]
+        w3 = _make_w3(100_000, deploy_block=1_000, nonce_blocks=nonce_blocks)
+        first = discovery.discover(w3, ADDRESS, chain=Chain.GNOSIS)
+
+        w3.eth.get_code.reset_mock()
+        assert discovery.discover(w3, ADDRESS, chain=Chain.GNOSIS) is first
+        w3.eth.get_code.assert_not_called()
+
+        # Head moved without new transactions: one nonce probe only.
+        w3.eth.block_number = 120_000
+        w3.eth.call.reset_mock()
+        activity = discovery.discover(w3, ADDRESS, chain=Chain.GNOSIS)
+        assert activity is not None
+        assert activity.last_block == 50_000
+        assert w3.eth.call.call_count == 1
+
+        # New transaction: search starts from the cached last block.
+        nonce_blocks.append(110_000)
+        w3.eth.block_number = 130_000
+        activity = discovery.discover(w3, ADDRESS, chain=Chain.GNOSIS)
+        assert activity is not None
+        assert (activity.first_block, activity.last_block) == (1_000, 110_000)
+        w3.eth.get_code.assert_not_called()
+        assert all(
+            c.kwargs["block_identifier"] >= 50_000 for c in w3.eth.call.call_args_list
+        )
+
+        discovery.clear()
+        assert discovery.discover(w3, ADDRESS, chain=Chain.GNOSIS) is not activity
+
+    def test_rpc_failure_raises(self) -> None:
+        """Persistent RPC failures raise instead of being read as "not deployed"."""
+        w3 = _make_w3(1_000, deploy_block=10, nonce_blocks=[])
+        w3.eth.get_code.side_effect = ValueError("missing trie node")
+        with patch("operate.ledger.address_activity.PROBE_RETRY_DELAY", 0):
+            with pytest.raises(ActivityDiscoveryError, match="missing trie node"):
+                AddressActivityDiscovery().discover(w3, ADDRESS)
+        assert w3.eth.get_code.call_count == 3
+
+    def test_transient_failure_is_retried(self) -> None:
+        """A probe that fails once is retried."""
+        w3 = _make_w3(1_000, deploy_block=10, nonce_blocks=[])
+        get_code = w3.eth.get_code.side_effect
+        calls = {"n": 0}
+
+        def _flaky(address: str, block_identifier: int) -> bytes:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise ConnectionError("reset")
+            return get_code(address, block_identifier)
+
+        w3.eth.get_code.side_effect = _flaky
+        with patch("operate.ledger.address_activity.PROBE_RETRY_DELAY", 0):
+            activity = AddressActivityDiscovery().discover(w3, ADDRESS)
+        assert activity is not None
+        assert activity.first_block == 10
+
+    def test_uses_archive_rpc(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Probes go to the archive RPC when configured, capped at its head."""
+        monkeypatch.setenv("BASE_ARCHIVE_RPC", "http://archive")
+        assert get_archive_rpc(Chain.BASE) == "http://archive"
+        archive = _make_w3(900, deploy_block=10, nonce_blocks=[20])
+        default = MagicMock()
+        with patch("operate.ledger.address_activity.Web3", wraps=None) as mock_web3_cls:
+            mock_web3_cls.return_value = archive
+            mock_web3_cls.to_checksum_address.side_effect = lambda a: a
+            activity = AddressActivityDiscovery().discover(
+                default, ADDRESS, chain=Chain.BASE, head_block=1_000
+            )
+        mock_web3_cls.HTTPProvider.assert_called_once_with("http://archive")
+        assert activity is not None
+        assert activity.head_block == 900
+        assert (activity.first_block, activity.last_block) == (10, 20)
+        default.eth.get_code.assert_not_called()
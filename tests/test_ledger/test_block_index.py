@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate.ledger.block_index module."""
+
+import bisect
+import json
+import random
+import typing as t
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from operate.ledger import block_index
+from operate.ledger.block_index import (
+    BlockTimestampIndex,
+    get_block_timestamp_index,
+    set_block_index_dir,
+    store_block_indexes,
+)
+from operate.operate_types import Chain
+
+
+def _make_w3(timestamps: t.List[int]) -> MagicMock:
+    """Return a web3 mock serving blocks with the given timestamps."""
+    w3 = MagicMock()
+    w3.eth.block_number = len(timestamps) - 1
+    w3.eth.get_block.side_effect = lambda n: {"timestamp": timestamps[n]}
+    return w3
+
+
+def _make_timestamps(n: int, block_time: float, jitter: float) -> t.List[int]:
+    """Return a non-decreasing list of `n` block timestamps."""
+    rng = random.Random(42)  # nosec B311
+    timestamps = [1_600_000_000]
+    for _ in range(n - 1):
+        timestamps.append(timestamps[-1] + max(0, round(rng.gauss(block_time, jitter))))
+    return timestamps
+
+
+def _expected(timestamps: t.List[int], timestamp: int) -> int:
+    """Reference implementation: largest block with timestamp < `timestamp`."""
+    return max(bisect.bisect_left(timestamps, timestamp) - 1, 0)
+
+
+class TestBlockTimestampIndex:
+    """Tests for BlockTimestampIndex."""
+
+    @pytest.mark.parametrize(
+        ("block_time", "jitter", "average_block_time"),
+        [(2, 0, 2.0), (5, 1.5, 5.0), (12, 2, 12.0), (2, 1, None)],
+    )
+    def test_matches_reference(
+        self, block_time: float, jitter: float, average_block_time: float
+    ) -> None:
+        """Lookups return the same block as an exhaustive search."""
+        timestamps = _make_timestamps(200_000, block_time, jitter)
+        w3 = _make_w3(timestamps)
+        index = BlockTimestampIndex(chain_id=1, average_block_time=average_block_time)
+        rng = random.Random(7)  # nosec B311
+        targets = [
+            rng.randint(timestamps[0] - 10, timestamps[-1] + 10) for _ in range(50)
+        ]
+        targets += [
+            timestamps[0],
+            timestamps[0] + 1,
+            timestamps[-1],
+            timestamps[-1] + 1,
+        ]
+        for target in targets:
+            assert index.find_block_before_timestamp(w3, target) == _expected(
+                timestamps, target
+            )
+
+    def test_uses_fewer_rpc_calls_than_bisection(self) -> None:
+        """First lookup takes a handful of calls; a repeated one almost none."""
+        timestamps = _make_timestamps(1_000_000, 5, 1)
+        w3 = _make_w3(timestamps)
+        index = BlockTimestampIndex(chain_id=100, average_block_time=5.0)
+        target = timestamps[654_321]
+
+        assert index.find_block_before_timestamp(w3, target) == 654_320
+        first_calls = index.rpc_calls
+        assert first_calls < 12
+
+        assert index.find_block_before_timestamp(w3, target) == 654_320
+        # Only eth_blockNumber: the latest block is already indexed.
+        assert index.rpc_calls - first_calls == 1
+
+    def test_persists_and_reloads(self, tmp_path: Path) -> None:
+        """Samples are written to disk and reused by a new instance."""
+        timestamps = _make_timestamps(10_000, 2, 0)
+        w3 = _make_w3(timestamps)
+        path = tmp_path / "base.json"
+        index = BlockTimestampIndex(chain_id=8453, path=path, average_block_time=2.0)
+        index.find_block_before_timestamp(w3, timestamps[5_000])
+        assert json.loads(path.read_text())["chain_id"] == 8453
+
+        reloaded = BlockTimestampIndex(chain_id=8453, path=path)
+        assert len(reloaded) == len(index)
+        w3.eth.get_block.reset_mock()
+        assert reloaded.find_block_before_timestamp(w3, timestamps[5_000]) == 4_999
+        w3.eth.get_block.assert_not_called()
+
+    def test_writes_are_throttled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Lookups write the table at most once per STORE_INTERVAL."""
+        timestamps = _make_timestamps(10_000, 2, 0)
+        w3 = _make_w3(timestamps)
+        path = tmp_path / "base.json"
+        index = BlockTimestampIndex(chain_id=8453, path=path, average_block_time=2.0)
+        index.find_block_before_timestamp(w3, timestamps[5_000])
+        written = path.read_text()
+
+        index.find_block_before_timestamp(w3, timestamps[8_000])
+        assert path.read_text() == written
+
+        monkeypatch.setattr(block_index, "STORE_INTERVAL", 0)
+        index.find_block_before_timestamp(w3, timestamps[8_000])
+        assert len(json.loads(path.read_text())["samples"]) == len(index)
+
+    def test_pending_samples_are_stored_on_demand(self, tmp_path: Path) -> None:
+        """Forced stores write the samples kept back by the throttling."""
+        set_block_index_dir(tmp_path)
+        try:
+            index = get_block_timestamp_index(Chain.BASE)
+            index.record(1, 2)
+            index.store()
+            index.record(2, 4)
+            index.store()
+            assert len(json.loads((tmp_path / "base.json").read_text())["samples"]) == 1
+
+            store_block_indexes()
+            assert len(json.loads((tmp_path / "base.json").read_text())["samples"]) == 2
+        finally:
+            set_block_index_dir(None)
+
+    def test_failed_store_does_not_stop_the_others(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A table that cannot be written is logged; the rest are still stored."""
+        set_block_index_dir(tmp_path)
+        try:
+            (tmp_path / "base.json").mkdir()
+            base = get_block_timestamp_index(Chain.BASE)
+            gnosis = get_block_timestamp_index(Chain.GNOSIS)
+            base.record(1, 2)
+            gnosis.record(1, 5)
+
+            with caplog.at_level("WARNING", logger=block_index.__name__):
+                store_block_indexes()
+            assert "Failed to store block index" in caplog.text
+            assert json.loads((tmp_path / "gnosis.json").read_text())["samples"] == [
+                [1, 5]
+            ]
+        finally:
+            set_block_index_dir(None)
+
+    def test_unreadable_file_is_ignored(self, tmp_path: Path) -> None:
+        """A corrupt index file results in an empty index."""
+        path = tmp_path / "gnosis.json"
+        path.write_text("not json")
+        index = BlockTimestampIndex(chain_id=100, path=path)
+        assert len(index) == 0
+
+    def test_table_is_thinned(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The sample table never grows past MAX_SAMPLES."""
+        monkeypatch.setattr(block_index, "MAX_SAMPLES", 10)
+        index = BlockTimestampIndex(chain_id=1)
+        for block in range(25):
+            index.record(block, block * 2)
+        assert len(index) <= 10
+        assert index.get_timestamp(MagicMock(), 24) == 48
+
+    def test_samples_beyond_latest_are_ignored(self) -> None:
+        """Samples above the current head (e.g. from another RPC) are skipped."""
+        timestamps = _make_timestamps(1_000, 2, 0)
+        w3 = _make_w3(timestamps)
+        index = BlockTimestampIndex(chain_id=1)
+        index.record(5_000, timestamps[-1] + 8_000)
+        index.record(5_000, 0)  # duplicates are ignored
+        assert index.find_block_before_timestamp(w3, timestamps[500]) == 499
+
+
+class TestSharedIndexes:
+    """Tests for the shared per-chain index registry."""
+
+    def test_shared_per_chain(self, tmp_path: Path) -> None:
+        """The same index is returned per chain and stored under the index dir."""
+        set_block_index_dir(tmp_path)
+        try:
+            index = get_block_timestamp_index(Chain.GNOSIS)
+            assert get_block_timestamp_index(Chain.GNOSIS) is index
+            assert get_block_timestamp_index(Chain.BASE) is not index
+            assert index.path == tmp_path / "gnosis.json"
+            assert index.average_block_time == 5.0
+        finally:
+            set_block_index_dir(None)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate.ledger.log_scanner module."""
+
+import threading
+import typing as t
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from operate.ledger import log_scanner
+from operate.ledger.log_scanner import (
+    CHUNK_SIZE_STEP,
+    ChunkSizer,
+    LogScanCheckpoints,
+    LogScanner,
+    MAX_CHUNK_SIZE,
+    get_chunk_sizer,
+    set_log_scan_checkpoints_path,
+)
+
+ADDRESS = "0x" + "a" * 40
+TOPICS: t.List[t.Optional[str]] = ["0x" + "1" * 64, None]
+
+
+def _make_w3(
+    events: t.Dict[int, int],
+    max_span: t.Optional[int] = None,
+    broken: t.Optional[t.Set[int]] = None,
+) -> MagicMock:
+    """Web3 mock emitting one log per `events` block (value as payload).
+
+    Windows wider than `max_span` fail, as do windows containing a block in
+    `broken`.
+    """
+    w3 = MagicMock()
+    w3.provider.endpoint_uri = None
+
+    def _get_logs(params: t.Dict) -> t.List[t.Dict]:
+        start, end = params["fromBlock"], params["toBlock"]
+        if max_span is not None and end - start + 1 > max_span:
+            raise ValueError("range too large")
+        if broken and any(start <= b <= end for b in broken):
+            raise ValueError("server error")
+        return [
+            {"blockNumber": block, "value": value}
+            for block, value in events.items()
+            if start <= block <= end
+        ]
+
+    w3.eth.get_logs.side_effect = _get_logs
+    return w3
+
+
+def _windows(w3: MagicMock) -> t.List[t.Tuple[int, int]]:
+    """Requested (fromBlock, toBlock) windows."""
+    return [
+        (c.args[0]["fromBlock"], c.args[0]["toBlock"])
+        for c in w3.eth.get_logs.call_args_list
+    ]
+
+
+@pytest.fixture(name="checkpoints")
+def fixture_checkpoints(tmp_path: Path) -> t.Iterator[Path]:
+    """Point the shared checkpoint store at a temporary file."""
+    path = tmp_path / "checkpoints.json"
+    set_log_scan_checkpoints_path(path)
+    yield path
+    set_log_scan_checkpoints_path(None)
+
+
+class TestChunkSizer:
+    """Tests for ChunkSizer."""
+
+    def test_aimd(self) -> None:
+        """Additive increase up to the maximum, multiplicative decrease to 1."""
+        sizer = ChunkSizer(size=10)
+        sizer.success()
+        assert sizer.size == 10 + CHUNK_SIZE_STEP
+        for _ in range(100):
+            sizer.failure()
+        assert sizer.size == 1
+        for _ in range(100):
+            sizer.success()
+        assert sizer.size == MAX_CHUNK_SIZE
+
+    def test_shared_per_endpoint(self) -> None:
+        """Scanners on the same endpoint share their sizer."""
+        w3, other = MagicMock(), MagicMock()
+        w3.provider.endpoint_uri = other.provider.endpoint_uri = "http://rpc"
+        assert get_chunk_sizer(w3) is get_chunk_sizer(other)
+
+
+class TestLogScannerFetch:
+    """Tests for LogScanner.fetch."""
+
+    def test_windows_are_fetched_concurrently(self) -> None:
+        """Up to `max_workers` windows are in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        w3 = _make_w3({})
+        get_logs = w3.eth.get_logs.side_effect
+
+        def _get_logs(params: t.Dict) -> t.List:
+            barrier.wait()
+            return get_logs(params)
+
+        w3.eth.get_logs.side_effect = _get_logs
+        scanner = LogScanner(w3, max_workers=3, sizer=ChunkSizer(size=10))
+        scanner.sizer.success = lambda: None  # type: ignore[method-assign]
+        logs, scanned_through = scanner.fetch(ADDRESS, TOPICS, 0, 29)
+        assert logs == []
+        assert scanned_through == 29
+        assert sorted(_windows(w3)) == [(0, 9), (10, 19), (20, 29)]
+
+    def test_failed_windows_are_split(self) -> None:
+        """Windows the RPC rejects are halved until they succeed."""
+        w3 = _make_w3({5: 1, 700: 2, 999: 3}, max_span=300)
+        scanner = LogScanner(w3, sizer=ChunkSizer(size=1_000))
+        logs, scanned_through = scanner.fetch(ADDRESS, TOPICS, 0, 999)
+        assert sorted(log["value"] for log in logs) == [1, 2, 3]
+        assert scanned_through == 999
+        assert (0, 999) in _windows(w3)
+        assert max(end - start + 1 for start, end in _windows(w3)[1:]) <= 500
+
+    def test_window_failing_at_minimum_size_is_skipped(self) -> None:
+        """A block that always fails is skipped and bounds the scanned range."""
+        w3 = _make_w3({2: 1, 6: 2}, broken={4})
+        scanner = LogScanner(w3, sizer=ChunkSizer(size=8))
+        logs, scanned_through = scanner.fetch(ADDRESS, TOPICS, 0, 7)
+        assert sorted(log["value"] for log in logs) == [1, 2]
+        assert scanned_through == 3
+        assert (4, 4) in _windows(w3)
+
+
+class TestLogScannerScan:
+    """Tests for LogScanner.scan."""
+
+    def test_without_chain_nothing_is_checkpointed(self, checkpoints: Path) -> None:
+        """Scans without a chain id are not persisted."""
+        w3 = _make_w3({10: 1, 20: None, 30: 3})  # type: ignore[dict-item]
+        scanner = LogScanner(w3, sizer=ChunkSizer())
+        assert scanner.scan(ADDRESS, TOPICS, 0, 100, lambda log: log["value"]) == {
+            1,
+            3,
+        }
+        assert not checkpoints.exists()
+
+    def test_only_new_blocks_are_fetched(self, checkpoints: Path) -> None:
+        """A rescan reuses the checkpoint and fetches only blocks after it."""
+        events = {10: 1, 50: 2}
+        w3 = _make_w3(events)
+        scanner = LogScanner(w3, sizer=ChunkSizer())
+
+        def extract(log: t.Dict) -> int:
+            return log["value"]
+
+        assert scanner.scan(ADDRESS, TOPICS, 0, 100, extract, chain_id=100) == {1, 2}
+
+        events[150] = 3
+        w3.eth.get_logs.reset_mock()
+        assert scanner.scan(ADDRESS, TOPICS, 0, 200, extract, chain_id=100) == {
+            1,
+            2,
+            3,
+        }
+        assert _windows(w3) == [(101, 200)]
+
+        # A narrower range is answered from the checkpoint alone.
+        w3.eth.get_logs.reset_mock()
+        assert scanner.scan(ADDRESS, TOPICS, 20, 160, extract, chain_id=100) == {2, 3}
+        w3.eth.get_logs.assert_not_called()
+
+        # Another topic set does not share the checkpoint.
+        assert scanner.scan(ADDRESS, [None], 0, 200, extract, chain_id=100) == {
+            1,
+            2,
+            3,
+        }
+        assert _windows(w3) == [(0, 200)]
+
+        # Checkpoints survive a restart.
+        reloaded = LogScanCheckpoints(checkpoints)
+        key = LogScanCheckpoints.key(100, ADDRESS.upper(), TOPICS)
+        assert reloaded.get(key) == {
+            "from_block": 0,
+            "to_block": 200,
+            "entries": [[10, 1], [50, 2], [150, 3]],
+        }
+
+    def test_checkpoint_stops_at_gap(self, checkpoints: Path) -> None:
+        """Blocks after a skipped window are fetched again on the next scan."""
+        w3 = _make_w3({2: 1, 6: 2}, broken={4})
+        scanner = LogScanner(w3, sizer=ChunkSizer(size=8))
+
+        def extract(log: t.Dict) -> int:
+            return log["value"]
+
+        assert scanner.scan(ADDRESS, TOPICS, 0, 7, extract, chain_id=1) == {1, 2}
+        assert log_scanner.LOG_SCAN_CHECKPOINTS.get(
+            LogScanCheckpoints.key(1, ADDRESS, TOPICS)
+        ) == {"from_block": 0, "to_block": 3, "entries": [[2, 1]]}
+
+        w3.eth.get_logs.reset_mock()
+        scanner.sizer = ChunkSizer(size=8)
+        w3.eth.get_logs.side_effect = _make_w3({2: 1, 6: 2}).eth.get_logs.side_effect
+        assert scanner.scan(ADDRESS, TOPICS, 0, 7, extract, chain_id=1) == {1, 2}
+        assert _windows(w3) == [(4, 7)]
+
+    def test_unreadable_checkpoints_are_ignored(self, tmp_path: Path) -> None:
+        """A corrupt checkpoint file starts an empty store."""
+        path = tmp_path / "checkpoints.json"
+        path.write_text("{", encoding="utf-8")
+        assert LogScanCheckpoints(path).get("any") is None
+
+    def test_in_memory_store(self) -> None:
+        """Without a path, checkpoints are kept in memory only."""
+        store = LogScanCheckpoints()
+        store.put("key", {"to_block": 1})
+        assert store.get("key") == {"to_block": 1}
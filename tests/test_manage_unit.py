@@ -33,6 +33,7 @@ from operate.operate_types import (
     LedgerConfig,
     OnChainState,
 )
+from operate.services.deploy_timings import DeployTimings
 from operate.services.manage import ServiceManager
 from operate.services.protocol import StakingState
 from operate.services.service import (
@@ -277,6 +278,37 @@ class TestValidateServicesAndJsonProperty:
         assert result == [{"name": "test"}]
 
 
+class TestContentVersion:
+    """Tests for content_version()."""
+
+    def test_tracks_stores_of_the_given_files(self, tmp_path: Path) -> None:
+        """The version changes with each store and with the set of services."""
+        manager = _make_manager(tmp_path)
+        for name in ("sc-b", "sc-a"):
+            (manager.path / name).mkdir(parents=True)
+            (manager.path / name / "config.json").write_text("{}")
+
+        version = manager.content_version()
+        assert [v.split(":")[0] for v in version] == [
+            "sc-a/config.json",
+            "sc-b/config.json",
+        ]
+        assert manager.content_version() == version
+        assert manager.content_version(
+            files=("deployment.json",), service_config_id="sc-a"
+        ) == ["sc-a/deployment.json:-"]
+
+        tmp = manager.path / "sc-a" / "config.json.tmp"
+        tmp.write_text('{"a": 1}')
+        tmp.replace(manager.path / "sc-a" / "config.json")
+        changed = manager.content_version()
+        assert changed[0] != version[0]
+        assert changed[1] == version[1]
+
+        (manager.path / "sc-c").mkdir()
+        assert len(manager.content_version()) == 3
+
+
 class TestExists:
     """Tests for exists()."""
 
@@ -900,7 +932,7 @@ class TestDeployServiceLocally:
         mock_deployment.build.assert_called_once_with(
             use_docker=True,
             use_kubernetes=False,
-            force=True,
+            force=False,
             chain="gnosis",
             keys_manager=manager.keys_manager,
         )
@@ -929,6 +961,41 @@ class TestDeployServiceLocally:
         mock_deployment.start.assert_not_called()
         assert result == mock_deployment
 
+    def test_force_rebuild(self, tmp_path: Path) -> None:
+        """force_rebuild builds even an up to date deployment."""
+        manager = _make_manager(tmp_path)
+        mock_service = _make_mock_service()
+        mock_deployment = MagicMock()
+        mock_service.deployment = mock_deployment
+
+        with patch.object(manager, "load", return_value=mock_service):
+            manager.deploy_service_locally(
+                service_config_id="sc-1", build_only=True, force_rebuild=True
+            )
+
+        assert mock_deployment.build.call_args.kwargs["force"] is True
+
+    def test_deploy_timings_recorded(self, tmp_path: Path) -> None:
+        """The deploy is timed, including a failed start."""
+        manager = _make_manager(tmp_path)
+        mock_service = _make_mock_service()
+        mock_service.deployment.start.side_effect = RuntimeError("start failed")
+        timings = DeployTimings()
+
+        with (
+            patch.object(manager, "load", return_value=mock_service),
+            patch("operate.services.manage.deploy_timings", timings),
+            pytest.raises(RuntimeError, match="start failed"),
+        ):
+            manager.deploy_service_locally(service_config_id="sc-1")
+
+        [deploy] = timings.json("sc-1")["deploys"]
+        assert deploy["status"] == "failed"
+        assert [(p["name"], p["failed"]) for p in deploy["phases"]] == [
+            ("build", False),
+            ("start", True),
+        ]
+
     def test_uses_home_chain_when_chain_not_provided(self, tmp_path: Path) -> None:
         """Uses service.home_chain when chain argument is None."""
         manager = _make_manager(tmp_path)
@@ -947,12 +1014,34 @@ class TestDeployServiceLocally:
         mock_deployment.build.assert_called_once_with(
             use_docker=False,
             use_kubernetes=False,
-            force=True,
+            force=False,
             chain="base",
             keys_manager=manager.keys_manager,
         )
 
 
+class TestRestartServiceLocally:
+    """Tests for restart_service_locally()."""
+
+    def test_restart_reuses_build(self, tmp_path: Path) -> None:
+        """The deployment processes are restarted without building it again."""
+        manager = _make_manager(tmp_path)
+        mock_service = _make_mock_service()
+        mock_deployment = MagicMock()
+        mock_service.deployment = mock_deployment
+        manager.wallet_manager.password = "pw"  # nosec B105
+
+        with patch.object(manager, "load", return_value=mock_service):
+            result = manager.restart_service_locally(service_config_id="sc-1")
+
+        mock_service.remove_latest_healthcheck.assert_called_once()
+        mock_deployment.restart.assert_called_once_with(
+            password="pw", is_aea=True  # nosec B106
+        )
+        mock_deployment.build.assert_not_called()
+        assert result == mock_deployment
+
+
 class TestStopServiceLocally:
     """Tests for stop_service_locally()."""
 
@@ -1013,6 +1102,98 @@ class TestUpdate:
         assert result == mock_service
 
 
+class TestUpdateServiceLocally:
+    """Tests for update_service_locally()."""
+
+    @staticmethod
+    def _deployed_service(tmp_path: Path) -> MagicMock:
+        """A mock service with a running deployment."""
+        mock_service = _make_mock_service()
+        mock_service.deployment.status = DeploymentStatus.DEPLOYED
+        mock_service.deployment.stage.return_value = "fp"
+        mock_service.backup.return_value = tmp_path / "backup"
+        (tmp_path / "backup").mkdir()
+        return mock_service
+
+    def test_not_deployed_service_is_updated(self, tmp_path: Path) -> None:
+        """A service without a running deployment is only updated."""
+        manager = _make_manager(tmp_path)
+        mock_service = _make_mock_service()
+        mock_service.deployment.status = DeploymentStatus.BUILT
+
+        with (
+            patch.object(manager, "load", return_value=mock_service),
+            patch.object(manager, "update") as mock_update,
+        ):
+            result = manager.update_service_locally(
+                service_config_id="sc-1", service_template={}  # type: ignore
+            )
+
+        mock_update.assert_called_once_with(
+            service_config_id="sc-1",
+            service_template={},
+            allow_different_service_public_id=False,
+            partial_update=True,
+        )
+        mock_service.deployment.stage.assert_not_called()
+        assert result == mock_update.return_value
+
+    def test_deployment_is_staged_and_swapped(self, tmp_path: Path) -> None:
+        """The updated deployment is staged and swapped in, and timed."""
+        manager = _make_manager(tmp_path)
+        mock_service = self._deployed_service(tmp_path)
+        manager.wallet_manager.password = "pw"  # nosec B105
+        timings = DeployTimings()
+
+        with (
+            patch.object(manager, "load", return_value=mock_service),
+            patch("operate.services.manage.deploy_timings", timings),
+        ):
+            result = manager.update_service_locally(
+                service_config_id="sc-1",
+                service_template={"hash": "new"},  # type: ignore
+                partial_update=False,
+            )
+
+        mock_service.update.assert_called_once_with(
+            service_template={"hash": "new"},
+            allow_different_service_public_id=False,
+            partial_update=False,
+        )
+        mock_service.deployment.stage.assert_called_once_with(
+            keys_manager=manager.keys_manager, password="pw"  # nosec B106
+        )
+        mock_service.deployment.swap.assert_called_once_with(
+            password="pw",  # nosec B106
+            is_aea=True,
+            previous_is_aea=True,
+            build_fingerprint="fp",
+        )
+        mock_service.restore.assert_not_called()
+        assert not (tmp_path / "backup").exists()
+        assert result == mock_service
+        [deploy] = timings.json("sc-1")["deploys"]
+        assert [p["name"] for p in deploy["phases"]] == ["update", "stage", "swap"]
+
+    def test_failed_update_restores_service(self, tmp_path: Path) -> None:
+        """The service is restored from its backup when the update fails."""
+        manager = _make_manager(tmp_path)
+        mock_service = self._deployed_service(tmp_path)
+        mock_service.deployment.stage.side_effect = RuntimeError("build failed")
+
+        with (
+            patch.object(manager, "load", return_value=mock_service),
+            pytest.raises(RuntimeError, match="build failed"),
+        ):
+            manager.update_service_locally(
+                service_config_id="sc-1", service_template={}  # type: ignore
+            )
+
+        mock_service.restore.assert_called_once_with(backup=tmp_path / "backup")
+        mock_service.deployment.swap.assert_not_called()
+        assert not (tmp_path / "backup").exists()
+
+
 class TestFundingRequirements:
     """Tests for funding_requirements()."""
 
@@ -21,16 +21,21 @@
 
 import json
 import os
+import shutil
 import time
 import typing as t
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from operate.constants import (
+    CONFIG_JSON,
     DEPLOYMENT_DIR,
     DEPLOYMENT_JSON,
+    DEPLOYMENT_PREVIOUS_DIR,
+    DEPLOYMENT_STAGING_DIR,
     HEALTHCHECK_JSON,
     ZERO_ADDRESS,
 )
@@ -49,8 +54,12 @@ from operate.services.service import (
     HostDeploymentGenerator,
     Service,
     ServiceHelper,
+    _agent_is_healthy,
+    _move_build,
+    _try_rmtree,
     remove_service_network,
 )
+from operate.utils.event_bus import DEPLOYMENT_STATUS_EVENT
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -607,6 +616,28 @@ class TestDeploymentNew:
         assert depl.nodes.tendermint == []
 
 
+class TestDeploymentStore:
+    """Tests for Deployment.store()."""
+
+    def test_store_publishes_status(self, tmp_path: Path) -> None:
+        """Each store publishes the status, keyed so that repeats are dropped."""
+        service_path = tmp_path / "sc-1"
+        service_path.mkdir()
+        with patch("operate.services.service.event_bus") as mock_bus:
+            depl = Deployment.new(path=service_path)
+            depl.status = DeploymentStatus.DEPLOYED
+            depl.store()
+
+        assert [c.args[1] for c in mock_bus.publish.call_args_list] == [
+            {"service_config_id": "sc-1", "status": DeploymentStatus.CREATED.value},
+            {"service_config_id": "sc-1", "status": DeploymentStatus.DEPLOYED.value},
+        ]
+        assert mock_bus.publish.call_args.kwargs["key"] == (
+            DEPLOYMENT_STATUS_EVENT,
+            "sc-1",
+        )
+
+
 class TestDeploymentLoad:
     """Tests for Deployment.load()."""
 
@@ -618,6 +649,79 @@ class TestDeploymentLoad:
         assert loaded.status == DeploymentStatus.CREATED
 
 
+class TestTryRmtree:
+    """Tests for _try_rmtree()."""
+
+    def test_removes_tree(self, tmp_path: Path) -> None:
+        """A removable tree is removed."""
+        (tmp_path / "build" / "agent").mkdir(parents=True)
+        assert _try_rmtree(tmp_path / "build")
+        assert not (tmp_path / "build").exists()
+
+    def test_failure_is_reported(self, tmp_path: Path) -> None:
+        """A failed removal returns False instead of raising."""
+        with patch(
+            "operate.services.service.shutil.rmtree",
+            side_effect=PermissionError("in use"),
+        ):
+            assert not _try_rmtree(tmp_path)
+
+
+class TestMoveBuild:
+    """Tests for _move_build()."""
+
+    def test_moves_tree(self, tmp_path: Path) -> None:
+        """A build is moved as a whole."""
+        (tmp_path / "src" / "agent").mkdir(parents=True)
+        _move_build(tmp_path / "src", tmp_path / "dst")
+        assert (tmp_path / "dst" / "agent").is_dir()
+        assert not (tmp_path / "src").exists()
+
+    def test_failure_is_raised(self, tmp_path: Path) -> None:
+        """A build which cannot be moved before the timeout raises."""
+        with (
+            patch(
+                "operate.services.service.os.replace",
+                side_effect=PermissionError("in use"),
+            ),
+            patch("operate.services.service.BUILD_DIR_REMOVAL_TIMEOUT", 0),
+            pytest.raises(PermissionError, match="in use"),
+        ):
+            _move_build(tmp_path / "src", tmp_path / "dst")
+
+
+class TestAgentIsHealthy:
+    """Tests for _agent_is_healthy()."""
+
+    @pytest.mark.parametrize(
+        ("status_code", "healthcheck", "healthy"),
+        [
+            (200, {"is_healthy": True}, True),
+            (200, {"is_healthy": False}, False),
+            (200, {"is_transitioning_fast": True}, True),
+            (200, {}, False),
+            (503, {"is_healthy": True}, False),
+        ],
+    )
+    def test_status(
+        self, status_code: int, healthcheck: t.Dict[str, t.Any], healthy: bool
+    ) -> None:
+        """The agent is healthy once its healthcheck responds OK and reports so."""
+        with patch("operate.services.service.requests.get") as mock_get:
+            mock_get.return_value.status_code = status_code
+            mock_get.return_value.json.return_value = healthcheck
+            assert _agent_is_healthy() is healthy
+
+    @pytest.mark.parametrize(
+        "error", [requests.ConnectionError("refused"), ValueError("not json")]
+    )
+    def test_no_healthcheck(self, error: Exception) -> None:
+        """An agent not listening yet, or not answering JSON, is not healthy."""
+        with patch("operate.services.service.requests.get") as mock_get:
+            mock_get.side_effect = error
+            assert _agent_is_healthy() is False
+
+
 class TestDeploymentCopyLogs:
     """Tests for Deployment.copy_previous_agent_run_logs()."""
 
@@ -711,6 +815,336 @@ class TestDeploymentStart:
         assert depl.status == DeploymentStatus.DEPLOYED
 
 
+class TestDeploymentRestart:
+    """Tests for Deployment.restart()."""
+
+    def test_restart_raises_when_not_deployed_or_built(self, tmp_path: Path) -> None:
+        """restart() raises NotAllowed while the deployment is in transition."""
+        depl = _make_deployment(tmp_path, DeploymentStatus.STOPPING)
+        with pytest.raises(NotAllowed):
+            depl.restart(password="pw")  # nosec B106
+
+    def test_restart_calls_restart_host_deployment(self, tmp_path: Path) -> None:
+        """restart() restarts the host processes and ends DEPLOYED."""
+        depl = _make_deployment(tmp_path, DeploymentStatus.DEPLOYED)
+
+        with patch("operate.services.service.restart_host_deployment") as mock_restart:
+            depl.restart(password="pw", is_aea=False)  # nosec B106
+
+        mock_restart.assert_called_once_with(
+            build_dir=tmp_path / DEPLOYMENT_DIR,
+            password="pw",  # nosec B106
+            is_aea=False,
+        )
+        assert depl.status == DeploymentStatus.DEPLOYED
+
+    def test_restart_exception_resets_status_to_built(self, tmp_path: Path) -> None:
+        """restart() resets status to BUILT and re-raises when it fails."""
+        depl = _make_deployment(tmp_path, DeploymentStatus.DEPLOYED)
+
+        with (
+            patch(
+                "operate.services.service.restart_host_deployment",
+                side_effect=RuntimeError("fail"),
+            ),
+            pytest.raises(RuntimeError, match="fail"),
+        ):
+            depl.restart(password="pw")  # nosec B106
+
+        assert depl.status == DeploymentStatus.BUILT
+
+
+class TestDeploymentStage:
+    """Tests for Deployment.stage()."""
+
+    @pytest.fixture(autouse=True)
+    def _package(self) -> t.Iterator[None]:
+        """Skip reading the service package."""
+        mock_helper = MagicMock()
+        mock_helper.config.number_of_agents = 1
+        with (
+            patch.object(Service, "helper", mock_helper),
+            patch.object(Service, "service_public_id", return_value="v/t:1.0.0"),
+        ):
+            yield
+
+    def test_stage_next_to_running_build(self, tmp_path: Path) -> None:
+        """stage() builds and sets up the staging dir for the deployment dir."""
+        service = _make_service(
+            tmp_path,
+            env_variables={
+                "SSL_KEY_PATH": {
+                    "name": "SSL key",
+                    "description": "",
+                    "value": "",
+                    "provision_type": ServiceEnvProvisionType.COMPUTED.value,
+                }
+            },
+        )
+        depl = _make_deployment(service.path, DeploymentStatus.DEPLOYED)
+        staging = service.path / DEPLOYMENT_STAGING_DIR
+        (staging / "stale").mkdir(parents=True)
+        mock_km = MagicMock()
+        mock_km.get.side_effect = lambda address: {"address": address}
+        env: t.Dict[str, str] = {}
+
+        def _generate_host_build(build: Path, **kwargs: t.Any) -> None:
+            env.update(os.environ)
+            build.mkdir(exist_ok=True)
+
+        with (
+            patch(
+                "operate.services.service.create_ssl_certificate",
+                return_value=(
+                    staging / "ssl" / "key.pem",
+                    staging / "ssl" / "cert.pem",
+                ),
+            ),
+            patch.object(
+                depl, "_generate_host_build", side_effect=_generate_host_build
+            ) as mock_generate,
+            patch("operate.services.service.prepare_host_deployment") as mock_prepare,
+        ):
+            fingerprint = depl.stage(keys_manager=mock_km, password="pw")  # nosec
+
+        assert mock_generate.call_args.kwargs["build"] == staging
+        assert mock_generate.call_args.kwargs["chain"] == "gnosis"
+        mock_prepare.assert_called_once_with(
+            build_dir=staging, password="pw", is_aea=True  # nosec B106
+        )
+        assert not (staging / "stale").exists()
+        assert env["SSL_KEY_PATH"] == str(
+            service.path / DEPLOYMENT_DIR / "ssl" / "key.pem"
+        )
+        assert "SSL_KEY_PATH" not in os.environ
+        assert fingerprint == depl._get_build_fingerprint(
+            service=Service.load(service.path),
+            keys_manager=mock_km,
+            use_docker=False,
+            chain="gnosis",
+        )
+        assert depl.status == DeploymentStatus.DEPLOYED
+
+    def test_failed_stage_is_removed(self, tmp_path: Path) -> None:
+        """A staging dir which fails to set up is removed."""
+        service = _make_service(tmp_path)
+        depl = _make_deployment(service.path, DeploymentStatus.DEPLOYED)
+
+        with (
+            patch(
+                "operate.services.service.create_ssl_certificate",
+                return_value=(Path("/ssl/key.pem"), Path("/ssl/cert.pem")),
+            ),
+            patch.object(
+                depl,
+                "_generate_host_build",
+                side_effect=lambda build, **_: build.mkdir(),
+            ),
+            patch(
+                "operate.services.service.prepare_host_deployment",
+                side_effect=RuntimeError("setup failed"),
+            ),
+            pytest.raises(RuntimeError, match="setup failed"),
+        ):
+            depl.stage(keys_manager=MagicMock(), password="pw")  # nosec B106
+
+        assert not (service.path / DEPLOYMENT_STAGING_DIR).exists()
+
+    def test_multi_agent_service_is_not_staged(self, tmp_path: Path) -> None:
+        """Staging a service with several agents fails before building it."""
+        service = _make_service(tmp_path)
+        depl = _make_deployment(service.path, DeploymentStatus.DEPLOYED)
+        mock_helper = MagicMock()
+        mock_helper.config.number_of_agents = 2
+
+        with (
+            patch.object(Service, "helper", mock_helper),
+            patch.object(depl, "_generate_host_build") as mock_generate,
+            pytest.raises(RuntimeError, match="single agent deployments"),
+        ):
+            depl.stage(keys_manager=MagicMock(), password="pw")  # nosec B106
+
+        mock_generate.assert_not_called()
+        assert not (service.path / DEPLOYMENT_STAGING_DIR).exists()
+
+
+class TestDeploymentSwap:
+    """Tests for Deployment.swap()."""
+
+    @staticmethod
+    def _stage(tmp_path: Path) -> Deployment:
+        """A deployment running a build, with another one staged."""
+        depl = _make_deployment(tmp_path, DeploymentStatus.DEPLOYED)
+        for name in (DEPLOYMENT_DIR, DEPLOYMENT_STAGING_DIR):
+            (tmp_path / name / "agent").mkdir(parents=True)
+            (tmp_path / name / "agent.json").write_text(name, encoding="utf-8")
+        (tmp_path / DEPLOYMENT_DIR / "agent" / "log.txt").write_text("old run")
+        return depl
+
+    def test_swap(self, tmp_path: Path) -> None:
+        """The staged build replaces the running one once its agent is healthy."""
+        depl = self._stage(tmp_path)
+        (tmp_path / DEPLOYMENT_PREVIOUS_DIR / "leftover").mkdir(parents=True)
+        with (
+            patch("operate.services.service.stop_host_deployment") as mock_stop,
+            patch("operate.services.service.relocate_host_deployment") as mock_relocate,
+            patch("operate.services.service.restart_host_deployment") as mock_restart,
+            patch(
+                "operate.services.service._agent_is_healthy",
+                return_value=True,
+            ),
+        ):
+            depl.swap(
+                password="pw",  # nosec B106
+                is_aea=False,
+                previous_is_aea=True,
+                build_fingerprint="fp",
+            )
+
+        build = tmp_path / DEPLOYMENT_DIR
+        mock_stop.assert_called_once_with(build_dir=build, is_aea=True)
+        mock_relocate.assert_called_once_with(
+            build_dir=build,
+            previous_dir=tmp_path / DEPLOYMENT_STAGING_DIR,
+            is_aea=False,
+        )
+        mock_restart.assert_called_once_with(
+            build_dir=build, password="pw", is_aea=False  # nosec B106
+        )
+        assert (build / "agent.json").read_text() == DEPLOYMENT_STAGING_DIR
+        assert (tmp_path / "prev_log.txt").read_text() == "old run"
+        assert not (tmp_path / DEPLOYMENT_STAGING_DIR).exists()
+        assert not (tmp_path / DEPLOYMENT_PREVIOUS_DIR).exists()
+        stored = Deployment.load(tmp_path)
+        assert stored.status == DeploymentStatus.DEPLOYED
+        assert stored.build_fingerprint == "fp"
+
+    def test_unhealthy_swap_is_rolled_back(self, tmp_path: Path) -> None:
+        """The previous build is restarted if the staged agent never gets healthy."""
+        depl = self._stage(tmp_path)
+        build = tmp_path / DEPLOYMENT_DIR
+        with (
+            patch("operate.services.service.stop_host_deployment") as mock_stop,
+            patch("operate.services.service.relocate_host_deployment"),
+            patch("operate.services.service.restart_host_deployment") as mock_restart,
+            patch(
+                "operate.services.service._agent_is_healthy",
+                return_value=False,
+            ),
+            patch("operate.services.service.FIRST_HEALTHCHECK_TIMEOUT", 0),
+            pytest.raises(RuntimeError, match="did not report healthy"),
+        ):
+            depl.swap(password="pw", previous_is_aea=False)  # nosec B106
+
+        assert mock_stop.call_count == 2
+        assert mock_restart.call_args_list[-1].kwargs == {
+            "build_dir": build,
+            "password": "pw",  # nosec B106
+            "is_aea": False,
+        }
+        assert (build / "agent.json").read_text() == DEPLOYMENT_DIR
+        assert not (tmp_path / DEPLOYMENT_PREVIOUS_DIR).exists()
+        assert Deployment.load(tmp_path).status == DeploymentStatus.DEPLOYED
+
+    def test_failed_staging_move_is_rolled_back(self, tmp_path: Path) -> None:
+        """The previous build is restarted if the staged one cannot be moved in."""
+        depl = self._stage(tmp_path)
+        build = tmp_path / DEPLOYMENT_DIR
+        move_build = _move_build
+
+        def _move(source: Path, destination: Path) -> None:
+            if source.name == DEPLOYMENT_STAGING_DIR:
+                raise PermissionError("file in use")
+            move_build(source, destination)
+
+        with (
+            patch("operate.services.service._move_build", side_effect=_move),
+            patch("operate.services.service.stop_host_deployment") as mock_stop,
+            patch("operate.services.service.relocate_host_deployment"),
+            patch("operate.services.service.restart_host_deployment") as mock_restart,
+            pytest.raises(PermissionError, match="file in use"),
+        ):
+            depl.swap(password="pw", previous_is_aea=False)  # nosec B106
+
+        # only the running build was stopped; there was no staged one to stop
+        mock_stop.assert_called_once()
+        mock_restart.assert_called_once_with(
+            build_dir=build, password="pw", is_aea=False  # nosec B106
+        )
+        assert (build / "agent.json").read_text() == DEPLOYMENT_DIR
+        assert not (tmp_path / DEPLOYMENT_PREVIOUS_DIR).exists()
+        assert Deployment.load(tmp_path).status == DeploymentStatus.DEPLOYED
+
+    def test_staged_build_failing_to_stop_is_still_rolled_back(
+        self, tmp_path: Path
+    ) -> None:
+        """The staged build is removed even if stopping its processes fails."""
+        depl = self._stage(tmp_path)
+        build = tmp_path / DEPLOYMENT_DIR
+        with (
+            patch(
+                "operate.services.service.stop_host_deployment",
+                side_effect=[None, ValueError("Service already in transition")],
+            ),
+            patch("operate.services.service.relocate_host_deployment"),
+            patch("operate.services.service.restart_host_deployment") as mock_restart,
+            patch("operate.services.service._agent_is_healthy", return_value=False),
+            patch("operate.services.service.FIRST_HEALTHCHECK_TIMEOUT", 0),
+            patch("operate.services.service.logger") as mock_logger,
+            pytest.raises(RuntimeError, match="did not report healthy"),
+        ):
+            depl.swap(password="pw")  # nosec B106
+
+        mock_logger.exception.assert_called_once_with(
+            "Failed to stop the staged deployment"
+        )
+        assert mock_restart.call_count == 2
+        assert (build / "agent.json").read_text() == DEPLOYMENT_DIR
+        assert Deployment.load(tmp_path).status == DeploymentStatus.DEPLOYED
+
+    def test_staged_build_is_removed_after_the_removal_timeout(
+        self, tmp_path: Path
+    ) -> None:
+        """A staged build still locked after the timeout is removed at once."""
+        depl = self._stage(tmp_path)
+        build = tmp_path / DEPLOYMENT_DIR
+        with (
+            patch("operate.services.service.stop_host_deployment"),
+            patch("operate.services.service.relocate_host_deployment"),
+            patch("operate.services.service.restart_host_deployment"),
+            patch("operate.services.service._agent_is_healthy", return_value=False),
+            patch("operate.services.service.FIRST_HEALTHCHECK_TIMEOUT", 0),
+            patch("operate.services.service._try_rmtree", return_value=False),
+            patch("operate.services.service.BUILD_DIR_REMOVAL_TIMEOUT", 0),
+            pytest.raises(RuntimeError, match="did not report healthy"),
+        ):
+            depl.swap(password="pw")  # nosec B106
+
+        assert (build / "agent.json").read_text() == DEPLOYMENT_DIR
+        assert not (tmp_path / DEPLOYMENT_PREVIOUS_DIR).exists()
+
+    def test_failed_stop_keeps_running_build(self, tmp_path: Path) -> None:
+        """A build which cannot be stopped is left in place."""
+        depl = self._stage(tmp_path)
+        with (
+            patch(
+                "operate.services.service.stop_host_deployment",
+                side_effect=ValueError("Service already in transition"),
+            ),
+            pytest.raises(ValueError, match="in transition"),
+        ):
+            depl.swap(password="pw")  # nosec B106
+
+        assert (tmp_path / DEPLOYMENT_DIR / "agent.json").read_text() == DEPLOYMENT_DIR
+        assert depl.status == DeploymentStatus.BUILT
+
+    def test_swap_without_stage(self, tmp_path: Path) -> None:
+        """swap() needs a staged deployment."""
+        depl = _make_deployment(tmp_path, DeploymentStatus.DEPLOYED)
+        with pytest.raises(NotAllowed, match="no staged deployment"):
+            depl.swap(password="pw")  # nosec B106
+
+
 class TestDeploymentStop:
     """Tests for Deployment.stop()."""
 
@@ -981,6 +1415,126 @@ class TestDeploymentBuild:
         del os.environ[original_key]
 
 
+class TestDeploymentBuildFingerprint:
+    """Tests for reusing builds made from the same inputs."""
+
+    def _build(
+        self, depl: Deployment, force: bool = False, **kwargs: t.Any
+    ) -> MagicMock:
+        """Run build() with a host build creating the build dir; return its mock."""
+        mock_km = MagicMock()
+        mock_km.get.side_effect = lambda address: {"address": address}
+
+        def _build_host(**_: t.Any) -> None:
+            (depl.path / DEPLOYMENT_DIR).mkdir(exist_ok=True)
+            depl.status = DeploymentStatus.BUILT
+
+        with (
+            patch(
+                "operate.services.service.create_ssl_certificate",
+                return_value=(Path("/ssl/key.pem"), Path("/ssl/cert.pem")),
+            ),
+            patch.object(depl, "_build_host", side_effect=_build_host) as mock_bh,
+        ):
+            depl.build(keys_manager=mock_km, force=force, **kwargs)
+        return mock_bh
+
+    def test_unchanged_build_is_reused(self, tmp_path: Path) -> None:
+        """A second build from the same inputs only refreshes the run logs."""
+        service = _make_service(tmp_path)
+        depl = Deployment.new(path=service.path)
+        self._build(depl).assert_called_once()
+        fingerprint = depl.build_fingerprint
+        assert fingerprint is not None
+        assert Deployment.load(service.path).build_fingerprint == fingerprint
+
+        log = service.path / DEPLOYMENT_DIR / "agent" / "log.txt"
+        log.parent.mkdir()
+        log.write_text("previous run", encoding="utf-8")
+        depl.status = DeploymentStatus.STOPPING
+        self._build(depl).assert_not_called()
+        assert depl.status == DeploymentStatus.BUILT
+        assert (service.path / "prev_log.txt").read_text() == "previous run"
+        assert depl.build_fingerprint == fingerprint
+
+        self._build(depl, force=True).assert_called_once()
+
+    def test_reused_build_does_not_reuse_tendermint_state(self, tmp_path: Path) -> None:
+        """The chain data of the previous run is reset, unlike the node keys."""
+        service = _make_service(tmp_path)
+        depl = Deployment.new(path=service.path)
+        self._build(depl)
+        home = service.path / DEPLOYMENT_DIR / "node"
+        (home / "data" / "blockstore.db").mkdir(parents=True)
+        (home / "config").mkdir()
+        (home / "config" / "node_key.json").write_text("key", encoding="utf-8")
+
+        self._build(depl).assert_not_called()
+        assert not (home / "data" / "blockstore.db").exists()
+        assert (home / "data" / "priv_validator_state.json").exists()
+        assert (home / "config" / "node_key.json").read_text() == "key"
+
+    def test_build_that_cannot_be_reset_is_rebuilt(self, tmp_path: Path) -> None:
+        """A build whose tendermint state cannot be reset is built again."""
+        service = _make_service(tmp_path)
+        depl = Deployment.new(path=service.path)
+        self._build(depl)
+        with patch(
+            "operate.services.service.reset_tendermint_state",
+            side_effect=PermissionError("owned by root"),
+        ):
+            self._build(depl).assert_called_once()
+
+    def test_changed_inputs_rebuild(self, tmp_path: Path) -> None:
+        """Env variables, chain data or runner type changes invalidate the build."""
+        service = _make_service(tmp_path)
+        depl = Deployment.new(path=service.path)
+        self._build(depl)
+        fingerprint = depl.build_fingerprint
+
+        _write_service_config(
+            service.path,
+            env_variables={
+                "VAR": {
+                    "name": "VAR",
+                    "description": "",
+                    "value": "changed",
+                    "provision_type": "fixed",
+                }
+            },
+        )
+        self._build(depl).assert_called_once()
+        assert depl.build_fingerprint != fingerprint
+
+        fingerprint = depl.build_fingerprint
+        self._build(depl, chain="base").assert_called_once()
+        assert depl.build_fingerprint != fingerprint
+
+    def test_missing_build_dir_rebuilds(self, tmp_path: Path) -> None:
+        """A deleted build is not reused."""
+        service = _make_service(tmp_path)
+        depl = Deployment.new(path=service.path)
+        self._build(depl)
+        depl.delete()
+        self._build(depl).assert_called_once()
+
+    def test_kubernetes_builds_are_not_fingerprinted(self, tmp_path: Path) -> None:
+        """Kubernetes builds live elsewhere and are always rebuilt."""
+        service = _make_service(tmp_path)
+        depl = Deployment.new(path=service.path)
+        with (
+            patch(
+                "operate.services.service.create_ssl_certificate",
+                return_value=(Path("/ssl/key.pem"), Path("/ssl/cert.pem")),
+            ),
+            patch.object(depl, "_build_kubernetes") as mock_bk,
+        ):
+            depl.build(keys_manager=MagicMock(), use_kubernetes=True, force=False)
+            depl.build(keys_manager=MagicMock(), use_kubernetes=True, force=False)
+        assert mock_bk.call_count == 2
+        assert depl.build_fingerprint is None
+
+
 # ---------------------------------------------------------------------------
 # tests for Service.helper and Service.deployment properties
 # ---------------------------------------------------------------------------
@@ -1505,6 +2059,86 @@ class TestServiceUpdate:
         assert new_staking != original_staking
         assert new_staking == "updated_staking_partial"
 
+    def test_update_keeps_package_until_downloaded(self, tmp_path: Path) -> None:
+        """update() replaces the previous package only once the new one is downloaded."""
+        service = _make_service(tmp_path)
+        previous_package = service.path / service.package_path
+        previous_package.mkdir()
+        seen: t.List[bool] = []
+
+        def _download(hash_id: str, target_dir: str) -> str:
+            seen.append(previous_package.exists())
+            package = Path(target_dir) / "new_pkg"
+            package.mkdir()
+            (package / "service.yaml").touch()
+            return str(package)
+
+        mock_ipfs = MagicMock()
+        mock_ipfs.download.side_effect = _download
+        with (
+            patch(
+                "operate.services.service.Service.get_service_public_id",
+                return_value=self._CURRENT_PUBLIC_ID,
+            ),
+            patch.object(
+                service, "service_public_id", return_value=self._CURRENT_PUBLIC_ID
+            ),
+            patch("operate.services.service.IPFSTool", return_value=mock_ipfs),
+            patch("operate.services.service.ServiceHelper"),
+        ):
+            service.update(self._base_template(service, hash="newHash123"))
+
+        assert seen == [True]
+        assert not previous_package.exists()
+        assert service.package_path == Path("new_pkg")
+        assert (service.path / "new_pkg" / "service.yaml").exists()
+        assert Service.load(service.path).package_path == Path("new_pkg")
+
+
+# ---------------------------------------------------------------------------
+# tests for Service.backup and Service.restore
+# ---------------------------------------------------------------------------
+
+
+class TestServiceBackup:
+    """Tests for Service.backup() and Service.restore()."""
+
+    @pytest.fixture(autouse=True)
+    def _public_id(self) -> t.Iterator[None]:
+        """Skip reading the service package."""
+        with patch.object(Service, "service_public_id", return_value="v/t:1.0.0"):
+            yield
+
+    def test_restore(self, tmp_path: Path) -> None:
+        """restore() brings back the configuration and package of the backup."""
+        service = _make_service(tmp_path)
+        package = service.path / service.package_path
+        package.mkdir()
+        (package / "service.yaml").write_text("previous", encoding="utf-8")
+        backup = service.backup()
+
+        (service.path / "new_pkg").mkdir()
+        service.package_path = Path("new_pkg")
+        service.name = "Updated"
+        service.store()
+        shutil.rmtree(package)
+
+        restored = service.restore(backup=backup)
+
+        assert restored.path == service.path
+        assert restored.name == "Test"
+        assert Service.load(service.path).package_path == Path("trader_pearl")
+        assert (package / "service.yaml").read_text() == "previous"
+        assert not (service.path / "new_pkg").exists()
+
+    def test_backup_replaces_previous_backup(self, tmp_path: Path) -> None:
+        """backup() does not keep files of an earlier backup."""
+        service = _make_service(tmp_path)
+        backup = service.backup()
+        (backup / "stale").touch()
+        assert service.backup() == backup
+        assert sorted(p.name for p in backup.iterdir()) == [CONFIG_JSON]
+
 
 # ---------------------------------------------------------------------------
 # tests for Service.update_user_params_from_template
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/services/deploy_timings.py."""
+
+import threading
+import typing as t
+
+import pytest
+
+from operate import __version__
+from operate.services.deploy_timings import DeployTiming, DeployTimings, PhaseTiming
+from operate.utils.metrics import DEPLOY_PHASE_DURATION
+
+
+def _duration(timing: t.Union[DeployTiming, PhaseTiming]) -> float:
+    """Duration of a finished deploy or phase."""
+    assert timing.duration is not None
+    return timing.duration
+
+
+class TestDeployTimings:
+    """Tests for DeployTimings."""
+
+    def test_phases_of_a_deploy(self) -> None:
+        """Phases are recorded in order, nested ones within their parent."""
+        timings = DeployTimings()
+        observed = DEPLOY_PHASE_DURATION.count("venv")
+        with timings.track("svc") as deploy:
+            with timings.phase("build"):
+                with timings.phase("venv"):
+                    pass
+            with timings.phase("start"):
+                pass
+
+        assert deploy.status == "completed"
+        build, venv, start = deploy.phases
+        assert [build.name, venv.name, start.name] == ["build", "venv", "start"]
+        assert build.offset <= venv.offset <= start.offset
+        assert venv.offset + _duration(venv) <= build.offset + _duration(build)
+        assert _duration(deploy) >= build.offset + _duration(build)
+        assert DEPLOY_PHASE_DURATION.count("venv") == observed + 1
+
+        payload = timings.json("svc")
+        assert payload["operate_version"] == __version__
+        assert payload["deploys"] == [deploy.json]
+
+    def test_failed_phase(self) -> None:
+        """A failing phase fails the deploy."""
+        timings = DeployTimings()
+
+        def _deploy() -> None:
+            with timings.track("svc"), timings.phase("download"):
+                raise RuntimeError("no network")
+
+        with pytest.raises(RuntimeError, match="no network"):
+            _deploy()
+
+        [deploy] = timings.json("svc")["deploys"]
+        assert deploy["status"] == "failed"
+        assert deploy["phases"][0]["failed"]
+        assert deploy["duration"] is not None
+
+    def test_phase_outside_a_deploy(self) -> None:
+        """Phases of code not running as part of a deploy are not recorded."""
+        timings = DeployTimings()
+        with timings.phase("build"):
+            pass
+        assert timings.json("svc")["deploys"] == []
+
+    def test_deploys_are_tracked_per_thread(self) -> None:
+        """Concurrent deploys record their own phases."""
+        timings = DeployTimings()
+        barrier = threading.Barrier(2)
+
+        def _deploy(service_config_id: str) -> None:
+            with timings.track(service_config_id):
+                barrier.wait()
+                with timings.phase(f"build-{service_config_id}"):
+                    barrier.wait()
+
+        threads = [threading.Thread(target=_deploy, args=(i,)) for i in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for service_config_id in ("a", "b"):
+            [deploy] = timings.json(service_config_id)["deploys"]
+            assert [p["name"] for p in deploy["phases"]] == [
+                f"build-{service_config_id}"
+            ]
+
+    def test_history_size(self) -> None:
+        """Only the most recent deploys of a service are kept."""
+        timings = DeployTimings(size=2)
+        for _ in range(3):
+            with timings.track("svc"):
+                pass
+        assert len(timings.json("svc")["deploys"]) == 2
+
+    def test_first_healthy(self) -> None:
+        """Only the first healthy probe after a completed deploy is recorded."""
+        timings = DeployTimings()
+        timings.healthy("svc")
+        with timings.track("svc") as deploy:
+            timings.healthy("svc")
+        assert deploy.first_healthy_after is None
+
+        timings.healthy("svc")
+        first_healthy_after = deploy.first_healthy_after
+        assert first_healthy_after is not None
+        assert first_healthy_after >= _duration(deploy)
+        timings.healthy("svc")
+        assert deploy.first_healthy_after == first_healthy_after
@@ -23,7 +23,7 @@ import json
 import logging
 import typing as t
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from deepdiff import DeepDiff
@@ -36,6 +36,7 @@ from operate.services.service import (
     SERVICE_CONFIG_VERSION,
     Service,
 )
+from operate.utils.event_bus import ACHIEVEMENT_EVENT
 
 from tests.conftest import TestOperateSevice
 
@@ -683,6 +684,19 @@ class TestServiceAchievementsNotifications:
         assert "achievement_1" in achievements_notifications.notifications
         assert "achievement_2" in achievements_notifications.notifications
 
+        # New achievements are published once
+        with patch("operate.services.service.event_bus") as mock_bus:
+            achievements_notifications.notifications.pop("achievement_2")
+            achievements_notifications.store()
+            service._load_achievements_notifications()
+        mock_bus.publish.assert_called_once_with(
+            ACHIEVEMENT_EVENT,
+            {
+                "service_config_id": service.service_config_id,
+                "achievement_id": "achievement_2",
+            },
+        )
+
     def test_load_achievements_notifications_invalid_json(
         self, test_operate_service: TestOperateSevice, caplog: pytest.LogCaptureFixture
     ) -> None:
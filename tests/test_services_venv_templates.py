@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/services/venv_templates.py."""
+
+import base64
+import hashlib
+import logging
+import os
+import subprocess  # nosec
+import typing as t
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from operate.services.venv_templates import VenvTemplateCache
+
+REQUIREMENTS = ["demo-pkg==0.1.0"]
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Posix venv layout")
+
+
+def _build_wheel(wheelhouse: Path) -> None:
+    """Build a minimal wheel with a console script."""
+    dist_info = "demo_pkg-0.1.0.dist-info"
+    files = {
+        "demo_pkg/__init__.py": "def main():\n    print('hello from demo')\n",
+        f"{dist_info}/METADATA": "Metadata-Version: 2.1\nName: demo-pkg\nVersion: 0.1.0\n",
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nGenerator: test\n"
+            "Root-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+        f"{dist_info}/entry_points.txt": "[console_scripts]\ndemo-hello = demo_pkg:main\n",
+    }
+    record = []
+    for name, content in files.items():
+        digest = base64.urlsafe_b64encode(hashlib.sha256(content.encode()).digest())
+        record.append(f"{name},sha256={digest.decode().rstrip('=')},{len(content)}")
+    record.append(f"{dist_info}/RECORD,,")
+    files[f"{dist_info}/RECORD"] = "\n".join(record) + "\n"
+
+    wheelhouse.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(wheelhouse / "demo_pkg-0.1.0-py3-none-any.whl", "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+
+
+def _run_cmd(args: t.List[str]) -> None:
+    result = subprocess.run(args, capture_output=True, check=False)  # nosec
+    if result.returncode != 0:
+        raise RuntimeError(f"Error running: {args}\n{result.stderr.decode()}")
+
+
+@pytest.fixture(scope="module")
+def wheelhouse(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A local wheelhouse with the demo package."""
+    path = tmp_path_factory.mktemp("wheelhouse")
+    _build_wheel(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def cache(tmp_path_factory: pytest.TempPathFactory) -> VenvTemplateCache:
+    """A template cache."""
+    return VenvTemplateCache(
+        path=tmp_path_factory.mktemp("templates"),
+        logger=logging.getLogger("test"),
+        run_cmd=_run_cmd,
+    )
+
+
+@pytest.fixture(scope="module")
+def template(cache: VenvTemplateCache, wheelhouse: Path) -> Path:
+    """The template for the demo requirements, created offline."""
+    return cache.get_or_create(REQUIREMENTS, wheelhouse=wheelhouse)
+
+
+class TestVenvTemplateCache:
+    """Tests for VenvTemplateCache."""
+
+    def test_key(self) -> None:
+        """Keys depend on the requirements set, not their order."""
+        assert VenvTemplateCache.key(["a", "b"]) == VenvTemplateCache.key(["b", "a"])
+        assert VenvTemplateCache.key(["a"]) != VenvTemplateCache.key(["a", "b"])
+
+    def test_created_once(
+        self, cache: VenvTemplateCache, template: Path, wheelhouse: Path
+    ) -> None:
+        """A template is created once and then reused."""
+        assert template == cache.template_path(REQUIREMENTS)
+        assert (template / VenvTemplateCache.MARKER).exists()
+        assert [p.name for p in cache.path.iterdir()] == [template.name]
+
+        run_cmd = cache.run_cmd
+        cache.run_cmd = lambda args: pytest.fail("Template created again")
+        try:
+            assert cache.get_or_create(REQUIREMENTS, wheelhouse=wheelhouse) == template
+        finally:
+            cache.run_cmd = run_cmd
+
+    def test_clone(
+        self, cache: VenvTemplateCache, template: Path, tmp_path: Path
+    ) -> None:
+        """Clones are working venvs at their own location."""
+        template_files = {p: p.read_bytes() for p in template.rglob("*") if p.is_file()}
+        target = tmp_path / "service" / "venv"
+        cache.clone(template, target)
+        # cloning over an existing venv replaces it
+        cache.clone(template, target)
+
+        result = subprocess.run(  # nosec
+            [str(target / "bin" / "demo-hello")],
+            capture_output=True,
+            check=True,
+        )
+        assert result.stdout == b"hello from demo\n"
+        script = (target / "bin" / "demo-hello").read_text()
+        assert script.startswith(f"#!{target}/bin/python")
+        assert str(target) in (target / "bin" / "activate").read_text()
+        assert str(target) in (target / "pyvenv.cfg").read_text()
+        assert not (target / VenvTemplateCache.MARKER).exists()
+        assert (target / "bin" / "python").is_symlink()
+
+        package = target / "lib"
+        init = next(package.rglob("demo_pkg/__init__.py"))
+        assert (
+            init.stat().st_ino
+            == next(template.rglob("demo_pkg/__init__.py")).stat().st_ino
+        )
+
+        # the template is left untouched
+        assert template_files == {
+            p: p.read_bytes() for p in template.rglob("*") if p.is_file()
+        }
+
+    def test_relocate(
+        self, cache: VenvTemplateCache, template: Path, tmp_path: Path
+    ) -> None:
+        """A moved clone works once relocated."""
+        cache.clone(template, tmp_path / "staging" / "venv")
+        os.replace(tmp_path / "staging", tmp_path / "deployment")
+        target = tmp_path / "deployment" / "venv"
+        VenvTemplateCache.relocate(
+            venv=target,
+            old_prefix=tmp_path / "staging",
+            new_prefix=tmp_path / "deployment",
+        )
+
+        result = subprocess.run(  # nosec
+            [str(target / "bin" / "demo-hello")],
+            capture_output=True,
+            check=True,
+        )
+        assert result.stdout == b"hello from demo\n"
+        assert str(tmp_path / "staging") not in (target / "pyvenv.cfg").read_text()
+        assert (target / "bin" / "python").is_symlink()
+
+    def test_relocate_skips_directories(self, tmp_path: Path) -> None:
+        """Directories in the bin dir of a moved venv are left alone."""
+        venv = tmp_path / "deployment" / "venv"
+        (venv / "bin" / "__pycache__").mkdir(parents=True)
+        (venv / "pyvenv.cfg").write_text(f"home = {tmp_path / 'staging'}\n")
+
+        VenvTemplateCache.relocate(
+            venv=venv,
+            old_prefix=tmp_path / "staging",
+            new_prefix=tmp_path / "deployment",
+        )
+
+        assert (venv / "bin" / "__pycache__").is_dir()
+        assert (venv / "pyvenv.cfg").read_text() == (
+            f"home = {tmp_path / 'deployment'}\n"
+        )
+
+    def test_clone_across_filesystems(
+        self,
+        cache: VenvTemplateCache,
+        template: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Files are copied where they cannot be hard linked."""
+
+        def _link(*args: t.Any) -> None:
+            raise OSError("Invalid cross-device link")
+
+        monkeypatch.setattr("operate.services.venv_templates.os.link", _link)
+        target = tmp_path / "venv"
+        cache.clone(template, target)
+        init = next(target.rglob("demo_pkg/__init__.py"))
+        assert (
+            init.stat().st_ino
+            != next(template.rglob("demo_pkg/__init__.py")).stat().st_ino
+        )
+        assert (
+            init.read_bytes()
+            == next(template.rglob("demo_pkg/__init__.py")).read_bytes()
+        )
+
+    def test_failed_creation(self, cache: VenvTemplateCache, tmp_path: Path) -> None:
+        """A failed installation leaves no template behind."""
+        with pytest.raises(RuntimeError, match="Error running"):
+            cache.get_or_create(["missing-pkg==1.0"], wheelhouse=tmp_path)
+        assert not cache.template_path(["missing-pkg==1.0"]).exists()
+        assert not list(cache.path.glob(f"{VenvTemplateCache.TMP_PREFIX}*"))
+
+    def test_leftovers_are_removed(self, tmp_path: Path) -> None:
+        """Builds interrupted earlier are removed, incomplete templates replaced."""
+        cache = VenvTemplateCache(
+            path=tmp_path, logger=logging.getLogger("test"), run_cmd=lambda args: None
+        )
+        leftover = tmp_path / f"{VenvTemplateCache.TMP_PREFIX}old"
+        leftover.mkdir()
+        incomplete = cache.template_path(["x"])
+        incomplete.mkdir()
+
+        template = cache.get_or_create(["x"])
+        assert template == incomplete
+        assert (template / VenvTemplateCache.MARKER).exists()
+        assert not leftover.exists()
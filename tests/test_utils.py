@@ -39,6 +39,7 @@ from operate.utils import (
     secure_copy_private_key,
     subtract_dicts,
     unrecoverable_delete,
+    wait_for,
 )
 
 
@@ -204,6 +205,23 @@ class TestSafeFileOperation:
         assert attempts["count"] == 3
 
 
+class TestWaitFor:
+    """Tests for wait_for."""
+
+    def test_returns_once_condition_holds(self) -> None:
+        """The wait ends on the first poll where the condition holds."""
+        results = iter([False, False, True])
+        start = time.monotonic()
+        assert wait_for(lambda: next(results), timeout=5, interval=0.01)
+        assert time.monotonic() - start < 1
+
+    def test_times_out(self) -> None:
+        """A condition that never holds returns False after the timeout."""
+        start = time.monotonic()
+        assert not wait_for(lambda: False, timeout=0.1, interval=0.01)
+        assert 0.1 <= time.monotonic() - start < 1
+
+
 class TestUnrecoverableDelete:
     """Tests for the unrecoverable_delete helper."""
 
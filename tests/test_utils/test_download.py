@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/utils/download.py."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from operate.utils.download import DownloadTracker, RangeDownloader
+
+DATA = os.urandom(8 * 1024)
+DATA_HASH = "sha256:" + hashlib.sha256(DATA).hexdigest()
+
+
+class _RangeServer(ThreadingHTTPServer):
+    """Serves `DATA`, with optional range support and failures."""
+
+    ranges_supported = True
+    part_ranges_supported = True
+    etag = '"v1"'
+    fail_at: t.Optional[int] = None  # drop the connection at this offset
+    short_at: t.Optional[int] = None  # end the response early at this offset
+
+    def __init__(self) -> None:
+        """Listen on a free local port."""
+        super().__init__(("127.0.0.1", 0), _RangeHandler)
+        self.requested: t.List[t.Optional[str]] = []
+
+    @property
+    def url(self) -> str:
+        """URL of the served file."""
+        return f"http://127.0.0.1:{self.server_address[1]}/agent.zip"
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    server: _RangeServer
+
+    def log_message(self, *args: t.Any) -> None:
+        """Keep the test output clean."""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Serve the requested range."""
+        server = self.server
+        header = self.headers.get("Range")
+        server.requested.append(header)
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", header or "")
+        probe = header == "bytes=0-0"
+        if (
+            match is None
+            or not server.ranges_supported
+            or (not probe and not server.part_ranges_supported)
+        ):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(DATA)))
+            self.end_headers()
+            self.wfile.write(DATA)
+            return
+
+        start, end = int(match.group(1)), int(match.group(2))
+        body = DATA[start : end + 1]
+        cut = None
+        for offset in (server.fail_at, server.short_at):
+            if offset is not None and start < offset <= end:
+                cut = offset - start
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(DATA)}")
+        self.send_header("ETag", server.etag)
+        if cut is not None and server.short_at is not None:
+            body = body[:cut]
+            server.short_at = None
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if cut is not None and server.fail_at is not None:
+            server.fail_at = None
+            self.wfile.write(body[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server() -> t.Iterator[_RangeServer]:
+    """A local HTTP server supporting range requests."""
+    range_server = _RangeServer()
+    thread = threading.Thread(target=range_server.serve_forever, daemon=True)
+    thread.start()
+    yield range_server
+    range_server.shutdown()
+    range_server.server_close()
+    thread.join()
+
+
+@pytest.fixture(autouse=True)
+def _small_parts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Split `DATA` in several parts and chunks."""
+    monkeypatch.setattr("operate.utils.download.MIN_PART_SIZE", 1024)
+    monkeypatch.setattr("operate.utils.download.CHUNK_SIZE", 256)
+
+
+def _downloader(server: _RangeServer, path: Path, **kwargs: t.Any) -> RangeDownloader:
+    kwargs.setdefault("tracker", DownloadTracker())
+    return RangeDownloader(url=server.url, path=path, timeout=10, **kwargs)
+
+
+def _requested_bytes(ranges: t.List[t.Optional[str]]) -> int:
+    total = 0
+    for header in ranges:
+        start, end = re.findall(r"\d+", t.cast(str, header))
+        total += int(end) - int(start) + 1
+    return total
+
+
+class TestRangeDownloader:
+    """Tests for RangeDownloader."""
+
+    def test_parallel_download(self, server: _RangeServer, tmp_path: Path) -> None:
+        """The file is fetched in parts and verified."""
+        path = tmp_path / "agent.zip"
+        downloader = _downloader(server, path, expected_hash=DATA_HASH)
+        downloader.run()
+
+        assert path.read_bytes() == DATA
+        assert server.requested[0] == "bytes=0-0"
+        assert sorted(t.cast(t.List[str], server.requested[1:])) == sorted(
+            ["bytes=0-2047", "bytes=2048-4095", "bytes=4096-6143", "bytes=6144-8191"]
+        )
+        assert not downloader.part_path.exists()
+        assert not downloader.journal_path.exists()
+        assert downloader.progress.json["status"] == "completed"
+        assert downloader.progress.downloaded_bytes == len(DATA)
+        assert downloader.tracker.json == [downloader.progress.json]
+
+    def test_resume_after_interruption(
+        self, server: _RangeServer, tmp_path: Path
+    ) -> None:
+        """A second run only fetches what the first one did not write."""
+        path = tmp_path / "agent.zip"
+        server.fail_at = 3000
+        first = _downloader(server, path, expected_hash=DATA_HASH)
+        with pytest.raises(requests.exceptions.RequestException):
+            first.run()
+        assert first.progress.status == "failed"
+        assert not path.exists()
+        journal = json.loads(first.journal_path.read_text())
+        start, end, done = journal["parts"][1]
+        assert (start, end) == (2048, 4095)
+        assert 0 < done <= 3000 - 2048
+
+        server.requested.clear()
+        second = _downloader(server, path, expected_hash=DATA_HASH)
+        second.run()
+        assert path.read_bytes() == DATA
+        assert f"bytes={2048 + done}-4095" in server.requested
+        assert _requested_bytes(server.requested[1:]) < len(DATA)
+        assert second.progress.downloaded_bytes == len(DATA)
+
+    def test_journal_is_written_after_the_data_is_synced(
+        self, server: _RangeServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every journal update follows an fsync of the data and of the journal."""
+        events: t.List[t.Tuple[str, t.Any]] = []
+        fsync, replace = os.fsync, os.replace
+
+        def _fsync(fd: int) -> None:
+            fsync(fd)
+            events.append(("fsync", os.fstat(fd).st_ino))
+
+        def _replace(src: t.Any, dst: t.Any) -> None:
+            inode = os.stat(src).st_ino
+            replace(src, dst)
+            events.append(("replace", inode))
+
+        monkeypatch.setattr("operate.utils.download.os.fsync", _fsync)
+        monkeypatch.setattr("operate.utils.download.os.replace", _replace)
+        monkeypatch.setattr("operate.utils.download.JOURNAL_INTERVAL", 0)
+        path = tmp_path / "agent.zip"
+        _downloader(server, path).run()
+
+        part_inode = path.stat().st_ino
+        journal_writes = [
+            i
+            for i, (kind, inode) in enumerate(events)
+            if kind == "replace" and inode != part_inode
+        ]
+        assert len(journal_writes) > 2
+        for i in journal_writes:
+            assert events[i - 2] == ("fsync", part_inode)
+            assert events[i - 1] == ("fsync", events[i][1])
+
+    def test_changed_file_restarts(self, server: _RangeServer, tmp_path: Path) -> None:
+        """A partial download of an older version of the file is discarded."""
+        path = tmp_path / "agent.zip"
+        server.fail_at = 3000
+        with pytest.raises(requests.exceptions.RequestException):
+            _downloader(server, path).run()
+
+        server.etag = '"v2"'
+        server.requested.clear()
+        _downloader(server, path).run()
+        assert path.read_bytes() == DATA
+        assert _requested_bytes(server.requested) == len(DATA) + 1
+
+    def test_short_response_is_an_error(
+        self, server: _RangeServer, tmp_path: Path
+    ) -> None:
+        """A part ending before its range does is not taken as complete."""
+        path = tmp_path / "agent.zip"
+        server.short_at = 5000
+        with pytest.raises(requests.exceptions.ChunkedEncodingError, match="missing"):
+            _downloader(server, path).run()
+        _downloader(server, path).run()
+        assert path.read_bytes() == DATA
+
+    def test_without_range_support(self, server: _RangeServer, tmp_path: Path) -> None:
+        """Servers ignoring ranges get a single request."""
+        server.ranges_supported = False
+        path = tmp_path / "agent.zip"
+        downloader = _downloader(server, path, expected_hash=DATA_HASH)
+        downloader.run()
+        assert path.read_bytes() == DATA
+        assert server.requested == ["bytes=0-0"]
+        assert downloader.progress.total_bytes == len(DATA)
+        assert not downloader.journal_path.exists()
+
+    def test_range_ignored_for_a_part(
+        self, server: _RangeServer, tmp_path: Path
+    ) -> None:
+        """A full response to a part request is refused."""
+        server.part_ranges_supported = False
+        with pytest.raises(ValueError, match="Range request ignored"):
+            _downloader(server, tmp_path / "agent.zip").run()
+
+    def test_hash_mismatch(self, server: _RangeServer, tmp_path: Path) -> None:
+        """A file not matching the expected hash is discarded."""
+        path = tmp_path / "agent.zip"
+        downloader = _downloader(server, path, expected_hash="sha256:" + "0" * 64)
+        with pytest.raises(ValueError, match="Hash verification failed"):
+            downloader.run()
+        assert list(tmp_path.iterdir()) == []
+        assert downloader.progress.status == "failed"
+
+    def test_complete_part_file_is_not_fetched_again(
+        self, server: _RangeServer, tmp_path: Path
+    ) -> None:
+        """A journal with all parts done only needs the probe."""
+        path = tmp_path / "agent.zip"
+        downloader = _downloader(server, path)
+        downloader.part_path.write_bytes(DATA)
+        downloader.journal_path.write_text(
+            json.dumps(
+                {
+                    "url": server.url,
+                    "size": len(DATA),
+                    "validator": server.etag,
+                    "parts": [[0, len(DATA) - 1, len(DATA)]],
+                }
+            )
+        )
+        downloader.run()
+        assert path.read_bytes() == DATA
+        assert server.requested == ["bytes=0-0"]
+
+
+class TestDownloadTracker:
+    """Tests for DownloadTracker."""
+
+    def test_keeps_recent_downloads(self) -> None:
+        """Finished downloads beyond the history size are dropped, oldest first."""
+        tracker = DownloadTracker()
+        running = tracker.start("http://x", Path("running"))
+        for i in range(DownloadTracker.HISTORY_SIZE + 5):
+            tracker.start("http://x", Path(f"file{i}")).status = "completed"
+        tracker.start("http://x", Path("last"))
+
+        paths = [download["path"] for download in tracker.json]
+        assert len(paths) == DownloadTracker.HISTORY_SIZE
+        assert paths[0] == "running"
+        assert paths[-1] == "last"
+        assert running.json["status"] == "downloading"
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/utils/etag.py."""
+
+from pathlib import Path
+
+from operate.utils.etag import MISSING_VERSION, etag_matches, file_version, make_etag
+
+
+def test_file_version(tmp_path: Path) -> None:
+    """The version changes when the file is replaced."""
+    path = tmp_path / "config.json"
+    assert file_version(path) == MISSING_VERSION
+    path.write_text("{}")
+    version = file_version(path)
+    assert version == file_version(path)
+
+    tmp = tmp_path / "config.json.tmp"
+    tmp.write_text("{}")
+    tmp.replace(path)
+    assert file_version(path) != version
+
+
+def test_make_etag() -> None:
+    """Tags are quoted, strong and depend on every part."""
+    etag = make_etag("/api/v2/services", "a:1")
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert etag == make_etag("/api/v2/services", "a:1")
+    assert etag != make_etag("/api/v2/services", "a:2")
+
+
+def test_etag_matches() -> None:
+    """If-None-Match lists, wildcards and weak tags are handled."""
+    etag = make_etag("x")
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/utils/event_bus.py."""
+
+import asyncio
+import json
+import threading
+import typing as t
+from unittest.mock import MagicMock
+
+import pytest
+
+from operate.utils.event_bus import (
+    DEPLOYMENT_STATUS_EVENT,
+    EventBus,
+    EventFilter,
+    FUNDING_STATUS_EVENT,
+    RESET_EVENT,
+    Subscription,
+)
+
+
+async def _drain(subscription: Subscription) -> t.List[t.Any]:
+    """Events already delivered to a subscription."""
+    await asyncio.sleep(0)
+    events = []
+    while not subscription._queue.empty():  # pylint: disable=protected-access
+        events.append(await subscription.get())
+    return events
+
+
+@pytest.mark.asyncio
+class TestEventBus:
+    """Tests for EventBus."""
+
+    async def test_publish_delivers_matching_events(self) -> None:
+        """Subscribers only get the events passing their filter."""
+        bus = EventBus()
+        everything = bus.subscribe()
+        deployments = bus.subscribe(
+            EventFilter(types=frozenset({DEPLOYMENT_STATUS_EVENT}))
+        )
+        svc1 = bus.subscribe(EventFilter(service_config_id="svc1"))
+
+        bus.publish(DEPLOYMENT_STATUS_EVENT, {"service_config_id": "svc1"})
+        bus.publish(FUNDING_STATUS_EVENT, {"service_config_id": "svc2"})
+
+        assert [e.id for e in await _drain(everything)] == [1, 2]
+        assert [e.type for e in await _drain(deployments)] == [DEPLOYMENT_STATUS_EVENT]
+        assert [e.data for e in await _drain(svc1)] == [{"service_config_id": "svc1"}]
+        assert bus.last_id == 2
+
+    async def test_keyed_publish_drops_repeats(self) -> None:
+        """An event equal to the last one for its key is not published."""
+        bus = EventBus()
+        data = {"service_config_id": "svc1", "status": 1}
+        assert bus.publish(DEPLOYMENT_STATUS_EVENT, data, key="svc1") is not None
+        assert bus.publish(DEPLOYMENT_STATUS_EVENT, data, key="svc1") is None
+        assert bus.publish(DEPLOYMENT_STATUS_EVENT, data, key="svc2") is not None
+        assert (
+            bus.publish(DEPLOYMENT_STATUS_EVENT, {**data, "status": 2}, key="svc1")
+            is not None
+        )
+        assert bus.last_id == 3
+
+    async def test_resume_replays_missed_events(self) -> None:
+        """A cursor within the replay buffer resumes with the missed events."""
+        bus = EventBus(replay_size=3)
+        for i in range(4):
+            bus.publish(FUNDING_STATUS_EVENT, {"i": i})
+
+        resumed = bus.subscribe(last_event_id=2)
+        assert [e.id for e in await _drain(resumed)] == [3, 4]
+        assert await _drain(bus.subscribe(last_event_id=4)) == []
+
+        # event 1 fell out of the buffer: the client must refetch everything,
+        # whatever its filter
+        event_filter = EventFilter(types=frozenset({DEPLOYMENT_STATUS_EVENT}))
+        (reset,) = await _drain(bus.subscribe(event_filter, last_event_id=0))
+        assert reset.type == RESET_EVENT
+        assert reset.id == 4
+
+    async def test_cursor_of_another_run_resets(self) -> None:
+        """A cursor from another run of the daemon gets a reset."""
+        bus = EventBus(first_id=100)
+        bus.publish(FUNDING_STATUS_EVENT, {"i": 0})
+
+        # issued before a restart, when ids had gone further
+        (reset,) = await _drain(bus.subscribe(last_event_id=500))
+        assert reset.type == RESET_EVENT
+        assert reset.id == 101
+
+        # issued by an earlier run, whose ids are below those of this one
+        (reset,) = await _drain(bus.subscribe(last_event_id=42))
+        assert reset.type == RESET_EVENT
+        assert await _drain(bus.subscribe(last_event_id=101)) == []
+
+    async def test_resume_too_far_behind_resets(self) -> None:
+        """A replay larger than the queue is replaced by a reset."""
+        bus = EventBus(queue_size=2)
+        for i in range(3):
+            bus.publish(FUNDING_STATUS_EVENT, {"i": i})
+        (reset,) = await _drain(bus.subscribe(last_event_id=0))
+        assert reset.type == RESET_EVENT
+
+    async def test_slow_subscriber_is_closed(self) -> None:
+        """A subscriber falling behind its queue is closed after its queued events."""
+        bus = EventBus(queue_size=2)
+        subscription = bus.subscribe()
+        for i in range(4):
+            bus.publish(FUNDING_STATUS_EVENT, {"i": i})
+        await asyncio.sleep(0)
+        assert [(await subscription.get()).id for _ in range(2)] == [1, 2]  # type: ignore[union-attr]
+        assert await subscription.get() is None
+        assert await subscription.get() is None
+        assert not bus._subscribers  # pylint: disable=protected-access
+
+    async def test_publish_from_another_thread(self) -> None:
+        """Publishers may run in worker threads."""
+        bus = EventBus()
+        subscription = bus.subscribe()
+        thread = threading.Thread(
+            target=bus.publish, args=(FUNDING_STATUS_EVENT, {"in_progress": True})
+        )
+        thread.start()
+        event = await asyncio.wait_for(subscription.get(), timeout=5)
+        thread.join()
+        assert event is not None
+        assert event.data == {"in_progress": True}
+        assert json.loads(event.sse.split("data: ")[1]) == event.json
+        assert event.sse.startswith(f"id: 1\nevent: {FUNDING_STATUS_EVENT}\n")
+
+    async def test_subscriber_with_closed_loop_is_dropped(self) -> None:
+        """Publishing to a subscriber whose loop is gone unsubscribes it."""
+        bus = EventBus()
+        subscription = bus.subscribe()
+        subscription._loop = MagicMock()  # pylint: disable=protected-access
+        subscription._loop.call_soon_threadsafe.side_effect = RuntimeError(
+            "closed"
+        )  # pylint: disable=protected-access
+        bus.publish(FUNDING_STATUS_EVENT, {})
+        assert not bus._subscribers  # pylint: disable=protected-access
+        subscription.close()
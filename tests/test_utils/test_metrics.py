@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/utils/metrics.py."""
+
+import typing as t
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from operate.utils.metrics import (
+    HTTP_REQUEST_DURATION,
+    JOB_DURATION,
+    Metric,
+    MetricsMiddleware,
+    MetricsRegistry,
+    timed_job,
+)
+
+
+class TestMetrics:
+    """Tests for the metric types."""
+
+    def test_counter(self) -> None:
+        """Counters render one sample per label set, with escaped values."""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ("method",))
+        counter.inc("GET")
+        counter.inc("GET", amount=2)
+        counter.inc('a"b\\c\n')
+        assert counter.value("GET") == 3
+        assert counter.value("POST") == 0
+        assert registry.render() == (
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{method="GET"} 3\n'
+            'requests_total{method="a\\"b\\\\c\\n"} 1\n'
+        )
+
+    def test_labels_are_checked(self) -> None:
+        """The number of label values must match the label names."""
+        counter = MetricsRegistry().counter("c", "C.", ("a", "b"))
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc("x")
+
+    def test_gauge_is_computed_on_render(self) -> None:
+        """Gauges call their function on each render only."""
+        registry = MetricsRegistry()
+        gauge = registry.gauge("depth", "Depth.", ("pool",))
+        assert registry.render() == "# HELP depth Depth.\n# TYPE depth gauge\n"
+        values: t.Dict[t.Tuple[str, ...], float] = {("disk",): 1, ("rpc",): 0.5}
+        gauge.set_function(lambda: values)
+        assert 'depth{pool="disk"} 1\ndepth{pool="rpc"} 0.5\n' in registry.render()
+
+    def test_histogram(self) -> None:
+        """Histograms render cumulative buckets, sum and count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency.", buckets=(1.0, 0.1))
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(3)
+        assert histogram.count() == 3
+        assert registry.render().splitlines()[2:] == [
+            'latency_bucket{le="0.1"} 2',
+            'latency_bucket{le="1"} 2',
+            'latency_bucket{le="+Inf"} 3',
+            "latency_sum 3.15",
+            "latency_count 3",
+        ]
+        with histogram.time():
+            pass
+        assert histogram.count() == 4
+
+    def test_registry_rejects_duplicates(self) -> None:
+        """Metric names are unique within a registry."""
+        registry = MetricsRegistry()
+        registry.counter("c", "C.")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("c", "C.")
+        with pytest.raises(NotImplementedError):
+            Metric("m", "M.").render()
+
+    def test_timed_job(self) -> None:
+        """Jobs are labelled by outcome, as context managers and decorators."""
+        ok, error = JOB_DURATION.count("test", "ok"), JOB_DURATION.count(
+            "test", "error"
+        )
+
+        @timed_job("test")
+        def _job(fail: bool) -> None:
+            if fail:
+                raise ValueError("failed")
+
+        _job(False)
+        with pytest.raises(ValueError, match="failed"):
+            _job(True)
+        with timed_job("test"):
+            pass
+        assert JOB_DURATION.count("test", "ok") == ok + 2
+        assert JOB_DURATION.count("test", "error") == error + 1
+
+
+class TestMetricsMiddleware:
+    """Tests for MetricsMiddleware."""
+
+    def test_requests_are_labelled_by_route(self) -> None:
+        """Paths are reduced to their route template."""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics-test/{item}")
+        async def _item(item: str) -> dict:
+            return {"item": item}
+
+        before = HTTP_REQUEST_DURATION.count("GET", "/metrics-test/{item}", "200")
+        unmatched = HTTP_REQUEST_DURATION.count("GET", "unmatched", "404")
+        with TestClient(app) as client:
+            assert client.get("/metrics-test/a").status_code == 200
+            assert client.get("/metrics-test/b").status_code == 200
+            assert client.get("/metrics-missing").status_code == 404
+        assert (
+            HTTP_REQUEST_DURATION.count("GET", "/metrics-test/{item}", "200")
+            == before + 2
+        )
+        assert HTTP_REQUEST_DURATION.count("GET", "unmatched", "404") == unmatched + 1
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate.utils.multicall module."""
+
+import typing as t
+from unittest.mock import MagicMock
+
+import pytest
+
+from operate.utils.multicall import MULTICALL3_ADDRESS, try_aggregate
+
+TARGET = "0x" + "a" * 40
+
+
+def _make_w3(response: t.Callable[[t.List], t.List]) -> MagicMock:
+    """Web3 mock whose aggregate3 call returns `response(calls)`."""
+    w3 = MagicMock()
+    contract = w3.eth.contract.return_value
+    contract.functions.aggregate3.side_effect = lambda calls: MagicMock(
+        call=MagicMock(return_value=response(calls))
+    )
+    return w3
+
+
+class TestTryAggregate:
+    """Tests for try_aggregate."""
+
+    def test_batches_and_maps_failures_to_none(self) -> None:
+        """Calls are split into batches; reverted calls yield None."""
+        w3 = _make_w3(
+            lambda calls: [
+                (data != b"\x02", data * 2 if data != b"\x02" else b"")
+                for _, _, data in calls
+            ]
+        )
+        calls = [(TARGET, bytes([i])) for i in range(5)]
+        results = try_aggregate(w3, calls, batch_size=2)
+
+        assert results == [b"\x00\x00", b"\x01\x01", None, b"\x03\x03", b"\x04\x04"]
+        assert w3.eth.contract.return_value.functions.aggregate3.call_count == 3
+        assert w3.eth.contract.call_args.kwargs["address"] == MULTICALL3_ADDRESS
+
+    def test_length_mismatch_raises(self) -> None:
+        """A response that does not match the batch is rejected."""
+        w3 = _make_w3(lambda calls: [])
+        with pytest.raises(ValueError, match="0 results for 1 calls"):
+            try_aggregate(w3, [(TARGET, b"\x00")])
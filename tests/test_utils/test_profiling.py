@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/utils/profiling.py."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from operate.utils.metrics import LOOP_LAG
+from operate.utils.profiling import LoopLagMonitor, collapsed_stacks, sample_stacks
+
+
+def _blocking_handler() -> None:
+    """Stand-in for a handler doing blocking work on the loop."""
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+
+    async def test_stall_is_reported_with_the_blocking_stack(self) -> None:
+        """A blocked loop is logged with the stack of the blocking call."""
+        logger = MagicMock()
+        monitor = LoopLagMonitor(threshold=0.1, logger=logger, interval=0.01)
+        observed = LOOP_LAG.count()
+        monitor.start()
+        await asyncio.sleep(0.05)
+        _blocking_handler()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+        await monitor.stop()
+
+        messages = [call.args[0] for call in logger.warning.call_args_list]
+        stalls = [m for m in messages if "blocked for more than" in m]
+        assert any("_blocking_handler" in m for m in stalls)
+        assert any("was blocked for" in m for m in messages)
+        assert LOOP_LAG.count() > observed
+
+    async def test_idle_loop_is_not_reported(self) -> None:
+        """Nothing is logged while the loop keeps up."""
+        logger = MagicMock()
+        monitor = LoopLagMonitor(threshold=2.0, logger=logger, interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        logger.warning.assert_not_called()
+
+
+class TestSampleStacks:
+    """Tests for sample_stacks and collapsed_stacks."""
+
+    def test_samples_other_threads(self) -> None:
+        """Stacks start with the thread name and exclude the sampling thread."""
+        release = threading.Event()
+        thread = threading.Thread(
+            target=release.wait, args=(5,), name="sampled-thread", daemon=True
+        )
+        thread.start()
+        try:
+            counts = sample_stacks(0.05, interval=0.01)
+        finally:
+            release.set()
+            thread.join()
+
+        sampled = [s for s in counts if s.startswith("sampled-thread;")]
+        assert sampled
+        assert "threading:wait" in sampled[0]
+        assert not any("sample_stacks" in s for s in counts)
+
+    def test_collapsed_format(self) -> None:
+        """One sorted line per stack, followed by its count."""
+        assert collapsed_stacks({"b;f 2": 1, "a;g": 3}) == "a;g 3\nb;f 2 1\n"
+        assert collapsed_stacks({}) == ""
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for operate/utils/request_executor.py."""
+
+import asyncio
+import threading
+import typing as t
+
+import pytest
+
+from operate.utils.request_executor import RequestExecutor
+
+
+@pytest.mark.asyncio
+class TestRequestExecutor:
+    """Tests for RequestExecutor."""
+
+    async def test_run_uses_the_pool_of_the_route_class(self) -> None:
+        """Work runs on a thread of the requested pool, with args and kwargs."""
+        executor = RequestExecutor(pool_sizes={RequestExecutor.RPC: 1})
+
+        def _fn(a: int, b: int = 0) -> t.Tuple[str, int]:
+            return threading.current_thread().name, a + b
+
+        name, total = await executor.run(RequestExecutor.RPC, _fn, 1, b=2)
+        assert name.startswith("operate-rpc")
+        assert total == 3
+        name, _ = await executor.run(RequestExecutor.DISK, _fn, 1)
+        assert name.startswith("operate-disk")
+
+    async def test_busy_pool_does_not_block_other_pools(self) -> None:
+        """A saturated RPC pool leaves disk reads running."""
+        executor = RequestExecutor(pool_sizes={RequestExecutor.RPC: 1})
+        release = threading.Event()
+        slow = asyncio.ensure_future(executor.run(RequestExecutor.RPC, release.wait, 5))
+        assert await executor.run(RequestExecutor.DISK, lambda: "disk") == "disk"
+        assert not slow.done()
+        release.set()
+        assert await slow is True
+
+    async def test_writes_to_a_resource_do_not_overlap(self) -> None:
+        """Writes to the same resource run one at a time, others in parallel."""
+        executor = RequestExecutor()
+        running: t.Dict[str, int] = {"wallet": 0, "service": 0}
+        overlapped: t.List[str] = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def _write(resource: str) -> None:
+            with lock:
+                running[resource] += 1
+                if running[resource] > 1:
+                    overlapped.append(resource)
+            release.wait(5)
+            with lock:
+                running[resource] -= 1
+
+        first = asyncio.ensure_future(
+            executor.run(RequestExecutor.WRITE, _write, "wallet", resource="wallet")
+        )
+        second = asyncio.ensure_future(
+            executor.run(RequestExecutor.WRITE, _write, "wallet", resource="wallet")
+        )
+        other = asyncio.ensure_future(
+            executor.run(RequestExecutor.WRITE, _write, "service", resource="service")
+        )
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if running["wallet"] and running["service"]:
+                break
+        # the other resource runs while the first wallet write holds the wallet
+        assert running == {"wallet": 1, "service": 1}
+        release.set()
+        await asyncio.gather(first, second, other)
+        assert overlapped == []
+
+    async def test_resource_is_held_until_cancelled_work_is_done(self) -> None:
+        """A caller going away does not let the next write start early."""
+        executor = RequestExecutor()
+        release = threading.Event()
+        first = asyncio.ensure_future(
+            executor.run(RequestExecutor.WRITE, release.wait, 5, resource="wallet")
+        )
+        await asyncio.sleep(0.05)
+        first.cancel()
+        second = asyncio.ensure_future(
+            executor.run(RequestExecutor.WRITE, lambda: "done", resource="wallet")
+        )
+        await asyncio.sleep(0.05)
+        assert not second.done()
+        release.set()
+        assert await second == "done"
+
+    async def test_resource_is_released_when_submit_fails(self) -> None:
+        """A write that cannot be queued does not keep its resource locked."""
+        executor = RequestExecutor()
+        pools = executor._pools  # pylint: disable=protected-access
+        pools[RequestExecutor.WRITE].shutdown()
+        with pytest.raises(RuntimeError, match="after shutdown"):
+            await executor.run(RequestExecutor.WRITE, lambda: None, resource="wallet")
+        assert not executor._locks[
+            "wallet"
+        ].locked()  # pylint: disable=protected-access
+
+    async def test_coalesce_runs_once_per_key(self) -> None:
+        """Concurrent calls with the same key share one execution."""
+        executor = RequestExecutor()
+        calls = []
+        release = threading.Event()
+
+        def _read(name: str) -> t.Dict[str, str]:
+            calls.append(name)
+            release.wait(5)
+            return {"name": name}
+
+        same = [
+            asyncio.ensure_future(
+                executor.coalesce("a", RequestExecutor.DISK, _read, "a")
+            )
+            for _ in range(3)
+        ]
+        other = asyncio.ensure_future(
+            executor.coalesce("b", RequestExecutor.DISK, _read, "b")
+        )
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*same, other)
+
+        assert sorted(calls) == ["a", "b"]
+        assert results[0] is results[1] is results[2]
+        assert results[3] == {"name": "b"}
+
+        # once done, the next call runs again
+        await executor.coalesce("a", RequestExecutor.DISK, _read, "a")
+        assert calls.count("a") == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_work(self) -> None:
+        """The remaining callers still get the result."""
+        executor = RequestExecutor()
+        release = threading.Event()
+
+        def _read() -> str:
+            release.wait(5)
+            return "ok"
+
+        first = asyncio.ensure_future(
+            executor.coalesce("a", RequestExecutor.DISK, _read)
+        )
+        second = asyncio.ensure_future(
+            executor.coalesce("a", RequestExecutor.DISK, _read)
+        )
+        await asyncio.sleep(0.05)
+        first.cancel()
+        release.set()
+        assert await second == "ok"
+        assert first.cancelled()
+
+    async def test_coalesce_propagates_errors(self) -> None:
+        """All callers see the error, and the key is released."""
+        executor = RequestExecutor()
+
+        def _read() -> None:
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            executor.coalesce("a", RequestExecutor.DISK, _read),
+            executor.coalesce("a", RequestExecutor.DISK, _read),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        with pytest.raises(ValueError, match="boom"):
+            await executor.coalesce("a", RequestExecutor.DISK, _read)